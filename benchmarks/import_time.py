@@ -0,0 +1,78 @@
+"""Measure the cold start cost of the library.
+
+Each sample runs in a fresh interpreter and times `import redditwarp.SYNC`
+(or `redditwarp.ASYNC`) and the construction of the first `Client`.
+
+Usage::
+
+    python benchmarks/import_time.py [--side SYNC|ASYNC] [--runs N]
+            [--max-import SECONDS] [--max-construct SECONDS]
+
+The median of the runs is reported. If a `--max-*` threshold is given and the
+median exceeds it, the script exits with a non-zero status so that it can be
+used as a regression check.
+"""
+
+from __future__ import annotations
+from typing import Optional, Sequence
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+_SNIPPET = '''\
+import sys, time, json
+t0 = time.perf_counter()
+import redditwarp.{side} as m
+t1 = time.perf_counter()
+m.Client()
+t2 = time.perf_counter()
+n = sum(1 for k in sys.modules if k.startswith('redditwarp'))
+print(json.dumps([t1 - t0, t2 - t1, n]))
+'''
+
+def sample(side: str) -> tuple[float, float, int]:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ, 'PYTHONPATH': root + os.pathsep + os.environ.get('PYTHONPATH', '')}
+    proc = subprocess.run(
+        [sys.executable, '-c', _SNIPPET.format(side=side)],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if proc.returncode:
+        raise SystemExit(proc.stderr)
+    import_time, construct_time, module_count = json.loads(proc.stdout)
+    return (import_time, construct_time, module_count)
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--side', choices=('SYNC', 'ASYNC'), default='SYNC')
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--max-import', type=float)
+    parser.add_argument('--max-construct', type=float)
+    args = parser.parse_args(argv)
+
+    samples = [sample(args.side) for _ in range(args.runs)]
+    import_time = statistics.median(s[0] for s in samples)
+    construct_time = statistics.median(s[1] for s in samples)
+    module_count = samples[-1][2]
+
+    print(f'import redditwarp.{args.side}: {import_time * 1000:.1f} ms')
+    print(f'first Client():  {construct_time * 1000:.1f} ms')
+    print(f'redditwarp modules loaded: {module_count}')
+
+    failed = False
+    if args.max_import is not None and import_time > args.max_import:
+        print(f'import time exceeds {args.max_import * 1000:.1f} ms', file=sys.stderr)
+        failed = True
+    if args.max_construct is not None and construct_time > args.max_construct:
+        print(f'construction time exceeds {args.max_construct * 1000:.1f} ms', file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""Compare JSON decoding backends on listing and comment tree response bodies.
+
+Usage::
+
+    python benchmarks/json_decoding.py [--number N]
+
+Each installed backend of :mod:`redditwarp.http.util.json_loading` is timed
+decoding the payloads from :mod:`payloads`. The cost of the previous approach
+(decoding the body to `str` and then parsing it with the standard library)
+is shown for reference.
+"""
+
+from __future__ import annotations
+from typing import Optional, Sequence, Callable, Any
+
+import os
+import sys
+import json
+import timeit
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from payloads import get_payloads  # noqa: E402
+from redditwarp.http.util import json_loading  # noqa: E402
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    decoder = json.JSONDecoder()
+    candidates: dict[str, Callable[[bytes], Any]] = {
+        'str + json (previous)': lambda b: decoder.decode(b.decode()),
+    }
+    for name in ('orjson', 'msgspec', 'ujson', 'json'):
+        try:
+            json_loading.set_json_backend(name)
+        except ImportError:
+            print(f'{name}: not installed')
+            continue
+        candidates[name] = json_loading.get_json_loads()
+
+    for payload_name, data in get_payloads().items():
+        print(f'\n{payload_name} ({len(data) / 1e6:.2f} MB)')
+        baseline = None
+        for name, f in candidates.items():
+            t = min(timeit.repeat(lambda: f(data), number=args.number, repeat=3)) / args.number
+            if baseline is None:
+                baseline = t
+            print(f'  {name:<24}{t * 1000:8.2f} ms  {baseline / t:5.1f}x')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""Compare the memory retained by regular and compact models for a large comment tree.
+
+Usage::
+
+    python benchmarks/model_memory.py [--comments N] [--authors N]
+
+A comment tree of `--comments` comments is generated with :mod:`payloads`.
+Every comment is placed in the submission's subreddit and given one of
+`--authors` authors, as in a real thread. The tree is decoded and loaded in
+each mode and the memory still allocated afterwards (with the decoded JSON
+released, unless the models keep a reference to it) is measured with
+:mod:`tracemalloc`.
+
+Modes:
+
+* `json`: the decoded JSON alone, for reference.
+* `models`: regular models from `load_submission_tree_node`.
+* `models+nested`: the same, after reading the nested attribute groups
+  (`subreddit`, `author`, `submission`, and `me`) of every comment.
+* `compact+d`: compact models that keep the raw data.
+* `compact`: compact models that discard the raw data.
+"""
+
+from __future__ import annotations
+from typing import Optional, Sequence, Callable, Any
+
+import os
+import sys
+import gc
+import json
+import random
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from payloads import make_comment_tree, _id36  # noqa: E402
+from redditwarp.client_SYNC import Client  # noqa: E402
+from redditwarp.model_loaders.comment_tree_SYNC import load_submission_tree_node  # noqa: E402
+from redditwarp.model_loaders.compact import CompactLoader  # noqa: E402
+
+def make_payload(n_comments: int, n_authors: int) -> bytes:
+    rng = random.Random(0)
+    tree = make_comment_tree(rng, n_comments)
+    subm_data = tree[0]['data']['children'][0]['data']
+    authors = [(f'user{i}', 't2_' + _id36(rng)) for i in range(n_authors)]
+
+    def fix(children: Sequence[Any]) -> None:
+        for m in children:
+            data = m['data']
+            data['subreddit_id'] = subm_data['subreddit_id']
+            data['author'], data['author_fullname'] = rng.choice(authors)
+            if data['replies']:
+                fix(data['replies']['data']['children'])
+    fix(tree[1]['data']['children'])
+    return json.dumps(tree).encode()
+
+def touch_nested(node: Any) -> Any:
+    for child in node.children:
+        c = child.value
+        c.subreddit, c.author, c.submission, c.me
+        touch_nested(child)
+    return node
+
+def measure(payload: bytes, load: Callable[[Any], Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = load(json.loads(payload))
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--comments', type=int, default=20000)
+    parser.add_argument('--authors', type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    payload = make_payload(args.comments, args.authors)
+    client = Client()
+    modes: dict[str, Callable[[Any], Any]] = {
+        'json': lambda d: d,
+        'models': lambda d: load_submission_tree_node(d, client, 'confidence'),
+        'models+nested': lambda d: touch_nested(load_submission_tree_node(d, client, 'confidence')),
+        'compact+d': lambda d: CompactLoader(keep_d=True).load_submission_tree_node(d),
+        'compact': lambda d: CompactLoader().load_submission_tree_node(d),
+    }
+
+    print(f'{args.comments} comments, {args.authors} authors ({len(payload) / 1e6:.2f} MB of JSON)')
+    baseline = None
+    for name, load in modes.items():
+        size = measure(payload, load)
+        if baseline is None:
+            baseline = size
+        print(f'  {name:<16}{size / 1e6:8.2f} MB  {size / args.comments:8.0f} B/comment  {size / baseline:5.2f}x json')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
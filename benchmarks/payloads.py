@@ -0,0 +1,199 @@
+"""Generate Reddit API response bodies for benchmarking.
+
+The payloads follow the shape and field set of real API responses (a
+100-item submission listing and a deep comment tree), with deterministic
+pseudo-random content so that results are comparable between runs.
+"""
+
+from __future__ import annotations
+from typing import Any
+
+import json
+import random
+import string
+
+def _text(rng: random.Random, n_words: int) -> str:
+    return ' '.join(
+        ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9)))
+        for _ in range(n_words)
+    )
+
+def _id36(rng: random.Random) -> str:
+    return ''.join(rng.choices(string.digits + string.ascii_lowercase, k=7))
+
+def make_submission(rng: random.Random) -> dict[str, Any]:
+    idn = _id36(rng)
+    subreddit = _text(rng, 1)
+    return {
+        'kind': 't3',
+        'data': {
+            'id': idn,
+            'name': 't3_' + idn,
+            'title': _text(rng, rng.randint(5, 20)),
+            'selftext': _text(rng, rng.randint(0, 200)),
+            'selftext_html': None,
+            'author': _text(rng, 1),
+            'author_fullname': 't2_' + _id36(rng),
+            'subreddit': subreddit,
+            'subreddit_id': 't5_' + _id36(rng),
+            'subreddit_name_prefixed': 'r/' + subreddit,
+            'permalink': f'/r/{subreddit}/comments/{idn}/',
+            'url': f'https://www.reddit.com/r/{subreddit}/comments/{idn}/',
+            'created_utc': 1700000000.0 + rng.randint(0, 10**7),
+            'score': rng.randint(0, 50000),
+            'ups': rng.randint(0, 50000),
+            'downs': 0,
+            'upvote_ratio': round(rng.random(), 2),
+            'num_comments': rng.randint(0, 5000),
+            'is_self': rng.random() < .5,
+            'over_18': False,
+            'spoiler': False,
+            'locked': False,
+            'stickied': False,
+            'archived': False,
+            'edited': False,
+            'distinguished': None,
+            'hide_score': False,
+            'removed_by_category': None,
+            'suggested_sort': None,
+            'contest_mode': False,
+            'is_original_content': False,
+            'num_crossposts': 0,
+            'is_crosspostable': True,
+            'is_robot_indexable': True,
+            'pinned': False,
+            'saved': False,
+            'hidden': False,
+            'likes': None,
+            'quarantine': False,
+            'send_replies': True,
+            'subreddit_subscribers': rng.randint(0, 10**7),
+            'subreddit_type': 'public',
+            'url_overridden_by_dest': None,
+            'num_reports': None,
+            'mod_reports': [],
+            'user_reports': [],
+            'crosspost_parent_list': [],
+            'author_premium': False,
+            'link_flair_text': None,
+            'link_flair_type': 'text',
+            'link_flair_css_class': None,
+            'link_flair_background_color': '',
+            'link_flair_text_color': 'dark',
+            'link_flair_richtext': [],
+            'author_flair_text': None,
+            'author_flair_type': 'text',
+            'author_flair_css_class': None,
+            'author_flair_template_id': None,
+            'author_flair_background_color': None,
+            'author_flair_text_color': None,
+            'author_flair_richtext': [],
+            'all_awardings': [],
+            'gildings': {},
+            'media': None,
+            'preview': {
+                'images': [{
+                    'source': {'url': 'https://preview.redd.it/' + _id36(rng), 'width': 1080, 'height': 720},
+                    'resolutions': [
+                        {'url': 'https://preview.redd.it/' + _id36(rng), 'width': w, 'height': w * 2 // 3}
+                        for w in (108, 216, 320, 640, 960)
+                    ],
+                }],
+                'enabled': True,
+            },
+        },
+    }
+
+def make_listing(rng: random.Random, n: int = 100) -> dict[str, Any]:
+    return {
+        'kind': 'Listing',
+        'data': {
+            'after': 't3_' + _id36(rng),
+            'before': None,
+            'dist': n,
+            'modhash': '',
+            'geo_filter': '',
+            'children': [make_submission(rng) for _ in range(n)],
+        },
+    }
+
+def make_comment(rng: random.Random, subreddit: str, link_id: str, parent_id: str, depth: int, budget: list[int]) -> dict[str, Any]:
+    idn = _id36(rng)
+    budget[0] -= 1
+    children = []
+    if depth < 10:
+        for _ in range(rng.randint(0, 3)):
+            if budget[0] <= 0:
+                break
+            children.append(make_comment(rng, subreddit, link_id, 't1_' + idn, depth + 1, budget))
+    return {
+        'kind': 't1',
+        'data': {
+            'id': idn,
+            'name': 't1_' + idn,
+            'link_id': link_id,
+            'parent_id': parent_id,
+            'body': _text(rng, rng.randint(3, 120)),
+            'body_html': None,
+            'author': _text(rng, 1),
+            'author_fullname': 't2_' + _id36(rng),
+            'created_utc': 1700000000.0 + rng.randint(0, 10**7),
+            'score': rng.randint(-50, 5000),
+            'ups': rng.randint(0, 5000),
+            'depth': depth,
+            'edited': False,
+            'stickied': False,
+            'distinguished': None,
+            'controversiality': 0,
+            'score_hidden': False,
+            'num_reports': None,
+            'mod_reports': [],
+            'user_reports': [],
+            'collapsed': False,
+            'is_submitter': False,
+            'archived': False,
+            'locked': False,
+            'saved': False,
+            'likes': None,
+            'send_replies': True,
+            'permalink': f'/r/{subreddit}/comments/{link_id[3:]}/_/{idn}/',
+            'subreddit': subreddit,
+            'subreddit_id': 't5_' + _id36(rng),
+            'subreddit_type': 'public',
+            'author_premium': False,
+            'author_flair_text': None,
+            'author_flair_type': 'text',
+            'author_flair_css_class': None,
+            'author_flair_template_id': None,
+            'author_flair_background_color': None,
+            'author_flair_text_color': None,
+            'author_flair_richtext': [],
+            'all_awardings': [],
+            'gildings': {},
+            'replies': {
+                'kind': 'Listing',
+                'data': {'after': None, 'before': None, 'children': children},
+            } if children else '',
+        },
+    }
+
+def make_comment_tree(rng: random.Random, n: int = 2000) -> list[Any]:
+    submission = make_submission(rng)
+    link_id = submission['data']['name']
+    subreddit = submission['data']['subreddit']
+    budget = [n]
+    top = []
+    while budget[0] > 0:
+        top.append(make_comment(rng, subreddit, link_id, link_id, 0, budget))
+    return [
+        {'kind': 'Listing', 'data': {'after': None, 'before': None, 'children': [submission]}},
+        {'kind': 'Listing', 'data': {'after': None, 'before': None, 'children': top}},
+    ]
+
+def get_payloads(seed: int = 0) -> dict[str, bytes]:
+    """Return encoded response bodies keyed by a descriptive name."""
+    rng = random.Random(seed)
+    return {
+        'listing_100': json.dumps(make_listing(rng)).encode(),
+        'comment_tree_2000': json.dumps(make_comment_tree(rng)).encode(),
+    }
@@ -0,0 +1,332 @@
+"""Run the offline benchmark suite and write machine-readable results.
+
+Usage::
+
+    python benchmarks/suite.py [--output FILE] [--compare BASELINE]
+            [--max-regression RATIO] [--only PREFIX] [--min-time SECONDS]
+
+No network is used: requests are answered by an in-memory connector placed
+at the bottom of the usual Reddit handler chain, and model loaders are fed
+the payloads from :mod:`payloads`.
+
+Benchmarks:
+
+* `pipeline.*`: the per-request cost of the handler chain, from the
+  connector alone up to the full chain of a `RedditHTTPClient`
+  (URL joining, origin routing, default headers, `raw_json`, authorization,
+  rate limiting, response caching and coalescing). The `pipeline.layers.*`
+  benchmarks add one handler at a time. A per-layer breakdown is printed,
+  measured separately by running the layers interleaved and taking medians.
+* `loaders.*`: throughput of `load_submission`, `load_comment`, and
+  `load_submission_tree_node`. The `loaders.listing_100.*` benchmarks load a
+  100 post listing page and read either just the ID and title of each post,
+  or every nested attribute group.
+* `paginator.*`: the cost of iterating a listing paginator through the client,
+  loading models or (`.raw`) yielding the raw data of each post. With
+  `msgspec` installed, `.structs` decodes the pages through the typed structs
+  of :mod:`redditwarp.models.listing_structs`.
+
+The results are printed and, with `--output`, written as JSON. Given a
+`--compare` file from an earlier run, each benchmark's change is shown, and the
+script exits with a non-zero status if any benchmark is slower than the
+baseline by more than `--max-regression` (default 0.25, i.e. 25%).
+"""
+
+from __future__ import annotations
+from typing import Optional, Sequence, Callable, Any, Mapping
+
+import os
+import sys
+import json
+import time
+import statistics
+import importlib.util
+import platform
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from payloads import get_payloads  # noqa: E402
+import redditwarp  # noqa: E402
+from redditwarp.client_SYNC import Client  # noqa: E402
+from redditwarp.core.http_client_SYNC import build_reddit_http_client_from_access_token  # noqa: E402
+from redditwarp.http.connector_SYNC import Connector  # noqa: E402
+from redditwarp.http.send_params import SendParams  # noqa: E402
+from redditwarp.http.requisition import Requisition  # noqa: E402
+from redditwarp.http.exchange import Exchange  # noqa: E402
+from redditwarp.http.request import Request  # noqa: E402
+from redditwarp.http.response import Response  # noqa: E402
+from redditwarp.http.handler_SYNC import Handler  # noqa: E402
+from redditwarp.auth.token import Token  # noqa: E402
+from redditwarp.core.authorizer_SYNC import Authorizer, Authorized  # noqa: E402
+from redditwarp.core.rate_limited_SYNC import RateLimited  # noqa: E402
+from redditwarp.core.cached_SYNC import Cached  # noqa: E402
+from redditwarp.core.response_cache import ResponseCache  # noqa: E402
+from redditwarp.core.coalesced_SYNC import Coalesced  # noqa: E402
+from redditwarp.core.reddit_please_send_json_SYNC import RedditPleaseSendJSON  # noqa: E402
+from redditwarp.core.direct_by_origin_SYNC import DirectByOrigin  # noqa: E402
+from redditwarp.core.accounted_SYNC import Accounted  # noqa: E402
+from redditwarp.core.recorded_SYNC import Recorded  # noqa: E402
+from redditwarp.model_loaders.submission_SYNC import load_submission  # noqa: E402
+from redditwarp.model_loaders.comment_SYNC import load_comment  # noqa: E402
+from redditwarp.model_loaders.comment_tree_SYNC import load_submission_tree_node  # noqa: E402
+
+# A budget so large that the rate limiter never makes a request wait.
+_RATE_LIMIT_HEADERS = {
+    'x-ratelimit-used': '0',
+    'x-ratelimit-remaining': '1000000000.0',
+    'x-ratelimit-reset': '600',
+}
+
+class InMemoryConnector(Connector):
+    """Answer every request with a fixed response body, keyed by URL path."""
+
+    def __init__(self, routes: Mapping[str, bytes], default: bytes = b'{}') -> None:
+        super().__init__()
+        self.routes = routes
+        self.default = default
+        self.headers = {'Content-Type': 'application/json; charset=UTF-8', **_RATE_LIMIT_HEADERS}
+
+    def _send(self, p: SendParams) -> Exchange:
+        reqi = p.requisition
+        path = reqi.url.partition('://')[2].partition('/')[2]
+        return Exchange(
+            requisition=reqi,
+            request=Request(reqi.verb, reqi.url, reqi.headers, b''),
+            response=Response(200, self.headers, self.routes.get('/' + path, self.default)),
+            history=(),
+        )
+
+# Transport adapter metadata, used for the User-Agent string of the client.
+name: str = 'in-memory'
+version: str = '0'
+
+
+def measure(f: Callable[[], object], min_time: float) -> tuple[float, int]:
+    """Return the best seconds per call of `f` and the number of calls per sample."""
+    # Warm up first so that one-off costs, like the pause a new rate limiter
+    # takes before its first budget report arrives, don't skew calibration.
+    for _ in range(20):
+        f()
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            f()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / 5:
+            break
+        number *= 2
+    best = elapsed / number
+    for _ in range(4):
+        start = time.perf_counter()
+        for _ in range(number):
+            f()
+        best = min(best, (time.perf_counter() - start) / number)
+    return (best, number)
+
+
+def measure_layer_costs(
+    benchmarks: Mapping[str, Callable[[], object]],
+    min_time: float,
+    rounds: int = 9,
+) -> dict[str, float]:
+    """Return the median seconds per call that each benchmark adds over the one before it.
+
+    The benchmarks are run interleaved, one sample of each per round, so that
+    drift in machine load affects consecutive layers alike. Each layer's cost
+    is the median over the rounds of its difference from the previous layer
+    in the same round. Costs near zero can come out slightly negative.
+    """
+    names = list(benchmarks)
+    numbers = {name: measure(benchmarks[name], min_time / rounds)[1] for name in names}
+    samples: dict[str, list[float]] = {name: [] for name in names}
+    for _ in range(rounds):
+        previous = 0.
+        for name in names:
+            f = benchmarks[name]
+            number = numbers[name]
+            start = time.perf_counter()
+            for _ in range(number):
+                f()
+            seconds = (time.perf_counter() - start) / number
+            samples[name].append(seconds - previous)
+            previous = seconds
+    return {name: statistics.median(samples[name]) for name in names}
+
+
+def get_layer_benchmarks() -> dict[str, tuple[Callable[[], object], int]]:
+    """Return benchmarks for the handler chain of a `RedditHTTPClient` built up one layer at a time.
+
+    The difference between consecutive benchmarks is the cost of a layer.
+    """
+    connector = InMemoryConnector({})
+    origin = 'https://oauth.reddit.com'
+    url = origin + '/api/v1/me'
+    authorizer = Authorizer(token=Token('benchmark'))
+
+    layers: list[tuple[str, Callable[[Handler], Handler]]] = [
+        ('authorized', lambda h: Authorized(h, authorizer)),
+        ('rate_limited', lambda h: RateLimited(h)),
+        ('cached', lambda h: Cached(h, ResponseCache())),
+        ('coalesced', lambda h: Coalesced(h)),
+        ('reddit_please_send_json', lambda h: RedditPleaseSendJSON(h)),
+        ('direct_by_origin', lambda h: DirectByOrigin(connector, {origin: h})),
+        ('accounted', lambda h: Accounted(h)),
+        ('recorded', lambda h: Recorded(h)),
+    ]
+
+    def make_benchmark(handler: Handler) -> Callable[[], object]:
+        return lambda: handler._send(SendParams(Requisition('GET', url, {}, {}, None)))
+
+    def build(depth: int) -> Handler:
+        # Each benchmark gets its own handlers so that stateful layers,
+        # such as the rate limiter, don't carry state between benchmarks.
+        handler: Handler = connector
+        for _, wrap in layers[:depth]:
+            handler = wrap(handler)
+        return handler
+
+    benchmarks = {'pipeline.layers.0_connector': (make_benchmark(build(0)), 1)}
+    for i, (name, _) in enumerate(layers, 1):
+        benchmarks[f'pipeline.layers.{i}_{name}'] = (make_benchmark(build(i)), 1)
+    return benchmarks
+
+
+def get_benchmarks() -> dict[str, tuple[Callable[[], object], int]]:
+    """Return the benchmarks keyed by name, with the number of items each call processes."""
+    payloads = get_payloads()
+    listing = payloads['listing_100']
+    comment_tree = payloads['comment_tree_2000']
+
+    connector = InMemoryConnector({'/hot': listing})
+    http = build_reddit_http_client_from_access_token('benchmark', connector=connector)
+    client = Client.from_http(http)
+    bare_http = http.bare_http
+    assert bare_http is not None
+
+    url = 'https://oauth.reddit.com/api/v1/me'
+    def send_connector() -> None:
+        connector._send(SendParams(Requisition('GET', url, {}, {}, None)))
+
+    listing_d = json.loads(listing)
+    submission_ds = [m['data'] for m in listing_d['data']['children']]
+    def load_submissions() -> None:
+        for d in submission_ds:
+            load_submission(d, client)
+    def load_listing_id_title() -> None:
+        # What a typical stream handler reads.
+        for d in submission_ds:
+            subm = load_submission(d, client)
+            subm.id
+            subm.title
+    def load_listing_all_fields() -> None:
+        for d in submission_ds:
+            subm = load_submission(d, client)
+            subm.created_at
+            subm.me
+            subm.subreddit
+            subm.author
+            subm.mod
+            subm.flair
+            subm.reports
+
+    tree_d = json.loads(comment_tree)
+    comment_ds: list[Any] = []
+    def collect(children: Sequence[Any]) -> None:
+        for m in children:
+            comment_ds.append(m['data'])
+            replies = m['data']['replies']
+            if replies:
+                collect(replies['data']['children'])
+    collect(tree_d[1]['data']['children'])
+    def load_comments() -> None:
+        for d in comment_ds:
+            load_comment(d, client)
+
+    def iterate_front_hot_structs() -> int:
+        it = client.p.front.pull.hot(1000)
+        it.get_paginator().struct_decoding = True
+        return sum(1 for _ in it)
+
+    benchmarks: dict[str, tuple[Callable[[], object], int]] = {
+        **get_layer_benchmarks(),
+        'pipeline.connector': (send_connector, 1),
+        'pipeline.bare_http': (lambda: bare_http.request('GET', url), 1),
+        'pipeline.full_chain': (lambda: http.request('GET', '/api/v1/me'), 1),
+        'pipeline.full_chain_json': (lambda: client.request('GET', '/api/v1/me'), 1),
+        'loaders.load_submission': (load_submissions, len(submission_ds)),
+        'loaders.listing_100.id_title': (load_listing_id_title, len(submission_ds)),
+        'loaders.listing_100.all_fields': (load_listing_all_fields, len(submission_ds)),
+        'loaders.load_comment': (load_comments, len(comment_ds)),
+        'loaders.load_submission_tree_node': (lambda: load_submission_tree_node(tree_d, client, 'confidence'), len(comment_ds)),
+        'paginator.front_hot_1000': (lambda: sum(1 for _ in client.p.front.pull.hot(1000)), 1000),
+        'paginator.front_hot_1000.raw': (lambda: sum(1 for _ in client.p.front.pull.hot(1000).as_raw()), 1000),
+    }
+    if importlib.util.find_spec('msgspec') is not None:
+        benchmarks['paginator.front_hot_1000.structs'] = (iterate_front_hot_structs, 1000)
+    return benchmarks
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--output')
+    parser.add_argument('--compare')
+    parser.add_argument('--max-regression', type=float, default=.25)
+    parser.add_argument('--only', default='')
+    parser.add_argument('--min-time', type=float, default=.5)
+    args = parser.parse_args(argv)
+
+    results: dict[str, dict[str, float]] = {}
+    for name, (f, items) in get_benchmarks().items():
+        if not name.startswith(args.only):
+            continue
+        seconds, number = measure(f, args.min_time)
+        results[name] = {
+            'seconds_per_call': seconds,
+            'items_per_call': items,
+            'items_per_second': items / seconds,
+            'calls_per_sample': number,
+        }
+        print(f'{name:<40}{seconds * 1e6:12.1f} us/call{items / seconds:14.0f} items/s')
+
+    if 'pipeline.layers.'.startswith(args.only) or args.only.startswith('pipeline.layers.'):
+        layer_benchmarks = {name: f for name, (f, _) in get_layer_benchmarks().items()}
+        print('\nper-layer cost (median of interleaved rounds):')
+        for name, seconds in measure_layer_costs(layer_benchmarks, args.min_time).items():
+            print(f'  {name.rpartition(".")[2]:<38}{seconds * 1e6:+10.2f} us')
+
+    report = {
+        'meta': {
+            'redditwarp_version': redditwarp.__about__.__version__,
+            'python_version': platform.python_version(),
+            'python_implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'timestamp': time.time(),
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as fh:
+            json.dump(report, fh, indent=2)
+
+    if not args.compare:
+        return 0
+    with open(args.compare) as fh:
+        baseline = json.load(fh)['results']
+    failed = False
+    print(f'\ncompared with {args.compare}:')
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        change = result['seconds_per_call'] / baseline[name]['seconds_per_call'] - 1
+        flag = ''
+        if change > args.max_regression:
+            flag = '  REGRESSION'
+            failed = True
+        print(f'{name:<40}{change:+8.1%}{flag}')
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""Token stores for reusing tokens across processes.
+
+A token store saves the most recent token obtained for a client and grant, so
+that other processes, or later runs of the same program, can use it instead
+of obtaining a new one from the token server.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional, Mapping, Any, MutableMapping, Union
+if TYPE_CHECKING:
+    from os import PathLike
+
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from dataclasses import dataclass
+
+from .token import Token
+from ..util.file_lock import lock_file, unlock_file
+
+
+def make_token_store_key(client_id: str, grant: Mapping[str, str]) -> str:
+    """Return a key that identifies tokens obtained by a client with a grant.
+
+    The key is a digest, so that credentials in the grant are not written out as keys.
+    """
+    material = json.dumps([client_id, sorted(grant.items())])
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+@dataclass(repr=False, eq=False)
+class StoredToken:
+    token: Token
+    ("")
+    renewal_time: Optional[float]
+    ("""
+        The wall clock time (as returned by `time.time()`) at which the token
+        should be renewed, or `None` if the token does not expire.
+        """)
+
+
+class TokenStore:
+    def load(self, key: str) -> Optional[StoredToken]:
+        """Return the token saved under `key`, or `None` if there isn't one."""
+        raise NotImplementedError
+
+    def save(self, key: str, value: StoredToken) -> None:
+        """Save a token under `key`, replacing any token already saved under it."""
+        raise NotImplementedError
+
+
+class MemoryTokenStore(TokenStore):
+    def __init__(self) -> None:
+        self._data: MutableMapping[str, StoredToken] = {}
+
+    def load(self, key: str) -> Optional[StoredToken]:
+        return self._data.get(key)
+
+    def save(self, key: str, value: StoredToken) -> None:
+        self._data[key] = value
+
+
+def _dump_stored_token(value: StoredToken) -> Mapping[str, Any]:
+    tk = value.token
+    return {
+        'token': {
+            'access_token': tk.access_token,
+            'token_type': tk.token_type,
+            'expires_in': tk.expires_in,
+            'refresh_token': tk.refresh_token,
+            'scope': tk.scope,
+        },
+        'data': dict(tk.d),
+        'renewal_time': value.renewal_time,
+    }
+
+def _load_stored_token(d: Mapping[str, Any]) -> StoredToken:
+    token = Token(**d['token'], d=d['data'])
+    return StoredToken(token=token, renewal_time=d['renewal_time'])
+
+
+class FileTokenStore(TokenStore):
+    """Keep tokens in a JSON file that can be shared between processes.
+
+    Writers take an exclusive lock on a companion `.lock` file and replace the
+    token file atomically, so concurrent writers don't lose each other's
+    updates and readers never see a partially written file. The file is created
+    readable by the owner only, as it contains credentials.
+    """
+
+    def __init__(self, path: Union[str, PathLike[str]]) -> None:
+        self.path: str = os.fspath(path)
+        ("")
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> Optional[StoredToken]:
+        d = self._read().get(key)
+        if d is None:
+            return None
+        try:
+            return _load_stored_token(d)
+        except (KeyError, TypeError):
+            return None
+
+    def save(self, key: str, value: StoredToken) -> None:
+        with self._lock:
+            fd = os.open(self.path + '.lock', os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                lock_file(fd)
+                try:
+                    data = self._read()
+                    data[key] = _dump_stored_token(value)
+                    self._write(data)
+                finally:
+                    unlock_file(fd)
+            finally:
+                os.close(fd)
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            with open(self.path, encoding='utf-8') as fh:
+                data = json.load(fh)
+        except (FileNotFoundError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return data
+
+    def _write(self, data: Mapping[str, Any]) -> None:
+        dirname = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=dirname, prefix='.tmp-', suffix='.json')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as fh:
+                json.dump(data, fh)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -1,6 +1,6 @@
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, TypeVar, Optional, Mapping, Union, Callable, overload
+from typing import TYPE_CHECKING, Any, TypeVar, Optional, Mapping, Union, Callable, ContextManager, overload
 if TYPE_CHECKING:
     from types import TracebackType
     from .auth.types import AuthorizationGrant
@@ -8,6 +8,8 @@ if TYPE_CHECKING:
     from .http.payload import Payload
     from .core.http_client_SYNC import HTTPClient
     from .types import JSON_ro
+    from .core.warm_up import WarmUpReport
+    from .core.accounting import Accounting
 
 from .auth import Token
 from .auth import grants
@@ -17,6 +19,7 @@ from .core.http_client_SYNC import (
     build_reddit_http_client,
     build_reddit_http_client_from_access_token,
 )
+from .core.accounting import having_accounting
 from .exceptions import raise_for_reddit_error, raise_for_non_json_response
 from .http.util.json_loading import load_json_from_response
 from .util.redditwarp_installed_client_credentials import get_redditwarp_client_id, get_device_id
@@ -172,6 +175,7 @@ class Client:
         timeout: float = -2,
         follow_redirects: Optional[bool] = None,
         snub: Optional[Callable[[JSON_ro], None]] = raise_for_reddit_error,
+        loads: Optional[Callable[[bytes], Any]] = None,
     ) -> Any:
         """Make an API request and return JSON data.
 
@@ -184,6 +188,9 @@ class Client:
         if you implement an API endpoint and know the structure of the errors,
         but the default snub function covers most Reddit API error structures.
 
+        The `loads` function decodes the response body in place of the default
+        JSON decoder. It must raise `ValueError` if the body is not JSON.
+
         This method is only appropriate for making calls to the Reddit API
         and not any other website because of the domain specific post processing
         that happens with the response data.
@@ -212,7 +219,7 @@ class Client:
 
             if resp.data:
                 try:
-                    json_data = load_json_from_response(resp)
+                    json_data = load_json_from_response(resp) if loads is None else loads(resp.data)
                 except ValueError as cause:
                     try:
                         raise_for_non_json_response(resp)
@@ -228,6 +235,24 @@ class Client:
             self.last_value = json_data
         return json_data
 
+    def warm_up(self) -> WarmUpReport:
+        """Obtain a token and open connections ahead of the first request.
+
+        See :meth:`RedditHTTPClient.warm_up() <redditwarp.core.http_client_SYNC.RedditHTTPClient.warm_up>`.
+        """
+        http = self.http
+        if not isinstance(http, RedditHTTPClient):
+            raise RuntimeError(f"self.http must be {RedditHTTPClient.__name__}")
+        return http.warm_up()
+
+    def accounting(self, name: str = '') -> ContextManager[Accounting]:
+        """Return a context manager that tallies the cost of requests made within it.
+
+        Requests are tallied by the `self.p` procedure that made them.
+        See :mod:`redditwarp.core.accounting`.
+        """
+        return having_accounting(name)
+
     def set_access_token(self, access_token: str) -> None:
         """Manually set the current access token."""
         http = self.http
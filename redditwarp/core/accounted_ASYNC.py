@@ -0,0 +1,32 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from ..http.send_params import SendParams
+    from ..http.exchange import Exchange
+
+import time
+
+from ..http.delegating_handler_ASYNC import DelegatingHandler
+from .accounting import Charge, accounting_var, charge_var, get_procedure_name
+
+class Accounted(DelegatingHandler):
+    """Charge requests to the accounting scope of the current context.
+
+    Nothing is done unless an accounting scope is open.
+    See :mod:`redditwarp.core.accounting`.
+    """
+
+    async def _send(self, p: SendParams) -> Exchange:
+        accounting = accounting_var.get()
+        if accounting is None:
+            return await super()._send(p)
+
+        procedure = get_procedure_name(p.requisition.url)
+        charge = Charge(procedure, accounting)
+        token = charge_var.set(charge)
+        start = time.monotonic()
+        try:
+            return await super()._send(p)
+        finally:
+            charge.add(requests=1, wall_time=time.monotonic() - start)
+            charge_var.reset(token)
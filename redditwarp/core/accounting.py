@@ -0,0 +1,353 @@
+"""Attribute the cost of requests to the procedures that made them.
+
+High-level calls can hide how many requests they make. A comment tree fetch
+followed by the expansion of its `MoreComments` nodes, or a bulk fetch over a
+long list of IDs, can each turn into dozens of requests. An accounting scope
+tallies the requests made within it by the `client.p.*` procedure that made
+them::
+
+    with client.accounting() as acct:
+        tree_node = client.p.comment_tree.fetch(submission_id)
+        ...
+    print(acct.format_report())
+
+The scope is held in a context variable, so it covers every request made
+within the block, including those made by paginators and iterators, and
+those made by other threads or tasks started with a copy of the context.
+Scopes nest. A request is charged to the scope it was made in and to each of
+that scope's enclosing scopes, so a scope per job inside a scope for the
+whole run shows both the per-job and the overall cost.
+
+A request's procedure is held in a context variable. The procedure objects
+under `client.p` are tagged when they are created (see :func:`tag_procedures`),
+so each public method sets the variable to its path under `client.p`
+(e.g., `p.submission.fetch.by_id`) for the duration of the call. The
+outermost procedure wins when one procedure calls another. Paginators and
+call chunk iterators remember the procedure that created them, and charge
+the requests they make later to it. Pages fetched by paginators created
+outside of a procedure are named by the paginator class
+(e.g., `HotListingPaginator.fetch`). Requests made with no procedure, such
+as those made directly with
+:meth:`Client.request() <redditwarp.client_SYNC.Client.request>`, are named
+by their endpoint template.
+
+Rate limit units and bytes are only charged for requests sent to the Reddit
+API through the rate limiter. Requests served from the response cache or
+shared with a coalesced request are counted but cost no units.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional, Iterator, ContextManager, MutableMapping, MutableSequence, Sequence, TypeVar, Callable, Any, MutableSet
+if TYPE_CHECKING:
+    from types import TracebackType
+
+import time
+import threading
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from functools import cached_property, wraps
+from types import FunctionType
+
+from .metrics import get_endpoint_template
+
+
+@dataclass(repr=False, eq=False)
+class AccountingEntry:
+    requests: int = 0
+    ("""
+        The number of requests made.
+        """)
+    units: int = 0
+    ("""
+        The number of rate limit units spent.
+        """)
+    bytes_sent: int = 0
+    ("""
+        The number of request body bytes sent to the Reddit API.
+        """)
+    bytes_received: int = 0
+    ("""
+        The number of response body bytes received from the Reddit API.
+        """)
+    wall_time: float = 0.
+    ("""
+        The total number of seconds spent in requests, including time spent
+        waiting for the rate limiter.
+        """)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} (requests={self.requests}, units={self.units},"
+            f" bytes_sent={self.bytes_sent}, bytes_received={self.bytes_received},"
+            f" wall_time={self.wall_time:.3f})>"
+        )
+
+
+class Accounting:
+    """The requests made within an accounting scope, tallied by procedure."""
+
+    def __init__(self, name: str = '', parent: Optional[Accounting] = None) -> None:
+        self.name: str = name
+        ("")
+        self.parent: Optional[Accounting] = parent
+        ("""
+            The enclosing scope, if any.
+            """)
+        self.children: MutableSequence[Accounting] = []
+        ("""
+            The scopes that were opened within this one.
+            """)
+        self.entries: MutableMapping[str, AccountingEntry] = {}
+        ("""
+            The tallies of this scope and its inner scopes, by procedure name.
+            """)
+        self.elapsed: float = 0.
+        ("""
+            The number of seconds the scope was open for.
+
+            Value is updated when the scope is exited.
+            """)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} name={self.name!r} entries={len(self.entries)}>"
+
+    def add(self,
+        procedure: str,
+        *,
+        requests: int = 0,
+        units: int = 0,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+        wall_time: float = 0.,
+    ) -> None:
+        with self._lock:
+            entry = self.entries.get(procedure)
+            if entry is None:
+                entry = self.entries[procedure] = AccountingEntry()
+            entry.requests += requests
+            entry.units += units
+            entry.bytes_sent += bytes_sent
+            entry.bytes_received += bytes_received
+            entry.wall_time += wall_time
+
+    def get_total(self) -> AccountingEntry:
+        """Return the sum of all entries."""
+        total = AccountingEntry()
+        with self._lock:
+            for entry in self.entries.values():
+                total.requests += entry.requests
+                total.units += entry.units
+                total.bytes_sent += entry.bytes_sent
+                total.bytes_received += entry.bytes_received
+                total.wall_time += entry.wall_time
+        return total
+
+    def format_report(self) -> str:
+        """Return the entries as a text table, most costly first."""
+        with self._lock:
+            items = sorted(
+                self.entries.items(),
+                key=lambda kv: (kv[1].units, kv[1].requests, kv[1].wall_time),
+                reverse=True,
+            )
+        rows = [('procedure', 'requests', 'units', 'sent', 'received', 'time')]
+        for procedure, entry in (*items, ('(total)', self.get_total())):
+            rows.append((
+                procedure,
+                str(entry.requests),
+                str(entry.units),
+                str(entry.bytes_sent),
+                str(entry.bytes_received),
+                f"{entry.wall_time:.3f}",
+            ))
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        return '\n'.join(
+            '  '.join(
+                cell.ljust(width) if i == 0 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(row, widths))
+            ).rstrip()
+            for row in rows
+        )
+
+
+class Charge:
+    """The procedure that a request is charged to, and the scopes that are charged."""
+
+    def __init__(self, procedure: str, accounting: Accounting) -> None:
+        self.procedure: str = procedure
+        ("")
+        scopes: MutableSequence[Accounting] = []
+        acct: Optional[Accounting] = accounting
+        while acct is not None:
+            scopes.append(acct)
+            acct = acct.parent
+        self.scopes: Sequence[Accounting] = scopes
+        ("""
+            The scope the request was made in, followed by its enclosing scopes.
+            """)
+
+    def add(self,
+        *,
+        requests: int = 0,
+        units: int = 0,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+        wall_time: float = 0.,
+    ) -> None:
+        for acct in self.scopes:
+            acct.add(
+                self.procedure,
+                requests=requests,
+                units=units,
+                bytes_sent=bytes_sent,
+                bytes_received=bytes_received,
+                wall_time=wall_time,
+            )
+
+
+accounting_var: ContextVar[Optional[Accounting]] = ContextVar('accounting', default=None)
+charge_var: ContextVar[Optional[Charge]] = ContextVar('charge', default=None)
+
+def get_accounting() -> Optional[Accounting]:
+    """Return the innermost accounting scope of the current context."""
+    return accounting_var.get()
+
+def having_accounting(name: str = '') -> ContextManager[Accounting]:
+    """Return a context manager that opens an accounting scope.
+
+    The scope is nested in the current scope, if there is one.
+    """
+    return _having_accounting(name)
+
+@contextmanager
+def _having_accounting(name: str) -> Iterator[Accounting]:
+    parent = accounting_var.get()
+    acct = Accounting(name, parent)
+    if parent is not None:
+        with parent._lock:
+            parent.children.append(acct)
+    token = accounting_var.set(acct)
+    start = time.monotonic()
+    try:
+        yield acct
+    finally:
+        acct.elapsed = time.monotonic() - start
+        accounting_var.reset(token)
+
+
+procedure_var: ContextVar[str] = ContextVar('procedure', default='')
+
+def get_procedure_name(url: str) -> str:
+    """Name the procedure that a request to `url` is charged to.
+
+    This is the procedure of the current context, or the endpoint template
+    of `url` if there is none.
+    """
+    return procedure_var.get() or get_endpoint_template(url)
+
+class _ProcedureContextManager(ContextManager[None]):
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._token: Optional[Token[str]] = None
+
+    def __enter__(self) -> None:
+        if self._name and not procedure_var.get():
+            self._token = procedure_var.set(self._name)
+
+    def __exit__(self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> Optional[bool]:
+        if self._token is not None:
+            procedure_var.reset(self._token)
+            self._token = None
+        return None
+
+def having_procedure(name: str) -> ContextManager[None]:
+    """Return a context manager that charges the requests made within it to procedure `name`.
+
+    It has no effect if a procedure is already set, so that requests are
+    charged to the outermost procedure.
+    """
+    return _ProcedureContextManager(name)
+
+
+_SITEPROCS_PACKAGE = 'redditwarp.siteprocs.'
+
+T = TypeVar('T')
+
+def tag_procedures(procs: T, name: str) -> T:
+    """Tag the public methods of a procedure object, and of the procedure objects it holds, with their names.
+
+    Each public method is replaced, on the instance, with a wrapper that calls
+    it within :func:`having_procedure`. The name of a method is its attribute
+    path from `procs`, prefixed by `name`.
+
+    .. .PARAMETERS
+
+    :param `T` procs:
+        A procedure object, such as `SubmissionProcedures`.
+    :param `str` name:
+        The path to `procs` under the client, e.g. `p.submission`.
+
+    .. .RETURNS
+
+    :returns: `procs`, for convenience.
+    """
+    _tag_procedures(procs, name, set())
+    return procs
+
+def _tag_procedures(procs: object, name: str, seen: MutableSet[int]) -> None:
+    if id(procs) in seen:
+        return
+    seen.add(id(procs))
+
+    cls = type(procs)
+    for attr in dir(cls):
+        if attr.startswith('_'):
+            continue
+        value = inspect.getattr_static(cls, attr)
+        if isinstance(value, cached_property):
+            # Make the nested procedure object now, so it's tagged below.
+            getattr(procs, attr)
+        elif isinstance(value, FunctionType):
+            setattr(procs, attr, _wrap_procedure(getattr(procs, attr), f"{name}.{attr}"))
+
+    for attr, value in list(vars(procs).items()):
+        if not attr.startswith('_') and type(value).__module__.startswith(_SITEPROCS_PACKAGE):
+            _tag_procedures(value, f"{name}.{attr}", seen)
+
+    if callable(procs):
+        # `__call__` is looked up on the type, so it can't be replaced on the instance.
+        procs.__class__ = _get_tagged_class(cls, name)
+
+def _wrap_procedure(fn: Callable[..., Any], name: str) -> Callable[..., Any]:
+    if inspect.iscoroutinefunction(fn):
+        @wraps(fn)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            with having_procedure(name):
+                return await fn(*args, **kwargs)
+        return async_wrapper
+
+    @wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with having_procedure(name):
+            return fn(*args, **kwargs)
+    return wrapper
+
+_tagged_classes: MutableMapping[tuple[type, str], type] = {}
+
+def _get_tagged_class(cls: type, name: str) -> type:
+    key = (cls, name)
+    tagged = _tagged_classes.get(key)
+    if tagged is None:
+        tagged = _tagged_classes[key] = type(cls.__name__, (cls,), {
+            '__call__': _wrap_procedure(cls.__call__, name),  # type: ignore[operator]
+            '__module__': cls.__module__,
+            '__qualname__': cls.__qualname__,
+        })
+    return tagged
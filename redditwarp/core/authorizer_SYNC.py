@@ -10,8 +10,12 @@ if TYPE_CHECKING:
     from ..http.exchange import Exchange
 
 import time
+import hashlib
+import threading
 
 from ..http.delegating_handler_SYNC import DelegatingHandler
+from ..http.response_stream_SYNC import StreamingResponse
+from ..auth.token_store import TokenStore, StoredToken, make_token_store_key
 from ..auth.exceptions import (
     UnknownTokenType,
     extract_www_authenticate_auth_params,
@@ -58,6 +62,10 @@ class Authorizer:
         ("""
             Name of the `Authorization` header. Use this attribute to change its capitalization.
             """)
+        self.token_store: Optional[TokenStore] = None
+        ("""
+            Where tokens are saved for reuse by other processes. See :mod:`redditwarp.auth.token_store`.
+            """)
 
     def has_token_client(self) -> bool:
         return self.token_client is not None
@@ -110,6 +118,8 @@ class Authorizer:
         else:
             self.renewal_time = self.time() + expires_in - self.renewal_skew
 
+        self.save_token()
+
         if tk.refresh_token:
             grant1 = tc.grant
             if (
@@ -118,6 +128,59 @@ class Authorizer:
             ):
                 tc.grant = {**grant1, 'refresh_token': tk.refresh_token}
 
+    def get_token_store_key(self) -> str:
+        """Return the key under which tokens are saved in the token store."""
+        tc = self.fetch_token_client()
+        return make_token_store_key(tc.client_creds[0], tc.grant)
+
+    def get_identity_key(self) -> str:
+        """Return a key that identifies who requests are authorized as.
+
+        Tokens obtained by the same client with the same grant share a key.
+        """
+        if self.has_token_client():
+            return self.get_token_store_key()
+        return hashlib.sha256(self.fetch_token().access_token.encode()).hexdigest()
+
+    def load_token(self) -> bool:
+        """Take a token from the token store (:attr:`token_store`) if it has a usable one.
+
+        A stored token is used if it is not due for renewal and is different
+        from the current token. Return true if a token was loaded.
+        """
+        store = self.token_store
+        if store is None or not self.has_token_client():
+            return False
+        stored = store.load(self.get_token_store_key())
+        if stored is None:
+            return False
+        tk = stored.token
+        if self.token is not None and tk.access_token == self.token.access_token:
+            return False
+
+        renewal_time = None
+        if stored.renewal_time is not None:
+            remaining = stored.renewal_time - time.time()
+            if remaining <= 0:
+                return False
+            renewal_time = self.time() + remaining
+
+        self.set_token(tk)
+        self.renewal_time = renewal_time
+        return True
+
+    def save_token(self) -> None:
+        """Save the current token to the token store (:attr:`token_store`), if one is set."""
+        store = self.token_store
+        if store is None or not self.has_token_client():
+            return
+        renewal_time = self.renewal_time
+        if renewal_time is not None:
+            # The renewal time is measured with `self.time()`, which might
+            # not be comparable between processes. Store the wall clock time.
+            renewal_time = time.time() + renewal_time - self.time()
+        store.save(self.get_token_store_key(), StoredToken(self.fetch_token(), renewal_time))
+
     def time(self) -> float:
         """Return the current internal time. This is used for :attr:`renewal_time`."""
         return self.time_func()
@@ -135,7 +198,7 @@ class Authorizer:
         return self.has_token_client()
 
     def attain_token(self) -> Token:
-        if self.should_renew_token():
+        if self.should_renew_token() and not self.load_token():
             self.renew_token()
         return self.fetch_token()
 
@@ -154,29 +217,113 @@ class Authorizer:
 
 
 class Authorized(DelegatingHandler):
-    """Used to make requests to endpoints that require authorization."""
+    """Used to make requests to endpoints that require authorization.
+
+    Concurrent requests that find the token expired, or rejected, wait on a
+    single token renewal.
+    """
 
     def __init__(self, handler: Handler, authorizer: Authorizer) -> None:
         super().__init__(handler)
         self.authorizer: Authorizer = authorizer
         ("")
+        self.background_renewal: bool = True
+        ("""
+            Renew the token in a background thread before it is due to be renewed
+            so that requests don't have to wait on the token endpoint.
+
+            The background renewal is scheduled for :attr:`Authorizer.renewal_skew`
+            seconds before :attr:`Authorizer.renewal_time`. If it fails, the token
+            is renewed by the next request made after the renewal time.
+            """)
+        self._lock = threading.Lock()
+        self._timer_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._timer_renewal_time: Optional[float] = None
+
+    def ensure_token(self) -> None:
+        """Obtain a token now if one is needed.
+
+        The renewal is shared with concurrent requests in the same way as a
+        renewal started by a request.
+        """
+        authorizer = self.authorizer
+        if authorizer.should_renew_token():
+            self._renew_token(authorizer.token)
 
     def _send(self, p: SendParams) -> Exchange:
         authorizer = self.authorizer
+        renewal_time = 0.
         if authorizer.should_renew_token():
-            authorizer.renew_token()
+            start = time.monotonic()
+            self._renew_token(authorizer.token)
+            renewal_time += time.monotonic() - start
+        self._schedule_background_renewal()
 
+        used_token = authorizer.fetch_token()
         authorizer.prepare_requisition(p.requisition)
         xchg = super()._send(p)
         auth_params = extract_www_authenticate_auth_params(xchg.response)
 
         invalid_token = auth_params.get('error', '') == 'invalid_token'
         if invalid_token and authorizer.can_renew_token():
-            authorizer.renew_token()
+            self._discard(xchg)
+            start = time.monotonic()
+            self._renew_token(used_token)
+            renewal_time += time.monotonic() - start
+
             authorizer.prepare_requisition(p.requisition)
             xchg = super()._send(p)
             auth_params = extract_www_authenticate_auth_params(xchg.response)
 
-        raise_for_resource_server_response_error(auth_params)
+        try:
+            raise_for_resource_server_response_error(auth_params)
+        except Exception:
+            self._discard(xchg)
+            raise
 
+        xchg.timings.token_renewal = renewal_time
         return xchg
+
+    def _discard(self, xchg: Exchange) -> None:
+        # Release the connection of a streamed response that won't be returned.
+        resp = xchg.response
+        if isinstance(resp, StreamingResponse):
+            resp.stream.close()
+
+    def _close(self) -> None:
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        super()._close()
+
+    def _renew_token(self, stale_token: Optional[Token]) -> None:
+        """Renew the token unless it was already renewed since `stale_token` was observed."""
+        with self._lock:
+            authorizer = self.authorizer
+            if authorizer.token is stale_token and not authorizer.load_token():
+                authorizer.renew_token()
+
+    def _schedule_background_renewal(self) -> None:
+        authorizer = self.authorizer
+        renewal_time = authorizer.renewal_time
+        if not self.background_renewal or renewal_time is None or not authorizer.can_renew_token():
+            return
+        with self._timer_lock:
+            if renewal_time == self._timer_renewal_time:
+                return
+            if self._timer is not None:
+                self._timer.cancel()
+            delay = max(0, renewal_time - authorizer.renewal_skew - authorizer.time())
+            self._timer_renewal_time = renewal_time
+            self._timer = threading.Timer(delay, self._run_background_renewal, (authorizer.token,))
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _run_background_renewal(self, stale_token: Optional[Token]) -> None:
+        try:
+            self._renew_token(stale_token)
+        except Exception:
+            # Left to be retried inline by the next request.
+            pass
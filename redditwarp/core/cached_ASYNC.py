@@ -0,0 +1,76 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable
+if TYPE_CHECKING:
+    from ..http.handler_ASYNC import Handler
+    from ..http.send_params import SendParams
+    from ..http.requisition import Requisition
+
+from ..http.delegating_handler_ASYNC import DelegatingHandler
+from ..http.exchange import Exchange
+from .response_cache import ResponseCache, vary_by_authorization_header
+
+class Cached(DelegatingHandler):
+    """Serve GET requests from a response cache.
+
+    Streamed requests bypass the cache.
+
+    An exchange for a fresh cache hit has empty timings, so its
+    `timings.started_at` is `0`. A revalidated response keeps the timings
+    of the conditional request that revalidated it.
+
+    See :mod:`redditwarp.core.response_cache`.
+    """
+
+    def __init__(self,
+        handler: Handler,
+        cache: ResponseCache,
+        vary: Callable[[Requisition], str] = vary_by_authorization_header,
+    ) -> None:
+        super().__init__(handler)
+        self.cache: ResponseCache = cache
+        ("")
+        self.vary: Callable[[Requisition], str] = vary
+        ("""
+            Returns a string that identifies who the request is authorized as.
+            Responses are never shared between requests with different values.
+            """)
+
+    async def _send(self, p: SendParams) -> Exchange:
+        reqi = p.requisition
+        cache = self.cache
+        if reqi.verb != 'GET' or p.stream or not cache.rules:
+            return await super()._send(p)
+        ttl = cache.get_ttl(reqi.url)
+        if ttl is None:
+            return await super()._send(p)
+
+        key = cache.make_key(self.vary(reqi), reqi.url, reqi.params)
+        entry = cache.lookup(key)
+        if entry is not None:
+            if cache.is_fresh(entry):
+                cache.hits += 1
+                return Exchange(
+                    requisition=reqi,
+                    request=entry.request,
+                    response=entry.response,
+                    history=(),
+                )
+            reqi.headers.update(entry.get_conditional_headers())
+
+        xchg = await super()._send(p)
+        resp = xchg.response
+        if entry is not None and resp.status == 304:
+            cache.revalidations += 1
+            cache.renew(entry, ttl)
+            return Exchange(
+                requisition=reqi,
+                request=xchg.request,
+                response=entry.response,
+                history=xchg.history,
+                timings=xchg.timings,
+            )
+
+        cache.misses += 1
+        if resp.status == 200:
+            cache.store(key, xchg.request, resp, ttl)
+        return xchg
@@ -0,0 +1,250 @@
+"""Cassettes: recordings of HTTP exchanges that can be replayed without a network.
+
+A cassette is a list of :class:`CassetteEntry` objects. It is saved to disk as
+gzip-compressed JSON lines, one entry per line, after a header line.
+
+Record a cassette by passing it to the client builder, which places a
+:class:`~.cassette_SYNC.CassetteRecorder` at the bottom of the client's handler
+chain. Replay it with a :class:`~.cassette_SYNC.CassettePlayer`::
+
+    from redditwarp.core.cassette import Cassette
+    from redditwarp.core.cassette_SYNC import CassettePlayer
+    from redditwarp.core.http_client_SYNC import build_reddit_http_client
+
+    cassette = Cassette()
+    http = build_reddit_http_client(client_id, client_secret, grant, cassette=cassette)
+    ...
+    cassette.save('bot.cassette')
+
+    player = CassettePlayer(Cassette.load('bot.cassette'))
+    http = build_reddit_http_client(client_id, client_secret, grant, connector=player)
+
+Request bodies and request headers are not recorded. Access and refresh tokens
+in token server responses, and `Set-Cookie` response headers, are redacted.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Mapping, MutableMapping, MutableSequence, Sequence, Iterable, Hashable, Union, IO
+if TYPE_CHECKING:
+    from os import PathLike
+    from ..http.exchange import Exchange
+
+import gzip
+import json
+import base64
+import threading
+from dataclasses import dataclass
+
+FORMAT_VERSION: int = 1
+
+_REDACTED_TOKEN_FIELDS = ('access_token', 'refresh_token')
+_REDACTED_HEADERS = frozenset(('set-cookie',))
+
+
+class CassetteMiss(LookupError):
+    """No recorded exchange matches the request."""
+
+
+@dataclass(repr=False, eq=False)
+class CassetteEntry:
+    verb: str
+    ("")
+    url: str
+    ("")
+    params: Mapping[str, str]
+    ("")
+    status: int
+    ("")
+    headers: Mapping[str, str]
+    ("""
+        The response headers.
+        """)
+    data: bytes
+    ("""
+        The response body.
+        """)
+    elapsed: float = 0.
+    ("""
+        The number of seconds the original request took.
+        """)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} [{self.verb} {self.url} {self.status}]>"
+
+    def get_match_key(self) -> Hashable:
+        return make_match_key(self.verb, self.url, self.params)
+
+
+def make_match_key(verb: str, url: str, params: Mapping[str, str]) -> Hashable:
+    return (verb.upper(), url, tuple(sorted(params.items())))
+
+
+def _redact(data: bytes) -> bytes:
+    try:
+        obj = json.loads(data)
+    except ValueError:
+        return data
+    if not (isinstance(obj, dict) and any(k in obj for k in _REDACTED_TOKEN_FIELDS)):
+        return data
+    for k in _REDACTED_TOKEN_FIELDS:
+        if k in obj:
+            obj[k] = 'redacted'
+    return json.dumps(obj).encode()
+
+def make_cassette_entry(xchg: Exchange, elapsed: float = 0.) -> CassetteEntry:
+    reqi = xchg.requisition
+    resp = xchg.response
+    return CassetteEntry(
+        verb=reqi.verb,
+        url=reqi.url,
+        params=dict(reqi.params),
+        status=resp.status,
+        headers={k: 'redacted' if k.lower() in _REDACTED_HEADERS else v for k, v in resp.headers.items()},
+        data=_redact(resp.data),
+        elapsed=elapsed,
+    )
+
+
+def _dump_entry(entry: CassetteEntry) -> str:
+    d: dict[str, object] = {
+        'v': entry.verb,
+        'u': entry.url,
+        'p': entry.params,
+        's': entry.status,
+        'h': entry.headers,
+        't': round(entry.elapsed, 6),
+    }
+    try:
+        d['b'] = entry.data.decode()
+    except UnicodeDecodeError:
+        d['b64'] = base64.b64encode(entry.data).decode()
+    return json.dumps(d, separators=(',', ':'))
+
+def _load_entry(line: str) -> CassetteEntry:
+    d = json.loads(line)
+    data = base64.b64decode(d['b64']) if 'b64' in d else d['b'].encode()
+    return CassetteEntry(
+        verb=d['v'],
+        url=d['u'],
+        params=d['p'],
+        status=d['s'],
+        headers=d['h'],
+        data=data,
+        elapsed=d.get('t', 0.),
+    )
+
+
+class Cassette:
+    """An ordered collection of recorded exchanges.
+
+    Entries are looked up by verb, URL, and query parameters. When a request
+    has been recorded more than once, its entries are served in the order
+    they were recorded. Once they run out, the last one is served again,
+    unless :attr:`allow_repeats` is false.
+    """
+
+    @property
+    def entries(self) -> Sequence[CassetteEntry]:
+        """The recorded entries, in the order they were recorded."""
+        return self._entries
+
+    def __init__(self, entries: Iterable[CassetteEntry] = ()) -> None:
+        self.allow_repeats: bool = True
+        ("")
+        self._lock = threading.Lock()
+        self._entries: MutableSequence[CassetteEntry] = []
+        self._index: MutableMapping[Hashable, MutableSequence[CassetteEntry]] = {}
+        self._positions: MutableMapping[Hashable, int] = {}
+        for entry in entries:
+            self.add(entry)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, entry: CassetteEntry) -> None:
+        with self._lock:
+            self._entries.append(entry)
+            self._index.setdefault(entry.get_match_key(), []).append(entry)
+
+    def find(self, verb: str, url: str, params: Mapping[str, str]) -> CassetteEntry:
+        """Return the next recorded entry for a request.
+
+        .. .RAISES
+
+        :raises CassetteMiss:
+            The request was not recorded, or its entries have been used up.
+        """
+        key = make_match_key(verb, url, params)
+        with self._lock:
+            matches = self._index.get(key)
+            if not matches:
+                raise CassetteMiss(f"{verb} {url}")
+            i = self._positions.get(key, 0)
+            if i >= len(matches):
+                if not self.allow_repeats:
+                    raise CassetteMiss(f"{verb} {url} (all {len(matches)} recordings used)")
+                i = len(matches) - 1
+            self._positions[key] = i + 1
+            return matches[i]
+
+    def rewind(self) -> None:
+        """Serve every request's entries from the start again."""
+        with self._lock:
+            self._positions.clear()
+
+    def dump(self, file: IO[str]) -> None:
+        file.write(json.dumps({'cassette': FORMAT_VERSION}) + '\n')
+        with self._lock:
+            for entry in self._entries:
+                file.write(_dump_entry(entry) + '\n')
+
+    def save(self, path: Union[str, PathLike[str]]) -> None:
+        """Write the cassette to a gzip-compressed file."""
+        with gzip.open(path, 'wt', encoding='utf-8') as fh:
+            self.dump(fh)
+
+    @classmethod
+    def parse(cls, file: IO[str]) -> Cassette:
+        header = json.loads(file.readline() or '{}')
+        version = header.get('cassette')
+        if version != FORMAT_VERSION:
+            raise ValueError(f"unsupported cassette format version: {version!r}")
+        return cls(_load_entry(line) for line in file if line.strip())
+
+    @classmethod
+    def load(cls, path: Union[str, PathLike[str]]) -> Cassette:
+        """Read a cassette written by :meth:`save`."""
+        with gzip.open(path, 'rt', encoding='utf-8') as fh:
+            return cls.parse(fh)
+
+
+class SimulatedRateLimit:
+    """Generate `x-ratelimit-*` response headers the way the Reddit API does."""
+
+    def __init__(self, *, limit: int = 1000, window_length: float = 600) -> None:
+        self.limit: int = limit
+        ("""
+            The number of requests allowed per window.
+            """)
+        self.window_length: float = window_length
+        ("""
+            The length of a rate limit window, in seconds.
+            """)
+        self._lock = threading.Lock()
+        self._window_end: float = float('-inf')
+        self._used: int = 0
+
+    def get_headers(self, now: float) -> Mapping[str, str]:
+        """Count one request made at time `now` and return the headers for its response."""
+        with self._lock:
+            if now >= self._window_end:
+                self._window_end = now + self.window_length
+                self._used = 0
+            self._used += 1
+            used = self._used
+            reset = int(self._window_end - now)
+        return {
+            'x-ratelimit-used': str(used),
+            'x-ratelimit-remaining': f"{max(0, self.limit - used):.1f}",
+            'x-ratelimit-reset': str(reset),
+        }
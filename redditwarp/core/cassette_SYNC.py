@@ -0,0 +1,110 @@
+"""Handlers that record exchanges to, and replay them from, a cassette.
+
+See :mod:`redditwarp.core.cassette`.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional, Callable
+if TYPE_CHECKING:
+    from ..http.handler_SYNC import Handler
+    from ..http.send_params import SendParams
+
+import time
+
+from ..http.connector_SYNC import Connector
+from ..http.exchange import Exchange
+from ..http.timings import Timings
+from ..http.request import Request
+from ..http.response import Response
+from ..http.util.case_insensitive_dict import CaseInsensitiveDict
+from ..http.util.merge_query_params import merge_query_params
+from .recorded_SYNC import Recorded
+from .cassette import Cassette, SimulatedRateLimit, make_cassette_entry, FORMAT_VERSION
+
+class CassetteRecorder(Recorded):
+    """Record every exchange that passes through to a cassette.
+
+    Unlike :class:`~.recorded_SYNC.Recorded`, which only keeps the most recent
+    exchanges, every successful exchange is kept. Save the cassette to disk
+    with `self.cassette.save()`. Exchanges with streamed response bodies are
+    not recorded.
+    """
+
+    def __init__(self, handler: Handler, cassette: Optional[Cassette] = None) -> None:
+        super().__init__(handler)
+        self.cassette: Cassette = Cassette() if cassette is None else cassette
+        ("")
+
+    def _send(self, p: SendParams) -> Exchange:
+        start = time.monotonic()
+        xchg = super()._send(p)
+        if not p.stream:
+            self.cassette.add(make_cassette_entry(xchg, time.monotonic() - start))
+        return xchg
+
+
+class CassettePlayer(Connector):
+    """A connector that serves responses from a cassette instead of the network.
+
+    .. .RAISES
+
+    :raises redditwarp.core.cassette.CassetteMiss:
+        The request was not recorded on the cassette.
+    """
+
+    def __init__(self,
+        cassette: Cassette,
+        *,
+        latency: float = 0,
+        latency_scale: float = 0,
+        rate_limit: Optional[SimulatedRateLimit] = None,
+    ) -> None:
+        super().__init__()
+        self.cassette: Cassette = cassette
+        ("")
+        self.latency: float = latency
+        ("""
+            A number of seconds to wait before each response.
+            """)
+        self.latency_scale: float = latency_scale
+        ("""
+            A multiplier of each entry's recorded duration to wait before responding.
+
+            Set to `1` to replay at the recorded speed. The wait is added to :attr:`latency`.
+            """)
+        self.rate_limit: Optional[SimulatedRateLimit] = rate_limit
+        ("""
+            If set, responses carry simulated `x-ratelimit-*` headers in place of the recorded ones.
+            """)
+        self.time_func: Callable[[], float] = time.monotonic
+        ("")
+
+    def _send(self, p: SendParams) -> Exchange:
+        reqi = p.requisition
+        entry = self.cassette.find(reqi.verb, reqi.url, reqi.params)
+
+        started_at = time.time()
+        delay = self.latency + self.latency_scale * entry.elapsed
+        if delay > 0:
+            time.sleep(delay)
+
+        headers = CaseInsensitiveDict(entry.headers)
+        if self.rate_limit is not None:
+            headers.update(self.rate_limit.get_headers(self.time_func()))
+
+        return Exchange(
+            requisition=reqi,
+            request=Request(
+                verb=reqi.verb,
+                url=merge_query_params(reqi.url, reqi.params),
+                headers=dict(reqi.headers),
+                data=b'',
+            ),
+            response=Response(status=entry.status, headers=headers, data=entry.data),
+            history=(),
+            timings=Timings(started_at=started_at, transport=delay),
+        )
+
+
+name: str = 'redditwarp-cassette'
+version: str = str(FORMAT_VERSION)
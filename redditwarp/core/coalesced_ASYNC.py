@@ -0,0 +1,80 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable, MutableMapping, Hashable
+if TYPE_CHECKING:
+    from ..http.handler_ASYNC import Handler
+    from ..http.send_params import SendParams
+    from ..http.requisition import Requisition
+
+from ..util.imports import lazy_import
+if TYPE_CHECKING:
+    import asyncio
+else:
+    lazy_import % 'asyncio'
+
+from ..http.delegating_handler_ASYNC import DelegatingHandler
+from ..http.exchange import Exchange
+from .response_cache import vary_by_authorization_header
+from .coalescing import make_coalescing_key, copy_exception
+
+class Coalesced(DelegatingHandler):
+    """Let identical concurrent GET requests share one response.
+
+    While a GET request is in flight, an identical request (same URL, params,
+    headers, and authorization) waits for it to complete instead of being
+    sent. All the waiters receive the same response, or a copy of the same
+    exception.
+
+    Coalescing is off unless :attr:`enabled` is set. Streamed requests are
+    never coalesced.
+    """
+
+    def __init__(self,
+        handler: Handler,
+        vary: Callable[[Requisition], str] = vary_by_authorization_header,
+    ) -> None:
+        super().__init__(handler)
+        self.enabled: bool = False
+        ("")
+        self.vary: Callable[[Requisition], str] = vary
+        ("""
+            Returns a string that identifies who the request is authorized as.
+            Requests with different values are never coalesced.
+            """)
+        self.coalesced_count: int = 0
+        ("""
+            The number of requests that were not sent because they shared the
+            response of an identical in-flight request.
+            """)
+        self._flights: MutableMapping[Hashable, asyncio.Task[Exchange]] = {}
+
+    async def _send(self, p: SendParams) -> Exchange:
+        reqi = p.requisition
+        if not self.enabled or reqi.verb != 'GET' or reqi.payload is not None or p.stream:
+            return await super()._send(p)
+
+        key = make_coalescing_key(reqi, self.vary(reqi))
+        task = self._flights.get(key)
+        leader = task is None
+        if task is None:
+            task = asyncio.ensure_future(super()._send(p))
+            self._flights[key] = task
+            task.add_done_callback(lambda _: self._flights.pop(key, None))
+        else:
+            self.coalesced_count += 1
+
+        try:
+            # Shielded so that a cancelled waiter doesn't cancel the request for the others.
+            xchg = await asyncio.shield(task)
+        except Exception as e:
+            if leader:
+                raise
+            raise copy_exception(e) from e
+        if xchg.requisition is reqi:
+            return xchg
+        return Exchange(
+            requisition=reqi,
+            request=xchg.request,
+            response=xchg.response,
+            history=xchg.history,
+            timings=xchg.timings,
+        )
@@ -0,0 +1,91 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable, MutableMapping, Hashable, Optional
+if TYPE_CHECKING:
+    from ..http.handler_SYNC import Handler
+    from ..http.send_params import SendParams
+    from ..http.requisition import Requisition
+
+import threading
+
+from ..http.delegating_handler_SYNC import DelegatingHandler
+from ..http.exchange import Exchange
+from .response_cache import vary_by_authorization_header
+from .coalescing import make_coalescing_key, copy_exception
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.exchange: Optional[Exchange] = None
+        self.exception: Optional[BaseException] = None
+
+class Coalesced(DelegatingHandler):
+    """Let identical concurrent GET requests share one response.
+
+    While a GET request is in flight, an identical request (same URL, params,
+    headers, and authorization) made from another thread waits for it to
+    complete instead of being sent. All the waiters receive the same response,
+    or a copy of the same exception.
+
+    Coalescing is off unless :attr:`enabled` is set. Streamed requests are
+    never coalesced.
+    """
+
+    def __init__(self,
+        handler: Handler,
+        vary: Callable[[Requisition], str] = vary_by_authorization_header,
+    ) -> None:
+        super().__init__(handler)
+        self.enabled: bool = False
+        ("")
+        self.vary: Callable[[Requisition], str] = vary
+        ("""
+            Returns a string that identifies who the request is authorized as.
+            Requests with different values are never coalesced.
+            """)
+        self.coalesced_count: int = 0
+        ("""
+            The number of requests that were not sent because they shared the
+            response of an identical in-flight request.
+            """)
+        self._flights: MutableMapping[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def _send(self, p: SendParams) -> Exchange:
+        reqi = p.requisition
+        if not self.enabled or reqi.verb != 'GET' or reqi.payload is not None or p.stream:
+            return super()._send(p)
+
+        key = make_coalescing_key(reqi, self.vary(reqi))
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.coalesced_count += 1
+
+        if leader:
+            try:
+                flight.exchange = super()._send(p)
+            except BaseException as e:
+                flight.exception = e
+                raise
+            finally:
+                with self._lock:
+                    del self._flights[key]
+                flight.done.set()
+            return flight.exchange
+
+        flight.done.wait()
+        exc = flight.exception
+        if exc is not None:
+            raise copy_exception(exc) from exc
+        xchg = flight.exchange
+        assert xchg is not None
+        return Exchange(
+            requisition=reqi,
+            request=xchg.request,
+            response=xchg.response,
+            history=xchg.history,
+            timings=xchg.timings,
+        )
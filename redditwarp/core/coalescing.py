@@ -0,0 +1,27 @@
+"""Helpers shared by the sync and async `Coalesced` handlers."""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Hashable, TypeVar
+if TYPE_CHECKING:
+    from ..http.requisition import Requisition
+
+E = TypeVar('E', bound=BaseException)
+
+def make_coalescing_key(requisition: Requisition, vary: str) -> Hashable:
+    return (
+        vary,
+        requisition.url,
+        tuple(sorted(requisition.params.items())),
+        tuple(sorted((k.lower(), v) for k, v in requisition.headers.items())),
+    )
+
+def copy_exception(exc: E) -> E:
+    """Return a copy of an exception without its traceback.
+
+    A request's exception is re-raised to each of its waiters as a copy, chained
+    from the original, so that the waiters' tracebacks don't pile up on one object.
+    """
+    cls = type(exc)
+    new = cls.__new__(cls, *exc.args)
+    new.__dict__.update(vars(exc))
+    return new
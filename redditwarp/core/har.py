@@ -0,0 +1,374 @@
+"""Export exchanges as HTTP Archive (HAR) files.
+
+HAR files can be opened in the network panel of web browsers and in other
+HAR viewers to show each request on a waterfall chart. The phases of each
+exchange's :class:`~redditwarp.http.timings.Timings` are mapped onto HAR
+timings. Time spent waiting on the rate limiter and on token renewal shows as
+`blocked`, and is also reported separately in the `_rateLimitWait` and
+`_tokenRenewal` custom fields.
+
+Export the exchanges that the client remembers::
+
+    from redditwarp.core.har import HARArchive
+
+    HARArchive.from_exchanges(client.http.last.exchange_queue).save('session.har')
+
+Or record every exchange while a block runs with a
+:class:`~.har_SYNC.HARRecorder`. For long-running programs, a
+:class:`RollingHARFileWriter` writes entries to disk as they arrive and starts
+a new file once a file is full::
+
+    from redditwarp.core.har import RollingHARFileWriter
+    from redditwarp.core.har_SYNC import HARRecorder
+
+    with RollingHARFileWriter('bot.har', max_entries=1000, backup_count=5) as writer:
+        with client.http.having_additional_middleware(lambda h: HARRecorder(h, writer)):
+            run_bot()
+
+By default, `Authorization` and `Cookie` header values, and access tokens,
+refresh tokens, and passwords in request and response bodies are redacted.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Optional, Mapping, MutableSequence, Sequence, Iterable, Union, IO
+if TYPE_CHECKING:
+    from os import PathLike
+    from types import TracebackType
+    from ..http.exchange import Exchange
+
+import os
+import json
+import time
+import base64
+import threading
+from datetime import datetime, timezone
+from http import HTTPStatus
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+from .. import __about__
+
+HAR_VERSION: str = '1.2'
+
+REDACTED: str = 'redacted'
+
+_REDACTED_HEADERS = frozenset(('authorization', 'cookie', 'set-cookie'))
+_REDACTED_FIELDS = frozenset(('access_token', 'refresh_token', 'password', 'client_secret'))
+
+
+def _redact_body(data: bytes, media_type: str) -> bytes:
+    if 'json' in media_type or data[:1] == b'{':
+        try:
+            obj = json.loads(data)
+        except ValueError:
+            return data
+        if not (isinstance(obj, dict) and _REDACTED_FIELDS.intersection(obj)):
+            return data
+        for k in _REDACTED_FIELDS.intersection(obj):
+            obj[k] = REDACTED
+        return json.dumps(obj).encode()
+
+    if 'x-www-form-urlencoded' in media_type:
+        try:
+            pairs = parse_qsl(data.decode(), keep_blank_values=True)
+        except UnicodeDecodeError:
+            return data
+        if not any(k in _REDACTED_FIELDS for k, _ in pairs):
+            return data
+        return urlencode([(k, REDACTED if k in _REDACTED_FIELDS else v) for k, v in pairs]).encode()
+
+    return data
+
+def _make_name_value_list(headers: Mapping[str, str], redact: bool) -> Sequence[Mapping[str, str]]:
+    return [
+        {'name': k, 'value': REDACTED if redact and k.lower() in _REDACTED_HEADERS else v}
+        for k, v in headers.items()
+    ]
+
+def _get_media_type(headers: Mapping[str, str]) -> str:
+    for k, v in headers.items():
+        if k.lower() == 'content-type':
+            return v
+    return ''
+
+def _format_datetime(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat(timespec='milliseconds')
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+def make_har_entry(xchg: Exchange, *, redact: bool = True, include_bodies: bool = True) -> Mapping[str, Any]:
+    """Convert an exchange to a HAR entry object.
+
+    .. .PARAMETERS
+
+    :param `Exchange` xchg:
+    :param `bool` redact:
+        Redact credentials and tokens in headers and bodies.
+    :param `bool` include_bodies:
+        Include request and response bodies. The body sizes are always included.
+    """
+    requ = xchg.request
+    resp = xchg.response
+    tm = xchg.timings
+
+    blocked = tm.rate_limit_wait + tm.token_renewal
+    connect = -1. if tm.connect is None else tm.connect
+    if tm.ttfb is not None:
+        wait = tm.ttfb
+    elif tm.transport is not None:
+        wait = max(0., tm.transport - (tm.download or 0.) - max(0., connect))
+    else:
+        wait = 0.
+    receive = tm.download or 0.
+    started_at = (tm.started_at or time.time()) - blocked
+
+    request: dict[str, Any] = {
+        'method': requ.verb,
+        'url': requ.url,
+        'httpVersion': 'HTTP/1.1',
+        'cookies': [],
+        'headers': _make_name_value_list(requ.headers, redact),
+        'queryString': [
+            {'name': k, 'value': REDACTED if redact and k in _REDACTED_FIELDS else v}
+            for k, v in parse_qsl(urlsplit(requ.url).query, keep_blank_values=True)
+        ],
+        'headersSize': -1,
+        'bodySize': len(requ.data),
+    }
+    if requ.data:
+        media_type = _get_media_type(requ.headers)
+        text = ''
+        if include_bodies:
+            data = _redact_body(requ.data, media_type) if redact else requ.data
+            text = data.decode(errors='replace')
+        request['postData'] = {'mimeType': media_type, 'text': text}
+
+    resp_media_type = _get_media_type(resp.headers)
+    content: dict[str, Any] = {'size': len(resp.data), 'mimeType': resp_media_type}
+    if include_bodies:
+        data = _redact_body(resp.data, resp_media_type) if redact else resp.data
+        try:
+            content['text'] = data.decode()
+        except UnicodeDecodeError:
+            content['text'] = base64.b64encode(data).decode()
+            content['encoding'] = 'base64'
+
+    try:
+        status_text = HTTPStatus(resp.status).phrase
+    except ValueError:
+        status_text = ''
+
+    return {
+        'startedDateTime': _format_datetime(started_at),
+        'time': _ms(blocked + max(0., connect) + wait + receive),
+        'request': request,
+        'response': {
+            'status': resp.status,
+            'statusText': status_text,
+            'httpVersion': 'HTTP/1.1',
+            'cookies': [],
+            'headers': _make_name_value_list(resp.headers, redact),
+            'content': content,
+            'redirectURL': resp.headers.get('Location', ''),
+            'headersSize': -1,
+            'bodySize': len(resp.data),
+        },
+        'cache': {},
+        'timings': {
+            'blocked': _ms(blocked),
+            'dns': -1,
+            'connect': -1 if connect < 0 else _ms(connect),
+            'send': 0,
+            'wait': _ms(wait),
+            'receive': _ms(receive),
+            'ssl': -1,
+        },
+        '_rateLimitWait': _ms(tm.rate_limit_wait),
+        '_tokenRenewal': _ms(tm.token_renewal),
+    }
+
+def make_har_log(entries: Iterable[Mapping[str, Any]]) -> Mapping[str, Any]:
+    """Wrap HAR entry objects in a HAR log object."""
+    return {
+        'log': {
+            'version': HAR_VERSION,
+            'creator': {'name': __about__.__title__, 'version': __about__.__version__},
+            'pages': [],
+            'entries': list(entries),
+        },
+    }
+
+
+class HARWriter:
+    """Receives exchanges and writes them out as HAR entries."""
+
+    def __init__(self, *, redact: bool = True, include_bodies: bool = True) -> None:
+        self.redact: bool = redact
+        ("""
+            Redact credentials and tokens in headers and bodies.
+            """)
+        self.include_bodies: bool = include_bodies
+        ("""
+            Include request and response bodies.
+            """)
+
+    def add(self, xchg: Exchange) -> None:
+        self.add_entry(make_har_entry(xchg, redact=self.redact, include_bodies=self.include_bodies))
+
+    def add_entry(self, entry: Mapping[str, Any]) -> None:
+        raise NotImplementedError
+
+
+class HARArchive(HARWriter):
+    """HAR entries kept in memory."""
+
+    @property
+    def entries(self) -> Sequence[Mapping[str, Any]]:
+        return self._entries
+
+    def __init__(self, *, redact: bool = True, include_bodies: bool = True) -> None:
+        super().__init__(redact=redact, include_bodies=include_bodies)
+        self._lock = threading.Lock()
+        self._entries: MutableSequence[Mapping[str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add_entry(self, entry: Mapping[str, Any]) -> None:
+        with self._lock:
+            self._entries.append(entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def to_dict(self) -> Mapping[str, Any]:
+        """Return the HAR log object."""
+        with self._lock:
+            return make_har_log(self._entries)
+
+    def dump(self, file: IO[str]) -> None:
+        json.dump(self.to_dict(), file)
+
+    def save(self, path: Union[str, PathLike[str]]) -> None:
+        with open(path, 'w', encoding='utf-8') as fh:
+            self.dump(fh)
+
+    @classmethod
+    def from_exchanges(cls,
+        exchanges: Iterable[Exchange],
+        *,
+        redact: bool = True,
+        include_bodies: bool = True,
+    ) -> HARArchive:
+        """Make an archive from exchanges, such as those of `client.http.last.exchange_queue`."""
+        self = cls(redact=redact, include_bodies=include_bodies)
+        for xchg in exchanges:
+            self.add(xchg)
+        return self
+
+
+class RollingHARFileWriter(HARWriter):
+    """Write HAR entries to a file as they arrive, starting a new file once it is full.
+
+    The file is a complete HAR file after every entry, so it can be opened
+    while it is still being written to. When the file holds :attr:`max_entries`
+    entries it is renamed with a `.1` suffix before its extension (e.g.,
+    `bot.har` to `bot.1.har`), older files are shifted along (`.1` to `.2`, and
+    so on), and a new file is started. At most :attr:`backup_count` old files
+    are kept.
+
+    Call :meth:`close` when done, or use the writer as a context manager.
+    """
+
+    _TRAILER = b']}}\n'
+
+    def __init__(self,
+        path: Union[str, PathLike[str]],
+        *,
+        max_entries: int = 1000,
+        backup_count: int = 5,
+        redact: bool = True,
+        include_bodies: bool = True,
+    ) -> None:
+        super().__init__(redact=redact, include_bodies=include_bodies)
+        self.path: str = os.fspath(path)
+        ("")
+        self.max_entries: int = max_entries
+        ("""
+            The number of entries a file holds before a new file is started.
+            """)
+        self.backup_count: int = backup_count
+        ("""
+            The number of full files to keep.
+            """)
+        self._lock = threading.Lock()
+        self._file: Optional[IO[bytes]] = None
+        self._count: int = 0
+        self._position: int = 0
+
+    def __enter__(self) -> RollingHARFileWriter:
+        return self
+
+    def __exit__(self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        exc_traceback: Optional[TracebackType],
+    ) -> Optional[bool]:
+        self.close()
+        return None
+
+    def add_entry(self, entry: Mapping[str, Any]) -> None:
+        data = json.dumps(entry).encode()
+        with self._lock:
+            if self._file is not None and self._count >= self.max_entries:
+                self._rollover()
+            if self._file is None:
+                self._open()
+            file = self._file
+            assert file is not None
+            file.seek(self._position)
+            if self._count:
+                file.write(b',')
+            file.write(data)
+            self._position = file.tell()
+            file.write(self._TRAILER)
+            file.truncate()
+            file.flush()
+            self._count += 1
+
+    def get_backup_path(self, n: int) -> str:
+        """Return the path of the `n`-th most recent full file."""
+        root, ext = os.path.splitext(self.path)
+        return f"{root}.{n}{ext}"
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _open(self) -> None:
+        header = json.dumps(make_har_log(()))
+        # Leave the entries array open, to be closed by the trailer.
+        head = header[:header.rindex('[') + 1].encode()
+        file = open(self.path, 'wb')
+        file.write(head)
+        self._position = file.tell()
+        file.write(self._TRAILER)
+        file.flush()
+        self._file = file
+        self._count = 0
+
+    def _rollover(self) -> None:
+        assert self._file is not None
+        self._file.close()
+        self._file = None
+        if self.backup_count <= 0:
+            os.remove(self.path)
+            return
+        for i in range(self.backup_count - 1, 0, -1):
+            src = self.get_backup_path(i)
+            if os.path.exists(src):
+                os.replace(src, self.get_backup_path(i + 1))
+        os.replace(self.path, self.get_backup_path(1))
@@ -0,0 +1,32 @@
+"""A handler that passes exchanges to a HAR writer.
+
+See :mod:`redditwarp.core.har`.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from ..http.handler_SYNC import Handler
+    from ..http.send_params import SendParams
+    from ..http.exchange import Exchange
+
+from ..http.delegating_handler_SYNC import DelegatingHandler
+from .har import HARWriter
+
+class HARRecorder(DelegatingHandler):
+    """Pass every successful exchange to a HAR writer.
+
+    Place it at the top of the handler chain, e.g., with
+    :meth:`~.http_client_SYNC.HTTPClient.having_additional_middleware`,
+    so that the exchanges' timings are complete when they are written.
+    """
+
+    def __init__(self, handler: Handler, writer: HARWriter) -> None:
+        super().__init__(handler)
+        self.writer: HARWriter = writer
+        ("")
+
+    def _send(self, p: SendParams) -> Exchange:
+        xchg = super()._send(p)
+        self.writer.add(xchg)
+        return xchg
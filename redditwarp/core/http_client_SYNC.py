@@ -1,13 +1,16 @@
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional, MutableMapping, Callable, ContextManager
+from typing import TYPE_CHECKING, Optional, MutableMapping, Callable, ContextManager, Hashable
 if TYPE_CHECKING:
     from ..http.send_params import SendParams
     from ..http.exchange import Exchange
 
+import time
+from functools import partial
 from contextvars import ContextVar
+from concurrent.futures import ThreadPoolExecutor
 
-from .const import RESOURCE_BASE_URL, TOKEN_OBTAINMENT_URL, TRUSTED_ORIGINS
+from .const import AUTHORIZATION_BASE_URL, RESOURCE_BASE_URL, TOKEN_OBTAINMENT_URL, TRUSTED_ORIGINS
 from ..http.http_client_SYNC import HTTPClient as BaseHTTPClient
 from ..auth.types import AuthorizationGrant
 from .authorizer_SYNC import Authorized
@@ -23,10 +26,22 @@ from ..auth.token import Token
 from .recorded_SYNC import Last
 from .authorizer_SYNC import Authorizer
 from .direct_by_origin_SYNC import DirectByOrigin
+from ..util.reservation_rate_limiter import ReservationRateLimiter
+from .tenant import FairQueue
+from .response_cache import ResponseCache
+from .cached_SYNC import Cached
+from .coalesced_SYNC import Coalesced
+from .metered_SYNC import Metered
+from .accounted_SYNC import Accounted
 from ..http.handler_SYNC import Handler
 from ..util.ctx_var_ctx_mgr import ContextVarContextManager
+from .prioritized_SYNC import Prioritized
+from .tenanted_SYNC import Tenanted
+from .warm_up import WarmUpReport, TOKEN_PHASE, RESOURCE_CONNECTION_PHASE, TOKEN_CONNECTION_PHASE
 from .follow_redirects_value_none_means_SYNC import FollowRedirectsValueNoneMeansTrue
 from ..http.transport.impls.python_urllib import PythonUrllibConnector
+from .cassette import Cassette
+from .cassette_SYNC import CassetteRecorder
 
 
 DEFAULT_TIMEOUT: float = 8
@@ -67,7 +82,10 @@ class HTTPClient(BaseHTTPClient):
         self._last: Last = Last(recorder)
 
     def _send(self, p: SendParams) -> Exchange:
-        (_d := p.requisition.headers).update({**self.headers, **_d})
+        headers = p.requisition.headers
+        for k, v in self.headers.items():
+            if k not in headers:
+                headers[k] = v
         return super()._send(p)
 
     def get_user_agent(self) -> str:
@@ -82,6 +100,20 @@ class HTTPClient(BaseHTTPClient):
     def having_additional_middleware(self, f: Callable[[Handler], Handler]) -> ContextManager[None]:
         return ContextVarContextManager(self._active_handler_var, f(self._active_handler_var.get()))
 
+    def having_priority(self, priority: int) -> ContextManager[None]:
+        """Return a context manager that sets the priority of requests made within it.
+
+        See :mod:`redditwarp.core.priority`.
+        """
+        return self.having_additional_middleware(lambda h: Prioritized(h, priority))
+
+    def having_tenant(self, tenant: Optional[Hashable]) -> ContextManager[None]:
+        """Return a context manager that sets the tenant of requests made within it.
+
+        See :mod:`redditwarp.core.tenant`.
+        """
+        return self.having_additional_middleware(lambda h: Tenanted(h, tenant))
+
 
 class RedditHTTPClient(HTTPClient):
     """An HTTP client for making requests to the public Reddit API."""
@@ -90,12 +122,54 @@ class RedditHTTPClient(HTTPClient):
     def authorizer(self) -> Authorizer:
         return self.fetch_authorizer()
 
+    @property
+    def authorized(self) -> Authorized:
+        return self.fetch_authorized()
+
+    @property
+    def rate_limiter(self) -> ReservationRateLimiter:
+        return self.fetch_rate_limiter()
+
+    @property
+    def fair_queue(self) -> FairQueue:
+        return self.fetch_fair_queue()
+
+    @property
+    def response_cache(self) -> ResponseCache:
+        return self.fetch_response_cache()
+
+    @property
+    def coalescer(self) -> Coalesced:
+        return self.fetch_coalescer()
+
+    @property
+    def metered(self) -> Metered:
+        return self.fetch_metered()
+
     def __init__(self, handler: Handler, *,
         headers: Optional[MutableMapping[str, str]] = None,
         authorizer: Optional[Authorizer] = None,
+        authorized: Optional[Authorized] = None,
+        rate_limiter: Optional[ReservationRateLimiter] = None,
+        fair_queue: Optional[FairQueue] = None,
+        response_cache: Optional[ResponseCache] = None,
+        coalescer: Optional[Coalesced] = None,
+        metered: Optional[Metered] = None,
+        bare_http: Optional[HTTPClient] = None,
     ) -> None:
         super().__init__(handler, headers=headers)
         self._authorizer: Optional[Authorizer] = authorizer
+        self._authorized: Optional[Authorized] = authorized
+        self._rate_limiter: Optional[ReservationRateLimiter] = rate_limiter
+        self._fair_queue: Optional[FairQueue] = fair_queue
+        self._response_cache: Optional[ResponseCache] = response_cache
+        self._coalescer: Optional[Coalesced] = coalescer
+        self._metered: Optional[Metered] = metered
+        self.bare_http: Optional[HTTPClient] = bare_http
+        ("""
+            An HTTP client that shares this client's connections but sends requests
+            without authorization or rate limiting. Used by :meth:`warm_up`.
+            """)
 
     def fetch_authorizer(self) -> Authorizer:
         if self._authorizer is None:
@@ -110,56 +184,246 @@ class RedditHTTPClient(HTTPClient):
         """
         self._authorizer = value
 
+    def fetch_authorized(self) -> Authorized:
+        if self._authorized is None:
+            raise RuntimeError('value not set')
+        return self._authorized
+
+    def fast_set_authorized(self, value: Optional[Authorized]) -> None:
+        """Changes the value of `self.authorized`.
+
+        Note, the :attr:`authorized` attribute is just a holder and changing
+        its value will not change the handler in the request pipeline.
+        """
+        self._authorized = value
+
+    def fetch_rate_limiter(self) -> ReservationRateLimiter:
+        if self._rate_limiter is None:
+            raise RuntimeError('value not set')
+        return self._rate_limiter
+
+    def fast_set_rate_limiter(self, value: Optional[ReservationRateLimiter]) -> None:
+        """Changes the value of `self.rate_limiter`.
+
+        Note, the :attr:`rate_limiter` attribute is just a holder and changing
+        its value will not change the underlying rate limiter. To share a rate
+        limit budget, change the state backend of the existing rate limiter instead.
+        """
+        self._rate_limiter = value
+
+    def fetch_fair_queue(self) -> FairQueue:
+        if self._fair_queue is None:
+            raise RuntimeError('value not set')
+        return self._fair_queue
+
+    def fast_set_fair_queue(self, value: Optional[FairQueue]) -> None:
+        """Changes the value of `self.fair_queue`.
+
+        Note, the :attr:`fair_queue` attribute is just a holder and changing
+        its value will not change the underlying fair queue.
+        """
+        self._fair_queue = value
+
+    def fetch_response_cache(self) -> ResponseCache:
+        if self._response_cache is None:
+            raise RuntimeError('value not set')
+        return self._response_cache
+
+    def fast_set_response_cache(self, value: Optional[ResponseCache]) -> None:
+        """Changes the value of `self.response_cache`.
+
+        Note, the :attr:`response_cache` attribute is just a holder and changing
+        its value will not change the underlying response cache.
+        """
+        self._response_cache = value
+
+    def fetch_coalescer(self) -> Coalesced:
+        if self._coalescer is None:
+            raise RuntimeError('value not set')
+        return self._coalescer
+
+    def fast_set_coalescer(self, value: Optional[Coalesced]) -> None:
+        """Changes the value of `self.coalescer`.
+
+        Note, the :attr:`coalescer` attribute is just a holder and changing
+        its value will not change the handler in the request pipeline.
+        To turn on request coalescing, set `self.coalescer.enabled` instead.
+        """
+        self._coalescer = value
+
+    def fetch_metered(self) -> Metered:
+        if self._metered is None:
+            raise RuntimeError('value not set')
+        return self._metered
+
+    def fast_set_metered(self, value: Optional[Metered]) -> None:
+        """Changes the value of `self.metered`.
+
+        Note, the :attr:`metered` attribute is just a holder and changing
+        its value will not change the handler in the request pipeline.
+        To collect metrics, set `self.metered.sink` instead.
+        """
+        self._metered = value
+
+    def warm_up(self) -> WarmUpReport:
+        """Do the setup work of the first request ahead of time.
+
+        Obtain an access token if one is needed and open pooled connections to
+        the resource server and the token server. These are done concurrently.
+
+        .. .RETURNS
+
+        :returns:
+            How long each phase took.
+        :rtype: :class:`~.warm_up.WarmUpReport`
+        """
+        tasks: dict[str, Callable[[], object]] = {}
+        authorized = self._authorized
+        authorizer = None if authorized is None else authorized.authorizer
+        need_token = (
+            authorizer is not None
+            and authorizer.can_renew_token()
+            and authorizer.should_renew_token()
+        )
+        if need_token:
+            assert authorized is not None
+            # Go through the handler so that requests made meanwhile wait on this renewal.
+            tasks[TOKEN_PHASE] = authorized.ensure_token
+        bare_http = self.bare_http
+        if bare_http is not None:
+            tasks[RESOURCE_CONNECTION_PHASE] = partial(bare_http.request, 'HEAD', RESOURCE_BASE_URL)
+            if not need_token and authorizer is not None and authorizer.can_renew_token():
+                tasks[TOKEN_CONNECTION_PHASE] = partial(bare_http.request, 'HEAD', AUTHORIZATION_BASE_URL)
+
+        def timed(f: Callable[[], object]) -> float:
+            start = time.monotonic()
+            f()
+            return time.monotonic() - start
+
+        start = time.monotonic()
+        phases: dict[str, float] = {}
+        if tasks:
+            with ThreadPoolExecutor(len(tasks)) as executor:
+                futures = {k: executor.submit(timed, f) for k, f in tasks.items()}
+                for k, fut in futures.items():
+                    phases[k] = fut.result()
+        return WarmUpReport(phases=phases, total=time.monotonic() - start)
+
 
 def build_reddit_http_client(
     client_id: str,
     client_secret: str,
     grant: AuthorizationGrant,
+    *,
+    connector: Optional[Handler] = None,
+    cassette: Optional[Cassette] = None,
 ) -> RedditHTTPClient:
-    connector = new_connector()
+    if connector is None:
+        connector = new_connector()
     ua = get_suitable_user_agent(connector.__module__)
     headers = CaseInsensitiveDict({'User-Agent': ua})
 
     foundation: Handler = connector
+    if cassette is not None:
+        foundation = CassetteRecorder(connector, cassette)
     connector_is_pyurllib = isinstance(connector, PythonUrllibConnector)
     if connector_is_pyurllib:
-        foundation = FollowRedirectsValueNoneMeansTrue(connector)
+        foundation = FollowRedirectsValueNoneMeansTrue(foundation)
 
-    http = HTTPClient(ApplyDefaultHeaders(foundation, headers))
+    bare_http = HTTPClient(ApplyDefaultHeaders(foundation, headers))
     if connector_is_pyurllib:
-        http.follow_redirects = None
+        bare_http.follow_redirects = None
     authorizer = Authorizer(
         RedditTokenObtainmentClient(
-            http,
+            bare_http,
             TOKEN_OBTAINMENT_URL,
             (client_id, client_secret),
             grant,
         )
     )
-    hdlr = RedditPleaseSendJSON(RateLimited(Authorized(foundation, authorizer)))
-    hdlr1 = DirectByOrigin(foundation, {x: hdlr for x in TRUSTED_ORIGINS})
-
-    http = RedditHTTPClient(hdlr1, headers=headers, authorizer=authorizer)
+    authorized = Authorized(foundation, authorizer)
+    rate_limiter = ReservationRateLimiter()
+    fair_queue = FairQueue()
+    response_cache = ResponseCache()
+    coalescer = Coalesced(
+        Cached(
+            RateLimited(authorized, rate_limiter, fair_queue),
+            response_cache,
+            lambda reqi: authorizer.get_identity_key(),
+        ),
+        lambda reqi: authorizer.get_identity_key(),
+    )
+    metered = Metered(coalescer)
+    hdlr = RedditPleaseSendJSON(metered)
+    hdlr1 = Accounted(DirectByOrigin(foundation, {x: hdlr for x in TRUSTED_ORIGINS}))
+
+    http = RedditHTTPClient(
+        hdlr1,
+        headers=headers,
+        authorizer=authorizer,
+        authorized=authorized,
+        rate_limiter=rate_limiter,
+        fair_queue=fair_queue,
+        response_cache=response_cache,
+        coalescer=coalescer,
+        metered=metered,
+        bare_http=bare_http,
+    )
     http.user_agent_base = ua
     if connector_is_pyurllib:
         http.follow_redirects = None
     return http
 
-def build_reddit_http_client_from_access_token(access_token: str) -> RedditHTTPClient:
-    connector = new_connector()
+def build_reddit_http_client_from_access_token(
+    access_token: str,
+    *,
+    connector: Optional[Handler] = None,
+    cassette: Optional[Cassette] = None,
+) -> RedditHTTPClient:
+    if connector is None:
+        connector = new_connector()
     ua = get_suitable_user_agent(connector.__module__)
     headers = CaseInsensitiveDict({'User-Agent': ua})
 
     foundation: Handler = connector
+    if cassette is not None:
+        foundation = CassetteRecorder(connector, cassette)
     connector_is_pyurllib = isinstance(connector, PythonUrllibConnector)
     if connector_is_pyurllib:
-        foundation = FollowRedirectsValueNoneMeansTrue(connector)
+        foundation = FollowRedirectsValueNoneMeansTrue(foundation)
 
+    bare_http = HTTPClient(ApplyDefaultHeaders(foundation, headers))
+    if connector_is_pyurllib:
+        bare_http.follow_redirects = None
     authorizer = Authorizer(token=Token(access_token))
-    hdlr = RedditPleaseSendJSON(RateLimited(Authorized(foundation, authorizer)))
-    hdlr1 = DirectByOrigin(foundation, {x: hdlr for x in TRUSTED_ORIGINS})
-
-    http = RedditHTTPClient(hdlr1, headers=headers, authorizer=authorizer)
+    authorized = Authorized(foundation, authorizer)
+    rate_limiter = ReservationRateLimiter()
+    fair_queue = FairQueue()
+    response_cache = ResponseCache()
+    coalescer = Coalesced(
+        Cached(
+            RateLimited(authorized, rate_limiter, fair_queue),
+            response_cache,
+            lambda reqi: authorizer.get_identity_key(),
+        ),
+        lambda reqi: authorizer.get_identity_key(),
+    )
+    metered = Metered(coalescer)
+    hdlr = RedditPleaseSendJSON(metered)
+    hdlr1 = Accounted(DirectByOrigin(foundation, {x: hdlr for x in TRUSTED_ORIGINS}))
+
+    http = RedditHTTPClient(
+        hdlr1,
+        headers=headers,
+        authorizer=authorizer,
+        authorized=authorized,
+        rate_limiter=rate_limiter,
+        fair_queue=fair_queue,
+        response_cache=response_cache,
+        coalescer=coalescer,
+        metered=metered,
+        bare_http=bare_http,
+    )
     http.user_agent_base = ua
     if connector_is_pyurllib:
         http.follow_redirects = None
@@ -0,0 +1,44 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional, Callable
+if TYPE_CHECKING:
+    from ..http.handler_ASYNC import Handler
+    from ..http.send_params import SendParams
+    from ..http.exchange import Exchange
+
+import time
+
+from ..http.delegating_handler_ASYNC import DelegatingHandler
+from .metrics import MetricsSink, get_endpoint_template
+
+class Metered(DelegatingHandler):
+    """Report every request to a metrics sink.
+
+    Nothing is recorded unless :attr:`sink` is set. See :mod:`redditwarp.core.metrics`.
+    """
+
+    def __init__(self,
+        handler: Handler,
+        sink: Optional[MetricsSink] = None,
+    ) -> None:
+        super().__init__(handler)
+        self.sink: Optional[MetricsSink] = sink
+        ("")
+        self.endpoint_template: Callable[[str], str] = get_endpoint_template
+        ("""
+            Maps a request URL to the endpoint template that its metrics are aggregated under.
+            """)
+
+    async def _send(self, p: SendParams) -> Exchange:
+        sink = self.sink
+        if sink is None:
+            return await super()._send(p)
+
+        endpoint = self.endpoint_template(p.requisition.url)
+        start = time.monotonic()
+        try:
+            xchg = await super()._send(p)
+        except Exception as e:
+            sink.record_error(endpoint, e, time.monotonic() - start)
+            raise
+        sink.record(endpoint, xchg, time.monotonic() - start)
+        return xchg
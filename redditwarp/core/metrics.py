@@ -0,0 +1,229 @@
+"""Aggregate request timings into metrics.
+
+A :class:`~.metered_SYNC.Metered` handler in the Reddit client's handler chain
+passes every exchange to a metrics sink, if one is set::
+
+    from redditwarp.core.metrics import PrometheusMetricsSink
+
+    sink = PrometheusMetricsSink()
+    client.http.metered.sink = sink
+    ...
+    print(sink.generate_text())
+
+Exchanges are aggregated by endpoint template (e.g., `/r/{name}/comments/{id}`)
+rather than by URL so that the number of series stays bounded. Each phase
+of :class:`~redditwarp.http.timings.Timings`, plus the `total` time of the
+request as seen by the handler, is recorded in its own histogram.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional, Sequence, MutableSequence, MutableMapping, Mapping
+if TYPE_CHECKING:
+    from ..http.exchange import Exchange
+
+import re
+import threading
+from bisect import bisect_left
+from urllib.parse import urlsplit
+
+_NAMED_SEGMENTS = frozenset(('r', 'u', 'user', 'by_id', 'duplicates', 'live', 'm', 'multi'))
+_TRAILING_SEGMENTS = frozenset(('comments', 'wiki'))
+_ID_PATTERN = re.compile(r'(t[1-8]_)?[0-9a-z]{5,}')
+
+def get_endpoint_template(url: str) -> str:
+    """Return the path of `url` with its variable segments replaced by placeholders.
+
+    E.g., `https://oauth.reddit.com/r/python/comments/abc123/title/`
+    becomes `/r/{name}/comments/{id}`.
+    """
+    segments = [x for x in urlsplit(url).path.split('/') if x]
+    result: MutableSequence[str] = []
+    previous = ''
+    for segment in segments:
+        if previous in _NAMED_SEGMENTS:
+            result.append('{name}')
+        elif previous in _TRAILING_SEGMENTS:
+            result.append('{id}' if previous == 'comments' else '{page}')
+            break
+        elif any(c.isdigit() for c in segment) and _ID_PATTERN.fullmatch(segment):
+            result.append('{id}')
+        else:
+            result.append(segment)
+        previous = segment
+    return '/' + '/'.join(result)
+
+
+class MetricsSink:
+    """Receives exchanges to aggregate. Subclass to send metrics elsewhere."""
+
+    def record(self, endpoint: str, xchg: Exchange, total: float) -> None:
+        """Record a completed exchange.
+
+        .. .PARAMETERS
+
+        :param `str` endpoint:
+            The endpoint template of the request.
+        :param `Exchange` xchg:
+        :param `float` total:
+            The number of seconds the request took, as seen by the handler.
+        """
+
+    def record_error(self, endpoint: str, exc: BaseException, total: float) -> None:
+        """Record a request that failed with an exception."""
+
+
+DEFAULT_BUCKETS: Sequence[float] = (.005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10, 30, 60)
+
+class Histogram:
+    """A cumulative-bucket histogram, like a Prometheus histogram."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets: Sequence[float] = tuple(sorted(buckets))
+        ("""
+            The upper bounds of the buckets. An implicit `+Inf` bucket follows.
+            """)
+        self.counts: MutableSequence[int] = [0] * (len(self.buckets) + 1)
+        ("""
+            The number of observations in each bucket (not cumulative).
+            """)
+        self.sum: float = 0.
+        ("")
+        self.count: int = 0
+        ("")
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def get_quantile(self, q: float) -> float:
+        """Estimate a quantile by interpolating within the bucket it falls in.
+
+        Returns `nan` if nothing has been observed. Values in the `+Inf` bucket
+        are estimated as the largest bucket bound.
+        """
+        if self.count == 0:
+            return float('nan')
+        rank = q * self.count
+        cumulative = 0
+        for i, n in enumerate(self.counts):
+            if n and cumulative + n >= rank:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i else 0.
+                upper = self.buckets[i]
+                return lower + (upper - lower) * (rank - cumulative) / n
+            cumulative += n
+        return self.buckets[-1]
+
+
+class HistogramMetricsSink(MetricsSink):
+    """Aggregate request metrics in memory."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets: Sequence[float] = buckets
+        ("")
+        self.histograms: MutableMapping[tuple[str, str], Histogram] = {}
+        ("""
+            Histograms of phase durations, keyed by endpoint template and phase name.
+            """)
+        self.responses: MutableMapping[tuple[str, int], int] = {}
+        ("""
+            The number of responses, keyed by endpoint template and status code.
+            """)
+        self.errors: MutableMapping[tuple[str, str], int] = {}
+        ("""
+            The number of failed requests, keyed by endpoint template and exception class name.
+            """)
+        self._lock = threading.Lock()
+
+    def _observe(self, endpoint: str, phase: str, value: float) -> None:
+        key = (endpoint, phase)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram(self.buckets)
+        histogram.observe(value)
+
+    def record(self, endpoint: str, xchg: Exchange, total: float) -> None:
+        status_key = (endpoint, xchg.response.status)
+        with self._lock:
+            self.responses[status_key] = self.responses.get(status_key, 0) + 1
+            self._observe(endpoint, 'total', total)
+            for phase, value in xchg.timings.get_phases().items():
+                self._observe(endpoint, phase, value)
+
+    def record_error(self, endpoint: str, exc: BaseException, total: float) -> None:
+        key = (endpoint, type(exc).__name__)
+        with self._lock:
+            self.errors[key] = self.errors.get(key, 0) + 1
+            self._observe(endpoint, 'total', total)
+
+    def get_histogram(self, endpoint: str, phase: str = 'total') -> Optional[Histogram]:
+        return self.histograms.get((endpoint, phase))
+
+    def get_quantiles(self, phase: str = 'total', q: float = .99) -> Mapping[str, float]:
+        """Return the estimated quantile of a phase for each endpoint template."""
+        with self._lock:
+            return {
+                endpoint: histogram.get_quantile(q)
+                for (endpoint, phase1), histogram in self.histograms.items()
+                if phase1 == phase
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self.histograms.clear()
+            self.responses.clear()
+            self.errors.clear()
+
+
+def _escape_label_value(s: str) -> str:
+    return s.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+def _format_labels(labels: Mapping[str, str]) -> str:
+    return '{' + ','.join(f'{k}="{_escape_label_value(v)}"' for k, v in labels.items()) + '}'
+
+def _format_float(v: float) -> str:
+    return repr(float(v)) if v != float('inf') else '+Inf'
+
+class PrometheusMetricsSink(HistogramMetricsSink):
+    """Aggregate request metrics in memory and expose them in the Prometheus text format.
+
+    Serve the output of :meth:`generate_text` from your metrics endpoint.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, *, namespace: str = 'redditwarp') -> None:
+        super().__init__(buckets)
+        self.namespace: str = namespace
+        ("""
+            The prefix of the metric names.
+            """)
+
+    def generate_text(self) -> str:
+        ns = self.namespace
+        lines: MutableSequence[str] = []
+        with self._lock:
+            name = f'{ns}_request_phase_seconds'
+            lines.append(f'# HELP {name} Time spent in each phase of a request.')
+            lines.append(f'# TYPE {name} histogram')
+            for (endpoint, phase), histogram in sorted(self.histograms.items()):
+                labels = {'endpoint': endpoint, 'phase': phase}
+                cumulative = 0
+                for bound, n in zip((*histogram.buckets, float('inf')), histogram.counts):
+                    cumulative += n
+                    lines.append(f'{name}_bucket{_format_labels({**labels, "le": _format_float(bound)})} {cumulative}')
+                lines.append(f'{name}_sum{_format_labels(labels)} {_format_float(histogram.sum)}')
+                lines.append(f'{name}_count{_format_labels(labels)} {histogram.count}')
+
+            name = f'{ns}_responses_total'
+            lines.append(f'# HELP {name} Responses received, by status code.')
+            lines.append(f'# TYPE {name} counter')
+            for (endpoint, status), n in sorted(self.responses.items()):
+                lines.append(f'{name}{_format_labels({"endpoint": endpoint, "status": str(status)})} {n}')
+
+            name = f'{ns}_request_errors_total'
+            lines.append(f'# HELP {name} Requests that failed with an exception.')
+            lines.append(f'# TYPE {name} counter')
+            for (endpoint, error), n in sorted(self.errors.items()):
+                lines.append(f'{name}{_format_labels({"endpoint": endpoint, "error": error})} {n}')
+        return '\n'.join(lines) + '\n'
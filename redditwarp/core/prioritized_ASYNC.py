@@ -0,0 +1,27 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from ..http.handler_ASYNC import Handler
+    from ..http.send_params import SendParams
+    from ..http.exchange import Exchange
+
+from ..http.delegating_handler_ASYNC import DelegatingHandler
+from .priority import request_priority_var
+
+class Prioritized(DelegatingHandler):
+    """Set the priority of requests passing through this handler.
+
+    See :mod:`redditwarp.core.priority`.
+    """
+
+    def __init__(self, handler: Handler, priority: int) -> None:
+        super().__init__(handler)
+        self.priority: int = priority
+        ("")
+
+    async def _send(self, p: SendParams) -> Exchange:
+        token = request_priority_var.set(self.priority)
+        try:
+            return await super()._send(p)
+        finally:
+            request_priority_var.reset(token)
@@ -0,0 +1,32 @@
+"""Request priorities.
+
+The rate limiter admits requests in order of priority when requests are
+queued. A request's priority is taken from a context variable, so it applies
+to every request made within the context, including those made by
+paginators and iterators.
+"""
+
+from __future__ import annotations
+from typing import ContextManager
+
+from contextvars import ContextVar
+from enum import IntEnum
+
+from ..util.ctx_var_ctx_mgr import ContextVarContextManager
+
+class Priority(IntEnum):
+    BACKGROUND = -2
+    LOW = -1
+    NORMAL = 0
+    HIGH = 1
+    URGENT = 2
+
+request_priority_var: ContextVar[int] = ContextVar('request_priority', default=Priority.NORMAL)
+
+def get_request_priority() -> int:
+    """Return the priority of requests made in the current context."""
+    return request_priority_var.get()
+
+def having_request_priority(priority: int) -> ContextManager[None]:
+    """Return a context manager that sets the priority of requests made within it."""
+    return ContextVarContextManager(request_priority_var, priority)
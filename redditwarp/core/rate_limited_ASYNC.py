@@ -1,6 +1,5 @@
-
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 if TYPE_CHECKING:
     from ..http.handler_ASYNC import Handler
     from ..http.send_params import SendParams
@@ -17,58 +16,146 @@ from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 
 from ..http.delegating_handler_ASYNC import DelegatingHandler
-from ..util.token_bucket import TokenBucket
+from ..util.reservation_rate_limiter import ReservationRateLimiter
+from ..util.priority_lock_ASYNC import PriorityLock
+from .priority import request_priority_var
+from .tenant import FairQueue, tenant_var
+from .accounting import charge_var
 
 class RateLimited(DelegatingHandler):
-    def __init__(self, handler: Handler) -> None:
+    """Rate limit requests based on the `x-ratelimit-*` response headers.
+
+    Requests that are waiting to be sent or are in flight are counted against
+    the remaining budget, and the budget is spread evenly over the time left
+    in the rate limit window. A bounded burst of requests is let through
+    without delay.
+
+    Queued requests are admitted in order of their priority
+    (see :mod:`redditwarp.core.priority`). To stop lower priority requests from
+    starving, a request gains one priority level for every
+    :attr:`priority_aging_interval` seconds it has been waiting.
+
+    Within a priority level, requests from different tenants share the budget
+    according to their weights (see :mod:`redditwarp.core.tenant`).
+
+    Requests are admitted one at a time. The request at the head of the queue
+    holds the queue while it waits out its delay, and the next request only
+    reserves its slot once that one has been admitted. This is deliberate. It
+    leaves the queued requests without reservations, so a higher priority
+    request that arrives later can still be admitted ahead of them. If each
+    request reserved its slot on arrival and then waited outside the queue,
+    the admission order would be fixed by arrival and priorities would have
+    no effect.
+
+    The limiter's state backend is used synchronously. A
+    :class:`~redditwarp.util.rate_limit_state.SharedFileRateLimitStateBackend`
+    takes its file lock on the event loop.
+    """
+
+    @property
+    def remaining(self) -> int:
+        return self.limiter.remaining
+
+    @property
+    def reset(self) -> int:
+        return int(self.limiter.get_reset())
+
+    @property
+    def used(self) -> int:
+        return self.limiter.used
+
+    def __init__(self,
+        handler: Handler,
+        limiter: Optional[ReservationRateLimiter] = None,
+        fair_queue: Optional[FairQueue] = None,
+    ) -> None:
         super().__init__(handler)
-        self.remaining: int = 0
-        ("")
-        self.reset: int = 0
+        self.limiter: ReservationRateLimiter = ReservationRateLimiter() if limiter is None else limiter
         ("")
-        self.used: int = 0
-        ("")
-        self._timestamp: float = time.monotonic()
-        self._tb = TokenBucket(capacity=10, rate=1)
-        self._lock = asyncio.Lock()
+        self.priority_aging_interval: float = 30
+        ("""
+            The number of seconds a queued request must wait to be treated as
+            one priority level higher.
+            """)
+        self.fair_queue: FairQueue = FairQueue() if fair_queue is None else fair_queue
+        ("""
+            Shares the budget between tenants. See :mod:`redditwarp.core.tenant`.
+            """)
+        self._lock = PriorityLock()
         self._datetime = datetime.min.replace(tzinfo=timezone.utc)
 
     async def _send(self, p: SendParams) -> Exchange:
-        async with self._lock:
-            tb = self._tb
-            s = 0.
-            if self.remaining <= 1:
-                s = self.reset
-            elif self.reset > 0:
-                tb.get_value()
-                tb.rate = self.remaining / self.reset
-                s = tb.get_cooldown(1)
+        limiter = self.limiter
+        wait_time = await self._admit()
+        try:
+            xchg = await super()._send(p)
+            self._update(xchg)
+        finally:
+            limiter.settle()
+        xchg.timings.rate_limit_wait = wait_time
+        charge = charge_var.get()
+        if charge is not None:
+            charge.add(
+                units=1,
+                bytes_sent=len(xchg.request.data),
+                bytes_received=len(xchg.response.data),
+            )
+        return xchg
 
-            await asyncio.sleep(s)
-            tb.consume(1)
+    async def _admit(self) -> float:
+        """Wait until the request may be sent and return the number of seconds waited."""
+        limiter = self.limiter
+        fair_queue = self.fair_queue
+        tenant = tenant_var.get()
+        now = time.monotonic()
+        cost = limiter.window_length / max(1, limiter.limit)
+        key = fair_queue.enqueue(tenant, now, cost) - request_priority_var.get() * self.priority_aging_interval
+        admitted = False
+        try:
+            await self._lock.acquire(key)
+            try:
+                # The lock is held while sleeping so that requests behind this
+                # one stay unreserved and can still be reordered by priority.
+                delay = limiter.reserve()
+                if delay > 0:
+                    try:
+                        await asyncio.sleep(delay)
+                    except BaseException:
+                        limiter.settle()
+                        raise
+            finally:
+                self._lock.release()
+            admitted = True
+        finally:
+            wait_time = time.monotonic() - now
+            fair_queue.dequeue(tenant, wait_time, admitted=admitted)
+        return wait_time
 
-        xchg = await super()._send(p)
+    async def _close(self) -> None:
+        try:
+            await super()._close()
+        finally:
+            self.limiter.close()
 
-        now = time.monotonic()
-        delta = now - self._timestamp
-        self._timestamp = now
+    def _update(self, xchg: Exchange) -> None:
+        limiter = self.limiter
+        headers = xchg.response.headers
+        if 'x-ratelimit-reset' not in headers:
+            limiter.consume()
+            return
 
-        dt = parsedate_to_datetime(xchg.response.headers['Date'])
-        if dt > self._datetime:
+        remaining = int(float(headers['x-ratelimit-remaining']))
+        date = headers.get('Date')
+        if date is not None:
+            # Responses can arrive out of order. Skip updates that are older
+            # than the newest one seen, unless they report a lower budget.
+            dt = parsedate_to_datetime(date)
+            if dt < self._datetime or (dt == self._datetime and remaining >= limiter.remaining):
+                return
             self._datetime = dt
 
-            headers = xchg.response.headers
-            if 'x-ratelimit-reset' in headers:
-                self.remaining = int(float(headers['x-ratelimit-remaining']))
-                self.reset = int(headers['x-ratelimit-reset'])
-                self.used = int(headers['x-ratelimit-used'])
-            else:
-                self.remaining -= 1
-                self.reset -= int(delta)
-                self.used += 1
-                if self.reset <= 0:
-                    self.remaining = 300
-                    self.reset = 600
-                    self.used = 0
-
-        return xchg
+        limiter.update(
+            remaining=remaining,
+            reset=int(headers['x-ratelimit-reset']),
+            used=int(headers['x-ratelimit-used']),
+        )
@@ -0,0 +1,185 @@
+"""An in-memory HTTP response cache for GET requests.
+
+Only requests whose URL path matches one of the cache's rules are cached. A
+rule gives the number of seconds a response is served from the cache without
+contacting the server. Once that time has passed, the response is revalidated
+with a conditional request if the server gave an `ETag` or `Last-Modified`
+header, so that an unchanged resource isn't downloaded again.
+
+Reddit marks API responses as uncacheable, so `Cache-Control` headers are not
+consulted. Only add rules for endpoints where serving slightly old data is
+acceptable.
+
+The cache is bounded by the total size of the response bodies it holds, and
+the least recently used entries are evicted first.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional, Sequence, MutableSequence, Mapping, Callable, Hashable
+if TYPE_CHECKING:
+    from ..http.request import Request
+    from ..http.response import Response
+    from ..http.requisition import Requisition
+
+import re
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+
+@dataclass(repr=False, eq=False)
+class CacheRule:
+    pattern: str
+    ("""
+        A regular expression that must match the whole URL path.
+        """)
+    ttl: float
+    ("""
+        The number of seconds a response is served from the cache without contacting the server.
+        """)
+    _regex: re.Pattern[str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._regex = re.compile(self.pattern)
+
+    def matches(self, path: str) -> bool:
+        return self._regex.fullmatch(path) is not None
+
+
+DEFAULT_CACHE_RULES: Sequence[CacheRule] = (
+    CacheRule(r'/r/[^/]+/about/edit', 300),
+    CacheRule(r'/r/[^/]+/about/rules', 600),
+    CacheRule(r'/r/[^/]+/api/(?:link|user)_flair_v2', 600),
+    CacheRule(r'/r/[^/]+/wiki/(?!settings/|revisions|discussions/|pages$)[^?]+', 300),
+    CacheRule(r'/user/[^/]+/about', 300),
+)
+("""
+    Rules for endpoints that serve data that rarely changes: subreddit settings
+    and rules, flair templates, wiki pages, and user profiles.
+    """)
+
+
+def vary_by_authorization_header(requisition: Requisition) -> str:
+    """Return a digest of the requisition's `Authorization` header."""
+    return hashlib.sha256(requisition.headers.get('Authorization', '').encode()).hexdigest()
+
+
+@dataclass(repr=False, eq=False)
+class CacheEntry:
+    request: Request
+    ("")
+    response: Response
+    ("")
+    expires_at: float
+    ("")
+    size: int
+    ("")
+
+    def get_conditional_headers(self) -> Mapping[str, str]:
+        """Return the headers to send to revalidate this entry."""
+        headers = {}
+        etag = self.response.headers.get('ETag')
+        if etag is not None:
+            headers['If-None-Match'] = etag
+        last_modified = self.response.headers.get('Last-Modified')
+        if last_modified is not None:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+
+class ResponseCache:
+    def __init__(self, *,
+        rules: Optional[Sequence[CacheRule]] = None,
+        max_bytes: int = 32 * 1024 * 1024,
+        time_func: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rules: MutableSequence[CacheRule] = [] if rules is None else list(rules)
+        ("""
+            The caching rules. The first rule that matches a request's URL path
+            applies. Nothing is cached when there are no rules.
+            """)
+        self.max_bytes: int = max_bytes
+        ("""
+            The maximum total size of the cached response bodies.
+            """)
+        self.time_func: Callable[[], float] = time_func
+        ("")
+        self.hits: int = 0
+        ("""
+            The number of requests served from the cache without contacting the server.
+            """)
+        self.revalidations: int = 0
+        ("""
+            The number of cached responses confirmed unchanged by a conditional request.
+            """)
+        self.misses: int = 0
+        ("")
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def time(self) -> float:
+        return self.time_func()
+
+    def get_size(self) -> int:
+        """Return the total size of the cached response bodies."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_ttl(self, url: str) -> Optional[float]:
+        """Return the TTL of the first rule matching the URL's path, or `None` if no rule matches."""
+        path = urlsplit(url).path
+        for rule in self.rules:
+            if rule.matches(path):
+                return rule.ttl
+        return None
+
+    @staticmethod
+    def make_key(vary: str, url: str, params: Mapping[str, str]) -> Hashable:
+        return (vary, url, tuple(sorted(params.items())))
+
+    def lookup(self, key: Hashable) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return self.time() < entry.expires_at
+
+    def store(self, key: Hashable, request: Request, response: Response, ttl: float) -> None:
+        size = len(response.data)
+        if size > self.max_bytes:
+            return
+        entry = CacheEntry(request=request, response=response, expires_at=self.time() + ttl, size=size)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old.size
+            self._entries[key] = entry
+            self._size += size
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+
+    def renew(self, entry: CacheEntry, ttl: float) -> None:
+        """Mark an entry as fresh again after the server confirmed it is unchanged."""
+        entry.expires_at = self.time() + ttl
+
+    def invalidate(self, url_pattern: str) -> None:
+        """Remove the entries whose URL path matches a regular expression."""
+        regex = re.compile(url_pattern)
+        with self._lock:
+            for key in [k for k, v in self._entries.items() if regex.fullmatch(urlsplit(v.request.url).path)]:
+                self._size -= self._entries.pop(key).size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
@@ -0,0 +1,132 @@
+"""Weighted fair queuing of requests across tenants.
+
+When a single client is shared by several independent workloads (tenants),
+such as bots for different subreddits running in one process, a busy tenant
+can fill the rate limiter's queue and delay every other tenant's requests.
+
+Requests name their tenant through a context variable. The rate limiter uses a
+:class:`FairQueue` to give each queued request a virtual finish time based on
+how much of the budget its tenant has recently been given, relative to the
+tenant's weight. Requests are admitted in order of virtual finish time, so each
+busy tenant receives a share of the budget proportional to its weight while a
+quiet tenant's requests are admitted promptly.
+"""
+
+from __future__ import annotations
+from typing import Optional, ContextManager, MutableMapping, Mapping, Hashable
+
+import threading
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from ..util.ctx_var_ctx_mgr import ContextVarContextManager
+
+tenant_var: ContextVar[Optional[Hashable]] = ContextVar('tenant', default=None)
+
+def get_tenant() -> Optional[Hashable]:
+    """Return the tenant of requests made in the current context."""
+    return tenant_var.get()
+
+def having_tenant(tenant: Optional[Hashable]) -> ContextManager[None]:
+    """Return a context manager that sets the tenant of requests made within it."""
+    return ContextVarContextManager(tenant_var, tenant)
+
+
+@dataclass(repr=False, eq=False)
+class TenantStats:
+    queued: int = 0
+    ("""
+        The number of requests currently waiting to be admitted.
+        """)
+    admitted: int = 0
+    ("""
+        The total number of requests admitted.
+        """)
+    total_wait_time: float = 0.
+    ("""
+        The total number of seconds admitted requests spent waiting.
+        """)
+    max_wait_time: float = 0.
+    ("""
+        The longest number of seconds an admitted request spent waiting.
+        """)
+
+    def get_mean_wait_time(self) -> float:
+        if self.admitted == 0:
+            return 0.
+        return self.total_wait_time / self.admitted
+
+
+class FairQueue:
+    """Assigns virtual finish times to requests so that tenants share a budget by weight.
+
+    This is a virtual clock scheduler. Each tenant has a clock that advances by
+    `cost / weight` for every request it makes, and never falls behind the real
+    time. A tenant that makes many requests pushes its clock far into the future,
+    so requests from tenants that have been quiet are ordered ahead of it.
+
+    Requests made without a tenant are scheduled as a tenant of their own.
+    """
+
+    def __init__(self, *, default_weight: float = 1) -> None:
+        self.weights: MutableMapping[Optional[Hashable], float] = {}
+        ("""
+            The weights of tenants. A tenant with twice the weight of another
+            receives twice the share of the budget when both are busy.
+            """)
+        self.default_weight: float = default_weight
+        ("""
+            The weight of tenants not listed in :attr:`weights`.
+            """)
+        self._clocks: MutableMapping[Optional[Hashable], float] = {}
+        self._stats: MutableMapping[Optional[Hashable], TenantStats] = {}
+        self._lock = threading.Lock()
+
+    def get_weight(self, tenant: Optional[Hashable]) -> float:
+        return self.weights.get(tenant, self.default_weight)
+
+    def get_stats(self) -> Mapping[Optional[Hashable], TenantStats]:
+        """Return the queue statistics of each tenant seen so far."""
+        return self._stats
+
+    def get_tenant_stats(self, tenant: Optional[Hashable]) -> TenantStats:
+        stats = self._stats.get(tenant)
+        if stats is None:
+            stats = self._stats[tenant] = TenantStats()
+        return stats
+
+    def enqueue(self, tenant: Optional[Hashable], now: float, cost: float) -> float:
+        """Record that a request from `tenant` is queued and return its virtual finish time.
+
+        `cost` is the amount of time the request is expected to occupy the
+        budget, which is the time between admissions when the budget is
+        spread evenly. Every call must be paired with a later call to :meth:`dequeue`.
+        """
+        weight = self.get_weight(tenant)
+        if weight <= 0:
+            raise ValueError(f'tenant weight must be positive: {tenant!r}')
+        with self._lock:
+            start = max(now, self._clocks.get(tenant, now))
+            finish = self._clocks[tenant] = start + cost / weight
+            self.get_tenant_stats(tenant).queued += 1
+            self._forget_idle_clocks(now)
+        return finish
+
+    def dequeue(self, tenant: Optional[Hashable], wait_time: float, *, admitted: bool = True) -> None:
+        """Record that a queued request has left the queue after waiting `wait_time` seconds.
+
+        Pass `admitted=False` if the request was abandoned instead of admitted.
+        """
+        with self._lock:
+            stats = self.get_tenant_stats(tenant)
+            stats.queued -= 1
+            if admitted:
+                stats.admitted += 1
+                stats.total_wait_time += wait_time
+                stats.max_wait_time = max(stats.max_wait_time, wait_time)
+
+    def _forget_idle_clocks(self, now: float) -> None:
+        # A clock that is behind the real time has no effect, so it can be dropped.
+        if len(self._clocks) > 64:
+            for tenant in [k for k, v in self._clocks.items() if v < now]:
+                del self._clocks[tenant]
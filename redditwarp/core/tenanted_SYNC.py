@@ -0,0 +1,27 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional, Hashable
+if TYPE_CHECKING:
+    from ..http.handler_SYNC import Handler
+    from ..http.send_params import SendParams
+    from ..http.exchange import Exchange
+
+from ..http.delegating_handler_SYNC import DelegatingHandler
+from .tenant import tenant_var
+
+class Tenanted(DelegatingHandler):
+    """Set the tenant of requests passing through this handler.
+
+    See :mod:`redditwarp.core.tenant`.
+    """
+
+    def __init__(self, handler: Handler, tenant: Optional[Hashable]) -> None:
+        super().__init__(handler)
+        self.tenant: Optional[Hashable] = tenant
+        ("")
+
+    def _send(self, p: SendParams) -> Exchange:
+        token = tenant_var.set(self.tenant)
+        try:
+            return super()._send(p)
+        finally:
+            tenant_var.reset(token)
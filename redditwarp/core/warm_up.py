@@ -0,0 +1,33 @@
+"""Support for warming up a client before its first request."""
+
+from __future__ import annotations
+from typing import Mapping
+
+from dataclasses import dataclass
+
+TOKEN_PHASE: str = 'token'
+("""
+    Obtaining an access token.
+    """)
+RESOURCE_CONNECTION_PHASE: str = 'resource_connection'
+("""
+    Connecting to the resource server (`oauth.reddit.com`), including the DNS lookup and TLS handshake.
+    """)
+TOKEN_CONNECTION_PHASE: str = 'token_connection'
+("""
+    Connecting to the token server. Skipped when a token is obtained, since that connects to the token server anyway.
+    """)
+
+
+@dataclass(repr=False, eq=False)
+class WarmUpReport:
+    phases: Mapping[str, float]
+    ("""
+        The number of seconds each phase took, keyed by phase name.
+
+        The phases run concurrently, so these durations overlap.
+        """)
+    total: float
+    ("""
+        The number of seconds the whole warm-up took.
+        """)
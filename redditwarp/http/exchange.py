@@ -1,4 +1,3 @@
-
 from __future__ import annotations
 from typing import TYPE_CHECKING, Sequence
 if TYPE_CHECKING:
@@ -6,7 +5,9 @@ if TYPE_CHECKING:
     from .request import Request
     from .response import Response
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from .timings import Timings
 
 
 @dataclass(repr=False, eq=False)
@@ -15,3 +16,4 @@ class Exchange:
     request: Request
     response: Response
     history: Sequence[Response]
+    timings: Timings = field(default_factory=Timings)
@@ -11,12 +11,14 @@ if TYPE_CHECKING:
     from .exchange import Exchange
     from ..types import JSON_ro
     from .payload import Payload
+    from .response_stream_ASYNC import StreamingResponse
 
-from urllib.parse import urljoin
+from .util.resolve_url import resolve_url
 
 from .requisition import make_requisition
 from .send_params import SendParams
 from .invoker_ASYNC import Invoker
+from .response_stream_ASYNC import as_streaming_response
 
 
 DEFAULT_TIMEOUT: float = 100.
@@ -124,9 +126,43 @@ class HTTPClient:
         )
         return await self._send(p)
 
+    @final
+    async def stream(self,
+        verb: str,
+        url: str,
+        *,
+        params: Optional[Mapping[str, str]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        data: Optional[Union[Mapping[str, str], bytes]] = None,
+        json: JSON_ro = None,
+        files: Optional[RequestFiles] = None,
+        payload: Optional[Payload] = None,
+        timeout: float = -2,
+        follow_redirects: Optional[bool] = None,
+    ) -> StreamingResponse:
+        """Make a request and return the response without reading its body.
+
+        Read the body in chunks from the response's `stream` attribute. If the
+        body won't be read to the end, use the response in an `async with` statement
+        or close its stream so that the connection is released.
+
+        If a handler in the chain does not support streaming, the response
+        body is read into memory and the stream is served from there.
+        """
+        reqi = self.make_requisition(verb, url, params=params, headers=headers,
+                data=data, json=json, files=files, payload=payload)
+        p = SendParams(
+            reqi,
+            timeout=timeout,
+            follow_redirects=follow_redirects,
+            stream=True,
+        )
+        xchg = await self._send(p)
+        return as_streaming_response(xchg.response)
+
     async def _send(self, p: SendParams) -> Exchange:
         reqi = p.requisition
-        reqi.url = urljoin(self.base_url, reqi.url)
+        reqi.url = resolve_url(self.base_url, reqi.url)
         if p.timeout == -2:
             p.timeout = self.timeout
         if p.follow_redirects is None:
@@ -1,6 +1,6 @@
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional, Mapping
+from typing import TYPE_CHECKING, Optional, Mapping, MutableMapping
 if TYPE_CHECKING:
     from ..handler_SYNC import Handler
     from ..send_params import SendParams
@@ -9,6 +9,12 @@ if TYPE_CHECKING:
 from ..delegating_handler_SYNC import DelegatingHandler
 
 
+def _apply_defaults(target: MutableMapping[str, str], defaults: Mapping[str, str]) -> None:
+    for k, v in defaults.items():
+        if k not in target:
+            target[k] = v
+
+
 class ApplyParamsAndHeaders(DelegatingHandler):
     def __init__(self, handler: Handler, *,
             params: Optional[Mapping[str, str]] = None,
@@ -37,8 +43,8 @@ class ApplyDefaultParamsAndHeaders(DelegatingHandler):
 
     def _send(self, p: SendParams) -> Exchange:
         reqi = p.requisition
-        (pd := reqi.params).update({**self.params, **pd})
-        (hd := reqi.headers).update({**self.headers, **hd})
+        _apply_defaults(reqi.params, self.params)
+        _apply_defaults(reqi.headers, self.headers)
         return super()._send(p)
 
 
@@ -61,7 +67,7 @@ class ApplyDefaultParams(DelegatingHandler):
 
     def _send(self, p: SendParams) -> Exchange:
         reqi = p.requisition
-        (pd := reqi.params).update({**self.params, **pd})
+        _apply_defaults(reqi.params, self.params)
         return super()._send(p)
 
 
@@ -84,5 +90,5 @@ class ApplyDefaultHeaders(DelegatingHandler):
 
     def _send(self, p: SendParams) -> Exchange:
         reqi = p.requisition
-        (hd := reqi.headers).update({**self.headers, **hd})
+        _apply_defaults(reqi.headers, self.headers)
         return super()._send(p)
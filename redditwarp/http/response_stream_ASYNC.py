@@ -0,0 +1,164 @@
+"""Response bodies that are read in chunks as they arrive.
+
+A request sent with `stream=True` (see
+:meth:`HTTPClient.stream() <redditwarp.http.http_client_ASYNC.HTTPClient.stream>`)
+gives a :class:`StreamingResponse`. Its body is left unread on the connection
+so that memory use stays flat no matter how large the body is.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable, AsyncIterator, Awaitable, Optional, TypeVar
+if TYPE_CHECKING:
+    from types import TracebackType
+
+from ..util.imports import lazy_import
+if TYPE_CHECKING:
+    import asyncio
+else:
+    lazy_import % 'asyncio'
+
+from dataclasses import dataclass, field
+
+from . import exceptions
+from .response import Response, UResponse
+from .response_stream_SYNC import DEFAULT_CHUNK_SIZE
+
+
+async def _close_nothing() -> None:
+    pass
+
+
+class ResponseStream:
+    """A response body that is read from the connection in chunks.
+
+    The body can only be read once. The connection is released when the body
+    has been read to the end or the stream is closed.
+    """
+
+    _TSelf = TypeVar('_TSelf', bound='ResponseStream')
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> ResponseStream:
+        """Make a stream over a body that has already been read."""
+        async def chunks(n: int) -> AsyncIterator[bytes]:
+            for i in range(0, len(data), n):
+                yield data[i:i + n]
+        return cls(chunks)
+
+    def __init__(self,
+        chunks: Callable[[int], AsyncIterator[bytes]],
+        close: Callable[[], Awaitable[None]] = _close_nothing,
+    ) -> None:
+        """
+        .. .PARAMETERS
+
+        :param `Callable[[int], AsyncIterator[bytes]]` chunks:
+            Given a chunk size, returns an asynchronous iterator over the body.
+        :param `Callable[[], Awaitable[None]]` close:
+            Releases the connection.
+        """
+        self._chunks = chunks
+        self._close = close
+        self.started: bool = False
+        ("""
+            Whether the body has started to be read.
+            """)
+        self.closed: bool = False
+        ("")
+        self.bytes_read: int = 0
+        ("""
+            The number of body bytes read so far.
+            """)
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self.iter_chunks()
+
+    async def __aenter__(self: _TSelf) -> _TSelf:
+        return self
+
+    async def __aexit__(self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        exc_traceback: Optional[TracebackType],
+    ) -> Optional[bool]:
+        await self.close()
+        return None
+
+    async def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Iterate over the body in chunks of at most `chunk_size` bytes.
+
+        .. .RAISES
+
+        :raises RuntimeError:
+            The body has already been read.
+        :raises redditwarp.http.exceptions.TimeoutException:
+        :raises redditwarp.http.exceptions.TransportError:
+        """
+        if self.started or self.closed:
+            raise RuntimeError('the response body has already been read')
+        self.started = True
+        try:
+            it = self._chunks(chunk_size).__aiter__()
+            while True:
+                try:
+                    chunk = await it.__anext__()
+                except StopAsyncIteration:
+                    break
+                except exceptions.ArgExc:
+                    raise
+                except asyncio.TimeoutError as cause:
+                    raise exceptions.TimeoutException from cause
+                except Exception as cause:
+                    raise exceptions.TransportError from cause
+                if chunk:
+                    self.bytes_read += len(chunk)
+                    yield chunk
+        finally:
+            await self.close()
+
+    async def read(self) -> bytes:
+        """Read the rest of the body."""
+        return b''.join([chunk async for chunk in self.iter_chunks()])
+
+    async def close(self) -> None:
+        """Release the connection. Unread body data is discarded."""
+        if not self.closed:
+            self.closed = True
+            await self._close()
+
+
+@dataclass(repr=False, eq=False)
+class StreamingResponse(UResponse):
+    """A response whose body is read from :attr:`stream`.
+
+    The :attr:`data` attribute is empty.
+    """
+
+    stream: ResponseStream = field(default_factory=lambda: ResponseStream.from_bytes(b''))
+    ("")
+
+    _TSelf = TypeVar('_TSelf', bound='StreamingResponse')
+
+    async def __aenter__(self: _TSelf) -> _TSelf:
+        return self
+
+    async def __aexit__(self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        exc_traceback: Optional[TracebackType],
+    ) -> Optional[bool]:
+        await self.stream.close()
+        return None
+
+
+def as_streaming_response(resp: Response) -> StreamingResponse:
+    """Return `resp` if it is a streaming response, otherwise a streaming response over its body."""
+    if isinstance(resp, StreamingResponse):
+        return resp
+    return StreamingResponse(
+        status=resp.status,
+        headers=resp.headers,
+        data=b'',
+        underlying_object=getattr(resp, 'underlying_object', None),
+        stream=ResponseStream.from_bytes(resp.data),
+    )
@@ -12,3 +12,8 @@ class SendParams:
     requisition: Requisition
     timeout: float = -2
     follow_redirects: Optional[bool] = None
+    stream: bool = False
+    ("""
+        Leave the response body unread. Connectors return a `StreamingResponse`
+        whose body is read from its `stream` attribute.
+        """)
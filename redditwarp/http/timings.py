@@ -0,0 +1,64 @@
+from __future__ import annotations
+from typing import Optional, Mapping
+
+from dataclasses import dataclass
+
+
+@dataclass(repr=False, eq=False)
+class Timings:
+    """A breakdown of where the time of a request went.
+
+    All durations are in seconds. A phase whose duration is `None` was not
+    measured, e.g., because the connector's HTTP library doesn't expose it.
+    """
+
+    started_at: float = 0.
+    ("""
+        Unix timestamp of when the connector began sending the request.
+
+        Value is `0` if the exchange didn't come from a connector (e.g., it was served from a cache).
+        """)
+    rate_limit_wait: float = 0.
+    ("""
+        Time spent waiting to be admitted by the rate limiter.
+        """)
+    token_renewal: float = 0.
+    ("""
+        Time spent obtaining a new access token before the request could be sent.
+        """)
+    connect: Optional[float] = None
+    ("""
+        Time spent establishing a connection, including the TLS handshake.
+
+        Value is `0` if an existing connection was reused.
+        """)
+    ttfb: Optional[float] = None
+    ("""
+        Time from when the request was sent to when the response headers were received.
+
+        If :attr:`connect` is `None`, this includes the time taken to connect.
+        """)
+    download: Optional[float] = None
+    ("""
+        Time spent reading the response body.
+        """)
+    transport: Optional[float] = None
+    ("""
+        Total time spent in the connector, including redirects.
+        """)
+
+    def __repr__(self) -> str:
+        phases = ', '.join(f"{k}={v:.3f}" for k, v in self.get_phases().items())
+        return f"<{self.__class__.__name__} ({phases})>"
+
+    def get_phases(self) -> Mapping[str, float]:
+        """Return the durations of the phases that were measured."""
+        phases = {
+            'rate_limit_wait': self.rate_limit_wait,
+            'token_renewal': self.token_renewal,
+            'connect': self.connect,
+            'ttfb': self.ttfb,
+            'download': self.download,
+            'transport': self.transport,
+        }
+        return {k: v for k, v in phases.items() if v is not None}
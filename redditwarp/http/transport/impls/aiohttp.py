@@ -2,6 +2,7 @@
 from __future__ import annotations
 from typing import Optional
 
+import time
 import asyncio
 
 import aiohttp  # type: ignore[import]
@@ -10,8 +11,11 @@ from ... import exceptions
 from ... import payload
 from ...send_params import SendParams
 from ...exchange import Exchange
+from ...timings import Timings
 from ...request import Request
 from ...response import UResponse
+from ...response_stream_ASYNC import ResponseStream, StreamingResponse
+from ...util.multipart_encoder import MultipartEncoder
 from ...connector_ASYNC import Connector as BaseConnector
 
 
@@ -25,6 +29,14 @@ def _get_effective_follow_redirects(v: Optional[bool]) -> bool:
         raise ValueError(f"invalid `follow_redirects` value: {v}")
     return v
 
+async def _read_history_body(resp: aiohttp.ClientResponse) -> bytes:
+    # Newer versions of aiohttp release redirect responses before returning,
+    # and their bodies can no longer be read.
+    try:
+        return await resp.read()
+    except aiohttp.ClientConnectionError:
+        return b''
+
 
 class AiohttpConnector(BaseConnector):
     def __init__(self,
@@ -78,20 +90,18 @@ class AiohttpConnector(BaseConnector):
             data = dict(pld.data)
 
         elif isinstance(pld, payload.MultipartFormData):
-            data = aiohttp.FormData()
-            for pt in pld.parts:
-                if isinstance(pt, payload.MultipartFormData.TextField):
-                    data.add_field(pt.name, pt.text)
-                elif isinstance(pt, payload.MultipartFormData.FileField):
-                    data.add_field(pt.name, pt.file, filename=pt.filename, content_type=pt.content_type)
-                else:
-                    raise ValueError('unexpected multipart field type: ' + repr(pt))
+            encoder = MultipartEncoder(pld)
+            headers['Content-Type'] = encoder.content_type
+            headers['Content-Length'] = str(encoder.content_length)
+            data = encoder.async_chunks()
 
         else:
             raise Exception(f"unsupported payload type: {pld.__class__.__name__!r}")
 
+        started_at = time.time()
+        t0 = time.monotonic()
         try:
-            async with self.session.request(
+            resp = await self.session.request(
                 method=r.verb,
                 url=r.url,
                 params=r.params,
@@ -100,7 +110,9 @@ class AiohttpConnector(BaseConnector):
                 allow_redirects=follow_redirects,
                 data=data,
                 json=json,
-            ) as resp:
+            )
+            try:
+                t1 = t2 = time.monotonic()
                 requ = resp.request_info
                 x_requ = Request(
                     verb=requ.method,
@@ -108,21 +120,43 @@ class AiohttpConnector(BaseConnector):
                     headers=requ.headers,
                     data=b'',
                 )
-                x_resp = UResponse(
-                    status=resp.status,
-                    headers=resp.headers,
-                    data=(await resp.content.read()),
-                    underlying_object=resp,
-                )
                 history = [
                     UResponse(
                         status=resp1.status,
                         headers=resp1.headers,
-                        data=(await resp1.content.read()),
+                        data=(await _read_history_body(resp1)),
                         underlying_object=resp1,
                     )
                     for resp1 in resp.history
                 ]
+                x_resp: UResponse
+                if p.stream:
+                    async def close() -> None:
+                        resp.release()
+
+                    x_resp = StreamingResponse(
+                        status=resp.status,
+                        headers=resp.headers,
+                        data=b'',
+                        underlying_object=resp,
+                        stream=ResponseStream(resp.content.iter_chunked, close),
+                    )
+                else:
+                    try:
+                        content = await resp.content.read()
+                    finally:
+                        resp.release()
+                    t2 = time.monotonic()
+                    x_resp = UResponse(
+                        status=resp.status,
+                        headers=resp.headers,
+                        data=content,
+                        underlying_object=resp,
+                    )
+            except BaseException:
+                # Don't leave the connection checked out if the response couldn't be built.
+                resp.release()
+                raise
         except asyncio.TimeoutError as cause:
             raise exceptions.TimeoutException from cause
         except Exception as cause:
@@ -133,6 +167,7 @@ class AiohttpConnector(BaseConnector):
             request=x_requ,
             response=x_resp,
             history=history,
+            timings=Timings(started_at=started_at, ttfb=t1 - t0, download=t2 - t1, transport=time.monotonic() - t0),
         )
 
     async def _close(self) -> None:
@@ -2,14 +2,19 @@
 from __future__ import annotations
 from typing import Any, Optional
 
+import time
+
 import httpx  # type: ignore[import]
 
 from ... import exceptions
 from ... import payload
 from ...send_params import SendParams
 from ...exchange import Exchange
+from ...timings import Timings
 from ...request import Request
 from ...response import UResponse
+from ...response_stream_ASYNC import ResponseStream, StreamingResponse
+from ...util.multipart_encoder import MultipartEncoder
 from ...connector_ASYNC import Connector as BaseConnector
 
 
@@ -44,7 +49,7 @@ class HttpxConnector(BaseConnector):
 
         headers: dict[str, str] = dict(r.headers)
         data: Any = None
-        content: Optional[bytes] = None
+        content: Any = None
         json: Any = None
         files: Any = None
 
@@ -67,49 +72,59 @@ class HttpxConnector(BaseConnector):
             data = dict(pld.data)
 
         elif isinstance(pld, payload.MultipartFormData):
-            files = {}
-            for pt in pld.parts:
-                if isinstance(pt, payload.MultipartFormData.TextField):
-                    files[pt.name] = (None, pt.text.encode(), None)
-                elif isinstance(pt, payload.MultipartFormData.FileField):
-                    files[pt.name] = (pt.filename, pt.file, pt.content_type)
-                else:
-                    raise ValueError('unexpected multipart field type: ' + repr(pt))
+            encoder = MultipartEncoder(pld)
+            headers['Content-Type'] = encoder.content_type
+            headers['Content-Length'] = str(encoder.content_length)
+            content = encoder.async_chunks()
 
         else:
             raise Exception(f"unsupported payload type: {pld.__class__.__name__!r}")
 
+        started_at = time.time()
+        start = time.monotonic()
         try:
-            resp = await self.client.request(
+            requ = self.client.build_request(
                 method=r.verb,
                 url=r.url,
                 params=r.params,
                 headers=headers,
                 timeout=timeout_obj,
-                follow_redirects=follow_redirects,
                 data=data,
                 content=content,
                 json=json,
                 files=files,
             )
+            resp = await self.client.send(requ, follow_redirects=follow_redirects, stream=p.stream)
         except httpx.TimeoutException as cause:
             raise exceptions.TimeoutException from cause
         except Exception as cause:
             raise exceptions.TransportError from cause
 
+        transport_time = time.monotonic() - start
+
         requ = resp.request
         x_requ = Request(
             verb=requ.method,
             url=str(requ.url),
             headers=requ.headers,
-            data=await requ.aread(),
-        )
-        x_resp = UResponse(
-            status=resp.status_code,
-            headers=resp.headers,
-            data=resp.content,
-            underlying_object=resp,
+            data=b'' if isinstance(pld, payload.MultipartFormData) else await requ.aread(),
         )
+        x_resp: UResponse
+        if p.stream:
+            x_resp = StreamingResponse(
+                status=resp.status_code,
+                headers=resp.headers,
+                data=b'',
+                underlying_object=resp,
+                stream=ResponseStream(resp.aiter_bytes, resp.aclose),
+            )
+        else:
+            x_resp = UResponse(
+                status=resp.status_code,
+                headers=resp.headers,
+                data=resp.content,
+                underlying_object=resp,
+            )
         history = [
             UResponse(
                 status=resp1.status_code,
@@ -124,6 +139,7 @@ class HttpxConnector(BaseConnector):
             request=x_requ,
             response=x_resp,
             history=history,
+            timings=Timings(started_at=started_at, transport=transport_time),
         )
 
     async def _close(self) -> None:
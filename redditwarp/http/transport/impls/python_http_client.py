@@ -0,0 +1,404 @@
+from __future__ import annotations
+from typing import Optional, MutableMapping, Mapping, Iterator, Union, Tuple, Callable
+
+import sys
+import time
+import threading
+import socket
+import ssl
+import http.client
+import urllib.parse
+import json
+from collections import deque
+
+from ... import exceptions
+from ... import payload
+from ...send_params import SendParams
+from ...exchange import Exchange
+from ...timings import Timings
+from ...request import Request
+from ...response import UResponse
+from ...response_stream_SYNC import ResponseStream, StreamingResponse
+from ...connector_SYNC import Connector as BaseConnector
+from ...util.merge_query_params import merge_query_params
+from ...util.multipart_encoder import MultipartEncoder
+from ...util.case_insensitive_dict import CaseInsensitiveDict
+
+
+def _get_effective_timeout(v: float) -> float:
+    if 0 > v != -1:
+        raise ValueError(f"invalid `timeout` value: {v}")
+    return v
+
+def _get_effective_follow_redirects(v: Optional[bool]) -> bool:
+    if v is None:
+        raise ValueError(f"invalid `follow_redirects` value: {v}")
+    return v
+
+
+_REDIRECT_STATUSES = frozenset((301, 302, 303, 307, 308))
+
+# Errors that indicate a pooled connection was closed by the server while idle.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+# A stale connection error can also be raised after the server has received the
+# request, so only requests that are safe to send twice are retried.
+_IDEMPOTENT_VERBS = frozenset(('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'))
+
+_Origin = Tuple[str, str, int]
+
+
+class _HTTPConnection(http.client.HTTPConnection):
+    def __init__(self, host: str, port: int) -> None:
+        super().__init__(host, port)
+        self.idle_since: float = 0.
+
+class _HTTPSConnection(http.client.HTTPSConnection):
+    def __init__(self, host: str, port: int, *,
+        ssl_context: ssl.SSLContext,
+        get_tls_session: Callable[[_Origin], Optional[ssl.SSLSession]],
+    ) -> None:
+        super().__init__(host, port, context=ssl_context)
+        self.idle_since: float = 0.
+        self.ssl_context: ssl.SSLContext = ssl_context
+        self._get_tls_session = get_tls_session
+
+    def connect(self) -> None:
+        http.client.HTTPConnection.connect(self)
+        origin = ('https', self.host, self.port)
+        self.sock = self.ssl_context.wrap_socket(
+            self.sock,
+            server_hostname=self.host,
+            session=self._get_tls_session(origin),
+        )
+
+_Connection = Union[_HTTPConnection, _HTTPSConnection]
+
+
+class ConnectionPool:
+    """A thread-safe pool of persistent `http.client` connections, keyed by origin."""
+
+    def __init__(self, *,
+        max_connections_per_host: int = 10,
+        idle_timeout: float = 60,
+        ssl_context: Optional[ssl.SSLContext] = None,
+    ) -> None:
+        self.max_connections_per_host: int = max_connections_per_host
+        ("""
+            The maximum number of open connections per origin, both idle and in use.
+            """)
+        self.idle_timeout: float = idle_timeout
+        ("""
+            Number of seconds an idle connection is kept before it is pruned.
+            """)
+        self.ssl_context: ssl.SSLContext = ssl.create_default_context() if ssl_context is None else ssl_context
+        ("")
+        self._cond = threading.Condition()
+        self._idle: MutableMapping[_Origin, deque[_Connection]] = {}
+        self._open_counts: MutableMapping[_Origin, int] = {}
+        self._tls_sessions: MutableMapping[_Origin, ssl.SSLSession] = {}
+
+    def get_tls_session(self, origin: _Origin) -> Optional[ssl.SSLSession]:
+        return self._tls_sessions.get(origin)
+
+    def acquire(self, origin: _Origin, timeout: Optional[float] = None) -> tuple[_Connection, bool]:
+        """Return a connection for `origin` and whether it is a reused one.
+
+        Blocks while the per-host connection limit is reached.
+
+        .. .RAISES
+
+        :raises redditwarp.http.exceptions.TimeoutException:
+            No connection became available within `timeout` seconds.
+        """
+        with self._cond:
+            self._prune_locked(time.monotonic())
+            idle = self._idle.setdefault(origin, deque())
+            if idle:
+                return (idle.pop(), True)
+
+            if not self._cond.wait_for(
+                lambda: bool(idle) or self._open_counts.get(origin, 0) < self.max_connections_per_host,
+                timeout,
+            ):
+                raise exceptions.TimeoutException('timed out waiting for a pooled connection')
+            if idle:
+                return (idle.pop(), True)
+            self._open_counts[origin] = self._open_counts.get(origin, 0) + 1
+
+        scheme, host, port = origin
+        conn: _Connection
+        if scheme == 'https':
+            conn = _HTTPSConnection(host, port,
+                    ssl_context=self.ssl_context, get_tls_session=self.get_tls_session)
+        else:
+            conn = _HTTPConnection(host, port)
+        return (conn, False)
+
+    def release(self, origin: _Origin, conn: _Connection, *, reusable: bool) -> None:
+        """Return a connection to the pool, or discard it if it cannot be reused."""
+        sock = conn.sock
+        if isinstance(sock, ssl.SSLSocket) and sock.session is not None:
+            self._tls_sessions[origin] = sock.session
+
+        with self._cond:
+            if reusable and sock is not None:
+                conn.idle_since = time.monotonic()
+                self._idle.setdefault(origin, deque()).append(conn)
+            else:
+                conn.close()
+                self._open_counts[origin] -= 1
+            self._cond.notify()
+
+    def prune(self) -> None:
+        """Close connections that have been idle for longer than `idle_timeout`."""
+        with self._cond:
+            self._prune_locked(time.monotonic())
+
+    def _prune_locked(self, now: float) -> None:
+        threshold = now - self.idle_timeout
+        for origin, idle in self._idle.items():
+            while idle and idle[0].idle_since < threshold:
+                idle.popleft().close()
+                self._open_counts[origin] -= 1
+                self._cond.notify()
+
+    def clear(self) -> None:
+        """Close all idle connections and forget cached TLS sessions."""
+        with self._cond:
+            for origin, idle in self._idle.items():
+                while idle:
+                    idle.pop().close()
+                    self._open_counts[origin] -= 1
+            self._tls_sessions.clear()
+            self._cond.notify_all()
+
+
+class PythonHTTPClientConnector(BaseConnector):
+    """A connector built on `http.client` that keeps connections alive between requests."""
+
+    def __init__(self, pool: ConnectionPool) -> None:
+        super().__init__()
+        self.pool: ConnectionPool = pool
+        ("")
+        self.max_redirects: int = 20
+        ("")
+
+    def _send(self, p: SendParams) -> Exchange:
+        r = p.requisition
+
+        etv = _get_effective_timeout(p.timeout)
+        t = None if etv == -1 else etv
+
+        follow_redirects = _get_effective_follow_redirects(p.follow_redirects)
+
+        url = merge_query_params(r.url, r.params)
+
+        headers: dict[str, str] = dict(r.headers)
+        data: Optional[Union[bytes, MultipartEncoder]] = None
+
+        pld = r.payload
+        if pld is None:
+            pass
+
+        elif isinstance(pld, payload.Bytes):
+            headers['Content-Type'] = pld.get_media_type()
+            data = pld.data
+
+        elif isinstance(pld, payload.Text):
+            headers['Content-Type'] = pld.get_media_type()
+            data = pld.text.encode()
+
+        elif isinstance(pld, payload.JSON):
+            headers['Content-Type'] = pld.get_media_type()
+            data = json.dumps(pld.json).encode()
+
+        elif isinstance(pld, payload.URLEncodedFormData):
+            headers['Content-Type'] = pld.get_media_type()
+            data = urllib.parse.urlencode(pld.data).encode()
+
+        elif isinstance(pld, payload.MultipartFormData):
+            encoder = MultipartEncoder(pld)
+            headers['Content-Type'] = encoder.content_type
+            headers['Content-Length'] = str(encoder.content_length)
+            data = encoder
+
+        else:
+            raise Exception(f"unsupported payload type: {pld.__class__.__name__!r}")
+
+        verb = r.verb
+        history: list[UResponse] = []
+        started_at = time.time()
+        start = time.monotonic()
+        connect = ttfb = download = 0.
+        try:
+            while True:
+                status, resp_headers, content, resp, phases, body_stream = self._perform(
+                        verb, url, headers, data, t, stream=p.stream)
+                connect += phases[0]
+                ttfb += phases[1]
+                download += phases[2]
+
+                location = resp_headers.get('Location')
+                redirect = bool(follow_redirects and status in _REDIRECT_STATUSES and location)
+                if body_stream is not None and redirect:
+                    content = body_stream.read()
+                    body_stream = None
+
+                x_resp: UResponse
+                if body_stream is None:
+                    x_resp = UResponse(
+                        status=status,
+                        headers=resp_headers,
+                        data=content,
+                        underlying_object=resp,
+                    )
+                else:
+                    x_resp = StreamingResponse(
+                        status=status,
+                        headers=resp_headers,
+                        data=b'',
+                        underlying_object=resp,
+                        stream=body_stream,
+                    )
+
+                if not redirect:
+                    break
+                assert location is not None
+                if len(history) >= self.max_redirects:
+                    raise exceptions.TransportError('exceeded maximum number of redirects')
+                history.append(x_resp)
+
+                new_url = urllib.parse.urljoin(url, location)
+                if urllib.parse.urlsplit(new_url)[:2] != urllib.parse.urlsplit(url)[:2]:
+                    headers = {k: v for k, v in headers.items() if k.lower() != 'authorization'}
+                url = new_url
+                if status == 303 or (status in (301, 302) and verb == 'POST'):
+                    verb = 'GET'
+                    data = None
+                    headers = {k: v for k, v in headers.items() if k.lower() not in ('content-type', 'content-length')}
+
+        except exceptions.ArgExc:
+            raise
+        except socket.timeout as cause:
+            raise exceptions.TimeoutException from cause
+        except Exception as cause:
+            raise exceptions.TransportError from cause
+
+        timings = Timings(
+            started_at=started_at,
+            connect=connect,
+            ttfb=ttfb,
+            download=download,
+            transport=time.monotonic() - start,
+        )
+        x_requ = Request(
+            verb=verb,
+            url=url,
+            headers=headers,
+            data=data if isinstance(data, bytes) else b'',
+        )
+        return Exchange(
+            requisition=r,
+            request=x_requ,
+            response=x_resp,
+            history=history,
+            timings=timings,
+        )
+
+    def _perform(self,
+        verb: str,
+        url: str,
+        headers: Mapping[str, str],
+        data: Optional[Union[bytes, MultipartEncoder]],
+        timeout: Optional[float],
+        *,
+        stream: bool = False,
+    ) -> tuple[
+        int,
+        CaseInsensitiveDict[str],
+        bytes,
+        http.client.HTTPResponse,
+        tuple[float, float, float],
+        Optional[ResponseStream],
+    ]:
+        """Send one request and read its response.
+
+        The fifth item of the returned tuple holds the connect, TTFB, and download durations.
+
+        If `stream` is true, the body is left unread and the connection is kept
+        out of the pool until the returned stream is closed.
+        """
+        o = urllib.parse.urlsplit(url)
+        scheme = o.scheme.lower()
+        if scheme not in ('http', 'https'):
+            raise ValueError(f"unsupported URL scheme: {scheme!r}")
+        host = o.hostname or ''
+        port = o.port or (443 if scheme == 'https' else 80)
+        origin = (scheme, host, port)
+        target = urllib.parse.urlunsplit(('', '', o.path or '/', o.query, ''))
+
+        while True:
+            conn, reused = self.pool.acquire(origin, timeout)
+            reusable = False
+            release = True
+            try:
+                conn.timeout = timeout
+                t0 = t1 = time.monotonic()
+                if conn.sock is None:
+                    conn.connect()
+                    t1 = time.monotonic()
+                else:
+                    conn.sock.settimeout(timeout)
+                conn.request(verb, target, body=data, headers=dict(headers))
+                resp = conn.getresponse()
+                t2 = t3 = time.monotonic()
+                if stream:
+                    content = b''
+                    release = False
+                else:
+                    content = resp.read()
+                    t3 = time.monotonic()
+                    reusable = not resp.will_close
+            except _STALE_CONNECTION_ERRORS:
+                if reused and verb in _IDEMPOTENT_VERBS:
+                    # The server likely closed the idle connection. Retry on a new one.
+                    continue
+                raise
+            finally:
+                if release:
+                    self.pool.release(origin, conn, reusable=reusable)
+
+            resp_headers: CaseInsensitiveDict[str] = CaseInsensitiveDict(dict(resp.getheaders()))
+            body_stream = self._make_stream(origin, conn, resp) if stream else None
+            return (resp.status, resp_headers, content, resp, (t1 - t0, t2 - t1, t3 - t2), body_stream)
+
+    def _make_stream(self, origin: _Origin, conn: _Connection, resp: http.client.HTTPResponse) -> ResponseStream:
+        def chunks(chunk_size: int) -> Iterator[bytes]:
+            while chunk := resp.read(chunk_size):
+                yield chunk
+
+        def close() -> None:
+            # The connection can only be reused if the body was read to the end.
+            self.pool.release(origin, conn, reusable=resp.isclosed() and not resp.will_close)
+
+        return ResponseStream(chunks, close)
+
+    def _close(self) -> None:
+        self.pool.clear()
+
+Connector = PythonHTTPClientConnector
+
+
+def new_connector() -> PythonHTTPClientConnector:
+    return PythonHTTPClientConnector(ConnectionPool())
+
+
+name: str = 'python-http-client'
+version: str = '%d.%d' % sys.version_info[:2]
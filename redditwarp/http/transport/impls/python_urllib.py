@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any, Optional
 
 import sys
+import time
 import urllib.request
 import urllib.parse
 import urllib.error
@@ -13,8 +14,11 @@ from ... import exceptions
 from ... import payload
 from ...send_params import SendParams
 from ...exchange import Exchange
+from ...timings import Timings
 from ...request import Request
 from ...response import UResponse
+from ...response_stream_SYNC import ResponseStream, StreamingResponse
+from ...util.multipart_encoder import MultipartEncoder
 from ...connector_SYNC import Connector as BaseConnector
 from ...util.merge_query_params import merge_query_params
 from ...util.case_insensitive_dict import CaseInsensitiveDict
@@ -67,7 +71,10 @@ class PythonUrllibConnector(BaseConnector):
             data = urllib.parse.urlencode(pld.data).encode()
 
         elif isinstance(pld, payload.MultipartFormData):
-            raise Exception('multipart payload not supported by python urllib')
+            encoder = MultipartEncoder(pld)
+            headers['Content-Type'] = encoder.content_type
+            headers['Content-Length'] = str(encoder.content_length)
+            data = encoder
 
         else:
             raise Exception(f"unsupported payload type: {pld.__class__.__name__!r}")
@@ -78,9 +85,17 @@ class PythonUrllibConnector(BaseConnector):
             data=data,
             headers=headers,
         )
+        started_at = time.time()
+        t0 = time.monotonic()
         try:
-            with urllib.request.urlopen(req, timeout=t) as resp:
-                content = resp.read()
+            resp = urllib.request.urlopen(req, timeout=t)
+            t1 = t2 = time.monotonic()
+            if p.stream:
+                content = b''
+            else:
+                with resp:
+                    content = resp.read()
+                t2 = time.monotonic()
         except socket.timeout as cause:
             raise exceptions.TimeoutException from cause
         except urllib.error.URLError as cause:
@@ -96,17 +111,29 @@ class PythonUrllibConnector(BaseConnector):
             headers={},
             data=b'',
         )
-        x_resp = UResponse(
-            status=resp.status,
-            headers=CaseInsensitiveDict(dict(resp.headers)),
-            data=content,
-            underlying_object=resp,
-        )
+        resp_headers = CaseInsensitiveDict(dict(resp.headers))
+        x_resp: UResponse
+        if p.stream:
+            x_resp = StreamingResponse(
+                status=resp.status,
+                headers=resp_headers,
+                data=b'',
+                underlying_object=resp,
+                stream=ResponseStream(lambda n: iter(lambda: resp.read(n), b''), resp.close),
+            )
+        else:
+            x_resp = UResponse(
+                status=resp.status,
+                headers=resp_headers,
+                data=content,
+                underlying_object=resp,
+            )
         return Exchange(
             requisition=r,
             request=x_requ,
             response=x_resp,
             history=(),
+            timings=Timings(started_at=started_at, ttfb=t1 - t0, download=t2 - t1, transport=t2 - t0),
         )
 
     def _close(self) -> None:
@@ -2,6 +2,8 @@
 from __future__ import annotations
 from typing import Optional, Any
 
+import time
+
 import requests  # type: ignore[import]
 import requests.adapters  # type: ignore[import]
 
@@ -9,8 +11,11 @@ from ... import exceptions
 from ... import payload
 from ...send_params import SendParams
 from ...exchange import Exchange
+from ...timings import Timings
 from ...request import Request
 from ...response import UResponse
+from ...response_stream_SYNC import ResponseStream, StreamingResponse
+from ...util.multipart_encoder import MultipartEncoder
 from ...connector_SYNC import Connector as BaseConnector
 
 
@@ -63,20 +68,16 @@ class RequestsConnector(BaseConnector):
             data = pld.data
 
         elif isinstance(pld, payload.MultipartFormData):
-            files = {}
-            for pt in pld.parts:
-                if isinstance(pt, payload.MultipartFormData.TextField):
-                    files[pt.name] = (None, pt.text)
-                elif isinstance(pt, payload.MultipartFormData.FileField):
-                    if pt.content_type == '':
-                        raise ValueError('empty string multipart content type not supported')
-                    files[pt.name] = (pt.filename, pt.file, pt.content_type)
-                else:
-                    raise ValueError('unexpected multipart field type: ' + repr(pt))
+            encoder = MultipartEncoder(pld)
+            headers['Content-Type'] = encoder.content_type
+            headers['Content-Length'] = str(encoder.content_length)
+            data = encoder
 
         else:
             raise Exception(f"unsupported payload type: {pld.__class__.__name__!r}")
 
+        started_at = time.time()
+        start = time.monotonic()
         try:
             resp = self.session.request(
                 method=r.verb,
@@ -88,18 +89,21 @@ class RequestsConnector(BaseConnector):
                 data=data,
                 json=json,
                 files=files,
+                stream=p.stream,
             )
         except requests.exceptions.ReadTimeout as cause:
             raise exceptions.TimeoutException from cause
         except Exception as cause:
             raise exceptions.TransportError from cause
 
+        transport_time = time.monotonic() - start
+
         requ = resp.request
 
         x_requ_data = requ.body
         if isinstance(x_requ_data, str):
             x_requ_data = x_requ_data.encode()
-        elif x_requ_data is None:
+        elif not isinstance(x_requ_data, bytes):
             x_requ_data = b''
 
         x_requ = Request(
@@ -108,12 +112,22 @@ class RequestsConnector(BaseConnector):
             headers=requ.headers,
             data=x_requ_data,
         )
-        x_resp = UResponse(
-            status=resp.status_code,
-            headers=resp.headers,
-            data=resp.content,
-            underlying_object=resp,
-        )
+        x_resp: UResponse
+        if p.stream:
+            x_resp = StreamingResponse(
+                status=resp.status_code,
+                headers=resp.headers,
+                data=b'',
+                underlying_object=resp,
+                stream=ResponseStream(resp.iter_content, resp.close),
+            )
+        else:
+            x_resp = UResponse(
+                status=resp.status_code,
+                headers=resp.headers,
+                data=resp.content,
+                underlying_object=resp,
+            )
         history = [
             UResponse(
                 status=resp1.status_code,
@@ -128,6 +142,7 @@ class RequestsConnector(BaseConnector):
             request=x_requ,
             response=x_resp,
             history=history,
+            timings=Timings(started_at=started_at, ttfb=resp.elapsed.total_seconds(), transport=transport_time),
         )
 
     def _close(self) -> None:
@@ -1,8 +1,9 @@
 
 from __future__ import annotations
-from typing import Optional, Union, Any, cast
+from typing import Optional, Any, cast
 
 import json
+import time
 
 import urllib3  # type: ignore[import]
 import urllib3.exceptions as urllib3_exceptions  # type: ignore[import]
@@ -11,8 +12,11 @@ from ... import exceptions
 from ... import payload
 from ...send_params import SendParams
 from ...exchange import Exchange
+from ...timings import Timings
 from ...request import Request
 from ...response import UResponse
+from ...response_stream_SYNC import ResponseStream, StreamingResponse
+from ...util.multipart_encoder import MultipartEncoder
 from ...connector_SYNC import Connector as BaseConnector
 from ...util.merge_query_params import merge_query_params
 
@@ -49,6 +53,8 @@ class Urllib3Connector(BaseConnector):
         pld = r.payload
 
         resp: urllib3.response.BaseHTTPResponse
+        started_at = time.time()
+        start = time.monotonic()
         try:
             if pld is None:
                 resp = self.http.urlopen(
@@ -57,6 +63,7 @@ class Urllib3Connector(BaseConnector):
                     headers=headers,
                     timeout=tmo,
                     redirect=follow_redirects,
+                    preload_content=not p.stream,
                 )
 
             elif isinstance(pld, payload.Bytes):
@@ -68,6 +75,7 @@ class Urllib3Connector(BaseConnector):
                     body=pld.data,
                     timeout=tmo,
                     redirect=follow_redirects,
+                    preload_content=not p.stream,
                 )
 
             elif isinstance(pld, payload.Text):
@@ -79,6 +87,7 @@ class Urllib3Connector(BaseConnector):
                     body=pld.text.encode(),
                     timeout=tmo,
                     redirect=follow_redirects,
+                    preload_content=not p.stream,
                 )
 
             elif isinstance(pld, payload.JSON):
@@ -90,6 +99,7 @@ class Urllib3Connector(BaseConnector):
                     body=json.dumps(pld.json).encode(),
                     timeout=tmo,
                     redirect=follow_redirects,
+                    preload_content=not p.stream,
                 )
 
             elif isinstance(pld, payload.URLEncodedFormData):
@@ -101,28 +111,22 @@ class Urllib3Connector(BaseConnector):
                     fields=fields0,
                     timeout=cast(Any, tmo),
                     redirect=cast(Any, follow_redirects),
+                    preload_content=not p.stream,
                     encode_multipart=False,
                 )
 
             elif isinstance(pld, payload.MultipartFormData):
-                fields: dict[str, Union[str, tuple[Optional[str], Union[str, bytes], Optional[str]]]] = {}
-                for pt in pld.parts:
-                    if isinstance(pt, payload.MultipartFormData.TextField):
-                        fields[pt.name] = pt.text
-                    elif isinstance(pt, payload.MultipartFormData.FileField):
-                        if pt.content_type == '':
-                            raise ValueError('empty string multipart content type not supported')
-                        fields[pt.name] = (pt.filename, pt.file.read(), pt.content_type)
-                    else:
-                        raise ValueError('unexpected multipart field type: ' + repr(pt))
-
-                resp = self.http.request_encode_body(
+                encoder = MultipartEncoder(pld)
+                headers['Content-Type'] = encoder.content_type
+                headers['Content-Length'] = str(encoder.content_length)
+                resp = self.http.urlopen(
                     r.verb,
                     url,
                     headers=headers,
-                    fields=cast(Any, fields),
-                    timeout=cast(Any, tmo),
-                    redirect=cast(Any, follow_redirects),
+                    body=encoder,
+                    timeout=tmo,
+                    redirect=follow_redirects,
+                    preload_content=not p.stream,
                 )
 
             else:
@@ -133,23 +137,44 @@ class Urllib3Connector(BaseConnector):
         except Exception as cause:
             raise exceptions.TransportError from cause
 
+        transport_time = time.monotonic() - start
+
         x_requ = Request(
             verb=r.verb,
             url=url,
             headers={},
             data=b'',
         )
-        x_resp = UResponse(
-            status=resp.status,
-            headers=resp.headers,
-            data=resp.data,
-            underlying_object=resp,
-        )
+        x_resp: UResponse
+        if p.stream:
+            def close() -> None:
+                if resp.closed:
+                    # The body was read to the end, so the connection can be reused.
+                    resp.release_conn()
+                else:
+                    # Discard the connection since the rest of the body is still on it.
+                    resp.close()
+
+            x_resp = StreamingResponse(
+                status=resp.status,
+                headers=resp.headers,
+                data=b'',
+                underlying_object=resp,
+                stream=ResponseStream(resp.stream, close),
+            )
+        else:
+            x_resp = UResponse(
+                status=resp.status,
+                headers=resp.headers,
+                data=resp.data,
+                underlying_object=resp,
+            )
         return Exchange(
             requisition=r,
             request=x_requ,
             response=x_resp,
             history=(),
+            timings=Timings(started_at=started_at, transport=transport_time),
         )
 
     def _close(self) -> None:
@@ -13,6 +13,7 @@ _transport_adapter_module_name_list: Sequence[str] = (
     'httpx_SYNC',
     'requests',
     'urllib3',
+    'python_http_client',
     'python_urllib',
 )
 _current_transport_adapter_module: Optional[ModuleType] = None
@@ -0,0 +1,57 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional, Mapping, Union, IO
+if TYPE_CHECKING:
+    from os import PathLike
+    from ..http_client_SYNC import HTTPClient
+
+import os
+
+from ..response_stream_SYNC import ResponseStream, DEFAULT_CHUNK_SIZE
+
+def _copy(stream: ResponseStream, file: IO[bytes], chunk_size: int) -> int:
+    for chunk in stream.iter_chunks(chunk_size):
+        file.write(chunk)
+    return stream.bytes_read
+
+def download(
+    http: HTTPClient,
+    url: str,
+    dest: Union[str, PathLike[str], IO[bytes]],
+    *,
+    params: Optional[Mapping[str, str]] = None,
+    headers: Optional[Mapping[str, str]] = None,
+    timeout: float = -2,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Stream the body of a GET request to a file, a chunk at a time.
+
+    If `dest` is a path, the body is written to a temporary file beside it
+    (the path with a `.part` suffix) that is renamed to `dest` once the
+    download completes, so `dest` never holds a partial download.
+
+    .. .RETURNS
+
+    :returns: The number of bytes written.
+    :rtype: `int`
+
+    .. .RAISES
+
+    :raises redditwarp.http.exceptions.StatusCodeException:
+        The response status was not successful. Nothing was written.
+    """
+    with http.stream('GET', url, params=params, headers=headers, timeout=timeout) as resp:
+        resp.ensure_successful_status()
+        if not isinstance(dest, (str, os.PathLike)):
+            return _copy(resp.stream, dest, chunk_size)
+
+        path = os.fspath(dest)
+        part_path = path + '.part'
+        try:
+            with open(part_path, 'wb') as fh:
+                n = _copy(resp.stream, fh, chunk_size)
+            os.replace(part_path, path)
+        except BaseException:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+        return n
@@ -1,6 +1,17 @@
 
+"""JSON decoding of response bodies.
+
+Response bodies are decoded with the fastest available JSON library, in order of
+preference: `orjson`, `msgspec`, `ujson`, then the standard library `json`
+module. The bytes of the body are decoded directly, without first being
+converted to a string.
+
+Use :func:`set_json_backend` to choose a backend, or to supply a custom
+decode function.
+"""
+
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence, Union
 if TYPE_CHECKING:
     from ..response import Response
 
@@ -9,6 +20,109 @@ import json
 json_decoder: json.JSONDecoder = json.JSONDecoder()
 json_decode: Callable[[str], Any] = json_decoder.decode
 
+
+JSONLoads = Callable[[bytes], Any]
+
+_json_backend_name_list: Sequence[str] = (
+    'orjson',
+    'msgspec',
+    'ujson',
+    'json',
+)
+_current_json_backend: Optional[tuple[str, JSONLoads]] = None
+
+
+def _import_json_backend(name: str) -> JSONLoads:
+    if name == 'orjson':
+        import orjson
+        return orjson.loads
+
+    if name == 'msgspec':
+        import msgspec.json
+        decode = msgspec.json.Decoder().decode
+        msgspec_error = msgspec.DecodeError
+
+        def msgspec_loads(data: bytes) -> Any:
+            try:
+                return decode(data)
+            except msgspec_error as cause:
+                raise ValueError(str(cause)) from cause
+
+        return msgspec_loads
+
+    if name == 'ujson':
+        import ujson  # type: ignore[import]
+        return ujson.loads
+
+    if name == 'json':
+        return json.loads
+
+    raise ValueError(f'unknown JSON backend: {name!r}')
+
+def _init_json_backend() -> tuple[str, JSONLoads]:
+    for name in _json_backend_name_list:
+        try:
+            return (name, _import_json_backend(name))
+        except ImportError:
+            pass
+    raise RuntimeError('unreachable')
+
+def _get_json_backend() -> tuple[str, JSONLoads]:
+    global _current_json_backend
+    if _current_json_backend is None:
+        _current_json_backend = _init_json_backend()
+    return _current_json_backend
+
+def get_json_backend_name() -> str:
+    """Return the name of the JSON backend in use, or `'custom'` for a custom decode function."""
+    return _get_json_backend()[0]
+
+def get_json_loads() -> JSONLoads:
+    """Return the function used to decode JSON from bytes."""
+    return _get_json_backend()[1]
+
+def set_json_backend(backend: Union[str, JSONLoads]) -> None:
+    """Set the JSON backend used to decode response bodies.
+
+    .. .PARAMETERS
+
+    :param backend:
+        The name of a backend (one of `'orjson'`, `'msgspec'`, `'ujson'`, or `'json'`),
+        or a function that decodes JSON from bytes. A function must raise
+        `ValueError` on invalid input, and `TypeError` on input of a type
+        it does not accept.
+
+    .. .RAISES
+
+    :raises ImportError:
+        The named backend is not installed.
+    :raises ValueError:
+        The backend name is not known.
+    """
+    global _current_json_backend
+    if isinstance(backend, str):
+        _current_json_backend = (backend, _import_json_backend(backend))
+    else:
+        _current_json_backend = ('custom', backend)
+
+def loads(data: bytes, /) -> Any:
+    """Decode JSON from bytes using the current backend.
+
+    Invalid JSON is reported with the backend's own `ValueError`. Input of a
+    type the backend does not accept is decoded with the standard library instead.
+
+    The third-party backends are stricter than the standard library in some
+    respects, such as rejecting or rounding integers larger than 64 bits. Use
+    the `'json'` backend if such values must be decoded exactly.
+    """
+    name, f = _get_json_backend()
+    try:
+        return f(data)
+    except TypeError:
+        if name == 'json':
+            raise
+    return json.loads(data)
+
 def load_json_from_response(resp: Response, /) -> Any:
     """Return the JSON data contained in a response object.
 
@@ -26,7 +140,7 @@ def load_json_from_response(resp: Response, /) -> Any:
     :raises ValueError:
         The response does not contain valid JSON data.
     """
-    return json_decode(resp.data.decode())
+    return loads(resp.data)
 
 def load_json_from_response_but_prefer_status_code_exception_on_failure(resp: Response, /) -> Any:
     """Return the JSON data contained in a response object.
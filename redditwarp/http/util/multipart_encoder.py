@@ -0,0 +1,216 @@
+"""A streaming encoder for `multipart/form-data` request bodies.
+
+The body is produced a chunk at a time, so memory use stays flat no matter how
+large the uploaded files are. File parts are read in chunks, or served as
+slices of a memory map when the file is a regular file on disk. The total
+length is computed up front so that the body is sent with a `Content-Length`
+header rather than with chunked transfer encoding, which some servers (such as
+the S3 buckets that Reddit media upload leases point to) don't accept.
+
+All bundled connectors send multipart payloads through this encoder::
+
+    encoder = MultipartEncoder(pld)
+    headers['Content-Type'] = encoder.content_type
+    headers['Content-Length'] = str(encoder.content_length)
+    conn.request('POST', url, body=encoder, headers=headers)
+
+The encoder can be iterated more than once (e.g., when a request is retried or
+a redirect is followed) as long as the files are seekable. Each iteration
+starts the files from the positions they were at when the encoder was made.
+"""
+
+from __future__ import annotations
+from typing import Optional, Iterator, AsyncIterator, AsyncIterable, Sequence, Union, IO
+
+import os
+import io
+import stat
+import mmap
+import uuid
+
+from ..payload import MultipartFormData
+
+DEFAULT_CHUNK_SIZE: int = 64 * 1024
+
+MMAP_THRESHOLD: int = 1024 * 1024
+"""Files at least this many bytes in size are sent from a memory map."""
+
+
+def _quote(s: str) -> str:
+    return s.replace('"', '%22').replace('\r', '%0D').replace('\n', '%0A')
+
+def _get_fileno(file: IO[bytes]) -> Optional[int]:
+    try:
+        return file.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+class _FilePart:
+    def __init__(self, file: IO[bytes]) -> None:
+        self.file = file
+        self.data: Optional[bytes] = None
+        self.position = 0
+        self.length = 0
+        self.fileno: Optional[int] = None
+
+        fd = _get_fileno(file)
+        if fd is not None:
+            st = os.fstat(fd)
+            if stat.S_ISREG(st.st_mode):
+                self.fileno = fd
+                self.position = file.tell()
+                self.length = max(0, st.st_size - self.position)
+                return
+
+        if file.seekable():
+            self.position = file.tell()
+            self.length = file.seek(0, io.SEEK_END) - self.position
+            file.seek(self.position)
+            return
+
+        # The length of a non-seekable stream can't be known without reading it.
+        self.data = file.read()
+        self.length = len(self.data)
+
+    def iter_chunks(self, chunk_size: int) -> Iterator[Union[bytes, memoryview]]:
+        if self.data is not None:
+            yield self.data
+            return
+        if self.length == 0:
+            return
+        if self.fileno is not None and self.length >= MMAP_THRESHOLD:
+            yield from self._iter_mmap_chunks(self.fileno, chunk_size)
+            return
+
+        file = self.file
+        file.seek(self.position)
+        remaining = self.length
+        while remaining > 0:
+            chunk = file.read(min(chunk_size, remaining))
+            if not chunk:
+                raise ValueError('file was truncated while being uploaded')
+            remaining -= len(chunk)
+            yield chunk
+
+    def _iter_mmap_chunks(self, fd: int, chunk_size: int) -> Iterator[memoryview]:
+        # The map must cover the file from the start, since its offset has to
+        # be a multiple of the allocation granularity.
+        end = self.position + self.length
+        mm = mmap.mmap(fd, end, access=mmap.ACCESS_READ)
+        try:
+            view = memoryview(mm)
+            for i in range(self.position, end, chunk_size):
+                yield view[i:min(i + chunk_size, end)]
+            view.release()
+        finally:
+            try:
+                mm.close()
+            except BufferError:
+                # A chunk is still referenced by the caller. The map is
+                # closed when the last chunk is garbage collected.
+                pass
+
+
+class MultipartEncoder:
+    """Encode a :class:`~redditwarp.http.payload.MultipartFormData` payload as a stream of chunks."""
+
+    @property
+    def content_type(self) -> str:
+        """The value for the request's `Content-Type` header, including the boundary."""
+        return f'multipart/form-data; boundary={self.boundary}'
+
+    @property
+    def content_length(self) -> int:
+        """The number of bytes in the encoded body."""
+        return self._content_length
+
+    def __init__(self,
+        pld: MultipartFormData,
+        *,
+        boundary: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """
+        .. .PARAMETERS
+
+        :param `MultipartFormData` pld:
+        :param `Optional[str]` boundary:
+            The part boundary. A random one is chosen if not given.
+        :param `int` chunk_size:
+            The maximum size of the chunks that files are read in.
+
+        .. .RAISES
+
+        :raises ValueError:
+            A file field has an empty string content type, or a part is not
+            a text or file field.
+        """
+        self.boundary: str = uuid.uuid4().hex if boundary is None else boundary
+        ("")
+        self.chunk_size: int = chunk_size
+        ("")
+        self._parts: Sequence[tuple[bytes, Union[bytes, _FilePart]]] = [
+            (self._make_part_head(field), self._make_part_body(field))
+            for field in pld.parts
+        ]
+        self._tail = f'--{self.boundary}--\r\n'.encode()
+        self._content_length = len(self._tail) + sum(
+            len(head) + (len(body) if isinstance(body, bytes) else body.length) + 2
+            for head, body in self._parts
+        )
+
+    def __len__(self) -> int:
+        return self._content_length
+
+    def __iter__(self) -> Iterator[Union[bytes, memoryview]]:
+        for head, body in self._parts:
+            yield head
+            if isinstance(body, bytes):
+                yield body
+            else:
+                yield from body.iter_chunks(self.chunk_size)
+            yield b'\r\n'
+        yield self._tail
+
+    def async_chunks(self) -> AsyncIterable[Union[bytes, memoryview]]:
+        """Return an async iterable over the encoded body, for async HTTP libraries.
+
+        File parts are still read synchronously, a chunk at a time.
+        """
+        return _AsyncChunks(self)
+
+    def read_all(self) -> bytes:
+        """Return the whole encoded body in one bytes object."""
+        return b''.join(self)
+
+    def _make_part_head(self, field: MultipartFormData.Field) -> bytes:
+        disposition = f'form-data; name="{_quote(field.name)}"'
+        lines = [f'--{self.boundary}']
+        if isinstance(field, MultipartFormData.FileField):
+            if field.filename is not None:
+                disposition += f'; filename="{_quote(field.filename)}"'
+            lines.append(f'Content-Disposition: {disposition}')
+            if field.content_type == '':
+                raise ValueError('empty string multipart content type not supported')
+            if field.content_type is not None:
+                lines.append(f'Content-Type: {field.content_type}')
+        else:
+            lines.append(f'Content-Disposition: {disposition}')
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode()
+
+    def _make_part_body(self, field: MultipartFormData.Field) -> Union[bytes, _FilePart]:
+        if isinstance(field, MultipartFormData.TextField):
+            return field.text.encode()
+        if isinstance(field, MultipartFormData.FileField):
+            return _FilePart(field.file)
+        raise ValueError('unexpected multipart field type: ' + repr(field))
+
+
+class _AsyncChunks:
+    def __init__(self, encoder: MultipartEncoder) -> None:
+        self._encoder = encoder
+
+    async def __aiter__(self) -> AsyncIterator[Union[bytes, memoryview]]:
+        for chunk in self._encoder:
+            yield chunk
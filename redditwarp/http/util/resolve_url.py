@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from urllib.parse import urljoin
+
+@lru_cache(maxsize=1024)
+def resolve_url(base_url: str, url: str) -> str:
+    """Return `urljoin(base_url, url)`, caching the results.
+
+    Clients tend to make requests to the same few paths repeatedly, and
+    `urljoin()` is relatively expensive.
+    """
+    return urljoin(base_url, url)
@@ -2,6 +2,8 @@
 from __future__ import annotations
 from typing import TypeVar, AsyncIterator, Callable, Optional, Awaitable, Iterable
 
+from ..core.accounting import procedure_var, having_procedure
+
 T = TypeVar('T')
 
 class StubbornCallerAsyncIterator(AsyncIterator[T]):
@@ -11,12 +13,16 @@ class StubbornCallerAsyncIterator(AsyncIterator[T]):
     `next(self)` will re-attempt the call until it returns a result.
 
     Has a `self.current` attribute to get the current callable.
+
+    The calls are charged to the procedure that created the iterator.
+    See :mod:`redditwarp.core.accounting`.
     """
 
     def __init__(self, iterable: Iterable[Callable[[], Awaitable[T]]]) -> None:
         self.__itr = iter(iterable)
         self.current: Optional[Callable[[], Awaitable[T]]] = None
         ("")
+        self._procedure: str = procedure_var.get()
 
     def __aiter__(self) -> AsyncIterator[T]:
         return self
@@ -27,6 +33,7 @@ class StubbornCallerAsyncIterator(AsyncIterator[T]):
                 self.current = next(self.__itr)
             except StopIteration:
                 raise StopAsyncIteration
-        ret = await self.current()
+        with having_procedure(self._procedure):
+            ret = await self.current()
         self.current = None
         return ret
@@ -2,6 +2,8 @@
 from __future__ import annotations
 from typing import TypeVar, Iterator, Iterable, Callable, Optional
 
+from ..core.accounting import procedure_var, having_procedure
+
 T = TypeVar('T')
 
 class StubbornCallerIterator(Iterator[T]):
@@ -11,12 +13,16 @@ class StubbornCallerIterator(Iterator[T]):
     `next(self)` will re-attempt the call until it returns a result.
 
     Has a `self.current` attribute to get the current callable.
+
+    The calls are charged to the procedure that created the iterator.
+    See :mod:`redditwarp.core.accounting`.
     """
 
     def __init__(self, iterable: Iterable[Callable[[], T]]) -> None:
         self.__itr = iter(iterable)
         self.current: Optional[Callable[[], T]] = None
         ("")
+        self._procedure: str = procedure_var.get()
 
     def __iter__(self) -> Iterator[T]:
         return self
@@ -24,6 +30,7 @@ class StubbornCallerIterator(Iterator[T]):
     def __next__(self) -> T:
         if self.current is None:
             self.current = next(self.__itr)
-        ret = self.current()
+        with having_procedure(self._procedure):
+            ret = self.current()
         self.current = None
         return ret
@@ -0,0 +1,102 @@
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Mapping, Optional
+if TYPE_CHECKING:
+    from ..util.tree_node import TreeNode
+    from ..models.comment import Comment
+    from ..models.submission import Submission
+
+from ..models.compact import (
+    CompactSubreddit,
+    CompactAuthor,
+    CompactComment,
+    CompactSubmission,
+    CompactTreeNode,
+)
+
+class CompactLoader:
+    """Load compact models, sharing subreddit and author objects between them.
+
+    Use one loader for the whole of a crawl so that each subreddit and author
+    is held in memory once.
+
+    .. .PARAMETERS
+
+    :param `bool` keep_d:
+        Keep the raw data on each model as the `d` attribute. By default
+        it is discarded once the fields are extracted.
+    """
+
+    def __init__(self, *, keep_d: bool = False) -> None:
+        self.keep_d: bool = keep_d
+        ("")
+        self._subreddits: dict[int, CompactSubreddit] = {}
+        self._authors: dict[int, CompactAuthor] = {}
+
+    def load_subreddit(self, d: Mapping[str, Any]) -> CompactSubreddit:
+        """Return the subreddit of a comment or submission data object."""
+        idn = int(d['subreddit_id'].partition('_')[2], 36)
+        subreddit = self._subreddits.get(idn)
+        if subreddit is None:
+            subreddit = self._subreddits[idn] = CompactSubreddit(idn, d['subreddit'])
+        return subreddit
+
+    def load_author(self, d: Mapping[str, Any]) -> Optional[CompactAuthor]:
+        """Return the author of a comment or submission data object.
+
+        Value is `None` if the thing was removed or deleted.
+        """
+        if d['author'].startswith('['):
+            return None
+        idn = int(d['author_fullname'].partition('_')[2], 36)
+        author = self._authors.get(idn)
+        if author is None:
+            author = self._authors[idn] = CompactAuthor(idn, d['author'], d['author_premium'])
+        return author
+
+    def load_comment(self, d: Mapping[str, Any]) -> CompactComment:
+        return CompactComment(d, self.load_subreddit(d), self.load_author(d), keep_d=self.keep_d)
+
+    def load_submission(self, d: Mapping[str, Any]) -> CompactSubmission:
+        return CompactSubmission(d, self.load_subreddit(d), self.load_author(d), keep_d=self.keep_d)
+
+    def load_submission_tree_node(self, d: Any) -> CompactTreeNode[CompactSubmission]:
+        """Load the response data of the comment tree endpoint.
+
+        The `more` objects are dropped.
+        """
+        def load_comment_tree_node(d: Any) -> CompactTreeNode[CompactComment]:
+            children = []
+            replies_data = d['replies']
+            if replies_data:
+                for m in replies_data['data']['children']:
+                    if m['kind'] != 'more':
+                        children.append(load_comment_tree_node(m['data']))
+            return CompactTreeNode(self.load_comment(d), children)
+
+        value = self.load_submission(d[0]['data']['children'][0]['data'])
+        children = [
+            load_comment_tree_node(m['data'])
+            for m in d[1]['data']['children']
+            if m['kind'] != 'more'
+        ]
+        return CompactTreeNode(value, children)
+
+    def compact_submission_tree_node(self, node: TreeNode[Submission, TreeNode[Comment, Any]]) -> CompactTreeNode[CompactSubmission]:
+        """Convert a comment tree already loaded as regular models.
+
+        Accepts the trees of both the sync and async clients.
+
+        The regular models are not referenced by the returned tree, so they
+        can be garbage collected afterwards.
+        """
+        def compact_comment_tree_node(node: TreeNode[Comment, Any]) -> CompactTreeNode[CompactComment]:
+            return CompactTreeNode(
+                self.load_comment(node.value.d),
+                [compact_comment_tree_node(child) for child in node.children],
+            )
+
+        return CompactTreeNode(
+            self.load_submission(node.value.d),
+            [compact_comment_tree_node(child) for child in node.children],
+        )
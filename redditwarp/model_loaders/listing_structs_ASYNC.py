@@ -0,0 +1,52 @@
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from ..client_ASYNC import Client
+    from ..models.comment_ASYNC import LooseComment
+    from ..models.submission_ASYNC import Submission
+    from ..models.subreddit_ASYNC import Subreddit
+    from ..models.user_ASYNC import User
+
+import msgspec
+
+from ..models.listing_structs import (
+    Thing,
+    CommentData,
+    AccountData,
+    SubmissionData,
+    SubredditData,
+)
+from .comment_ASYNC import load_loose_comment
+from .submission_ASYNC import load_submission
+from .subreddit_ASYNC import load_subreddit
+from .user_ASYNC import load_user
+
+def load_comment_data(data: CommentData, client: Client) -> LooseComment:
+    return load_loose_comment(msgspec.to_builtins(data), client)
+
+def load_account_data(data: AccountData, client: Client) -> User:
+    return load_user(msgspec.to_builtins(data), client)
+
+def load_submission_data(data: SubmissionData, client: Client) -> Submission:
+    return load_submission(msgspec.to_builtins(data), client)
+
+def load_subreddit_data(data: SubredditData, client: Client) -> Subreddit:
+    return load_subreddit(msgspec.to_builtins(data), client)
+
+def load_thing(thing: Thing, client: Client) -> object:
+    """Load the model for a thing struct of any kind.
+
+    The model loaders read from a mapping, so the struct's fields are first
+    converted to a dict. Fields that are unset are left out.
+    """
+    data = thing.data
+    if isinstance(data, CommentData):
+        return load_comment_data(data, client)
+    if isinstance(data, SubmissionData):
+        return load_submission_data(data, client)
+    if isinstance(data, SubredditData):
+        return load_subreddit_data(data, client)
+    if isinstance(data, AccountData):
+        return load_account_data(data, client)
+    raise Exception('unknown thing type')
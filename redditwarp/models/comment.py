@@ -6,19 +6,76 @@ from datetime import datetime, timezone
 
 from ..core.const import AUTHORIZATION_BASE_URL
 from .datamemento import DatamementoBase
+from ..util.lazy_attribute import lazy_attribute
 from .report import ModReport, UserReport
 from ..model_loaders.report import load_mod_report, load_user_report
 
 class Comment(DatamementoBase):
-    @property
+    # The groups of nested attributes, and the datetimes, are only built
+    # when first accessed. Comment streams and large comment trees mostly
+    # read a few scalar fields. As with `Submission`, a missing key needed
+    # by one of them raises `KeyError` on that first access instead of in
+    # the loader.
+
+    @lazy_attribute
+    def created_at(self) -> datetime:
+        """When the comment was made."""
+        return datetime.fromtimestamp(self.created_ut, timezone.utc)
+
+    @lazy_attribute
+    def edited_at(self) -> datetime:
+        """When the comment was edited.
+
+        Value is `datetime.min` if :attr:`is_edited` is false.
+        """
+        if self.is_edited:
+            return datetime.fromtimestamp(self.edited_ut, timezone.utc)
+        return datetime.min
+
+    @lazy_attribute
+    def edited(self) -> Optional[Comment.Edited]:
+        """Value non-`None` if the comment was edited."""
+        if self.is_edited:
+            return self.Edited(self)
+        return None
+
+    @lazy_attribute
+    def me(self) -> Comment.Me:
+        """Attributes relating to the current user.
+
+        If there is no user context, these values contain nonsense.
+        """
+        return self.Me(self.d)
+
+    @lazy_attribute
     def submission(self) -> Comment.Submission:
         """Information related to the comment's submission."""
-        return self.__submission
+        return self.Submission(self.d)
 
-    @property
+    @lazy_attribute
     def subreddit(self) -> Comment.Subreddit:
         """Information related to the comment's subreddit."""
-        return self.__subreddit
+        return self.Subreddit(self.d)
+
+    @lazy_attribute
+    def author(self) -> Optional[Comment.Author]:
+        """Information about the author.
+
+        Value is `None` if the comment was removed or deleted.
+        """
+        if self.author_display_name.startswith('['):
+            return None
+        return self.Author(self.d)
+
+    @lazy_attribute
+    def mod(self) -> Optional[Comment.Moderation]:
+        """Attributes relating to moderation.
+
+        Value is `None` if the current user is not a moderator of the subreddit.
+        """
+        if 'spam' in self.d:
+            return self.Moderation(self.d)
+        return None
 
     class Me:
         def __init__(self, d: Mapping[str, Any]) -> None:
@@ -231,10 +288,6 @@ class Comment(DatamementoBase):
         ("""
             Unix timestamp of when the comment was made.
             """)
-        self.created_at: datetime = datetime.fromtimestamp(self.created_ut, timezone.utc)
-        ("""
-            When the comment was made.
-            """)
 
         self.body: str = d['body']
         ("""
@@ -273,21 +326,6 @@ class Comment(DatamementoBase):
 
             Value is `0` if :attr:`is_edited` is false.
             """)
-        self.edited_at: datetime = datetime.min
-        ("""
-            When the comment was edited.
-
-            Value is `datetime.min` if :attr:`is_edited` is false.
-            """)
-        if self.is_edited:
-            self.edited_at = datetime.fromtimestamp(self.edited_ut, timezone.utc)
-
-        self.edited: Optional[Comment.Edited] = None
-        ("""
-            Value non-`None` if the comment was edited.
-            """)
-        if edited:
-            self.edited = self.Edited(self)
 
         self.is_submitter: bool = d['is_submitter']
         ("""
@@ -335,41 +373,13 @@ class Comment(DatamementoBase):
             Same as :attr:`parent_comment_idn`.
             """)
 
-        self.me: Comment.Me = self.Me(d)
-        ("""
-            Attributes relating to the current user.
-
-            If there is no user context, these values contain nonsense.
-            """)
-
-        self.__submission: Comment.Submission = self.Submission(d)
-        self.__subreddit: Comment.Subreddit = self.Subreddit(d)
-
-        s: str = d['author']
-        self.author_display_name: str = s
+        self.author_display_name: str = d['author']
         ("""
             The author's username.
 
             Possibly `[removed]` if the comment was removed or
             `[deleted]` if the comment was deleted by the author.
             """)
-        self.author: Optional[Comment.Author] = None
-        ("""
-            Information about the author.
-
-            Value is `None` if the comment was removed or deleted.
-            """)
-        if not s.startswith('['):
-            self.author = self.Author(d)
-
-        self.mod: Optional[Comment.Moderation] = None
-        ("""
-            Attributes relating to moderation.
-
-            Value is `None` if the current user is not a moderator of the subreddit.
-            """)
-        if 'spam' in d:
-            self.mod = self.Moderation(d)
 
 
 class LooseComment(Comment):
@@ -378,13 +388,13 @@ class LooseComment(Comment):
     # * `GET /r/{subreddit}/comments`
     # * `GET /user/{username}/overview` (and variants)
 
-    @property
+    @lazy_attribute
     def submission(self) -> LooseComment.Submission:
-        return self.__submission
+        return self.Submission(self.d)
 
-    @property
+    @lazy_attribute
     def subreddit(self) -> LooseComment.Subreddit:
-        return self.__subreddit
+        return self.Subreddit(self.d)
 
     class Submission(Comment.Submission):
         def __init__(self, d: Mapping[str, Any]) -> None:
@@ -405,8 +415,3 @@ class LooseComment(Comment):
             super().__init__(d)
             self.quarantined: bool = d['quarantine']
             ("")
-
-    def __init__(self, d: Mapping[str, Any]) -> None:
-        super().__init__(d)
-        self.__submission: LooseComment.Submission = self.Submission(d)
-        self.__subreddit: LooseComment.Subreddit = self.Subreddit(d)
@@ -0,0 +1,280 @@
+"""Compact, slotted representations of comments and submissions for bulk crawls.
+
+The regular models keep an instance `__dict__`, the raw `d` mapping, and both
+the base 36 and integer forms of each ID. That is convenient, but when hundreds
+of thousands of comments are kept in memory the models take up several times
+the size of the data they hold.
+
+The classes here use `__slots__`, store only the integer form of IDs (the
+`id`, `id36`, and other derived attributes are properties), and share the
+`subreddit` and `author` objects between all the comments and submissions
+loaded by the same :class:`~redditwarp.model_loaders.compact.CompactLoader`.
+The raw `d` mapping is discarded unless the loader is asked to keep it.
+
+Compact models have no methods that make requests. Only a subset of the
+attributes of the regular models are available.
+"""
+
+from __future__ import annotations
+from typing import Any, Generic, Mapping, Optional, Sequence, TypeVar
+
+from datetime import datetime, timezone
+
+from ..core.const import AUTHORIZATION_BASE_URL
+from ..util.base_conversion import to_base36
+
+
+class CompactSubreddit:
+    __slots__ = ('idn', 'name')
+
+    @property
+    def id36(self) -> str:
+        return to_base36(self.idn)
+
+    @property
+    def id(self) -> int:
+        """Same as :attr:`idn`."""
+        return self.idn
+
+    def __init__(self, idn: int, name: str) -> None:
+        self.idn: int = idn
+        ("")
+        self.name: str = name
+        ("")
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} name={self.name!r}>"
+
+
+class CompactAuthor:
+    __slots__ = ('idn', 'name', 'has_premium')
+
+    @property
+    def id36(self) -> str:
+        return to_base36(self.idn)
+
+    @property
+    def id(self) -> int:
+        """Same as :attr:`idn`."""
+        return self.idn
+
+    def __init__(self, idn: int, name: str, has_premium: bool) -> None:
+        self.idn: int = idn
+        ("")
+        self.name: str = name
+        ("")
+        self.has_premium: bool = has_premium
+        ("")
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} name={self.name!r}>"
+
+
+class _CompactThing:
+    __slots__ = (
+        'd',
+        'idn',
+        'created_ut',
+        'score',
+        'permalink_path',
+        'edited_ut',
+        'stickied',
+        'locked',
+        'distinguished',
+        'subreddit',
+        'author_display_name',
+        'author',
+    )
+
+    @property
+    def id36(self) -> str:
+        return to_base36(self.idn)
+
+    @property
+    def id(self) -> int:
+        """Same as :attr:`idn`."""
+        return self.idn
+
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromtimestamp(self.created_ut, timezone.utc)
+
+    @property
+    def permalink(self) -> str:
+        return AUTHORIZATION_BASE_URL + self.permalink_path
+
+    @property
+    def is_edited(self) -> bool:
+        return self.edited_ut != 0
+
+    @property
+    def edited_at(self) -> datetime:
+        """Value is `datetime.min` if :attr:`is_edited` is false."""
+        if self.edited_ut:
+            return datetime.fromtimestamp(self.edited_ut, timezone.utc)
+        return datetime.min
+
+    def __init__(self,
+        d: Mapping[str, Any],
+        subreddit: CompactSubreddit,
+        author: Optional[CompactAuthor],
+        *,
+        keep_d: bool = False,
+    ) -> None:
+        self.d: Optional[Mapping[str, Any]] = d if keep_d else None
+        ("""
+            The raw data. Value is `None` unless the loader was asked to keep it.
+            """)
+        self.idn: int = int(d['id'], 36)
+        ("")
+        self.created_ut: int = int(d['created_utc'])
+        ("")
+        self.score: int = d['score']
+        ("")
+        self.permalink_path: str = d['permalink']
+        ("")
+        edited: Any = d['edited']
+        self.edited_ut: int = int(edited) if edited else 0
+        ("""
+            Value is `0` if not edited.
+            """)
+        self.stickied: bool = d['stickied']
+        ("")
+        self.locked: bool = d['locked']
+        ("")
+        self.distinguished: str = d['distinguished'] or ''
+        ("")
+        self.subreddit: CompactSubreddit = subreddit
+        ("""
+            Shared with the other things from the same subreddit.
+            """)
+        self.author_display_name: str = d['author'] if author is None else author.name
+        ("")
+        self.author: Optional[CompactAuthor] = author
+        ("""
+            Shared with the other things by the same author.
+
+            Value is `None` if the thing was removed or deleted.
+            """)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} id36={self.id36!r}>"
+
+
+class CompactComment(_CompactThing):
+    __slots__ = (
+        'body',
+        'score_hidden',
+        'is_submitter',
+        'collapsed',
+        'parent_comment_idn',
+        'submission_idn',
+    )
+
+    @property
+    def submission_id36(self) -> str:
+        return to_base36(self.submission_idn)
+
+    @property
+    def submission_id(self) -> int:
+        """Same as :attr:`submission_idn`."""
+        return self.submission_idn
+
+    @property
+    def is_top_level(self) -> bool:
+        """Whether the comment is a direct child of the submission."""
+        return self.parent_comment_idn == 0
+
+    @property
+    def has_parent_comment(self) -> bool:
+        return self.parent_comment_idn != 0
+
+    @property
+    def parent_comment_id36(self) -> str:
+        """Empty string if the comment is top level."""
+        return to_base36(self.parent_comment_idn) if self.parent_comment_idn else ''
+
+    @property
+    def parent_comment_id(self) -> int:
+        """Same as :attr:`parent_comment_idn`."""
+        return self.parent_comment_idn
+
+    def __init__(self,
+        d: Mapping[str, Any],
+        subreddit: CompactSubreddit,
+        author: Optional[CompactAuthor],
+        *,
+        keep_d: bool = False,
+    ) -> None:
+        super().__init__(d, subreddit, author, keep_d=keep_d)
+        self.body: str = d['body']
+        ("")
+        self.score_hidden: bool = d['score_hidden']
+        ("")
+        self.is_submitter: bool = d['is_submitter']
+        ("")
+        self.collapsed: bool = d['collapsed']
+        ("")
+        parent_id: str = d['parent_id']
+        self.parent_comment_idn: int = 0 if parent_id.startswith('t3_') else int(parent_id.partition('_')[2], 36)
+        ("""
+            Value is `0` if the comment is top level.
+            """)
+        self.submission_idn: int = int(d['link_id'].partition('_')[2], 36)
+        ("")
+
+
+class CompactSubmission(_CompactThing):
+    __slots__ = (
+        'title',
+        'body',
+        'link',
+        'comment_count',
+        'upvote_ratio',
+        'archived',
+        'nsfw',
+        'spoiler',
+    )
+
+    def __init__(self,
+        d: Mapping[str, Any],
+        subreddit: CompactSubreddit,
+        author: Optional[CompactAuthor],
+        *,
+        keep_d: bool = False,
+    ) -> None:
+        super().__init__(d, subreddit, author, keep_d=keep_d)
+        self.title: str = d['title']
+        ("")
+        self.body: str = d['selftext'] if d['is_self'] else ''
+        ("""
+            The body text of a text post. Empty string for other kinds of posts.
+            """)
+        self.link: str = d.get('url_overridden_by_dest', '')
+        ("""
+            The URL linked to by a link post. Empty string for other kinds of posts.
+            """)
+        self.comment_count: int = d['num_comments']
+        ("")
+        self.upvote_ratio: float = d['upvote_ratio']
+        ("")
+        self.archived: bool = d['archived']
+        ("")
+        self.nsfw: bool = d['over_18']
+        ("")
+        self.spoiler: bool = d['spoiler']
+        ("")
+
+
+TValue_co = TypeVar('TValue_co', covariant=True)
+
+class CompactTreeNode(Generic[TValue_co]):
+    """A slotted tree node of compact models. The `more` nodes of comment trees are dropped."""
+
+    __slots__ = ('value', 'children')
+
+    def __init__(self, value: TValue_co, children: Sequence[CompactTreeNode[CompactComment]]) -> None:
+        self.value: TValue_co = value
+        ("")
+        self.children: Sequence[CompactTreeNode[CompactComment]] = children
+        ("")
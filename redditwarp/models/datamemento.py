@@ -2,34 +2,29 @@
 from __future__ import annotations
 from typing import Any, Mapping
 
-from functools import cached_property
-
 from ..util.attribute_mapping_proxy import DictAndListRecursiveAttributeMappingProxy
+from ..util.lazy_attribute import lazy_attribute
 
 
 D = Mapping[str, Any]
 B = DictAndListRecursiveAttributeMappingProxy[Any]
 
 
+# The `b` proxy is rarely used, so it is only made when first accessed.
+
 class DatamementoPropertiesMixin:
     d: D
 
-    @cached_property
+    @lazy_attribute
     def b(self) -> B:
         return DictAndListRecursiveAttributeMappingProxy(self.d)
 
 
-class DatamementoBase:
+class DatamementoBase(DatamementoPropertiesMixin):
     def __init__(self, d: D) -> None:
         self.d: D = d
         ("")
-        self.b: B = DictAndListRecursiveAttributeMappingProxy(d)
-        ("")
 
 
-class DatamementoDataclassesMixin:
-    d: D
-    b: B
-
-    def __post_init__(self) -> None:
-        object.__setattr__(self, 'b', DictAndListRecursiveAttributeMappingProxy(self.d))
+class DatamementoDataclassesMixin(DatamementoPropertiesMixin):
+    pass
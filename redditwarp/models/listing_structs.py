@@ -0,0 +1,299 @@
+"""Typed structs for listings of comments, accounts, submissions, and subreddits.
+
+Requires the `msgspec` package.
+
+These structs make a field-pruning decoder. :func:`decode_listing` parses a
+listing response body into them, and only the fields the models read are
+built. The rest of each object is skipped over by the parser without being
+turned into Python objects. Fields that may be absent from a response are
+`UNSET` when they are.
+
+The loaders in :mod:`redditwarp.model_loaders.listing_structs_SYNC`
+(or :mod:`~redditwarp.model_loaders.listing_structs_ASYNC`) produce the
+regular models from the thing structs. Models loaded this way have a `d`
+mapping that holds just the kept fields.
+
+Listing paginators decode their pages through these structs when their
+`struct_decoding` attribute is set to true, and load their models straight
+from the decoded children.
+"""
+
+from __future__ import annotations
+from typing import Any, List, Optional, Union
+
+import re
+
+import msgspec
+from msgspec import UNSET as UNSET, UnsetType as UnsetType
+
+from ..http.util.json_loading import loads
+
+
+class ThingData(msgspec.Struct, gc=False):
+    """Base class for the data of a thing."""
+
+
+class CommentData(ThingData):
+    id: str
+    name: str
+    created_utc: float
+    body: str
+    score: int
+    permalink: str
+    link_id: str
+    parent_id: str
+    subreddit: str
+    subreddit_id: str
+    author: str
+    edited: Union[bool, float] = False
+    distinguished: Optional[str] = None
+    stickied: bool = False
+    locked: bool = False
+    archived: bool = False
+    collapsed: bool = False
+    score_hidden: bool = False
+    is_submitter: bool = False
+    body_html: Union[UnsetType, Optional[str]] = UNSET
+    subreddit_type: Union[UnsetType, str] = UNSET
+    author_fullname: Union[UnsetType, str] = UNSET
+    author_premium: Union[UnsetType, bool] = UNSET
+    author_flair_text: Union[UnsetType, Optional[str]] = UNSET
+    author_flair_type: Union[UnsetType, Optional[str]] = UNSET
+    author_flair_css_class: Union[UnsetType, Optional[str]] = UNSET
+    author_flair_template_id: Union[UnsetType, Optional[str]] = UNSET
+    author_flair_background_color: Union[UnsetType, Optional[str]] = UNSET
+    author_flair_text_color: Union[UnsetType, Optional[str]] = UNSET
+    likes: Union[UnsetType, Optional[bool]] = UNSET
+    saved: Union[UnsetType, bool] = UNSET
+    send_replies: Union[UnsetType, bool] = UNSET
+    quarantine: Union[UnsetType, bool] = UNSET
+    over_18: Union[UnsetType, bool] = UNSET
+    link_title: Union[UnsetType, str] = UNSET
+    link_author: Union[UnsetType, str] = UNSET
+    link_permalink: Union[UnsetType, str] = UNSET
+    num_reports: Union[UnsetType, Optional[int]] = UNSET
+    mod_reports: Union[UnsetType, Any] = UNSET
+    user_reports: Union[UnsetType, Any] = UNSET
+    spam: Union[UnsetType, bool] = UNSET
+    ignore_reports: Union[UnsetType, bool] = UNSET
+    approved_at_utc: Union[UnsetType, Optional[float]] = UNSET
+    approved_by: Union[UnsetType, Optional[str]] = UNSET
+    banned_at_utc: Union[UnsetType, Optional[float]] = UNSET
+    banned_by: Union[UnsetType, Any] = UNSET
+    mod_note: Union[UnsetType, Optional[str]] = UNSET
+    mod_reason_by: Union[UnsetType, Optional[str]] = UNSET
+    mod_reason_title: Union[UnsetType, Optional[str]] = UNSET
+    replies: Union[UnsetType, Any] = UNSET
+
+
+class AccountData(ThingData):
+    id: str
+    name: str
+    created_utc: float
+    link_karma: int = 0
+    comment_karma: int = 0
+    awardee_karma: Union[UnsetType, int] = UNSET
+    awarder_karma: Union[UnsetType, int] = UNSET
+    total_karma: Union[UnsetType, int] = UNSET
+    is_gold: Union[UnsetType, bool] = UNSET
+    is_mod: Union[UnsetType, bool] = UNSET
+    is_employee: Union[UnsetType, bool] = UNSET
+    is_friend: Union[UnsetType, bool] = UNSET
+    is_blocked: Union[UnsetType, bool] = UNSET
+    is_suspended: Union[UnsetType, bool] = UNSET
+    has_verified_email: Union[UnsetType, Optional[bool]] = UNSET
+    icon_img: Union[UnsetType, str] = UNSET
+    subreddit: Union[UnsetType, Any] = UNSET
+
+
+class SubmissionData(ThingData):
+    id: str
+    name: str
+    created_utc: float
+    title: str
+    score: int
+    permalink: str
+    url: str
+    subreddit: str
+    subreddit_id: str
+    author: str
+    is_self: bool
+    num_comments: int = 0
+    upvote_ratio: float = 0.
+    selftext: str = ''
+    edited: Union[bool, float] = False
+    distinguished: Optional[str] = None
+    over_18: bool = False
+    spoiler: bool = False
+    stickied: bool = False
+    locked: bool = False
+    archived: bool = False
+    selftext_html: Union[UnsetType, Optional[str]] = UNSET
+    url_overridden_by_dest: Union[UnsetType, Optional[str]] = UNSET
+    subreddit_type: Union[UnsetType, str] = UNSET
+    subreddit_subscribers: Union[UnsetType, int] = UNSET
+    author_fullname: Union[UnsetType, str] = UNSET
+    author_premium: Union[UnsetType, bool] = UNSET
+    author_flair_text: Union[UnsetType, Optional[str]] = UNSET
+    author_flair_type: Union[UnsetType, Optional[str]] = UNSET
+    author_flair_css_class: Union[UnsetType, Optional[str]] = UNSET
+    author_flair_template_id: Union[UnsetType, Optional[str]] = UNSET
+    author_flair_background_color: Union[UnsetType, Optional[str]] = UNSET
+    author_flair_text_color: Union[UnsetType, Optional[str]] = UNSET
+    link_flair_text: Union[UnsetType, Optional[str]] = UNSET
+    link_flair_type: Union[UnsetType, Optional[str]] = UNSET
+    link_flair_css_class: Union[UnsetType, Optional[str]] = UNSET
+    link_flair_template_id: Union[UnsetType, Optional[str]] = UNSET
+    link_flair_background_color: Union[UnsetType, Optional[str]] = UNSET
+    link_flair_text_color: Union[UnsetType, Optional[str]] = UNSET
+    hide_score: Union[UnsetType, bool] = UNSET
+    removed_by_category: Union[UnsetType, Optional[str]] = UNSET
+    suggested_sort: Union[UnsetType, Optional[str]] = UNSET
+    contest_mode: Union[UnsetType, bool] = UNSET
+    is_original_content: Union[UnsetType, bool] = UNSET
+    is_crosspostable: Union[UnsetType, bool] = UNSET
+    is_robot_indexable: Union[UnsetType, bool] = UNSET
+    is_followed: Union[UnsetType, bool] = UNSET
+    num_crossposts: Union[UnsetType, int] = UNSET
+    pinned: Union[UnsetType, bool] = UNSET
+    saved: Union[UnsetType, bool] = UNSET
+    hidden: Union[UnsetType, bool] = UNSET
+    likes: Union[UnsetType, Optional[bool]] = UNSET
+    quarantine: Union[UnsetType, bool] = UNSET
+    send_replies: Union[UnsetType, bool] = UNSET
+    event_start: Union[UnsetType, Optional[float]] = UNSET
+    event_end: Union[UnsetType, Optional[float]] = UNSET
+    event_is_live: Union[UnsetType, bool] = UNSET
+    is_gallery: Union[UnsetType, bool] = UNSET
+    gallery_data: Union[UnsetType, Any] = UNSET
+    poll_data: Union[UnsetType, Any] = UNSET
+    crosspost_parent: Union[UnsetType, str] = UNSET
+    crosspost_parent_list: Union[UnsetType, Any] = UNSET
+    num_reports: Union[UnsetType, Optional[int]] = UNSET
+    mod_reports: Union[UnsetType, Any] = UNSET
+    user_reports: Union[UnsetType, Any] = UNSET
+    spam: Union[UnsetType, bool] = UNSET
+    ignore_reports: Union[UnsetType, bool] = UNSET
+    approved_at_utc: Union[UnsetType, Optional[float]] = UNSET
+    approved_by: Union[UnsetType, Optional[str]] = UNSET
+    banned_at_utc: Union[UnsetType, Optional[float]] = UNSET
+    banned_by: Union[UnsetType, Any] = UNSET
+    mod_note: Union[UnsetType, Optional[str]] = UNSET
+    mod_reason_by: Union[UnsetType, Optional[str]] = UNSET
+    mod_reason_title: Union[UnsetType, Optional[str]] = UNSET
+
+
+class SubredditData(ThingData):
+    id: str
+    name: str
+    created_utc: float
+    display_name: str
+    title: str = ''
+    subreddit_type: str = 'public'
+    subscribers: Optional[int] = None
+    over18: Optional[bool] = None
+    quarantine: bool = False
+    active_user_count: Union[UnsetType, Optional[int]] = UNSET
+    public_description: Union[UnsetType, str] = UNSET
+    public_description_html: Union[UnsetType, Optional[str]] = UNSET
+    description: Union[UnsetType, str] = UNSET
+    description_html: Union[UnsetType, Optional[str]] = UNSET
+    submit_text: Union[UnsetType, str] = UNSET
+    submit_text_html: Union[UnsetType, Optional[str]] = UNSET
+    submit_text_label: Union[UnsetType, Optional[str]] = UNSET
+    submit_link_label: Union[UnsetType, Optional[str]] = UNSET
+    submission_type: Union[UnsetType, str] = UNSET
+    suggested_comment_sort: Union[UnsetType, Optional[str]] = UNSET
+    allow_galleries: Union[UnsetType, bool] = UNSET
+    allow_polls: Union[UnsetType, bool] = UNSET
+    has_menu_widget: Union[UnsetType, bool] = UNSET
+    public_traffic: Union[UnsetType, Optional[bool]] = UNSET
+    link_flair_enabled: Union[UnsetType, bool] = UNSET
+    link_flair_position: Union[UnsetType, str] = UNSET
+    can_assign_link_flair: Union[UnsetType, bool] = UNSET
+    can_assign_user_flair: Union[UnsetType, bool] = UNSET
+    user_flair_enabled_in_sr: Union[UnsetType, bool] = UNSET
+    user_flair_position: Union[UnsetType, str] = UNSET
+    user_sr_flair_enabled: Union[UnsetType, Optional[bool]] = UNSET
+    user_flair_text: Union[UnsetType, Optional[str]] = UNSET
+    user_flair_css_class: Union[UnsetType, Optional[str]] = UNSET
+    user_flair_template_id: Union[UnsetType, Optional[str]] = UNSET
+    user_flair_type: Union[UnsetType, Optional[str]] = UNSET
+    user_flair_background_color: Union[UnsetType, Optional[str]] = UNSET
+    user_flair_text_color: Union[UnsetType, Optional[str]] = UNSET
+    user_has_favorited: Union[UnsetType, Optional[bool]] = UNSET
+    user_is_banned: Union[UnsetType, Optional[bool]] = UNSET
+    user_is_contributor: Union[UnsetType, Optional[bool]] = UNSET
+    user_is_moderator: Union[UnsetType, Optional[bool]] = UNSET
+    user_is_muted: Union[UnsetType, Optional[bool]] = UNSET
+    user_is_subscriber: Union[UnsetType, Optional[bool]] = UNSET
+    user_sr_theme_enabled: Union[UnsetType, Optional[bool]] = UNSET
+
+
+class Comment(msgspec.Struct, tag_field='kind', tag='t1', gc=False):
+    data: CommentData
+
+class Account(msgspec.Struct, tag_field='kind', tag='t2', gc=False):
+    data: AccountData
+
+class Submission(msgspec.Struct, tag_field='kind', tag='t3', gc=False):
+    data: SubmissionData
+
+class Subreddit(msgspec.Struct, tag_field='kind', tag='t5', gc=False):
+    data: SubredditData
+
+Thing = Union[Comment, Account, Submission, Subreddit]
+
+
+class ListingData(msgspec.Struct, gc=False):
+    children: List[Thing]
+    after: Optional[str] = None
+    before: Optional[str] = None
+    dist: Optional[int] = None
+
+class Listing(msgspec.Struct, tag_field='kind', tag='Listing', gc=False):
+    data: ListingData
+
+
+_listing_decoder = msgspec.json.Decoder(Listing)
+
+def decode_listing(data: bytes) -> Listing:
+    """Decode a listing response body.
+
+    .. .RAISES
+
+    :raises ValueError:
+        The data is not valid JSON, or is not a listing of comments,
+        accounts, submissions, or subreddits.
+    """
+    try:
+        return _listing_decoder.decode(data)
+    except msgspec.DecodeError as cause:
+        raise ValueError(str(cause)) from cause
+
+_listing_start = re.compile(rb'\s*{\s*"kind"\s*:\s*"Listing"')
+
+def decode_listing_or_json(data: bytes) -> Any:
+    """Decode a response body that is expected to be a listing.
+
+    Returns a :class:`Listing` when the body is a listing of comments, accounts,
+    submissions, or subreddits. Any other body, such as an API error object or
+    a listing of other things, is returned as regular JSON data.
+
+    Bodies that don't start like a listing go straight to the regular JSON
+    decoder, so they are only decoded once.
+
+    .. .RAISES
+
+    :raises ValueError:
+        The data is not valid JSON.
+    """
+    if _listing_start.match(data):
+        try:
+            return _listing_decoder.decode(data)
+        except msgspec.ValidationError:
+            # A listing of things these structs don't describe.
+            pass
+        except msgspec.DecodeError as cause:
+            raise ValueError(str(cause)) from cause
+    return loads(data)
@@ -6,11 +6,91 @@ from datetime import datetime, timezone
 
 from ..core.const import AUTHORIZATION_BASE_URL
 from .datamemento import DatamementoBase
+from ..util.lazy_attribute import lazy_attribute
 from .report import ModReport, UserReport
 from ..model_loaders.report import load_mod_report, load_user_report
 from dataclasses import dataclass
 
 class Submission(DatamementoBase):
+    # The groups of nested attributes, and the datetimes, are only built
+    # when first accessed. Most consumers of high-volume listings only read
+    # a few scalar fields. A key that one of these needs but is missing from
+    # the data raises `KeyError` on that first access, not when the model
+    # is loaded.
+
+    @lazy_attribute
+    def created_at(self) -> datetime:
+        """When the submission was made."""
+        return datetime.fromtimestamp(self.created_ut, timezone.utc)
+
+    @lazy_attribute
+    def edited_at(self) -> datetime:
+        """When the submission was edited.
+
+        Value is `datetime.min` if :attr:`is_edited` is false.
+        """
+        if self.is_edited:
+            return datetime.fromtimestamp(self.edited_ut, timezone.utc)
+        return datetime.min
+
+    @lazy_attribute
+    def edited(self) -> Optional[Submission.Edited]:
+        """Value non-`None` if the submission was edited."""
+        if self.is_edited:
+            return self.Edited(self)
+        return None
+
+    @lazy_attribute
+    def event(self) -> Optional[Submission.Event]:
+        """Attributes related to event metadata of the submission."""
+        if 'event_start' in self.d:
+            return self.Event(self.d)
+        return None
+
+    @lazy_attribute
+    def me(self) -> Submission.Me:
+        """Attributes relating to the current user.
+
+        If there is no user context, these values contain nonsense.
+        """
+        return self.Me(self.d)
+
+    @lazy_attribute
+    def subreddit(self) -> Submission.Subreddit:
+        """Information related to the submission's subreddit."""
+        return self.Subreddit(self.d)
+
+    @lazy_attribute
+    def author(self) -> Optional[Submission.Author]:
+        """Information about the author.
+
+        Value is `None` if the submission was removed or deleted.
+        """
+        if self.author_display_name.startswith('['):
+            return None
+        return self.Author(self.d)
+
+    @lazy_attribute
+    def mod(self) -> Optional[Submission.Moderation]:
+        """Attributes relating to moderation.
+
+        Value is `None` if the current user is not a moderator of the subreddit.
+        """
+        if 'spam' in self.d:
+            return self.Moderation(self.d)
+        return None
+
+    @lazy_attribute
+    def flair(self) -> Submission.Flair:
+        """Attributes related to the author's flair."""
+        return self.Flair(self.d)
+
+    @lazy_attribute
+    def reports(self) -> Optional[Submission.Reports]:
+        if self.d['num_reports'] is not None:
+            return self.Reports(self.d)
+        return None
+
     class Me:
         def __init__(self, d: Mapping[str, Any]) -> None:
             self.saved: bool = d['saved']
@@ -283,10 +363,6 @@ class Submission(DatamementoBase):
         ("""
             Unix timestamp of when the submission was made.
             """)
-        self.created_at: datetime = datetime.fromtimestamp(self.created_ut, timezone.utc)
-        ("""
-            When the submission was made.
-            """)
 
         self.title: str = d['title']
         ("")
@@ -326,21 +402,6 @@ class Submission(DatamementoBase):
 
             Value is `0` if :attr:`is_edited` is false.
             """)
-        self.edited_at: datetime = datetime.min
-        ("""
-            When the submission was edited.
-
-            Value is `datetime.min` if :attr:`is_edited` is false.
-            """)
-        if self.is_edited:
-            self.edited_at = datetime.fromtimestamp(self.edited_ut, timezone.utc)
-
-        self.edited: Optional[Submission.Edited] = None
-        ("""
-            Value non-`None` if the comment was edited.
-            """)
-        if edited:
-            self.edited = self.Edited(self)
 
         self.upvote_ratio: float = d['upvote_ratio']
         ("")
@@ -413,60 +474,13 @@ class Submission(DatamementoBase):
             Value empty string if not distinguished.
             """)
 
-        self.event: Optional[Submission.Event] = None
-        ("""
-            Attributes related to event metadata of the submission.
-            """)
-        if 'event_start' in d:
-            self.event = self.Event(d)
-
-        self.me: Submission.Me = self.Me(d)
-        ("""
-            Attributes relating to the current user.
-
-            If there is no user context, these values contain nonsense.
-            """)
-
-        self.subreddit: Submission.Subreddit = self.Subreddit(d)
-        ("""
-            Information related to the submission's subreddit.
-            """)
-
-        author: str = d['author']
-        self.author_display_name: str = author
+        self.author_display_name: str = d['author']
         ("""
             The author's username.
 
             Possibly `[removed]` if the submission was removed or
             `[deleted]` if the submission was deleted by the author.
             """)
-        self.author: Optional[Submission.Author] = None
-        ("""
-            Information about the author.
-
-            Value is `None` if the submission was removed or deleted.
-            """)
-        if not author.startswith('['):
-            self.author = self.Author(d)
-
-        self.mod: Optional[Submission.Moderation] = None
-        ("""
-            Attributes relating to moderation.
-
-            Value is `None` if the current user is not a moderator of the subreddit.
-            """)
-        if 'spam' in d:
-            self.mod = self.Moderation(d)
-
-        self.flair: Submission.Flair = self.Flair(d)
-        ("""
-            Attributes related to the author's flair.
-            """)
-
-        self.reports: Optional[Submission.Reports] = None
-        ("")
-        if d['num_reports'] is not None:
-            self.reports = self.Reports(d)
 
 
 class LinkPost(Submission):
@@ -490,6 +504,21 @@ class TextPost(Submission):
             """)
 
 class GalleryPost(Submission):
+    @lazy_attribute
+    def gallery(self) -> Sequence[GalleryPost.GalleryItem]:
+        gallery_data_items: Sequence[Any] = ()
+        if gallery_data := self.d.get('gallery_data'):
+            gallery_data_items = gallery_data['items']
+        return [
+            self.GalleryItem(
+                id=m['id'],
+                media_id=m['media_id'],
+                caption=m.get('caption', ''),
+                outbound_link=m.get('outbound_url', ''),
+            )
+            for m in gallery_data_items
+        ]
+
     @dataclass(repr=False, eq=False)
     class GalleryItem:
         id: int
@@ -504,32 +533,22 @@ class GalleryPost(Submission):
             The URL of the gallery.
             """)
 
-        gallery_data_items: Sequence[Any] = ()
-        if gallery_data := d.get('gallery_data'):
-            gallery_data_items = gallery_data['items']
-        self.gallery: Sequence[GalleryPost.GalleryItem] = [
-            self.GalleryItem(
-                id=m['id'],
-                media_id=m['media_id'],
-                caption=m.get('caption', ''),
-                outbound_link=m.get('outbound_url', ''),
-            )
-            for m in gallery_data_items
-        ]
-        ("")
-
 class PollPost(Submission):
     pass
 
 class CrosspostSubmission(Submission):
-    @property
+    @lazy_attribute
     def original(self) -> Optional[Submission]:
         """Original submission of this crosspost.
 
         Value `None` if the original submission is from a subreddit that is
         now banned and the submission is no longer accessible.
         """
-        return self.__original
+        from ..model_loaders.submission import load_submission  # Avoid cyclic import
+        return self._load_original(
+            d=self.d,
+            load_submission=load_submission,
+        )
 
     def __init__(self, d: Mapping[str, Any]) -> None:
         super().__init__(d)
@@ -546,15 +565,6 @@ class CrosspostSubmission(Submission):
             Same as :attr:`original_idn`.
             """)
 
-        self.__original: Optional[Submission] = None
-        # https://github.com/python/mypy/issues/4177
-        if self.__class__.original == __class__.original:  # type: ignore[name-defined]
-            from ..model_loaders.submission import load_submission  # Avoid cyclic import
-            self.__original = self._load_original(
-                d=d,
-                load_submission=load_submission,
-            )
-
     _TSubmission = TypeVar('_TSubmission', bound=Submission)
 
     @final
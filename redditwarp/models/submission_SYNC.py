@@ -13,6 +13,7 @@ from .submission import (
     PollPost as BasePollPost,
     CrosspostSubmission as BaseCrosspostSubmission,
 )
+from ..util.lazy_attribute import lazy_attribute
 
 class Submission(BaseSubmission):
     def __init__(self, d: Mapping[str, Any], client: Client) -> None:
@@ -82,17 +83,13 @@ class PollPost(Submission, BasePollPost):
     pass
 
 class CrosspostSubmission(Submission, BaseCrosspostSubmission):
-    @property
+    @lazy_attribute
     def original(self) -> Optional[Submission]:
-        return self.__original
-
-    def __init__(self, d: Mapping[str, Any], client: Client) -> None:
-        super().__init__(d, client)
         from ..model_loaders.submission_SYNC import load_submission  # Avoid cyclic import
-        my_load_submission = lambda d: load_submission(d=d, client=client)
-        self.__original: Optional[Submission] = self._load_original(
-            d=d,
-            load_submission=my_load_submission,
+        client = self.client
+        return self._load_original(
+            d=self.d,
+            load_submission=lambda d: load_submission(d=d, client=client),
         )
 
 CrossPost = CrosspostSubmission
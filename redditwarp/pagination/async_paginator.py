@@ -1,6 +1,8 @@
 
 from __future__ import annotations
-from typing import TypeVar, Sequence, Generic, AsyncIterator, Optional
+from typing import TypeVar, Sequence, Generic, AsyncIterator, Optional, Any, Awaitable, Callable
+
+from ..core.accounting import procedure_var, having_procedure
 
 T = TypeVar('T')
 
@@ -10,14 +12,27 @@ class AsyncPaginator(Generic[T]):
     def __init__(self, *, limit: Optional[int] = None) -> None:
         self.limit: Optional[int] = limit
         ("")
+        self._procedure: str = procedure_var.get()
+
+    def __aiter__(self) -> AsyncIterator[Sequence[T]]:
+        return self._iter_pages(self.fetch)
 
-    async def __aiter__(self) -> AsyncIterator[Sequence[T]]:
-        while page := await self.fetch():
+    async def _iter_pages(self, fetch: Callable[[], Awaitable[Sequence[Any]]]) -> AsyncIterator[Sequence[Any]]:
+        while page := await self._fetch_page(fetch):
             yield page
 
+    async def _fetch_page(self, fetch: Callable[[], Awaitable[Sequence[Any]]]) -> Sequence[Any]:
+        # Pages are charged to the procedure that created the paginator.
+        with having_procedure(self._procedure or f"{type(self).__name__}.fetch"):
+            return await fetch()
+
     async def fetch(self) -> Sequence[T]:
         raise NotImplementedError
 
+    async def fetch_raw(self) -> Sequence[Any]:
+        """Fetch the next page like :meth:`fetch`, but return the raw data of each item instead of models."""
+        raise NotImplementedError
+
 class OffsetAsyncPaginator(AsyncPaginator[T]):
     def __init__(self, *, limit: Optional[int] = None, offset: Optional[int] = None) -> None:
         super().__init__(limit=limit)
@@ -52,8 +67,39 @@ class HasMore:
 # Mixins
 
 class HasMoreAsyncPaginator(HasMore, AsyncPaginator[T]):
-    async def __aiter__(self) -> AsyncIterator[Sequence[T]]:
-        if page := await self.fetch():
+    async def _iter_pages(self, fetch: Callable[[], Awaitable[Sequence[Any]]]) -> AsyncIterator[Sequence[Any]]:
+        if page := await self._fetch_page(fetch):
             yield page
-            while self.has_more() and (page := await self.fetch()):
+            while self.has_more() and (page := await self._fetch_page(fetch)):
                 yield page
+
+
+# Adapters
+
+class RawAsyncPaginator(AsyncPaginator[Any]):
+    """Page through another paginator, yielding the raw data of each item instead of models.
+
+    The wrapped paginator's cursor, limit, and iteration behaviour are used
+    as is. Only the model loading step is skipped.
+    """
+
+    @property
+    def limit(self) -> Optional[int]:  # type: ignore[override]
+        return self.paginator.limit
+
+    @limit.setter
+    def limit(self, value: Optional[int]) -> None:
+        self.paginator.limit = value
+
+    def __init__(self, paginator: AsyncPaginator[Any]) -> None:
+        self.paginator: AsyncPaginator[Any] = paginator
+        ("")
+
+    def __aiter__(self) -> AsyncIterator[Sequence[Any]]:
+        return self.paginator._iter_pages(self.paginator.fetch_raw)
+
+    async def fetch(self) -> Sequence[Any]:
+        return await self.paginator.fetch_raw()
+
+    async def fetch_raw(self) -> Sequence[Any]:
+        return await self.paginator.fetch_raw()
@@ -1,6 +1,8 @@
 
 from __future__ import annotations
-from typing import TypeVar, Sequence, Generic, Iterator, Optional
+from typing import TypeVar, Sequence, Generic, Iterator, Optional, Any, Callable
+
+from ..core.accounting import procedure_var, having_procedure
 
 T = TypeVar('T')
 
@@ -10,14 +12,27 @@ class Paginator(Generic[T]):
     def __init__(self, *, limit: Optional[int] = None) -> None:
         self.limit: Optional[int] = limit
         ("")
+        self._procedure: str = procedure_var.get()
 
     def __iter__(self) -> Iterator[Sequence[T]]:
-        while page := self.fetch():
+        return self._iter_pages(self.fetch)
+
+    def _iter_pages(self, fetch: Callable[[], Sequence[Any]]) -> Iterator[Sequence[Any]]:
+        while page := self._fetch_page(fetch):
             yield page
 
+    def _fetch_page(self, fetch: Callable[[], Sequence[Any]]) -> Sequence[Any]:
+        # Pages are charged to the procedure that created the paginator.
+        with having_procedure(self._procedure or f"{type(self).__name__}.fetch"):
+            return fetch()
+
     def fetch(self) -> Sequence[T]:
         raise NotImplementedError
 
+    def fetch_raw(self) -> Sequence[Any]:
+        """Fetch the next page like :meth:`fetch`, but return the raw data of each item instead of models."""
+        raise NotImplementedError
+
 class OffsetPaginator(Paginator[T]):
     def __init__(self, *, limit: Optional[int] = None, offset: Optional[int] = None) -> None:
         super().__init__(limit=limit)
@@ -52,8 +67,39 @@ class HasMore:
 # Mixins
 
 class HasMorePaginator(HasMore, Paginator[T]):
-    def __iter__(self) -> Iterator[Sequence[T]]:
-        if page := self.fetch():
+    def _iter_pages(self, fetch: Callable[[], Sequence[Any]]) -> Iterator[Sequence[Any]]:
+        if page := self._fetch_page(fetch):
             yield page
-            while self.has_more() and (page := self.fetch()):
+            while self.has_more() and (page := self._fetch_page(fetch)):
                 yield page
+
+
+# Adapters
+
+class RawPaginator(Paginator[Any]):
+    """Page through another paginator, yielding the raw data of each item instead of models.
+
+    The wrapped paginator's cursor, limit, and iteration behaviour are used
+    as is. Only the model loading step is skipped.
+    """
+
+    @property
+    def limit(self) -> Optional[int]:  # type: ignore[override]
+        return self.paginator.limit
+
+    @limit.setter
+    def limit(self, value: Optional[int]) -> None:
+        self.paginator.limit = value
+
+    def __init__(self, paginator: Paginator[Any]) -> None:
+        self.paginator: Paginator[Any] = paginator
+        ("")
+
+    def __iter__(self) -> Iterator[Sequence[Any]]:
+        return self.paginator._iter_pages(self.paginator.fetch_raw)
+
+    def fetch(self) -> Sequence[Any]:
+        return self.paginator.fetch_raw()
+
+    def fetch_raw(self) -> Sequence[Any]:
+        return self.paginator.fetch_raw()
@@ -1,8 +1,8 @@
 
 from __future__ import annotations
-from typing import TypeVar, AsyncIterator, Iterator, Generic, Optional, Sequence
+from typing import Any, TypeVar, AsyncIterator, Iterator, Generic, Optional, Sequence
 
-from .async_paginator import AsyncPaginator
+from .async_paginator import AsyncPaginator, RawAsyncPaginator
 
 E = TypeVar('E')
 
@@ -36,6 +36,15 @@ class PaginatorChainingAsyncIterator(AsyncIterator[E]):
 
         raise StopAsyncIteration
 
+    def as_raw(self) -> PaginatorChainingAsyncIterator[Any]:
+        """Return an iterator that yields the raw data of each item instead of models.
+
+        The new iterator continues from where the paginator is up to, and
+        yields at most as many items as this iterator has remaining. Use it in
+        place of this iterator, not alongside it.
+        """
+        return PaginatorChainingAsyncIterator(RawAsyncPaginator(self._paginator), self.remaining)
+
 
 
 __bound = 'AsyncPaginator[E]'
@@ -1,8 +1,8 @@
 
 from __future__ import annotations
-from typing import TypeVar, Iterator, Generic, Optional, Sequence
+from typing import Any, TypeVar, Iterator, Generic, Optional, Sequence
 
-from .paginator import Paginator
+from .paginator import Paginator, RawPaginator
 
 E = TypeVar('E')
 
@@ -36,6 +36,15 @@ class PaginatorChainingIterator(Iterator[E]):
 
         raise StopIteration
 
+    def as_raw(self) -> PaginatorChainingIterator[Any]:
+        """Return an iterator that yields the raw data of each item instead of models.
+
+        The new iterator continues from where the paginator is up to, and
+        yields at most as many items as this iterator has remaining. Use it in
+        place of this iterator, not alongside it.
+        """
+        return PaginatorChainingIterator(RawPaginator(self._paginator), self.remaining)
+
 
 
 __bound = 'Paginator[E]'
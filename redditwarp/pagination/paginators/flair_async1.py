@@ -75,5 +75,8 @@ class UserFlairAssociationAsyncPaginator(
         return data
 
     async def fetch(self) -> Sequence[UserFlairAssociation]:
+        return [load_user_flair_association(d) for d in await self.fetch_raw()]
+
+    async def fetch_raw(self) -> Sequence[Any]:
         data = await self._fetch_data()
-        return [load_user_flair_association(d) for d in data['users']]
+        return data['users']
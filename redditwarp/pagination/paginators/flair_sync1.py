@@ -75,5 +75,8 @@ class UserFlairAssociationPaginator(
         return data
 
     def fetch(self) -> Sequence[UserFlairAssociation]:
+        return [load_user_flair_association(d) for d in self.fetch_raw()]
+
+    def fetch_raw(self) -> Sequence[Any]:
         data = self._fetch_data()
-        return [load_user_flair_association(d) for d in data['users']]
+        return data['users']
@@ -8,5 +8,4 @@ from ....model_loaders.comment_ASYNC import load_loose_comment
 
 class LooseCommentListingAsyncPaginator(ListingAsyncPaginator[LooseComment]):
     async def fetch(self) -> Sequence[LooseComment]:
-        data = await self._fetch_data()
-        return [load_loose_comment(d['data'], self.client) for d in data['children']]
+        return await self._fetch_models(load_loose_comment)
@@ -8,5 +8,4 @@ from ....model_loaders.comment_SYNC import load_loose_comment
 
 class LooseCommentListingPaginator(ListingPaginator[LooseComment]):
     def fetch(self) -> Sequence[LooseComment]:
-        data = self._fetch_data()
-        return [load_loose_comment(d['data'], self.client) for d in data['children']]
+        return self._fetch_models(load_loose_comment)
@@ -1,6 +1,6 @@
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, TypeVar, Any, Mapping, Optional, Callable, Iterable
+from typing import TYPE_CHECKING, TypeVar, Any, Mapping, Optional, Callable, Iterable, Sequence, cast
 if TYPE_CHECKING:
     from ....client_ASYNC import Client
 
@@ -30,6 +30,12 @@ class ListingAsyncPaginator(Resettable, HasMoreAsyncPaginator[T], Bidirectional,
         ("")
         self.show_all: bool = False
         ("")
+        self.struct_decoding: bool = False
+        ("""
+            Decode pages through the typed structs of
+            :mod:`redditwarp.models.listing_structs`, which skips the fields
+            the models don't read. Requires the `msgspec` package.
+            """)
         self.__reset()
 
     def __reset(self) -> None:
@@ -80,22 +86,75 @@ class ListingAsyncPaginator(Resettable, HasMoreAsyncPaginator[T], Bidirectional,
             if self.before:
                 yield ('before', self.before)
 
-    async def _fetch_data(self) -> Any:
-        params = dict(self._generate_params())
-        root = await self.client.request('GET', self.url, params=params)
-        data = root['data']
-        children = data['children']
+    async def _fetch_listing(self) -> Any:
+        """Fetch the next page and return the listing's data.
 
-        dist: int = x if (x := data['dist']) else len(children)
+        This is a :class:`~redditwarp.models.listing_structs.ListingData`
+        struct if the page was decoded through the structs, otherwise it's
+        the JSON data.
+        """
+        params = dict(self._generate_params())
+        loads: Optional[Callable[[bytes], Any]] = None
+        if self.struct_decoding:
+            from ....models.listing_structs import decode_listing_or_json
+            loads = decode_listing_or_json
+        root = await self.client.request('GET', self.url, params=params, loads=loads)
+
+        if isinstance(root, Mapping):
+            data = root['data']
+            children = data['children']
+            dist = data['dist']
+            suggested_forward_cursor = data['after'] or ''
+            suggested_backward_cursor = data['before'] or ''
+            if children:
+                first_cursor = self.cursor_extractor(children[0])
+                last_cursor = self.cursor_extractor(children[-1])
+        else:
+            data = root.data
+            children = data.children
+            dist = data.dist
+            suggested_forward_cursor = data.after or ''
+            suggested_backward_cursor = data.before or ''
+            if children:
+                first_cursor = children[0].data.name
+                last_cursor = children[-1].data.name
+
+        if not dist:
+            dist = len(children)
         self.after_count += (1 if self.direction else -1) * dist
         self.before_count = self.after_count - dist + 1
 
-        suggested_forward_cursor = data['after'] or ''
-        suggested_backward_cursor = data['before'] or ''
         if children:
-            self.after = suggested_forward_cursor if suggested_forward_cursor else self.cursor_extractor(children[-1])
-            self.before = suggested_backward_cursor if suggested_backward_cursor else self.cursor_extractor(children[0])
+            self.after = suggested_forward_cursor if suggested_forward_cursor else last_cursor
+            self.before = suggested_backward_cursor if suggested_backward_cursor else first_cursor
         self.has_after = bool(suggested_forward_cursor)
         self.has_before = bool(suggested_backward_cursor)
 
         return data
+
+    async def _fetch_data(self) -> Any:
+        data = await self._fetch_listing()
+        if not isinstance(data, Mapping):
+            import msgspec
+            data = msgspec.to_builtins(data)
+        return data
+
+    async def _fetch_models(self, load: Callable[[Any, Client], T]) -> Sequence[T]:
+        """Fetch the next page and load a model from each child's data with `load`.
+
+        Children decoded through the structs are loaded by
+        :func:`~redditwarp.model_loaders.listing_structs_ASYNC.load_thing`
+        instead.
+        """
+        data = await self._fetch_listing()
+        if isinstance(data, Mapping):
+            return [load(child['data'], self.client) for child in data['children']]
+        from ....model_loaders.listing_structs_ASYNC import load_thing
+        return [cast(T, load_thing(child, self.client)) for child in data.children]
+
+    async def fetch_raw(self) -> Sequence[Any]:
+        data = await self._fetch_listing()
+        if isinstance(data, Mapping):
+            return [child['data'] for child in data['children']]
+        import msgspec
+        return [msgspec.to_builtins(child.data) for child in data.children]
@@ -1,6 +1,6 @@
 
 from __future__ import annotations
-from typing import Sequence, Optional
+from typing import Sequence, Optional, Mapping
 
 from ..listing.listing_paginator import ListingPaginator
 from ....model_loaders.comment_SYNC import load_loose_comment
@@ -9,7 +9,16 @@ from ....exceptions import UnexpectedResultException
 
 class SubmissionAndLooseCommentListingPaginator(ListingPaginator[object]):
     def fetch(self) -> Sequence[object]:
-        data = self._fetch_data()
+        data = self._fetch_listing()
+        if not isinstance(data, Mapping):
+            from ....models.listing_structs import Comment, Submission
+            from ....model_loaders.listing_structs_SYNC import load_thing
+            things = data.children
+            for thing in things:
+                if not isinstance(thing, (Comment, Submission)):
+                    raise UnexpectedResultException(f'unexpected kind {thing.__struct_config__.tag!r}')
+            return [load_thing(thing, self.client) for thing in things]
+
         l = []
         for child in data['children']:
             kind = child['kind']
@@ -8,5 +8,4 @@ from ....models.submission_ASYNC import Submission
 
 class SubmissionListingAsyncPaginator(ListingAsyncPaginator[Submission]):
     async def fetch(self) -> Sequence[Submission]:
-        data = await self._fetch_data()
-        return [load_submission(d['data'], self.client) for d in data['children']]
+        return await self._fetch_models(load_submission)
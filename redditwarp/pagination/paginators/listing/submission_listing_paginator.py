@@ -8,5 +8,4 @@ from ....models.submission_SYNC import Submission
 
 class SubmissionListingPaginator(ListingPaginator[Submission]):
     def fetch(self) -> Sequence[Submission]:
-        data = self._fetch_data()
-        return [load_submission(d['data'], self.client) for d in data['children']]
+        return self._fetch_models(load_submission)
@@ -8,5 +8,4 @@ from ....models.subreddit_ASYNC import Subreddit
 
 class SubredditListingAsyncPaginator(ListingAsyncPaginator[Subreddit]):
     async def fetch(self) -> Sequence[Subreddit]:
-        data = await self._fetch_data()
-        return [load_subreddit(d['data'], self.client) for d in data['children']]
+        return await self._fetch_models(load_subreddit)
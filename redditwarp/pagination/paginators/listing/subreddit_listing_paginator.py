@@ -8,5 +8,4 @@ from ....models.subreddit_SYNC import Subreddit
 
 class SubredditListingPaginator(ListingPaginator[Subreddit]):
     def fetch(self) -> Sequence[Subreddit]:
-        data = self._fetch_data()
-        return [load_subreddit(d['data'], self.client) for d in data['children']]
+        return self._fetch_models(load_subreddit)
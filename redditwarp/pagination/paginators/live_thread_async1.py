@@ -8,5 +8,4 @@ from ...model_loaders.live_thread_ASYNC import load_live_update
 
 class LiveUpdateListingAsyncPaginator(ListingAsyncPaginator[LiveUpdate]):
     async def fetch(self) -> Sequence[LiveUpdate]:
-        data = await self._fetch_data()
-        return [load_live_update(d['data'], self.client) for d in data['children']]
+        return [load_live_update(d, self.client) for d in await self.fetch_raw()]
@@ -8,5 +8,4 @@ from ...model_loaders.live_thread_SYNC import load_live_update
 
 class LiveUpdateListingPaginator(ListingPaginator[LiveUpdate]):
     def fetch(self) -> Sequence[LiveUpdate]:
-        data = self._fetch_data()
-        return [load_live_update(d['data'], self.client) for d in data['children']]
+        return [load_live_update(d, self.client) for d in self.fetch_raw()]
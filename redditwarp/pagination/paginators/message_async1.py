@@ -13,20 +13,16 @@ from ...model_loaders.message_ASYNC import (
 
 class MessageListingAsyncPaginator(ListingAsyncPaginator[MailboxMessage]):
     async def fetch(self) -> Sequence[MailboxMessage]:
-        data = await self._fetch_data()
-        return [load_mailbox_message(d['data'], self.client) for d in data['children']]
+        return [load_mailbox_message(d, self.client) for d in await self.fetch_raw()]
 
 class ComposedMessageListingAsyncPaginator(ListingAsyncPaginator[ComposedMessage]):
     async def fetch(self) -> Sequence[ComposedMessage]:
-        data = await self._fetch_data()
-        return [load_composed_message(d['data'], self.client) for d in data['children']]
+        return [load_composed_message(d, self.client) for d in await self.fetch_raw()]
 
 class CommentMessageListingAsyncPaginator(ListingAsyncPaginator[CommentMessage]):
     async def fetch(self) -> Sequence[CommentMessage]:
-        data = await self._fetch_data()
-        return [load_comment_message(d['data'], self.client) for d in data['children']]
+        return [load_comment_message(d, self.client) for d in await self.fetch_raw()]
 
 class ComposedMessageThreadListingAsyncPaginator(ListingAsyncPaginator[Sequence[ComposedMessage]]):
     async def fetch(self) -> Sequence[Sequence[ComposedMessage]]:
-        data = await self._fetch_data()
-        return [load_composed_message_thread(d['data'], self.client) for d in data['children']]
+        return [load_composed_message_thread(d, self.client) for d in await self.fetch_raw()]
@@ -13,20 +13,16 @@ from ...model_loaders.message_SYNC import (
 
 class MessageListingPaginator(ListingPaginator[MailboxMessage]):
     def fetch(self) -> Sequence[MailboxMessage]:
-        data = self._fetch_data()
-        return [load_mailbox_message(d['data'], self.client) for d in data['children']]
+        return [load_mailbox_message(d, self.client) for d in self.fetch_raw()]
 
 class ComposedMessageListingPaginator(ListingPaginator[ComposedMessage]):
     def fetch(self) -> Sequence[ComposedMessage]:
-        data = self._fetch_data()
-        return [load_composed_message(d['data'], self.client) for d in data['children']]
+        return [load_composed_message(d, self.client) for d in self.fetch_raw()]
 
 class CommentMessageListingPaginator(ListingPaginator[CommentMessage]):
     def fetch(self) -> Sequence[CommentMessage]:
-        data = self._fetch_data()
-        return [load_comment_message(d['data'], self.client) for d in data['children']]
+        return [load_comment_message(d, self.client) for d in self.fetch_raw()]
 
 class ComposedMessageThreadListingPaginator(ListingPaginator[Sequence[ComposedMessage]]):
     def fetch(self) -> Sequence[Sequence[ComposedMessage]]:
-        data = self._fetch_data()
-        return [load_composed_message_thread(d['data'], self.client) for d in data['children']]
+        return [load_composed_message_thread(d, self.client) for d in self.fetch_raw()]
@@ -1,6 +1,6 @@
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, TypeVar, Optional, Sequence
+from typing import TYPE_CHECKING, TypeVar, Any, Optional, Sequence
 if TYPE_CHECKING:
     from ....client_ASYNC import Client
 
@@ -21,13 +21,15 @@ class LegacyModerationUsersAsyncPaginator(ListingAsyncPaginator[T]):
     ) -> None:
         super().__init__(client, url, limit=limit, cursor_extractor=itemgetter('rel_id'))
 
+    async def fetch_raw(self) -> Sequence[Any]:
+        data = await self._fetch_data()
+        return data['children']
+
 
 class UserRelationshipListingAsyncPaginator(LegacyModerationUsersAsyncPaginator[UserRelationship]):
     async def fetch(self) -> Sequence[UserRelationship]:
-        data = await self._fetch_data()
-        return [load_user_relationship(d) for d in data['children']]
+        return [load_user_relationship(d) for d in await self.fetch_raw()]
 
 class BannedSubredditUserRelationshipListingAsyncPaginator(LegacyModerationUsersAsyncPaginator[BannedSubredditUserRelationship]):
     async def fetch(self) -> Sequence[BannedSubredditUserRelationship]:
-        data = await self._fetch_data()
-        return [load_banned_subreddit_user_relation(d) for d in data['children']]
+        return [load_banned_subreddit_user_relation(d) for d in await self.fetch_raw()]
@@ -71,9 +71,11 @@ class GBaseModerationNoteAsyncPaginator(HasMoreAsyncPaginator[T], CursorAsyncPag
         return root
 
     async def fetch(self) -> Sequence[T]:
+        return [self._load_mod_note(d) for d in await self.fetch_raw()]
+
+    async def fetch_raw(self) -> Sequence[Any]:
         root = await self._fetch_data()
-        mod_notes = root['mod_notes']
-        return [self._load_mod_note(d) for d in mod_notes]
+        return root['mod_notes']
 
     def _load_mod_note(self, d: Mapping[str, Any]) -> T:
         raise NotImplementedError
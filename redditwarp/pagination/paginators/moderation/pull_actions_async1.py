@@ -36,5 +36,4 @@ class ModerationActionLogAsyncPaginator(ListingAsyncPaginator[ModerationActionLo
             yield ('mod', self.mod)
 
     async def fetch(self) -> Sequence[ModerationActionLogEntry]:
-        data = await self._fetch_data()
-        return [load_moderation_action_log_entry(d['data']) for d in data['children']]
+        return [load_moderation_action_log_entry(d) for d in await self.fetch_raw()]
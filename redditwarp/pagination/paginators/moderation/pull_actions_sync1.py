@@ -36,5 +36,4 @@ class ModerationActionLogPaginator(ListingPaginator[ModerationActionLogEntry]):
             yield ('mod', self.mod)
 
     def fetch(self) -> Sequence[ModerationActionLogEntry]:
-        data = self._fetch_data()
-        return [load_moderation_action_log_entry(d['data']) for d in data['children']]
+        return [load_moderation_action_log_entry(d) for d in self.fetch_raw()]
@@ -82,28 +82,40 @@ class ModerationUsersAsyncPaginator(HasMoreAsyncPaginator[T], Bidirectional, Cur
 
 class ModeratorsAsyncPaginator(ModerationUsersAsyncPaginator[Moderator]):
     async def fetch(self) -> Sequence[Moderator]:
+        return [load_moderator(d) for d in await self.fetch_raw()]
+
+    async def fetch_raw(self) -> Sequence[Any]:
         root = await self._fetch_data()
         order = root['moderatorIds']
         object_map = root['moderators']
-        return [load_moderator(object_map[full_id36]) for full_id36 in order]
+        return [object_map[full_id36] for full_id36 in order]
 
 class ApprovedUsersAsyncPaginator(ModerationUsersAsyncPaginator[ApprovedUser]):
     async def fetch(self) -> Sequence[ApprovedUser]:
+        return [load_approved_user(d) for d in await self.fetch_raw()]
+
+    async def fetch_raw(self) -> Sequence[Any]:
         root = await self._fetch_data()
         order = root['approvedSubmitterIds']
         object_map = root['approvedSubmitters']
-        return [load_approved_user(object_map[full_id36]) for full_id36 in order]
+        return [object_map[full_id36] for full_id36 in order]
 
 class BannedUsersAsyncPaginator(ModerationUsersAsyncPaginator[BannedUser]):
     async def fetch(self) -> Sequence[BannedUser]:
+        return [load_banned_user(d) for d in await self.fetch_raw()]
+
+    async def fetch_raw(self) -> Sequence[Any]:
         root = await self._fetch_data()
         order = root['bannedUserIds']
         object_map = root['bannedUsers']
-        return [load_banned_user(object_map[full_id36]) for full_id36 in order]
+        return [object_map[full_id36] for full_id36 in order]
 
 class MutedUsersAsyncPaginator(ModerationUsersAsyncPaginator[MutedUser]):
     async def fetch(self) -> Sequence[MutedUser]:
+        return [load_muted_user(d) for d in await self.fetch_raw()]
+
+    async def fetch_raw(self) -> Sequence[Any]:
         root = await self._fetch_data()
         order = root['mutedUserIds']
         object_map = root['mutedUsers']
-        return [load_muted_user(object_map[full_id36]) for full_id36 in order]
+        return [object_map[full_id36] for full_id36 in order]
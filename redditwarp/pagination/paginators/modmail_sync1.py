@@ -78,6 +78,13 @@ class ModmailConversationMessagePaginator(Resettable, CursorPaginator[Tuple[Conv
         return data
 
     def fetch(self) -> Sequence[Tuple[ConversationInfo, Message]]:
+        return [
+            (load_conversation_info(conversation_data, self.client), load_message(message_data, self.client))
+            for conversation_data, message_data in self.fetch_raw()
+        ]
+
+    def fetch_raw(self) -> Sequence[Tuple[Any, Any]]:
+        """Return pairs of the raw conversation and message data."""
         data = self._fetch_data()
         conversations_mapping = data['conversations']
         messages_mapping = data['messages']
@@ -86,8 +93,5 @@ class ModmailConversationMessagePaginator(Resettable, CursorPaginator[Tuple[Conv
             conversation_data = conversations_mapping[convo_id36]
             message_id36 = conversation_data['objIds'][0]['id']
             message_data = messages_mapping[message_id36]
-            results.append((
-                load_conversation_info(conversation_data, self.client),
-                load_message(message_data, self.client),
-            ))
+            results.append((conversation_data, message_data))
         return results
@@ -100,3 +100,8 @@ class SubmissionDuplicatesPaginator(ListingPaginator[Submission]):
         origin = load_submission(root[0]['data']['children'][0]['data'], self.client)
         data = root[1]['data']
         return SubmissionDuplicates([load_submission(d['data'], self.client) for d in data['children']], origin)
+
+    def fetch_raw(self) -> Sequence[Any]:
+        """Return the raw data of the duplicates. The origin submission is not included."""
+        root = self._fetch_data()
+        return [child['data'] for child in root[1]['data']['children']]
@@ -27,5 +27,4 @@ class UserSearchAsyncPaginator(
         yield ('q', self.query)
 
     async def fetch(self) -> Sequence[User]:
-        data = await self._fetch_data()
-        return [load_user(d['data'], self.client) for d in data['children']]
+        return await self._fetch_models(load_user)
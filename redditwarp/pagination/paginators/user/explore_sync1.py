@@ -27,5 +27,4 @@ class UserSearchPaginator(
         yield ('q', self.query)
 
     def fetch(self) -> Sequence[User]:
-        data = self._fetch_data()
-        return [load_user(d['data'], self.client) for d in data['children']]
+        return self._fetch_models(load_user)
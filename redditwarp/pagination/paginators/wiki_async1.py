@@ -1,6 +1,6 @@
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Optional, Sequence
 if TYPE_CHECKING:
     from ...client_ASYNC import Client
 
@@ -19,5 +19,8 @@ class WikiPageRevisionsAsyncPaginator(ListingAsyncPaginator[WikiPageRevision]):
         super().__init__(client, url, limit=limit, cursor_extractor=cursor_extractor)
 
     async def fetch(self) -> Sequence[WikiPageRevision]:
+        return [load_wiki_page_revision(d, self.client) for d in await self.fetch_raw()]
+
+    async def fetch_raw(self) -> Sequence[Any]:
         data = await self._fetch_data()
-        return [load_wiki_page_revision(d, self.client) for d in data['children']]
+        return data['children']
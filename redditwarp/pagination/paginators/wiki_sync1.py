@@ -1,6 +1,6 @@
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Optional, Sequence
 if TYPE_CHECKING:
     from ...client_SYNC import Client
 
@@ -19,5 +19,8 @@ class WikiPageRevisionsPaginator(ListingPaginator[WikiPageRevision]):
         super().__init__(client, url, limit=limit, cursor_extractor=cursor_extractor)
 
     def fetch(self) -> Sequence[WikiPageRevision]:
+        return [load_wiki_page_revision(d, self.client) for d in self.fetch_raw()]
+
+    def fetch_raw(self) -> Sequence[Any]:
         data = self._fetch_data()
-        return [load_wiki_page_revision(d, self.client) for d in data['children']]
+        return data['children']
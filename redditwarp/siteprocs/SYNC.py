@@ -1,76 +1,150 @@
-
 from __future__ import annotations
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from ..client_SYNC import Client
+    from .submission.SYNC import SubmissionProcedures
+    from .comment.SYNC import CommentProcedures
+    from .subreddit.SYNC import SubredditProcedures
+    from .comment_tree.SYNC import CommentTreeProcedures
+    from .front.SYNC import FrontProcedures
+    from .user.SYNC import UserProcedures
+    from .account.SYNC import AccountProcedures
+    from .collection.SYNC import CollectionProcedures
+    from .flair.SYNC import FlairProcedures
+    from .flair_emoji.SYNC import FlairEmojiProcedures
+    from .custom_feed.SYNC import CustomFeedProcedures
+    from .live_thread.SYNC import LiveThreadProcedures
+    from .message.SYNC import MessageProcedures
+    from .moderation.SYNC import ModerationProcedures
+    from .draft.SYNC import DraftProcedures
+    from .misc.SYNC import MiscProcedures
+    from .modmail.SYNC import ModmailProcedures
+    from .widget.SYNC import WidgetProcedures
+    from .wiki.SYNC import WikiProcedures
+    from .subreddit_style_old.SYNC import SubredditStyleOldProcedures
+    from .subreddit_style_new.SYNC import SubredditStyleNewProcedures
+
+from functools import cached_property
 
-from .submission.SYNC import SubmissionProcedures
-from .comment.SYNC import CommentProcedures
-from .subreddit.SYNC import SubredditProcedures
-from .comment_tree.SYNC import CommentTreeProcedures
-from .front.SYNC import FrontProcedures
-from .user.SYNC import UserProcedures
-from .account.SYNC import AccountProcedures
-from .collection.SYNC import CollectionProcedures
-from .flair.SYNC import FlairProcedures
-from .flair_emoji.SYNC import FlairEmojiProcedures
-from .custom_feed.SYNC import CustomFeedProcedures
-from .live_thread.SYNC import LiveThreadProcedures
-from .message.SYNC import MessageProcedures
-from .moderation.SYNC import ModerationProcedures
-from .draft.SYNC import DraftProcedures
-from .misc.SYNC import MiscProcedures
-from .modmail.SYNC import ModmailProcedures
-from .widget.SYNC import WidgetProcedures
-from .wiki.SYNC import WikiProcedures
-from .subreddit_style_old.SYNC import SubredditStyleOldProcedures
-from .subreddit_style_new.SYNC import SubredditStyleNewProcedures
+from ..core.accounting import tag_procedures
 
 class SiteProcedures:
+    """The procedure areas are imported and instantiated on first access.
+
+    Importing all of them up front would load nearly every model, loader,
+    paginator, and iterator module in the library.
+
+    Each area is tagged for request cost accounting when it's instantiated.
+    See :mod:`redditwarp.core.accounting`.
+    """
+
     def __init__(self, client: Client) -> None:
         self._client = client
-        self.submission: SubmissionProcedures = SubmissionProcedures(client)
-        ("")
-        self.comment: CommentProcedures = CommentProcedures(client)
-        ("")
-        self.subreddit: SubredditProcedures = SubredditProcedures(client)
-        ("")
-        self.comment_tree: CommentTreeProcedures = CommentTreeProcedures(client)
-        ("")
-        self.front: FrontProcedures = FrontProcedures(client)
-        ("")
-        self.user: UserProcedures = UserProcedures(client)
-        ("")
-        self.account: AccountProcedures = AccountProcedures(client)
-        ("")
-        self.collection: CollectionProcedures = CollectionProcedures(client)
-        ("")
-        self.flair: FlairProcedures = FlairProcedures(client)
-        ("")
-        self.flair_emoji: FlairEmojiProcedures = FlairEmojiProcedures(client)
-        ("")
-        self.custom_feed: CustomFeedProcedures = CustomFeedProcedures(client)
-        ("")
-        self.live_thread: LiveThreadProcedures = LiveThreadProcedures(client)
-        ("")
-        self.message: MessageProcedures = MessageProcedures(client)
-        ("")
-        self.moderation: ModerationProcedures = ModerationProcedures(client)
-        ("")
-        self.draft: DraftProcedures = DraftProcedures(client)
-        ("")
-        self.misc: MiscProcedures = MiscProcedures(client)
-        ("")
-        self.modmail: ModmailProcedures = ModmailProcedures(client)
-        ("")
-        self.widget: WidgetProcedures = WidgetProcedures(client)
-        ("")
-        self.wiki: WikiProcedures = WikiProcedures(client)
-        ("")
-        self.subreddit_style_old: SubredditStyleOldProcedures = SubredditStyleOldProcedures(client)
-        ("")
-        self.subreddit_style_new: SubredditStyleNewProcedures = SubredditStyleNewProcedures(client)
-        ("")
+
+    @cached_property
+    def submission(self) -> SubmissionProcedures:
+        from .submission.SYNC import SubmissionProcedures
+        return tag_procedures(SubmissionProcedures(self._client), 'p.submission')
+
+    @cached_property
+    def comment(self) -> CommentProcedures:
+        from .comment.SYNC import CommentProcedures
+        return tag_procedures(CommentProcedures(self._client), 'p.comment')
+
+    @cached_property
+    def subreddit(self) -> SubredditProcedures:
+        from .subreddit.SYNC import SubredditProcedures
+        return tag_procedures(SubredditProcedures(self._client), 'p.subreddit')
+
+    @cached_property
+    def comment_tree(self) -> CommentTreeProcedures:
+        from .comment_tree.SYNC import CommentTreeProcedures
+        return tag_procedures(CommentTreeProcedures(self._client), 'p.comment_tree')
+
+    @cached_property
+    def front(self) -> FrontProcedures:
+        from .front.SYNC import FrontProcedures
+        return tag_procedures(FrontProcedures(self._client), 'p.front')
+
+    @cached_property
+    def user(self) -> UserProcedures:
+        from .user.SYNC import UserProcedures
+        return tag_procedures(UserProcedures(self._client), 'p.user')
+
+    @cached_property
+    def account(self) -> AccountProcedures:
+        from .account.SYNC import AccountProcedures
+        return tag_procedures(AccountProcedures(self._client), 'p.account')
+
+    @cached_property
+    def collection(self) -> CollectionProcedures:
+        from .collection.SYNC import CollectionProcedures
+        return tag_procedures(CollectionProcedures(self._client), 'p.collection')
+
+    @cached_property
+    def flair(self) -> FlairProcedures:
+        from .flair.SYNC import FlairProcedures
+        return tag_procedures(FlairProcedures(self._client), 'p.flair')
+
+    @cached_property
+    def flair_emoji(self) -> FlairEmojiProcedures:
+        from .flair_emoji.SYNC import FlairEmojiProcedures
+        return tag_procedures(FlairEmojiProcedures(self._client), 'p.flair_emoji')
+
+    @cached_property
+    def custom_feed(self) -> CustomFeedProcedures:
+        from .custom_feed.SYNC import CustomFeedProcedures
+        return tag_procedures(CustomFeedProcedures(self._client), 'p.custom_feed')
+
+    @cached_property
+    def live_thread(self) -> LiveThreadProcedures:
+        from .live_thread.SYNC import LiveThreadProcedures
+        return tag_procedures(LiveThreadProcedures(self._client), 'p.live_thread')
+
+    @cached_property
+    def message(self) -> MessageProcedures:
+        from .message.SYNC import MessageProcedures
+        return tag_procedures(MessageProcedures(self._client), 'p.message')
+
+    @cached_property
+    def moderation(self) -> ModerationProcedures:
+        from .moderation.SYNC import ModerationProcedures
+        return tag_procedures(ModerationProcedures(self._client), 'p.moderation')
+
+    @cached_property
+    def draft(self) -> DraftProcedures:
+        from .draft.SYNC import DraftProcedures
+        return tag_procedures(DraftProcedures(self._client), 'p.draft')
+
+    @cached_property
+    def misc(self) -> MiscProcedures:
+        from .misc.SYNC import MiscProcedures
+        return tag_procedures(MiscProcedures(self._client), 'p.misc')
+
+    @cached_property
+    def modmail(self) -> ModmailProcedures:
+        from .modmail.SYNC import ModmailProcedures
+        return tag_procedures(ModmailProcedures(self._client), 'p.modmail')
+
+    @cached_property
+    def widget(self) -> WidgetProcedures:
+        from .widget.SYNC import WidgetProcedures
+        return tag_procedures(WidgetProcedures(self._client), 'p.widget')
+
+    @cached_property
+    def wiki(self) -> WikiProcedures:
+        from .wiki.SYNC import WikiProcedures
+        return tag_procedures(WikiProcedures(self._client), 'p.wiki')
+
+    @cached_property
+    def subreddit_style_old(self) -> SubredditStyleOldProcedures:
+        from .subreddit_style_old.SYNC import SubredditStyleOldProcedures
+        return tag_procedures(SubredditStyleOldProcedures(self._client), 'p.subreddit_style_old')
+
+    @cached_property
+    def subreddit_style_new(self) -> SubredditStyleNewProcedures:
+        from .subreddit_style_new.SYNC import SubredditStyleNewProcedures
+        return tag_procedures(SubredditStyleNewProcedures(self._client), 'p.subreddit_style_new')
 
     def ping(self) -> None:
         """Make a request to the server having no effect."""
@@ -1,6 +1,6 @@
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional, Sequence, Iterable, Union, Mapping, TypeVar
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Iterable, Union, Mapping, TypeVar
 if TYPE_CHECKING:
     from ...client_SYNC import Client
     from ...models.comment_SYNC import Comment
@@ -68,15 +68,34 @@ class CommentProcedures:
         :rtype: :class:`~.iterators.call_chunk_chaining_iterator.CallChunkChainingIterator`\\[:class:`~.models.comment_SYNC.Comment`]
         """
         def mass_fetch(ids: Sequence[_YIntOrStr]) -> Sequence[Comment]:
-            # https://github.com/python/mypy/issues/4134
-            id36s = ((x if isinstance((x := i), str) else to_base36(x)) for i in ids)  # type: ignore[arg-type]
-            full_id36s = map('t1_'.__add__, id36s)
-            ids_str = ','.join(full_id36s)
-            root = self._client.request('GET', '/api/info', params={'id': ids_str})
-            return [load_comment(i['data'], self._client) for i in root['data']['children']]
+            return [load_comment(d, self._client) for d in self._mass_fetch_raw(ids)]
 
         return CallChunkChainingIterator(CallChunk[Sequence[_YIntOrStr], Sequence[Comment]](mass_fetch, idfs) for idfs in chunked(ids, 100))
 
+    def bulk_fetch_raw(self, ids: Iterable[_YIntOrStr]) -> CallChunkChainingIterator[Mapping[str, Any]]:
+        """Like :meth:`bulk_fetch`, but yield the raw data of each comment without loading models.
+
+        Any ID not found will be ignored.
+
+        .. .PARAMETERS
+
+        :param `Iterable[_YIntOrStr]` ids:
+            Comment IDs.
+
+        .. .RETURNS
+
+        :rtype: :class:`~.iterators.call_chunk_chaining_iterator.CallChunkChainingIterator`\\[`Mapping`\\[`str`, `Any`]]
+        """
+        return CallChunkChainingIterator(CallChunk[Sequence[_YIntOrStr], Sequence[Mapping[str, Any]]](self._mass_fetch_raw, idfs) for idfs in chunked(ids, 100))
+
+    def _mass_fetch_raw(self, ids: Sequence[_YIntOrStr]) -> Sequence[Mapping[str, Any]]:
+        # https://github.com/python/mypy/issues/4134
+        id36s = ((x if isinstance((x := i), str) else to_base36(x)) for i in ids)  # type: ignore[arg-type]
+        full_id36s = map('t1_'.__add__, id36s)
+        ids_str = ','.join(full_id36s)
+        root = self._client.request('GET', '/api/info', params={'id': ids_str})
+        return [i['data'] for i in root['data']['children']]
+
     def reply(self, idy: Union[int, str], body: Union[str, Mapping[str, JSON_ro]]) -> Comment:
         """Reply to a comment.
 
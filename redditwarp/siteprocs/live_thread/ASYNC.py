@@ -1,6 +1,6 @@
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional, Sequence, Iterable, Mapping, Union
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Iterable, Mapping, Union
 if TYPE_CHECKING:
     from ...client_ASYNC import Client
     from ...models.live_thread_ASYNC import LiveThread, LiveUpdate
@@ -60,12 +60,38 @@ class LiveThreadProcedures:
                 A specified ID does not exist.
         """
         async def mass_fetch(idts: Sequence[str]) -> Sequence[LiveThread]:
-            idts_str = ','.join(idts)
-            root = await self._client.request('GET', '/api/live/by_id/' + idts_str)
-            return [load_live_thread(o['data'], self._client) for o in root['data']['children']]
+            return [load_live_thread(d, self._client) for d in await self._mass_fetch_raw(idts)]
 
         return CallChunkChainingAsyncIterator(AsyncCallChunk(mass_fetch, idfs) for idfs in chunked(idts, 100))
 
+    def bulk_fetch_raw(self, idts: Iterable[str]) -> CallChunkChainingAsyncIterator[Mapping[str, Any]]:
+        """Like :meth:`bulk_fetch`, but yield the raw data of each live thread without loading models.
+
+        Entries are returned in the same order as specified.
+
+        If one of the IDs in a batch does not exist then a 500 HTTP error is returned.
+
+        .. .PARAMETERS
+
+        :param `Iterable[str]` idts:
+
+        .. .RETURNS
+
+        :rtype: :class:`~.iterators.call_chunk_chaining_async_iterator.CallChunkChainingAsyncIterator`\\[`Mapping`\\[`str`, `Any`]]
+
+        .. .RAISES
+
+        :raises redditwarp.http.exceptions.StatusCodeException:
+            + `500`:
+                A specified ID does not exist.
+        """
+        return CallChunkChainingAsyncIterator(AsyncCallChunk(self._mass_fetch_raw, idfs) for idfs in chunked(idts, 100))
+
+    async def _mass_fetch_raw(self, idts: Sequence[str]) -> Sequence[Mapping[str, Any]]:
+        idts_str = ','.join(idts)
+        root = await self._client.request('GET', '/api/live/by_id/' + idts_str)
+        return [o['data'] for o in root['data']['children']]
+
     async def create(self,
         title: str,
         description: str = '',
@@ -259,15 +259,33 @@ class SubredditProcedures:
         :rtype: :class:`~.iterators.call_chunk_chaining_async_iterator.CallChunkChainingAsyncIterator`\\[`object`]
         """
         async def mass_fetch(ids: Sequence[_YIntOrStr]) -> Sequence[object]:
-            # https://github.com/python/mypy/issues/4134
-            id36s = ((x if isinstance((x := i), str) else to_base36(x)) for i in ids)  # type: ignore[arg-type]
-            full_id36s = map('t5_'.__add__, id36s)
-            ids_str = ','.join(full_id36s)
-            root = await self._client.request('GET', '/api/info', params={'id': ids_str})
-            return [load_potentially_inaccessible_subreddit(i['data'], self._client) for i in root['data']['children']]
+            return [load_potentially_inaccessible_subreddit(d, self._client) for d in await self._mass_fetch_potentially_inaccessible_raw(ids)]
 
         return CallChunkChainingAsyncIterator(AsyncCallChunk[Sequence[_YIntOrStr], Sequence[object]](mass_fetch, chunk) for chunk in chunked(ids, 100))
 
+    def bulk_fetch_potentially_inaccessible_raw(self, ids: Iterable[_YIntOrStr]) -> CallChunkChainingAsyncIterator[Mapping[str, Any]]:
+        """Like :meth:`bulk_fetch_potentially_inaccessible`, but yield the raw data of each subreddit without loading models.
+
+        Any ID not found will be ignored.
+
+        .. .PARAMETERS
+
+        :param `Iterable[_YIntOrStr]` ids:
+
+        .. .RETURNS
+
+        :rtype: :class:`~.iterators.call_chunk_chaining_async_iterator.CallChunkChainingAsyncIterator`\\[`Mapping`\\[`str`, `Any`]]
+        """
+        return CallChunkChainingAsyncIterator(AsyncCallChunk[Sequence[_YIntOrStr], Sequence[Mapping[str, Any]]](self._mass_fetch_potentially_inaccessible_raw, chunk) for chunk in chunked(ids, 100))
+
+    async def _mass_fetch_potentially_inaccessible_raw(self, ids: Sequence[_YIntOrStr]) -> Sequence[Mapping[str, Any]]:
+        # https://github.com/python/mypy/issues/4134
+        id36s = ((x if isinstance((x := i), str) else to_base36(x)) for i in ids)  # type: ignore[arg-type]
+        full_id36s = map('t5_'.__add__, id36s)
+        ids_str = ','.join(full_id36s)
+        root = await self._client.request('GET', '/api/info', params={'id': ids_str})
+        return [i['data'] for i in root['data']['children']]
+
     def bulk_fetch_potentially_inaccessible_by_name(self, names: Iterable[str]) -> CallChunkChainingAsyncIterator[object]:
         """Bulk fetch information about a potentially inacessible subreddits, by name.
 
@@ -288,11 +306,29 @@ class SubredditProcedures:
         :rtype: :class:`~.iterators.call_chunk_chaining_async_iterator.CallChunkChainingAsyncIterator`\\[`object`]
         """
         async def mass_fetch(names: Sequence[str]) -> Sequence[object]:
-            root = await self._client.request('GET', '/api/info', params={'sr_name': ','.join(names)})
-            return [load_potentially_inaccessible_subreddit(i['data'], self._client) for i in root['data']['children']]
+            return [load_potentially_inaccessible_subreddit(d, self._client) for d in await self._mass_fetch_potentially_inaccessible_by_name_raw(names)]
 
         return CallChunkChainingAsyncIterator(AsyncCallChunk(mass_fetch, chunk) for chunk in chunked(names, 100))
 
+    def bulk_fetch_potentially_inaccessible_by_name_raw(self, names: Iterable[str]) -> CallChunkChainingAsyncIterator[Mapping[str, Any]]:
+        """Like :meth:`bulk_fetch_potentially_inaccessible_by_name`, but yield the raw data of each subreddit without loading models.
+
+        Any name not found will be ignored.
+
+        .. .PARAMETERS
+
+        :param `Iterable[str]` names:
+
+        .. .RETURNS
+
+        :rtype: :class:`~.iterators.call_chunk_chaining_async_iterator.CallChunkChainingAsyncIterator`\\[`Mapping`\\[`str`, `Any`]]
+        """
+        return CallChunkChainingAsyncIterator(AsyncCallChunk(self._mass_fetch_potentially_inaccessible_by_name_raw, chunk) for chunk in chunked(names, 100))
+
+    async def _mass_fetch_potentially_inaccessible_by_name_raw(self, names: Sequence[str]) -> Sequence[Mapping[str, Any]]:
+        root = await self._client.request('GET', '/api/info', params={'sr_name': ','.join(names)})
+        return [i['data'] for i in root['data']['children']]
+
     def pull_new_comments(self, sr: str, amount: Optional[int] = None) -> ImpartedPaginatorChainingAsyncIterator[LooseCommentListingAsyncPaginator, LooseComment]:
         """Pull new comments from a subreddit.
 
@@ -22,7 +22,7 @@ Examples:
 """
 
 from __future__ import annotations
-from typing import Any, TypeVar, Mapping, Iterable, Iterator, IO, Sequence, overload, Union
+from typing import Any, TypeVar, Mapping, MutableMapping, Iterable, Iterator, IO, Sequence, Optional, overload, Union
 
 from pprint import PrettyPrinter
 
@@ -94,25 +94,61 @@ class AttributeMappingProxy(Mapping[str, V]):
         PrettyPrinter._dispatch[__repr__] = _pprint.__func__  # type: ignore[attr-defined]
 
 
-class MappingRecursiveAttributeMappingProxy(AttributeMappingProxy[V]):
-    def __getattr__(self, name: str) -> Any:
-        attr = super().__getattr__(name)
-        if isinstance(attr, Mapping):
-            return MappingRecursiveAttributeMappingProxy(attr)
-        return attr
+class _RecursiveAttributeMappingProxy(AttributeMappingProxy[V]):
+    # The proxies made for child containers are kept, so that repeated
+    # attribute hops over the same path don't wrap the children again.
+    # A kept proxy is only reused while it still wraps the current value.
+    __slots__ = ('_children',)
+    _children: Optional[MutableMapping[str, Any]]
+
+    def __init__(self, mapping: Mapping[str, V]) -> None:
+        super().__init__(mapping)
+        object.__setattr__(self, '_children', None)
+
+    def __setstate__(self, state: Mapping[str, V]) -> None:
+        super().__setstate__(state)
+        object.__setattr__(self, '_children', None)
 
-class DictRecursiveAttributeMappingProxy(AttributeMappingProxy[V]):
     def __getattr__(self, name: str) -> Any:
         attr = super().__getattr__(name)
-        if isinstance(attr, dict):
-            return DictRecursiveAttributeMappingProxy(attr)
-        return attr
+        children = self._children
+        if children is not None:
+            proxy = children.get(name)
+            if proxy is not None and abs(proxy) is attr:
+                return proxy
+        proxy = self._wrap(attr)
+        if proxy is not attr:
+            if children is None:
+                children = {}
+                object.__setattr__(self, '_children', children)
+            children[name] = proxy
+        return proxy
+
+    def _wrap(self, value: Any) -> Any:
+        raise NotImplementedError
+
+class MappingRecursiveAttributeMappingProxy(_RecursiveAttributeMappingProxy[V]):
+    __slots__ = ()
+
+    def _wrap(self, value: Any) -> Any:
+        if isinstance(value, Mapping):
+            return MappingRecursiveAttributeMappingProxy(value)
+        return value
+
+class DictRecursiveAttributeMappingProxy(_RecursiveAttributeMappingProxy[V]):
+    __slots__ = ()
+
+    def _wrap(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return DictRecursiveAttributeMappingProxy(value)
+        return value
 
 
 
 class ListProxy(Sequence[Any]):
     def __init__(self, data: Sequence[Any]) -> None:
         self._elements: Sequence[Any] = data
+        self._children: Optional[MutableMapping[int, Any]] = None
 
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({self._elements})'
@@ -135,11 +171,23 @@ class ListProxy(Sequence[Any]):
     def __getitem__(self, index: slice) -> Sequence[Any]: ...
     def __getitem__(self, index: Union[int, slice]) -> Union[Any, Sequence[Any]]:
         item = self._elements[index]
+        if isinstance(index, slice):
+            return self.__class__(item) if isinstance(item, list) else item
+        children = self._children
+        if children is not None:
+            proxy = children.get(index)
+            if proxy is not None and abs(proxy) is item:
+                return proxy
         if isinstance(item, dict):
-            return DictAndListRecursiveAttributeMappingProxy(item)
-        if isinstance(item, list):
-            return self.__class__(item)
-        return item
+            proxy = DictAndListRecursiveAttributeMappingProxy(item)
+        elif isinstance(item, list):
+            proxy = self.__class__(item)
+        else:
+            return item
+        if children is None:
+            children = self._children = {}
+        children[index] = proxy
+        return proxy
 
     @staticmethod
     def _pprint(
@@ -166,11 +214,12 @@ class ListProxy(Sequence[Any]):
     if isinstance(getattr(PrettyPrinter, '_dispatch', None), dict):
         PrettyPrinter._dispatch[__repr__] = _pprint.__func__  # type: ignore[attr-defined]
 
-class DictAndListRecursiveAttributeMappingProxy(AttributeMappingProxy[V]):
-    def __getattr__(self, name: str) -> Any:
-        attr = super().__getattr__(name)
-        if isinstance(attr, dict):
-            return DictAndListRecursiveAttributeMappingProxy(attr)
-        elif isinstance(attr, list):
-            return ListProxy(attr)
-        return attr
+class DictAndListRecursiveAttributeMappingProxy(_RecursiveAttributeMappingProxy[V]):
+    __slots__ = ()
+
+    def _wrap(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return DictAndListRecursiveAttributeMappingProxy(value)
+        elif isinstance(value, list):
+            return ListProxy(value)
+        return value
@@ -0,0 +1,28 @@
+"""Exclusive advisory locks on open files, for coordinating between processes."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+if sys.platform == 'win32':
+    import msvcrt
+
+    def lock_file(fd: int) -> None:
+        """Block until an exclusive lock on the file is acquired."""
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+    def unlock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def lock_file(fd: int) -> None:
+        """Block until an exclusive lock on the file is acquired."""
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def unlock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
@@ -0,0 +1,42 @@
+
+from __future__ import annotations
+from typing import Any, Callable, Generic, Optional, TypeVar, overload
+
+T_co = TypeVar('T_co', covariant=True)
+
+class lazy_attribute(Generic[T_co]):
+    """Like `functools.cached_property`, but without a lock.
+
+    The value is computed on first access and stored in the instance
+    `__dict__` under the same name, so later accesses are plain attribute
+    lookups. Before Python 3.12, `functools.cached_property` takes a lock on
+    every access that misses, which costs more than building most of the
+    values it is used for.
+
+    Two threads that access the attribute for the first time at once may
+    both compute it. The function must be free of side effects.
+
+    An exception raised by the function propagates from the attribute access.
+    Nothing is stored, so the next access calls the function again.
+    """
+
+    def __init__(self, func: Callable[[Any], T_co]) -> None:
+        self.func = func
+        self.attrname: Optional[str] = None
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attrname = name
+
+    @overload
+    def __get__(self, instance: None, owner: Optional[type] = None) -> lazy_attribute[T_co]: ...
+    @overload
+    def __get__(self, instance: object, owner: Optional[type] = None) -> T_co: ...
+    def __get__(self, instance: Optional[object], owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        attrname = self.attrname
+        if attrname is None:
+            raise TypeError('cannot use lazy_attribute instance without calling __set_name__ on it')
+        value = instance.__dict__[attrname] = self.func(instance)
+        return value
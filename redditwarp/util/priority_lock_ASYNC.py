@@ -0,0 +1,63 @@
+"""A lock that is handed to waiters in order of a sort key rather than arrival."""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from .imports import lazy_import
+if TYPE_CHECKING:
+    import asyncio
+else:
+    lazy_import % 'asyncio'
+
+import heapq
+from itertools import count
+
+class PriorityLock:
+    def __init__(self) -> None:
+        self._locked = False
+        self._heap: list[tuple[float, int, asyncio.Future[None]]] = []
+        self._counter = count()
+        self._waiter_count = 0
+
+    def locked(self) -> bool:
+        return self._locked
+
+    def get_waiter_count(self) -> int:
+        return self._waiter_count
+
+    async def acquire(self, key: float = 0) -> None:
+        """Acquire the lock.
+
+        When the lock is released, it is handed to the waiter with the lowest `key`.
+        Waiters with equal keys are served in arrival order.
+        """
+        if not self._locked:
+            self._locked = True
+            return
+
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._heap, (key, next(self._counter), fut))
+        self._waiter_count += 1
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # The lock was handed over just as we were cancelled.
+                self.release()
+            else:
+                # The future stays in the heap and is skipped by `release()`.
+                self._waiter_count -= 1
+            raise
+
+    def release(self) -> None:
+        if not self._locked:
+            raise RuntimeError('lock is not acquired')
+        heap = self._heap
+        while heap:
+            _, _, fut = heapq.heappop(heap)
+            if not fut.done():
+                # Ownership passes directly to the next waiter.
+                self._waiter_count -= 1
+                fut.set_result(None)
+                return
+        self._locked = False
@@ -0,0 +1,71 @@
+"""A lock that is handed to waiters in order of a sort key rather than arrival."""
+
+from __future__ import annotations
+
+import threading
+import heapq
+from itertools import count
+
+class _Waiter:
+    __slots__ = ('cond', 'granted')
+
+    def __init__(self, cond: threading.Condition) -> None:
+        self.cond = cond
+        self.granted = False
+
+class PriorityLock:
+    def __init__(self) -> None:
+        self._mutex = threading.Lock()
+        self._locked = False
+        self._heap: list[tuple[float, int, _Waiter]] = []
+        self._counter = count()
+
+    def locked(self) -> bool:
+        return self._locked
+
+    def get_waiter_count(self) -> int:
+        return len(self._heap)
+
+    def acquire(self, key: float = 0) -> None:
+        """Acquire the lock.
+
+        When the lock is released, it is handed to the waiter with the lowest `key`.
+        Waiters with equal keys are served in arrival order.
+        """
+        with self._mutex:
+            if not self._locked:
+                self._locked = True
+                return
+
+            # Each waiter has its own condition so that a release wakes only
+            # the waiter it hands the lock to.
+            waiter = _Waiter(threading.Condition(self._mutex))
+            entry = (key, next(self._counter), waiter)
+            heapq.heappush(self._heap, entry)
+            try:
+                while not waiter.granted:
+                    waiter.cond.wait()
+            except BaseException:
+                if waiter.granted:
+                    # The lock was handed over just as we were interrupted.
+                    self._hand_over()
+                else:
+                    self._heap.remove(entry)
+                    heapq.heapify(self._heap)
+                raise
+
+    def release(self) -> None:
+        with self._mutex:
+            if not self._locked:
+                raise RuntimeError('lock is not acquired')
+            self._hand_over()
+
+    def _hand_over(self) -> None:
+        # Must be called with the mutex held.
+        if self._heap:
+            # Ownership passes directly to the next waiter.
+            _, _, waiter = heapq.heappop(self._heap)
+            waiter.granted = True
+            waiter.cond.notify()
+        else:
+            self._locked = False
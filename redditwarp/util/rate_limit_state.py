@@ -0,0 +1,168 @@
+"""Storage backends for the state of a :class:`~.reservation_rate_limiter.ReservationRateLimiter`.
+
+A backend hands out the rate limit state under a lock so that the limiter can
+read and update it atomically. The :class:`LocalRateLimitStateBackend` keeps
+the state in memory. The :class:`SharedFileRateLimitStateBackend` keeps it in a
+memory-mapped file so that rate limiters in different processes on the same
+host can share one budget.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable, Iterator, Union, ContextManager, Optional
+if TYPE_CHECKING:
+    from os import PathLike
+    from types import TracebackType
+
+import os
+import time
+import mmap
+import struct
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from .file_lock import lock_file, unlock_file
+
+
+@dataclass(repr=False, eq=False)
+class RateLimitState:
+    limit: int = 0
+    ("""
+        The estimated total budget of a window. Zero if the state is uninitialised.
+        """)
+    remaining: int = 0
+    ("")
+    used: int = 0
+    ("")
+    reserved: int = 0
+    ("""
+        The number of reservations that have not been settled yet.
+        """)
+    window_end: float = 0.
+    ("""
+        The time at which the current window ends.
+        """)
+    tat: float = 0.
+    ("""
+        The theoretical arrival time of the next reservation.
+        """)
+
+
+class RateLimitStateBackend:
+    def time(self) -> float:
+        """Return the current time in the clock that the state is measured with."""
+        raise NotImplementedError
+
+    def transaction(self) -> ContextManager[RateLimitState]:
+        """Lock the state and return it for reading and updating.
+
+        Use with a `with` statement. Changes made to the state object are saved
+        when the block exits.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class LocalRateLimitStateBackend(RateLimitStateBackend):
+    def __init__(self, *, time_func: Callable[[], float] = time.monotonic) -> None:
+        self.time_func: Callable[[], float] = time_func
+        ("")
+        self._state = RateLimitState()
+        self._lock = threading.Lock()
+        # A transaction is taken several times per request, so a single
+        # lock-holding context object is reused instead of a generator-based
+        # context manager being created each time.
+        self._transaction = _LockedStateContext(self._lock, self._state)
+
+    def time(self) -> float:
+        return self.time_func()
+
+    def transaction(self) -> ContextManager[RateLimitState]:
+        return self._transaction
+
+
+class _LockedStateContext:
+    def __init__(self, lock: threading.Lock, state: RateLimitState) -> None:
+        self._lock = lock
+        self._state = state
+
+    def __enter__(self) -> RateLimitState:
+        self._lock.acquire()
+        return self._state
+
+    def __exit__(self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        exc_traceback: Optional[TracebackType],
+    ) -> Optional[bool]:
+        self._lock.release()
+        return None
+
+
+class SharedFileRateLimitStateBackend(RateLimitStateBackend):
+    """Keep the rate limit state in a memory-mapped file guarded by a file lock.
+
+    All processes that use the same file path share one budget. The state is
+    measured with the wall clock (`time.time()`) because the monotonic clock
+    is not guaranteed to be comparable between processes.
+
+    Taking a transaction blocks on the file lock until no other process holds
+    it. The lock is only held while the state is read and written back, so
+    the wait is short, but with the async client it happens on the event loop.
+    A process that is suspended while holding the lock stalls every other
+    process sharing the file, including their event loops.
+
+    The backend is closed when the client whose rate limiter uses it is closed.
+    """
+
+    MAGIC = b'RWRLS\x00\x00\x01'
+    _STRUCT = struct.Struct('<8sqqqqdd')
+
+    def __init__(self, path: Union[str, PathLike[str]]) -> None:
+        self.path: str = os.fspath(path)
+        ("")
+        self._lock = threading.Lock()
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        size = self._STRUCT.size
+        lock_file(self._fd)
+        try:
+            if os.fstat(self._fd).st_size < size:
+                os.ftruncate(self._fd, size)
+        finally:
+            unlock_file(self._fd)
+        self._mm = mmap.mmap(self._fd, size)
+
+    def time(self) -> float:
+        return time.time()
+
+    def transaction(self) -> ContextManager[RateLimitState]:
+        return self._transaction()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[RateLimitState]:
+        with self._lock:
+            lock_file(self._fd)
+            try:
+                magic, *values = self._STRUCT.unpack_from(self._mm, 0)
+                state = RateLimitState(*values) if magic == self.MAGIC else RateLimitState()
+                yield state
+                self._STRUCT.pack_into(
+                    self._mm, 0,
+                    self.MAGIC,
+                    state.limit,
+                    state.remaining,
+                    state.used,
+                    state.reserved,
+                    state.window_end,
+                    state.tat,
+                )
+            finally:
+                unlock_file(self._fd)
+
+    def close(self) -> None:
+        if self._mm.closed:
+            return
+        self._mm.close()
+        os.close(self._fd)
@@ -0,0 +1,179 @@
+"""A rate limiter that spreads a windowed request budget evenly across the window.
+
+Unlike a plain token bucket, reservations that have been handed out but not yet
+settled (i.e., requests that are waiting to be sent or are in flight) are counted
+against the budget. This stops a large number of concurrent callers from
+overspending a budget that was last reported before any of them were sent.
+
+The limiter state is kept in a :class:`~.rate_limit_state.RateLimitStateBackend`.
+Use a :class:`~.rate_limit_state.SharedFileRateLimitStateBackend` to have rate
+limiters in several processes share one budget.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional
+if TYPE_CHECKING:
+    from types import TracebackType
+
+from .rate_limit_state import RateLimitState, RateLimitStateBackend, LocalRateLimitStateBackend
+
+class ReservationRateLimiter:
+    @property
+    def limit(self) -> int:
+        """The estimated total budget of a window."""
+        with self._transaction() as state:
+            return state.limit
+
+    @property
+    def remaining(self) -> int:
+        """The budget remaining in the current window, as last reported."""
+        with self._transaction() as state:
+            return state.remaining
+
+    @property
+    def used(self) -> int:
+        """The budget used in the current window, as last reported."""
+        with self._transaction() as state:
+            return state.used
+
+    @property
+    def reserved(self) -> int:
+        """The number of reservations that have not been settled yet."""
+        with self._transaction() as state:
+            return state.reserved
+
+    def __init__(self, *,
+        burst: int = 10,
+        window_length: float = 600,
+        fallback_limit: int = 300,
+        state_backend: Optional[RateLimitStateBackend] = None,
+    ) -> None:
+        self.burst: int = burst
+        ("""
+            The maximum number of reservations that can be granted back to back
+            without being spaced out.
+            """)
+        self.window_length: float = window_length
+        ("""
+            The assumed length, in seconds, of a rate limit window.
+            """)
+        self.fallback_limit: int = fallback_limit
+        ("""
+            The budget assumed for a window when no budget information has been received.
+            """)
+        self.state_backend: RateLimitStateBackend = LocalRateLimitStateBackend() if state_backend is None else state_backend
+        ("""
+            Where the limiter state is stored.
+
+            Multiple limiters may share a backend, in which case they share one budget.
+            """)
+
+    def time(self) -> float:
+        return self.state_backend.time()
+
+    def close(self) -> None:
+        """Close the state backend."""
+        self.state_backend.close()
+
+    def _transaction(self) -> _Transaction:
+        return _Transaction(self)
+
+    def get_reset(self) -> float:
+        """Return the number of seconds until the current window ends."""
+        with self._transaction() as state:
+            return max(0, state.window_end - self.time())
+
+    def get_available(self) -> int:
+        """Return the budget remaining in the current window after subtracting reservations."""
+        with self._transaction() as state:
+            return state.remaining - state.reserved
+
+    def reserve(self) -> float:
+        """Reserve one unit of budget and return the number of seconds to wait before using it.
+
+        Every call must be paired with a later call to :meth:`settle`.
+
+        If the budget of the current window is used up then the reservation is
+        placed in the next window.
+        """
+        with self._transaction() as state:
+            now = self.time()
+            available = state.remaining - state.reserved
+            if available > 0:
+                tat = max(state.tat, now)
+                interval = max(0, state.window_end - tat) / available
+            else:
+                interval = self.window_length / max(1, state.limit)
+                tat = max(state.tat, state.window_end)
+
+            allowed_at = max(now, tat - (self.burst - 1) * interval)
+            if available <= 0:
+                allowed_at = max(allowed_at, state.window_end)
+            state.tat = tat + interval
+            state.reserved += 1
+            return allowed_at - now
+
+    def settle(self) -> None:
+        """Release a reservation made by :meth:`reserve`."""
+        with self._transaction() as state:
+            if state.reserved > 0:
+                state.reserved -= 1
+
+    def update(self, remaining: int, reset: float, used: int) -> None:
+        """Record budget information reported by the server.
+
+        Reports that are older than the information already held (i.e., they
+        are for the same window but show less budget used) are ignored.
+        """
+        with self._transaction() as state:
+            window_end = self.time() + reset
+            if abs(window_end - state.window_end) < 2 and used < state.used:
+                return
+            state.remaining = remaining
+            state.used = used
+            state.limit = max(1, remaining + used)
+            state.window_end = window_end
+
+    def consume(self) -> None:
+        """Record the use of one unit of budget when the server did not report budget information."""
+        with self._transaction() as state:
+            state.remaining -= 1
+            state.used += 1
+
+
+class _Transaction:
+    def __init__(self, limiter: ReservationRateLimiter) -> None:
+        self._limiter = limiter
+        self._cm = limiter.state_backend.transaction()
+
+    def __enter__(self) -> RateLimitState:
+        state = self._cm.__enter__()
+        self._prepare(state)
+        return state
+
+    def __exit__(self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        exc_traceback: Optional[TracebackType],
+    ) -> Optional[bool]:
+        return self._cm.__exit__(exc_type, exc_value, exc_traceback)
+
+    def _prepare(self, state: RateLimitState) -> None:
+        limiter = self._limiter
+        now = limiter.time()
+        if state.limit <= 0:
+            state.limit = state.remaining = limiter.fallback_limit
+            state.used = state.reserved = 0
+            state.window_end = now + limiter.window_length
+            state.tat = 0.
+            return
+
+        if now < state.window_end:
+            return
+        lapsed = (now - state.window_end) // limiter.window_length + 1
+        state.window_end += lapsed * limiter.window_length
+        state.remaining = state.limit
+        state.used = 0
+        # Reservations left unsettled by a process that died are
+        # forgotten when a window ends.
+        state.reserved = 0
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from redditwarp.auth.token import Token
+from redditwarp.auth.token_store import FileTokenStore, MemoryTokenStore, StoredToken, make_token_store_key
+
+def test_make_token_store_key() -> None:
+    key = make_token_store_key('client', {'grant_type': 'password', 'username': 'u', 'password': 'secret'})
+    assert 'secret' not in key
+    assert key == make_token_store_key('client', {'password': 'secret', 'username': 'u', 'grant_type': 'password'})
+    assert key != make_token_store_key('other', {'grant_type': 'password', 'username': 'u', 'password': 'secret'})
+
+def test_memory_token_store() -> None:
+    store = MemoryTokenStore()
+    assert store.load('a') is None
+    value = StoredToken(Token('x'), None)
+    store.save('a', value)
+    assert store.load('a') is value
+
+def test_file_token_store(tmp_path: Path) -> None:
+    path = tmp_path / 'tokens.json'
+    store = FileTokenStore(path)
+    assert store.load('a') is None
+
+    token = Token.from_dict({'access_token': 'x', 'token_type': 'bearer', 'expires_in': 86400, 'scope': '*'})
+    store.save('a', StoredToken(token, 1234.5))
+    store.save('b', StoredToken(Token('y'), None))
+
+    other = FileTokenStore(path)
+    stored = other.load('a')
+    assert stored is not None
+    assert stored.token.access_token == 'x'
+    assert stored.token.expires_in == 86400
+    assert stored.token['scope'] == '*'
+    assert stored.renewal_time == 1234.5
+    stored = other.load('b')
+    assert stored is not None
+    assert stored.token.access_token == 'y'
+    assert stored.renewal_time is None
+
+def test_file_token_store__corrupt_file(tmp_path: Path) -> None:
+    path = tmp_path / 'tokens.json'
+    path.write_text('{')
+    store = FileTokenStore(path)
+    assert store.load('a') is None
+    store.save('a', StoredToken(Token('x'), time.time()))
+    assert store.load('a') is not None
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from contextlib import suppress
+
+from redditwarp.client_SYNC import Client
+from redditwarp.core.accounting import Accounting, get_accounting, having_accounting, having_procedure
+from redditwarp.core.accounted_SYNC import Accounted
+from redditwarp.core.rate_limited_SYNC import RateLimited
+from redditwarp.core.http_client_SYNC import RedditHTTPClient
+from redditwarp.pagination.paginators.front_sync1 import HotListingPaginator
+from redditwarp.http.handler_SYNC import Handler
+from redditwarp.http.send_params import SendParams
+from redditwarp.http.exchange import Exchange
+from redditwarp.http.request import Request
+from redditwarp.http.response import Response
+from redditwarp.exceptions import NoResultException
+
+LISTING = b'{"kind": "Listing", "data": {"after": null, "before": null, "dist": 0, "children": []}}'
+
+class MyHandler(Handler):
+    def _send(self, p: SendParams) -> Exchange:
+        reqi = p.requisition
+        data = LISTING if reqi.verb == 'GET' else b'{}'
+        return Exchange(
+            requisition=reqi,
+            request=Request(reqi.verb, reqi.url, {}, b'abc'),
+            response=Response(200, {}, data),
+            history=(),
+        )
+
+def make_client() -> Client:
+    return Client.from_http(RedditHTTPClient(Accounted(RateLimited(MyHandler()))))
+
+def test_procedure_names() -> None:
+    client = make_client()
+    with client.accounting() as acct:
+        # The listings are empty, so these raise after making their request.
+        with suppress(NoResultException):
+            client.p.submission.fetch(1)
+        with suppress(NoResultException):
+            client.p.submission.fetch.by_id36('abc')
+        with suppress(NoResultException):
+            client.p.submission.fetch.as_textpost('abc')
+        list(client.p.moderation.pull.modqueue('test', 1))
+
+    assert set(acct.entries) == {
+        'p.submission.fetch',
+        'p.submission.fetch.by_id36',
+        'p.submission.fetch.as_textpost',
+        'p.moderation.pull.modqueue',
+    }
+
+def test_outermost_procedure_is_charged() -> None:
+    client = make_client()
+    with client.accounting() as acct:
+        with having_procedure('job'):
+            client.p.submission.delete(1)
+    assert list(acct.entries) == ['job']
+
+def test_nothing_recorded_outside_scope() -> None:
+    client = make_client()
+    client.p.submission.delete(1)
+    assert get_accounting() is None
+
+def test_attribution() -> None:
+    client = make_client()
+    with client.accounting() as acct:
+        client.p.submission.delete(1)
+        client.p.submission.delete(2)
+        list(client.p.front.pull.hot(10))
+        client.request('GET', '/r/test/about')
+
+    entry = acct.entries['p.submission.delete']
+    assert entry.requests == 2
+    assert entry.units == 2
+    assert entry.bytes_sent == 6
+    assert entry.bytes_received == 4
+    assert entry.wall_time > 0
+    assert acct.entries['p.front.pull.hot'].requests == 1
+    assert acct.entries['/r/{name}/about'].requests == 1
+    total = acct.get_total()
+    assert total.requests == 4
+    assert total.units == 4
+    assert acct.elapsed > 0
+    assert acct.format_report().splitlines()[-1].startswith('(total)')
+
+def test_bulk_procedure_over_iterator() -> None:
+    client = make_client()
+    with client.accounting() as acct:
+        for _ in client.p.submission.bulk_hide(range(450)):
+            pass
+    assert acct.entries['p.submission.bulk_hide'].requests == 2
+
+def test_paginator_made_outside_procedure() -> None:
+    client = make_client()
+    with client.accounting() as acct:
+        list(HotListingPaginator(client, '/hot'))
+    assert acct.entries['HotListingPaginator.fetch'].requests == 1
+
+def test_nested_scopes() -> None:
+    client = make_client()
+    with having_accounting('run') as outer:
+        client.p.submission.delete(1)
+        with client.accounting('job') as inner:
+            client.p.submission.save(1)
+        assert get_accounting() is outer
+
+    assert inner.parent is outer
+    assert outer.children == [inner]
+    assert list(inner.entries) == ['p.submission.save']
+    assert set(outer.entries) == {'p.submission.delete', 'p.submission.save'}
+    assert outer.get_total().requests == 2
+
+def test_units_not_charged_without_rate_limiter() -> None:
+    client = Client.from_http(RedditHTTPClient(Accounted(MyHandler())))
+    with client.accounting() as acct:
+        client.p.submission.delete(1)
+    entry = acct.entries['p.submission.delete']
+    assert entry.requests == 1
+    assert entry.units == 0
+    assert isinstance(acct, Accounting)
@@ -2,6 +2,8 @@
 from __future__ import annotations
 from typing import Optional, MutableSequence, Sequence
 
+import asyncio
+
 import pytest
 
 from redditwarp.core.authorizer_ASYNC import Authorizer, Authorized
@@ -14,6 +16,7 @@ from redditwarp.http.send_params import SendParams
 from redditwarp.http.exchange import Exchange
 from redditwarp.http.request import Request
 from redditwarp.http.response import Response
+from redditwarp.http.response_stream_ASYNC import ResponseStream, StreamingResponse
 from redditwarp import auth
 
 class MyTokenObtainmentClient(TokenObtainmentClient):
@@ -162,3 +165,70 @@ class TestAuthorized:
         reqi = HTTPClient.make_requisition('', '')
         await HTTPClient(handler).submit(reqi)
         assert reqi.headers[authorizer.authorization_header_name].partition(' ')[-1] == 'token_two'
+
+    @pytest.mark.asyncio
+    async def test_streamed_responses_that_are_not_returned_are_closed(self) -> None:
+        def new_response(status: int, www_authenticate: str) -> StreamingResponse:
+            return StreamingResponse(status, {'WWW-Authenticate': www_authenticate}, b'', stream=ResponseStream.from_bytes(b'{}'))
+
+        retried = new_response(401, 'Bearer realm="reddit", error="invalid_token"')
+        returned = new_response(200, '')
+        handler: Handler = ReplayingHandler([retried, returned])
+        token_client = MyTokenObtainmentClient(Token('token_two'))
+        authorizer = Authorizer(
+            token_client=token_client,
+            token=Token('token_one'),
+        )
+        handler = Authorized(handler, authorizer)
+        resp = await HTTPClient(handler).stream('', '')
+        assert resp is returned
+        assert retried.stream.closed
+        assert not returned.stream.closed
+
+        rejected = new_response(403, 'Bearer realm="reddit", error="insufficient_scope"')
+        handler = Authorized(ReplayingHandler([rejected]), authorizer)
+        with pytest.raises(auth.exceptions.ResourceServerResponseErrorTypes.InsufficientScope):
+            await HTTPClient(handler).stream('', '')
+        assert rejected.stream.closed
+
+    @pytest.mark.asyncio
+    async def test_concurrent_renewals_are_single_flight(self) -> None:
+        class CountingTokenObtainmentClient(MyTokenObtainmentClient):
+            def __init__(self) -> None:
+                super().__init__(Token('token'))
+                self.calls = 0
+
+            async def fetch_token(self) -> Token:
+                self.calls += 1
+                await asyncio.sleep(.05)
+                return Token(f'token{self.calls}')
+
+        token_client = CountingTokenObtainmentClient()
+        authorizer = Authorizer(token_client=token_client, token=None)
+        handler = Authorized(Handler(), authorizer)
+        await asyncio.gather(*[handler._renew_token(None) for _ in range(5)])
+        assert token_client.calls == 1
+        assert authorizer.fetch_token().access_token == 'token1'
+
+    @pytest.mark.asyncio
+    async def test_background_renewal(self) -> None:
+        renewed = asyncio.Event()
+
+        class SignallingTokenObtainmentClient(MyTokenObtainmentClient):
+            async def fetch_token(self) -> Token:
+                renewed.set()
+                return Token('token_two', expires_in=3600)
+
+        handler: Handler = ReplayingHandler([Response(200, {}, b'')])
+        authorizer = MyAuthorizer(
+            token_client=SignallingTokenObtainmentClient(Token('')),
+            token=Token('token_one'),
+        )
+        authorizer.renewal_skew = 30
+        authorizer.renewal_time = 40
+        handler = Authorized(handler, authorizer)
+        reqi = HTTPClient.make_requisition('', '')
+        await HTTPClient(handler).submit(reqi)
+        assert reqi.headers[authorizer.authorization_header_name].partition(' ')[-1] == 'token_one'
+        await asyncio.wait_for(renewed.wait(), 5)
+        await handler._close()
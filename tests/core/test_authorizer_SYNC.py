@@ -2,10 +2,14 @@
 from __future__ import annotations
 from typing import Optional, MutableSequence, Sequence
 
+import time
+import threading
+
 import pytest
 
 from redditwarp.core.authorizer_SYNC import Authorizer, Authorized
 from redditwarp.auth.token import Token
+from redditwarp.auth.token_store import MemoryTokenStore, StoredToken
 from redditwarp.auth.token_obtainment_client_SYNC import TokenObtainmentClient
 from redditwarp.auth.exceptions import UnknownTokenType
 from redditwarp.http.http_client_SYNC import HTTPClient
@@ -14,6 +18,7 @@ from redditwarp.http.send_params import SendParams
 from redditwarp.http.exchange import Exchange
 from redditwarp.http.request import Request
 from redditwarp.http.response import Response
+from redditwarp.http.response_stream_SYNC import ResponseStream, StreamingResponse
 from redditwarp import auth
 
 class MyTokenObtainmentClient(TokenObtainmentClient):
@@ -156,3 +161,113 @@ class TestAuthorized:
         reqi = HTTPClient.make_requisition('', '')
         HTTPClient(handler).submit(reqi)
         assert reqi.headers[authorizer.authorization_header_name].partition(' ')[-1] == 'token_two'
+
+    def test_streamed_responses_that_are_not_returned_are_closed(self) -> None:
+        def new_response(status: int, www_authenticate: str) -> StreamingResponse:
+            return StreamingResponse(status, {'WWW-Authenticate': www_authenticate}, b'', stream=ResponseStream.from_bytes(b'{}'))
+
+        retried = new_response(401, 'Bearer realm="reddit", error="invalid_token"')
+        returned = new_response(200, '')
+        handler: Handler = ReplayingHandler([retried, returned])
+        token_client = MyTokenObtainmentClient(Token('token_two'))
+        authorizer = Authorizer(
+            token_client=token_client,
+            token=Token('token_one'),
+        )
+        handler = Authorized(handler, authorizer)
+        resp = HTTPClient(handler).stream('', '')
+        assert resp is returned
+        assert retried.stream.closed
+        assert not returned.stream.closed
+
+        rejected = new_response(403, 'Bearer realm="reddit", error="insufficient_scope"')
+        handler = Authorized(ReplayingHandler([rejected]), authorizer)
+        with pytest.raises(auth.exceptions.ResourceServerResponseErrorTypes.InsufficientScope):
+            HTTPClient(handler).stream('', '')
+        assert rejected.stream.closed
+
+    def test_concurrent_renewals_are_single_flight(self) -> None:
+        class CountingTokenObtainmentClient(MyTokenObtainmentClient):
+            def __init__(self) -> None:
+                super().__init__(Token('token'))
+                self.calls = 0
+
+            def fetch_token(self) -> Token:
+                self.calls += 1
+                time.sleep(.05)
+                return Token(f'token{self.calls}')
+
+        token_client = CountingTokenObtainmentClient()
+        authorizer = Authorizer(token_client=token_client, token=None)
+        handler = Authorized(Handler(), authorizer)
+        threads = [threading.Thread(target=handler._renew_token, args=(None,)) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert token_client.calls == 1
+        assert authorizer.fetch_token().access_token == 'token1'
+
+    def test_background_renewal(self) -> None:
+        renewed = threading.Event()
+
+        class SignallingTokenObtainmentClient(MyTokenObtainmentClient):
+            def fetch_token(self) -> Token:
+                renewed.set()
+                return Token('token_two', expires_in=3600)
+
+        handler: Handler = ReplayingHandler([Response(200, {}, b'')])
+        authorizer = MyAuthorizer(
+            token_client=SignallingTokenObtainmentClient(Token('')),
+            token=Token('token_one'),
+        )
+        authorizer.renewal_skew = 30
+        authorizer.renewal_time = 40.5
+        handler = Authorized(handler, authorizer)
+        reqi = HTTPClient.make_requisition('', '')
+        HTTPClient(handler).submit(reqi)
+        assert reqi.headers[authorizer.authorization_header_name].partition(' ')[-1] == 'token_one'
+        assert not renewed.is_set()
+        assert renewed.wait(5)
+        handler._close()
+
+
+class TestTokenStore:
+    def test_token_is_reused_from_store(self) -> None:
+        store = MemoryTokenStore()
+        token_client = MyTokenObtainmentClient(Token('token_one', expires_in=3600))
+        o = Authorizer(token_client=token_client, token=None)
+        o.token_store = store
+        assert o.attain_token().access_token == 'token_one'
+
+        token_client2 = MyTokenObtainmentClient(Token('token_two', expires_in=3600))
+        o2 = Authorizer(token_client=token_client2, token=None)
+        o2.token_store = store
+        assert o2.attain_token().access_token == 'token_one'
+        assert o2.renewal_time is not None
+        assert o2.renewal_time - o2.time() > 3000
+
+    def test_expired_stored_token_is_not_used(self) -> None:
+        store = MemoryTokenStore()
+        token_client = MyTokenObtainmentClient(Token('token_two'))
+        o = Authorizer(token_client=token_client, token=None)
+        o.token_store = store
+        store.save(o.get_token_store_key(), StoredToken(Token('token_one'), time.time() - 1))
+        assert o.attain_token().access_token == 'token_two'
+
+    def test_rejected_token_is_not_reloaded(self) -> None:
+        handler: Handler = ReplayingHandler([
+            Response(401, {'WWW-Authenticate': 'Bearer realm="reddit", error="invalid_token"'}, b''),
+            Response(200, {}, b''),
+        ])
+        store = MemoryTokenStore()
+        token_client = MyTokenObtainmentClient(Token('token_two'))
+        authorizer = Authorizer(token_client=token_client, token=None)
+        authorizer.token_store = store
+        store.save(authorizer.get_token_store_key(), StoredToken(Token('token_one'), None))
+        reqi = HTTPClient.make_requisition('', '')
+        HTTPClient(Authorized(handler, authorizer)).submit(reqi)
+        assert reqi.headers[authorizer.authorization_header_name].partition(' ')[-1] == 'token_two'
+        stored = store.load(authorizer.get_token_store_key())
+        assert stored is not None
+        assert stored.token.access_token == 'token_two'
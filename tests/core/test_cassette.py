@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from redditwarp.core.cassette import (
+    Cassette,
+    CassetteEntry,
+    CassetteMiss,
+    SimulatedRateLimit,
+    make_cassette_entry,
+)
+from redditwarp.http.exchange import Exchange
+from redditwarp.http.requisition import Requisition
+from redditwarp.http.request import Request
+from redditwarp.http.response import Response
+
+URL = 'https://oauth.reddit.com/r/test/about'
+
+def new_entry(data: bytes = b'{}', params: dict[str, str] = {'raw_json': '1'}) -> CassetteEntry:
+    return CassetteEntry('GET', URL, params, 200, {'Content-Type': 'application/json'}, data, .25)
+
+def test_save_and_load_round_trip(tmp_path: object) -> None:
+    cassette = Cassette([new_entry(b'{"a": 1}'), new_entry(b'\xff\x00')])
+    path = f"{tmp_path}/test.cassette"
+    cassette.save(path)
+    loaded = Cassette.load(path)
+    assert len(loaded) == 2
+    e1, e2 = loaded.entries
+    assert (e1.verb, e1.url, e1.params, e1.status) == ('GET', URL, {'raw_json': '1'}, 200)
+    assert e1.headers == {'Content-Type': 'application/json'}
+    assert e1.data == b'{"a": 1}'
+    assert e1.elapsed == .25
+    assert e2.data == b'\xff\x00'
+
+def test_parse_rejects_unknown_version() -> None:
+    with pytest.raises(ValueError):
+        Cassette.parse(io.StringIO('{"cassette": 99}\n'))
+
+def test_entries_are_served_in_order_then_repeated() -> None:
+    cassette = Cassette([new_entry(b'1'), new_entry(b'2')])
+    assert cassette.find('GET', URL, {'raw_json': '1'}).data == b'1'
+    assert cassette.find('GET', URL, {'raw_json': '1'}).data == b'2'
+    assert cassette.find('GET', URL, {'raw_json': '1'}).data == b'2'
+    cassette.rewind()
+    assert cassette.find('GET', URL, {'raw_json': '1'}).data == b'1'
+
+    cassette.allow_repeats = False
+    cassette.find('GET', URL, {'raw_json': '1'})
+    with pytest.raises(CassetteMiss):
+        cassette.find('GET', URL, {'raw_json': '1'})
+
+def test_find_matches_verb_url_and_params() -> None:
+    cassette = Cassette([new_entry(params={'a': '1', 'b': '2'})])
+    assert cassette.find('get', URL, {'b': '2', 'a': '1'})
+    with pytest.raises(CassetteMiss):
+        cassette.find('GET', URL, {'a': '1'})
+    with pytest.raises(CassetteMiss):
+        cassette.find('POST', URL, {'a': '1', 'b': '2'})
+
+def test_tokens_are_redacted() -> None:
+    reqi = Requisition('POST', 'https://www.reddit.com/api/v1/access_token', {}, {}, None)
+    body: dict[str, object] = {'access_token': 'secret', 'refresh_token': 'secret2', 'token_type': 'bearer', 'expires_in': 86400}
+    xchg = Exchange(
+        requisition=reqi,
+        request=Request('POST', reqi.url, {}, b''),
+        response=Response(200, {}, json.dumps(body).encode()),
+        history=(),
+    )
+    entry = make_cassette_entry(xchg)
+    expected: dict[str, object] = {**body, 'access_token': 'redacted', 'refresh_token': 'redacted'}
+    assert json.loads(entry.data) == expected
+
+def test_cookies_are_redacted() -> None:
+    reqi = Requisition('GET', URL, {}, {}, None)
+    xchg = Exchange(
+        requisition=reqi,
+        request=Request('GET', URL, {}, b''),
+        response=Response(200, {'Set-Cookie': 'session=secret', 'Content-Type': 'application/json'}, b'{}'),
+        history=(),
+    )
+    entry = make_cassette_entry(xchg)
+    assert entry.headers == {'Set-Cookie': 'redacted', 'Content-Type': 'application/json'}
+
+def test_simulated_rate_limit() -> None:
+    rate_limit = SimulatedRateLimit(limit=10, window_length=600)
+    headers = rate_limit.get_headers(100)
+    assert headers == {'x-ratelimit-used': '1', 'x-ratelimit-remaining': '9.0', 'x-ratelimit-reset': '600'}
+    headers = rate_limit.get_headers(400)
+    assert headers['x-ratelimit-used'] == '2'
+    assert headers['x-ratelimit-reset'] == '300'
+    headers = rate_limit.get_headers(700)
+    assert headers['x-ratelimit-used'] == '1'
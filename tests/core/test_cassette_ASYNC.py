@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import pytest
+
+from redditwarp.core.cassette import SimulatedRateLimit
+from redditwarp.core.cassette_ASYNC import CassetteRecorder, CassettePlayer
+from redditwarp.http.handler_ASYNC import Handler
+from redditwarp.http.send_params import SendParams
+from redditwarp.http.exchange import Exchange
+from redditwarp.http.requisition import Requisition
+from redditwarp.http.request import Request
+from redditwarp.http.response import Response
+
+class MyHandler(Handler):
+    async def _send(self, p: SendParams) -> Exchange:
+        return Exchange(
+            requisition=p.requisition,
+            request=Request(p.requisition.verb, p.requisition.url, {}, b''),
+            response=Response(200, {}, b'{"name": "test"}'),
+            history=(),
+        )
+
+@pytest.mark.asyncio
+async def test_record_then_replay() -> None:
+    url = 'https://oauth.reddit.com/r/test/about'
+    recorder = CassetteRecorder(MyHandler())
+    await recorder._send(SendParams(Requisition('GET', url, {'raw_json': '1'}, {}, None)))
+    assert len(recorder.cassette) == 1
+
+    player = CassettePlayer(recorder.cassette, rate_limit=SimulatedRateLimit())
+    xchg = await player._send(SendParams(Requisition('GET', url, {'raw_json': '1'}, {}, None)))
+    assert xchg.response.data == b'{"name": "test"}'
+    assert xchg.response.headers['x-ratelimit-remaining'] == '999.0'
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from redditwarp.core.cassette import Cassette, CassetteEntry, CassetteMiss, SimulatedRateLimit
+from redditwarp.core.cassette_SYNC import CassettePlayer
+from redditwarp.core.http_client_SYNC import build_reddit_http_client_from_access_token
+from redditwarp.http.handler_SYNC import Handler
+from redditwarp.http.send_params import SendParams
+from redditwarp.http.exchange import Exchange
+from redditwarp.http.request import Request
+from redditwarp.http.response import Response
+from redditwarp.http.transport.impls.python_urllib import PythonUrllibConnector
+
+# The client builders take the User-Agent from the connector's module.
+name = 'test'
+version = '0'
+
+class MyHandler(Handler):
+    def _send(self, p: SendParams) -> Exchange:
+        return Exchange(
+            requisition=p.requisition,
+            request=Request(p.requisition.verb, p.requisition.url, {}, b''),
+            response=Response(200, {'x-ratelimit-used': '5'}, b'{"name": "test"}'),
+            history=(),
+        )
+
+def test_record_then_replay_through_client_chain() -> None:
+    cassette = Cassette()
+    http = build_reddit_http_client_from_access_token('abc', connector=MyHandler(), cassette=cassette)
+    http.request('GET', '/r/test/about')
+    assert len(cassette) == 1
+    entry = cassette.entries[0]
+    assert entry.url == 'https://oauth.reddit.com/r/test/about'
+    assert entry.params['raw_json'] == '1'
+
+    player = CassettePlayer(cassette, rate_limit=SimulatedRateLimit(limit=100))
+    http = build_reddit_http_client_from_access_token('abc', connector=player)
+    resp = http.request('GET', '/r/test/about')
+    assert resp.data == b'{"name": "test"}'
+    assert resp.headers['x-ratelimit-used'] == '1'
+    assert http.rate_limiter.remaining == 99
+
+def test_player_raises_on_miss() -> None:
+    player = CassettePlayer(Cassette())
+    http = build_reddit_http_client_from_access_token('abc', connector=player)
+    with pytest.raises(CassetteMiss):
+        http.request('GET', '/r/test/about')
+
+def test_player_latency() -> None:
+    entry = CassetteEntry('GET', 'https://oauth.reddit.com/r/test/about', {'raw_json': '1', 'api_type': 'json'}, 200, {}, b'{}', .1)
+    player = CassettePlayer(Cassette([entry]), latency=.01, latency_scale=.5)
+    http = build_reddit_http_client_from_access_token('abc', connector=player)
+    start = time.monotonic()
+    http.request('GET', '/r/test/about')
+    assert time.monotonic() - start >= .06
+    xchg = http.last.exchange
+    assert xchg is not None
+    assert xchg.request.url.startswith('https://oauth.reddit.com/r/test/about?')
+
+def test_recording_keeps_the_transport_settings() -> None:
+    connector = PythonUrllibConnector()
+    http = build_reddit_http_client_from_access_token('abc', connector=connector, cassette=Cassette())
+    assert http.follow_redirects is None
+    assert 'python-urllib/' in http.user_agent_base
+    bare_http = http.bare_http
+    assert bare_http is not None
+    assert bare_http.follow_redirects is None
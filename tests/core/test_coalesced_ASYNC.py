@@ -0,0 +1,84 @@
+from __future__ import annotations
+from typing import MutableSequence
+
+import asyncio
+
+import pytest
+
+from redditwarp.core.coalesced_ASYNC import Coalesced
+from redditwarp.http.handler_ASYNC import Handler
+from redditwarp.http.send_params import SendParams
+from redditwarp.http.exchange import Exchange
+from redditwarp.http.requisition import Requisition
+from redditwarp.http.request import Request
+from redditwarp.http.response import Response
+
+class SlowHandler(Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.history: MutableSequence[Requisition] = []
+        self.exception: BaseException | None = None
+
+    async def _send(self, p: SendParams) -> Exchange:
+        self.history.append(p.requisition)
+        await asyncio.sleep(.01)
+        if self.exception is not None:
+            raise self.exception
+        return Exchange(
+            requisition=p.requisition,
+            request=Request(p.requisition.verb, p.requisition.url, {}, b''),
+            response=Response(200, {}, b'{}'),
+            history=(),
+        )
+
+async def send(handler: Handler, url: str, auth: str = 'a') -> Exchange:
+    reqi = Requisition('GET', url, {'raw_json': '1'}, {'Authorization': auth}, None)
+    return await handler._send(SendParams(reqi))
+
+URL = 'https://oauth.reddit.com/r/test/about'
+
+@pytest.mark.asyncio
+async def test_identical_requests_share_one_response() -> None:
+    server = SlowHandler()
+    handler = Coalesced(server)
+    handler.enabled = True
+    xchgs = await asyncio.gather(*(send(handler, URL) for _ in range(30)))
+    assert len(server.history) == 1
+    assert handler.coalesced_count == 29
+    assert len({id(x.response) for x in xchgs}) == 1
+    await send(handler, URL)
+    assert len(server.history) == 2
+
+@pytest.mark.asyncio
+async def test_exception_is_shared() -> None:
+    server = SlowHandler()
+    server.exception = RuntimeError('boom')
+    handler = Coalesced(server)
+    handler.enabled = True
+    excs = await asyncio.gather(*(send(handler, URL) for _ in range(4)), return_exceptions=True)
+    assert len(server.history) == 1
+    assert all(isinstance(e, RuntimeError) and e.args == ('boom',) for e in excs)
+    # Waiters get their own copy, chained from the leader's exception.
+    assert sum(e is server.exception for e in excs) == 1
+    assert sum(isinstance(e, BaseException) and e.__cause__ is server.exception for e in excs) == 3
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_the_others() -> None:
+    server = SlowHandler()
+    handler = Coalesced(server)
+    handler.enabled = True
+    t1 = asyncio.ensure_future(send(handler, URL))
+    t2 = asyncio.ensure_future(send(handler, URL))
+    await asyncio.sleep(0)
+    t1.cancel()
+    xchg = await t2
+    assert xchg.response.status == 200
+    assert len(server.history) == 1
+
+@pytest.mark.asyncio
+async def test_different_authorization_is_not_coalesced() -> None:
+    server = SlowHandler()
+    handler = Coalesced(server)
+    handler.enabled = True
+    await asyncio.gather(send(handler, URL, 'a'), send(handler, URL, 'b'))
+    assert len(server.history) == 2
@@ -0,0 +1,105 @@
+from __future__ import annotations
+from typing import MutableSequence
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from redditwarp.core.coalesced_SYNC import Coalesced
+from redditwarp.http.handler_SYNC import Handler
+from redditwarp.http.send_params import SendParams
+from redditwarp.http.exchange import Exchange
+from redditwarp.http.requisition import Requisition
+from redditwarp.http.request import Request
+from redditwarp.http.response import Response
+
+class SlowHandler(Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.gate = threading.Event()
+        self.history: MutableSequence[Requisition] = []
+        self.exception: BaseException | None = None
+
+    def _send(self, p: SendParams) -> Exchange:
+        self.history.append(p.requisition)
+        self.gate.wait(5)
+        if self.exception is not None:
+            raise self.exception
+        return Exchange(
+            requisition=p.requisition,
+            request=Request(p.requisition.verb, p.requisition.url, {}, b''),
+            response=Response(200, {}, b'{}'),
+            history=(),
+        )
+
+def send(handler: Handler, url: str, auth: str = 'a', verb: str = 'GET') -> Exchange:
+    reqi = Requisition(verb, url, {'raw_json': '1'}, {'Authorization': auth}, None)
+    return handler._send(SendParams(reqi))
+
+URL = 'https://oauth.reddit.com/r/test/about'
+
+def run_concurrently(handler: Coalesced, server: SlowHandler, calls: int, **kwargs: str) -> list[Exchange]:
+    with ThreadPoolExecutor(calls) as executor:
+        futures = [executor.submit(send, handler, URL, **kwargs) for _ in range(calls)]
+        while handler.coalesced_count < calls - 1:
+            server.gate.wait(.01)
+        server.gate.set()
+        return [f.result() for f in futures]
+
+def test_identical_requests_share_one_response() -> None:
+    server = SlowHandler()
+    handler = Coalesced(server)
+    handler.enabled = True
+    xchgs = run_concurrently(handler, server, 8)
+    assert len(server.history) == 1
+    assert handler.coalesced_count == 7
+    assert len({id(x.response) for x in xchgs}) == 1
+    assert len({id(x.requisition) for x in xchgs}) == 8
+
+def test_exception_is_shared() -> None:
+    server = SlowHandler()
+    server.exception = RuntimeError('boom')
+    handler = Coalesced(server)
+    handler.enabled = True
+    with ThreadPoolExecutor(4) as executor:
+        futures = [executor.submit(send, handler, URL) for _ in range(4)]
+        while handler.coalesced_count < 3:
+            server.gate.wait(.01)
+        server.gate.set()
+        excs = [f.exception() for f in futures]
+    assert len(server.history) == 1
+    assert all(isinstance(e, RuntimeError) and e.args == ('boom',) for e in excs)
+    # Waiters get their own copy, chained from the leader's exception.
+    assert sum(e is server.exception for e in excs) == 1
+    assert sum(e is not None and e.__cause__ is server.exception for e in excs) == 3
+
+def test_requests_are_not_coalesced_unless_enabled() -> None:
+    server = SlowHandler()
+    server.gate.set()
+    handler = Coalesced(server)
+    send(handler, URL)
+    send(handler, URL)
+    assert len(server.history) == 2
+    assert handler.coalesced_count == 0
+
+def test_different_authorization_is_not_coalesced() -> None:
+    server = SlowHandler()
+    handler = Coalesced(server)
+    handler.enabled = True
+    with ThreadPoolExecutor(2) as executor:
+        f1 = executor.submit(send, handler, URL, auth='a')
+        f2 = executor.submit(send, handler, URL, auth='b')
+        while len(server.history) < 2:
+            server.gate.wait(.01)
+        server.gate.set()
+        f1.result()
+        f2.result()
+    assert handler.coalesced_count == 0
+
+def test_non_get_requests_are_not_coalesced() -> None:
+    server = SlowHandler()
+    server.gate.set()
+    handler = Coalesced(server)
+    handler.enabled = True
+    send(handler, URL, verb='POST')
+    send(handler, URL, verb='POST')
+    assert len(server.history) == 2
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+
+from redditwarp.core.direct_by_origin_SYNC import DirectByOrigin
+from redditwarp.http.handler_SYNC import Handler
+from redditwarp.http.send_params import SendParams
+from redditwarp.http.exchange import Exchange
+from redditwarp.http.requisition import Requisition
+from redditwarp.http.request import Request
+from redditwarp.http.response import Response
+
+class NamedHandler(Handler):
+    def __init__(self, name: str) -> None:
+        super().__init__()
+        self.name = name
+
+    def _send(self, p: SendParams) -> Exchange:
+        return Exchange(
+            requisition=p.requisition,
+            request=Request(p.requisition.verb, p.requisition.url, {}, b''),
+            response=Response(200, {}, self.name.encode()),
+            history=(),
+        )
+
+@pytest.mark.parametrize('url,expected', [
+    ('https://oauth.reddit.com', b'trusted'),
+    ('https://oauth.reddit.com/api/v1/me', b'trusted'),
+    ('https://oauth.reddit.com?a=1', b'trusted'),
+    ('HTTPS://oauth.reddit.com/api/v1/me', b'trusted'),
+    ('https://oauth.reddit.com.example.com/api/v1/me', b'default'),
+    ('https://oauth.reddit.com:8080/api/v1/me', b'default'),
+    ('http://oauth.reddit.com/api/v1/me', b'default'),
+    ('https://example.com/https://oauth.reddit.com', b'default'),
+])
+def test_direction(url: str, expected: bytes) -> None:
+    handler = DirectByOrigin(NamedHandler('default'), {'https://oauth.reddit.com': NamedHandler('trusted')})
+    xchg = handler._send(SendParams(Requisition('GET', url, {}, {}, None)))
+    assert xchg.response.data == expected
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import json
+from typing import Mapping
+from pathlib import Path
+
+from redditwarp.core.har import (
+    REDACTED,
+    make_har_entry,
+    HARArchive,
+    RollingHARFileWriter,
+)
+from redditwarp.core.har_SYNC import HARRecorder
+from redditwarp.core.http_client_SYNC import HTTPClient
+from redditwarp.http.handler_SYNC import Handler
+from redditwarp.http.send_params import SendParams
+from redditwarp.http.exchange import Exchange
+from redditwarp.http.requisition import Requisition
+from redditwarp.http.request import Request
+from redditwarp.http.response import Response
+from redditwarp.http.timings import Timings
+
+def make_exchange(
+    url: str = 'https://oauth.reddit.com/api/v1/me?raw_json=1',
+    *,
+    request_headers: Mapping[str, str] = {},
+    request_data: bytes = b'',
+    response_headers: Mapping[str, str] = {'Content-Type': 'application/json'},
+    response_data: bytes = b'{"name": "test"}',
+) -> Exchange:
+    return Exchange(
+        requisition=Requisition('GET', url, {}, {}, None),
+        request=Request('GET', url, request_headers, request_data),
+        response=Response(200, response_headers, response_data),
+        history=(),
+        timings=Timings(
+            started_at=1700000000.,
+            rate_limit_wait=.5,
+            token_renewal=.25,
+            connect=.01,
+            ttfb=.1,
+            download=.02,
+            transport=.13,
+        ),
+    )
+
+class MyHandler(Handler):
+    def _send(self, p: SendParams) -> Exchange:
+        return make_exchange(p.requisition.url)
+
+def test_make_har_entry() -> None:
+    entry = make_har_entry(make_exchange())
+    assert entry['startedDateTime'] == '2023-11-14T22:13:19.250+00:00'
+    assert entry['timings'] == {
+        'blocked': 750.,
+        'dns': -1,
+        'connect': 10.,
+        'send': 0,
+        'wait': 100.,
+        'receive': 20.,
+        'ssl': -1,
+    }
+    assert entry['time'] == 880.
+    assert entry['_rateLimitWait'] == 500.
+    assert entry['request']['queryString'] == [{'name': 'raw_json', 'value': '1'}]
+    assert 'postData' not in entry['request']
+    assert entry['response']['statusText'] == 'OK'
+    assert entry['response']['content'] == {
+        'size': 16,
+        'mimeType': 'application/json',
+        'text': '{"name": "test"}',
+    }
+
+def test_make_har_entry_unmeasured_phases() -> None:
+    xchg = make_exchange()
+    xchg.timings = Timings()
+    entry = make_har_entry(xchg)
+    assert entry['timings']['connect'] == -1
+    assert entry['time'] == 0
+
+def test_redaction() -> None:
+    xchg = make_exchange(
+        'https://www.reddit.com/api/v1/access_token',
+        request_headers={'Authorization': 'Basic abc', 'Content-Type': 'application/x-www-form-urlencoded'},
+        request_data=b'grant_type=password&username=u&password=p',
+        response_data=b'{"access_token": "xyz", "expires_in": 86400}',
+    )
+    entry = make_har_entry(xchg)
+    request = entry['request']
+    assert request['headers'] == [
+        {'name': 'Authorization', 'value': REDACTED},
+        {'name': 'Content-Type', 'value': 'application/x-www-form-urlencoded'},
+    ]
+    assert request['postData']['text'] == 'grant_type=password&username=u&password=redacted'
+    assert json.loads(entry['response']['content']['text'])['access_token'] == REDACTED
+
+    entry = make_har_entry(xchg, redact=False, include_bodies=False)
+    assert entry['request']['headers'][0]['value'] == 'Basic abc'
+    assert entry['request']['postData']['text'] == ''
+    assert 'text' not in entry['response']['content']
+
+def test_archive_from_exchanges(tmp_path: Path) -> None:
+    archive = HARArchive.from_exchanges([make_exchange(), make_exchange()])
+    assert len(archive) == 2
+    path = tmp_path / 'session.har'
+    archive.save(path)
+    with open(path) as fh:
+        har = json.load(fh)
+    assert har['log']['version'] == '1.2'
+    assert len(har['log']['entries']) == 2
+
+def test_recorder() -> None:
+    archive = HARArchive()
+    http = HTTPClient(MyHandler())
+    with http.having_additional_middleware(lambda h: HARRecorder(h, archive)):
+        http.request('GET', 'https://oauth.reddit.com/api/v1/me')
+    http.request('GET', 'https://oauth.reddit.com/api/v1/me')
+    assert len(archive) == 1
+
+def test_rolling_file_writer(tmp_path: Path) -> None:
+    path = tmp_path / 'bot.har'
+    with RollingHARFileWriter(path, max_entries=2, backup_count=2) as writer:
+        for i in range(7):
+            writer.add(make_exchange())
+            with open(path) as fh:
+                assert len(json.load(fh)['log']['entries']) == i % 2 + 1
+
+    assert sorted(x.name for x in tmp_path.iterdir()) == ['bot.1.har', 'bot.2.har', 'bot.har']
+    for name, n in [('bot.har', 1), ('bot.1.har', 2), ('bot.2.har', 2)]:
+        with open(tmp_path / name) as fh:
+            assert len(json.load(fh)['log']['entries']) == n
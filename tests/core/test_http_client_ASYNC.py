@@ -4,9 +4,17 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from typing import MutableMapping, Optional, MutableSequence
 
+import asyncio
+
 import pytest
 
-from redditwarp.core.http_client_ASYNC import HTTPClient
+from redditwarp.core.http_client_ASYNC import HTTPClient, RedditHTTPClient
+from redditwarp.core.authorizer_ASYNC import Authorizer, Authorized
+from redditwarp.core.const import AUTHORIZATION_BASE_URL, RESOURCE_BASE_URL
+from redditwarp.core.warm_up import TOKEN_PHASE, RESOURCE_CONNECTION_PHASE, TOKEN_CONNECTION_PHASE
+from redditwarp.auth.token import Token
+from redditwarp.auth.token_obtainment_client_ASYNC import TokenObtainmentClient
+from redditwarp.http.http_client_ASYNC import HTTPClient as BaseHTTPClient
 from redditwarp.http.handler_ASYNC import Handler
 from redditwarp.http.delegating_handler_ASYNC import DelegatingHandler
 from redditwarp.http.send_params import SendParams
@@ -143,3 +151,48 @@ class TestLastMessageRecord:
         assert http.last.transfer is None
 
         assert list(http.last.transfer_queue) == [(req1, xchg1)]
+
+
+class TestWarmUp:
+    class MyTokenObtainmentClient(TokenObtainmentClient):
+        def __init__(self) -> None:
+            super().__init__(BaseHTTPClient(Handler()), '', ('', ''), {})
+            self.calls = 0
+            self.delay = 0.
+
+        async def fetch_token(self) -> Token:
+            self.calls += 1
+            await asyncio.sleep(self.delay)
+            return Token('token', expires_in=3600)
+
+    @pytest.mark.asyncio
+    async def test_warm_up(self) -> None:
+        recorder = RecordingHandler(NeutralHandler(200, {}, b''))
+        token_client = self.MyTokenObtainmentClient()
+        authorizer = Authorizer(token_client)
+        authorized = Authorized(Handler(), authorizer)
+        http = RedditHTTPClient(Handler(), authorizer=authorizer, authorized=authorized, bare_http=HTTPClient(recorder))
+        report = await http.warm_up()
+        assert set(report.phases) == {TOKEN_PHASE, RESOURCE_CONNECTION_PHASE}
+        assert token_client.calls == 1
+        assert [(r.verb, r.url) for r in recorder.history] == [('HEAD', RESOURCE_BASE_URL)]
+
+        recorder.history.clear()
+        report = await http.warm_up()
+        assert set(report.phases) == {RESOURCE_CONNECTION_PHASE, TOKEN_CONNECTION_PHASE}
+        assert token_client.calls == 1
+        assert sorted(r.url for r in recorder.history) == sorted([AUTHORIZATION_BASE_URL, RESOURCE_BASE_URL])
+
+    @pytest.mark.asyncio
+    async def test_warm_up_shares_token_renewal_with_requests(self) -> None:
+        token_client = self.MyTokenObtainmentClient()
+        token_client.delay = .05
+        authorizer = Authorizer(token_client)
+        authorized = Authorized(NeutralHandler(200, {}, b''), authorizer)
+        authorized.background_renewal = False
+        http = RedditHTTPClient(authorized, authorizer=authorizer, authorized=authorized)
+        warm_up = asyncio.create_task(http.warm_up())
+        await asyncio.sleep(0)
+        await http.request('GET', RESOURCE_BASE_URL)
+        await warm_up
+        assert token_client.calls == 1
@@ -4,7 +4,16 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from typing import MutableMapping, Optional, MutableSequence
 
-from redditwarp.core.http_client_SYNC import HTTPClient
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from redditwarp.core.http_client_SYNC import HTTPClient, RedditHTTPClient
+from redditwarp.core.authorizer_SYNC import Authorizer, Authorized
+from redditwarp.core.const import AUTHORIZATION_BASE_URL, RESOURCE_BASE_URL
+from redditwarp.core.warm_up import TOKEN_PHASE, RESOURCE_CONNECTION_PHASE, TOKEN_CONNECTION_PHASE
+from redditwarp.auth.token import Token
+from redditwarp.auth.token_obtainment_client_SYNC import TokenObtainmentClient
+from redditwarp.http.http_client_SYNC import HTTPClient as BaseHTTPClient
 from redditwarp.http.handler_SYNC import Handler
 from redditwarp.http.delegating_handler_SYNC import DelegatingHandler
 from redditwarp.http.send_params import SendParams
@@ -136,3 +145,47 @@ class TestLastMessageRecord:
         assert http.last.transfer is None
 
         assert list(http.last.transfer_queue) == [(req1, xchg1)]
+
+
+class TestWarmUp:
+    class MyTokenObtainmentClient(TokenObtainmentClient):
+        def __init__(self) -> None:
+            super().__init__(BaseHTTPClient(Handler()), '', ('', ''), {})
+            self.calls = 0
+            self.delay = 0.
+
+        def fetch_token(self) -> Token:
+            self.calls += 1
+            time.sleep(self.delay)
+            return Token('token', expires_in=3600)
+
+    def test_warm_up(self) -> None:
+        recorder = RecordingHandler(NeutralHandler(200, {}, b''))
+        token_client = self.MyTokenObtainmentClient()
+        authorizer = Authorizer(token_client)
+        authorized = Authorized(Handler(), authorizer)
+        http = RedditHTTPClient(Handler(), authorizer=authorizer, authorized=authorized, bare_http=HTTPClient(recorder))
+        report = http.warm_up()
+        assert set(report.phases) == {TOKEN_PHASE, RESOURCE_CONNECTION_PHASE}
+        assert token_client.calls == 1
+        assert [(r.verb, r.url) for r in recorder.history] == [('HEAD', RESOURCE_BASE_URL)]
+
+        recorder.history.clear()
+        report = http.warm_up()
+        assert set(report.phases) == {RESOURCE_CONNECTION_PHASE, TOKEN_CONNECTION_PHASE}
+        assert token_client.calls == 1
+        assert sorted(r.url for r in recorder.history) == sorted([AUTHORIZATION_BASE_URL, RESOURCE_BASE_URL])
+
+    def test_warm_up_shares_token_renewal_with_requests(self) -> None:
+        token_client = self.MyTokenObtainmentClient()
+        token_client.delay = .1
+        authorizer = Authorizer(token_client)
+        authorized = Authorized(NeutralHandler(200, {}, b''), authorizer)
+        authorized.background_renewal = False
+        http = RedditHTTPClient(authorized, authorizer=authorizer, authorized=authorized)
+        with ThreadPoolExecutor(2) as executor:
+            warm_up = executor.submit(http.warm_up)
+            time.sleep(.05)
+            executor.submit(http.request, 'GET', RESOURCE_BASE_URL).result()
+            warm_up.result()
+        assert token_client.calls == 1
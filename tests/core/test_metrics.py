@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from redditwarp.core.metrics import (
+    get_endpoint_template,
+    Histogram,
+    HistogramMetricsSink,
+    PrometheusMetricsSink,
+)
+from redditwarp.core.metered_SYNC import Metered
+from redditwarp.core.rate_limited_SYNC import RateLimited
+from redditwarp.http.handler_SYNC import Handler
+from redditwarp.http.send_params import SendParams
+from redditwarp.http.exchange import Exchange
+from redditwarp.http.requisition import Requisition
+from redditwarp.http.request import Request
+from redditwarp.http.response import Response
+from redditwarp.http.timings import Timings
+
+class MyHandler(Handler):
+    def __init__(self, status: int = 200) -> None:
+        super().__init__()
+        self.status = status
+
+    def _send(self, p: SendParams) -> Exchange:
+        if self.status == 0:
+            raise RuntimeError
+        return Exchange(
+            requisition=p.requisition,
+            request=Request(p.requisition.verb, p.requisition.url, {}, b''),
+            response=Response(self.status, {}, b'{}'),
+            history=(),
+            timings=Timings(connect=.001, ttfb=.02, download=.003, transport=.03),
+        )
+
+def send(handler: Handler, url: str) -> Exchange:
+    return handler._send(SendParams(Requisition('GET', url, {}, {}, None)))
+
+@pytest.mark.parametrize('url,expected', [
+    ('https://oauth.reddit.com/api/v1/me', '/api/v1/me'),
+    ('https://oauth.reddit.com/r/python/about', '/r/{name}/about'),
+    ('https://oauth.reddit.com/r/python/comments/abc123/some_title/def456', '/r/{name}/comments/{id}'),
+    ('https://oauth.reddit.com/comments/abc123', '/comments/{id}'),
+    ('https://oauth.reddit.com/user/spez/submitted', '/user/{name}/submitted'),
+    ('https://oauth.reddit.com/r/python/wiki/index', '/r/{name}/wiki/{page}'),
+    ('https://oauth.reddit.com/api/info', '/api/info'),
+    ('https://oauth.reddit.com/api/del_msg/t4_1a2b3c', '/api/del_msg/{id}'),
+])
+def test_get_endpoint_template(url: str, expected: str) -> None:
+    assert get_endpoint_template(url) == expected
+
+def test_histogram_quantile() -> None:
+    histogram = Histogram((1, 2, 4))
+    assert math.isnan(histogram.get_quantile(.5))
+    for v in (.5, 1.5, 1.5, 3, 10):
+        histogram.observe(v)
+    assert histogram.counts == [1, 2, 1, 1]
+    assert histogram.count == 5
+    assert histogram.sum == 16.5
+    assert histogram.get_quantile(.5) == pytest.approx(1.75)
+    assert histogram.get_quantile(1) == 4
+
+def test_metered_records_phases_per_endpoint() -> None:
+    sink = HistogramMetricsSink()
+    handler = Metered(RateLimited(MyHandler()), sink)
+    send(handler, 'https://oauth.reddit.com/r/a/about')
+    send(handler, 'https://oauth.reddit.com/r/b/about')
+    assert sink.responses == {('/r/{name}/about', 200): 2}
+    for phase in ('total', 'rate_limit_wait', 'token_renewal', 'connect', 'ttfb', 'download', 'transport'):
+        histogram = sink.get_histogram('/r/{name}/about', phase)
+        assert histogram is not None
+        assert histogram.count == 2
+    assert .01 < sink.get_quantiles('ttfb', .99)['/r/{name}/about'] <= .025
+
+def test_metered_records_errors() -> None:
+    sink = HistogramMetricsSink()
+    handler = Metered(MyHandler(0), sink)
+    with pytest.raises(RuntimeError):
+        send(handler, 'https://oauth.reddit.com/api/v1/me')
+    assert sink.errors == {('/api/v1/me', 'RuntimeError'): 1}
+
+def test_metered_without_sink() -> None:
+    handler = Metered(MyHandler())
+    send(handler, 'https://oauth.reddit.com/api/v1/me')
+
+def test_prometheus_text() -> None:
+    sink = PrometheusMetricsSink((.01, .1))
+    handler = Metered(MyHandler(), sink)
+    send(handler, 'https://oauth.reddit.com/api/v1/me')
+    text = sink.generate_text()
+    assert '# TYPE redditwarp_request_phase_seconds histogram\n' in text
+    assert 'redditwarp_request_phase_seconds_bucket{endpoint="/api/v1/me",phase="ttfb",le="0.01"} 0\n' in text
+    assert 'redditwarp_request_phase_seconds_bucket{endpoint="/api/v1/me",phase="ttfb",le="0.1"} 1\n' in text
+    assert 'redditwarp_request_phase_seconds_bucket{endpoint="/api/v1/me",phase="ttfb",le="+Inf"} 1\n' in text
+    assert 'redditwarp_request_phase_seconds_count{endpoint="/api/v1/me",phase="ttfb"} 1\n' in text
+    assert 'redditwarp_responses_total{endpoint="/api/v1/me",status="200"} 1\n' in text
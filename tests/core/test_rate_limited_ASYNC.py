@@ -0,0 +1,89 @@
+from __future__ import annotations
+from typing import Sequence
+
+import asyncio
+
+import pytest
+
+from redditwarp.core.rate_limited_ASYNC import RateLimited
+from redditwarp.core.priority import Priority, having_request_priority
+from redditwarp.util.reservation_rate_limiter import ReservationRateLimiter
+from redditwarp.http.handler_ASYNC import Handler
+from redditwarp.http.send_params import SendParams
+from redditwarp.http.exchange import Exchange
+from redditwarp.http.requisition import Requisition
+from redditwarp.http.request import Request
+from redditwarp.http.response import Response
+
+
+class RecordingHandler(Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.sent: list[str] = []
+
+    async def _send(self, p: SendParams) -> Exchange:
+        self.sent.append(p.requisition.url)
+        return Exchange(
+            requisition=p.requisition,
+            request=Request(p.requisition.verb, p.requisition.url, {}, b''),
+            response=Response(200, {}, b''),
+            history=(),
+        )
+
+def new_handler() -> tuple[RateLimited, RecordingHandler]:
+    recorder = RecordingHandler()
+    # One request is let through at once, and the rest are spaced about 50ms apart.
+    limiter = ReservationRateLimiter(burst=1, window_length=5, fallback_limit=100)
+    return (RateLimited(recorder, limiter), recorder)
+
+async def send_queued(handler: RateLimited, requests: Sequence[tuple[str, int]]) -> None:
+    """Send `requests` while the queue is blocked, so they are all waiting together."""
+    async def send(name: str) -> None:
+        await handler._send(SendParams(Requisition('GET', name, {}, {}, None)))
+
+    def spawn(name: str, priority: int = Priority.NORMAL) -> asyncio.Task[None]:
+        with having_request_priority(priority):
+            return asyncio.create_task(send(name))
+
+    tasks = [spawn('first')]
+    await tasks[0]
+    # This request is delayed and holds the queue while it waits.
+    tasks.append(spawn('blocker'))
+    for _ in range(100):
+        if handler._lock.locked():
+            break
+        await asyncio.sleep(0)
+    for i, (name, priority) in enumerate(requests, 1):
+        tasks.append(spawn(name, priority))
+        for _ in range(100):
+            if handler._lock.get_waiter_count() >= i:
+                break
+            await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_higher_priority_request_goes_ahead_of_queued_requests() -> None:
+    handler, recorder = new_handler()
+    await send_queued(handler, [
+        ('low1', Priority.LOW),
+        ('low2', Priority.LOW),
+        ('high', Priority.HIGH),
+    ])
+    assert recorder.sent == ['first', 'blocker', 'high', 'low1', 'low2']
+
+@pytest.mark.asyncio
+async def test_aging_stops_starvation() -> None:
+    requests = [('background', Priority.BACKGROUND)] + [(f'normal{i}', Priority.NORMAL) for i in range(5)]
+
+    handler, recorder = new_handler()
+    await send_queued(handler, requests)
+    # The queue is far shorter than the default aging interval, so the background
+    # request waits for all the others.
+    assert recorder.sent[-1] == 'background'
+
+    handler, recorder = new_handler()
+    # A waiting request rises one priority level for each admission's worth of time.
+    handler.priority_aging_interval = handler.limiter.window_length / handler.limiter.limit
+    await send_queued(handler, requests)
+    assert recorder.sent.index('background') < len(recorder.sent) - 1
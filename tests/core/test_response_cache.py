@@ -0,0 +1,129 @@
+from __future__ import annotations
+from typing import MutableSequence, Mapping
+
+from redditwarp.core.response_cache import ResponseCache, CacheRule
+from redditwarp.core.cached_SYNC import Cached
+from redditwarp.http.handler_SYNC import Handler
+from redditwarp.http.send_params import SendParams
+from redditwarp.http.exchange import Exchange
+from redditwarp.http.requisition import Requisition
+from redditwarp.http.request import Request
+from redditwarp.http.response import Response
+from redditwarp.http.timings import Timings
+
+class Clock:
+    def __init__(self, t: float = 0) -> None:
+        self.t = t
+    def __call__(self) -> float:
+        return self.t
+
+class ServerHandler(Handler):
+    def __init__(self, status: int = 200, headers: Mapping[str, str] = {}, data: bytes = b'{}') -> None:
+        super().__init__()
+        self.status = status
+        self.headers = headers
+        self.data = data
+        self.history: MutableSequence[Requisition] = []
+
+    def _send(self, p: SendParams) -> Exchange:
+        self.history.append(p.requisition)
+        return Exchange(
+            requisition=p.requisition,
+            request=Request(p.requisition.verb, p.requisition.url, dict(p.requisition.headers), b''),
+            response=Response(self.status, self.headers, self.data),
+            history=(),
+            timings=Timings(started_at=1000., transport=.5),
+        )
+
+def send(handler: Handler, url: str, auth: str = 'a', verb: str = 'GET') -> Exchange:
+    reqi = Requisition(verb, url, {}, {'Authorization': auth}, None)
+    return handler._send(SendParams(reqi))
+
+URL = 'https://oauth.reddit.com/r/test/about/rules'
+
+def new_cache(clock: Clock, **kwargs: int) -> ResponseCache:
+    return ResponseCache(rules=[CacheRule(r'/r/[^/]+/about/rules', 60)], time_func=clock, **kwargs)
+
+def test_fresh_response_is_served_from_cache() -> None:
+    clock = Clock()
+    server = ServerHandler()
+    cache = new_cache(clock)
+    handler = Cached(server, cache)
+    send(handler, URL)
+    clock.t = 59
+    xchg = send(handler, URL)
+    assert xchg.response.data == b'{}'
+    assert len(server.history) == 1
+    assert cache.hits == 1
+    assert xchg.timings.started_at == 0
+
+def test_unmatched_and_non_get_requests_are_not_cached() -> None:
+    server = ServerHandler()
+    handler = Cached(server, new_cache(Clock()))
+    send(handler, 'https://oauth.reddit.com/r/test/about')
+    send(handler, 'https://oauth.reddit.com/r/test/about')
+    send(handler, URL, verb='POST')
+    send(handler, URL, verb='POST')
+    assert len(server.history) == 4
+
+def test_varies_by_authorization() -> None:
+    server = ServerHandler()
+    handler = Cached(server, new_cache(Clock()))
+    send(handler, URL, auth='a')
+    send(handler, URL, auth='b')
+    send(handler, URL, auth='a')
+    assert len(server.history) == 2
+
+def test_stale_response_is_revalidated() -> None:
+    clock = Clock()
+    server = ServerHandler(headers={'ETag': '"v1"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+    cache = new_cache(clock)
+    handler = Cached(server, cache)
+    send(handler, URL)
+    clock.t = 61
+    server.status = 304
+    server.data = b''
+    xchg = send(handler, URL)
+    assert server.history[-1].headers['If-None-Match'] == '"v1"'
+    assert server.history[-1].headers['If-Modified-Since'] == 'Wed, 21 Oct 2015 07:28:00 GMT'
+    assert xchg.response.status == 200
+    assert xchg.response.data == b'{}'
+    assert cache.revalidations == 1
+    assert xchg.timings.started_at == 1000.
+    assert xchg.timings.transport == .5
+    clock.t = 120
+    send(handler, URL)
+    assert len(server.history) == 2
+
+def test_error_responses_are_not_cached() -> None:
+    server = ServerHandler(status=500)
+    handler = Cached(server, new_cache(Clock()))
+    send(handler, URL)
+    send(handler, URL)
+    assert len(server.history) == 2
+
+def test_lru_eviction_by_size() -> None:
+    server = ServerHandler(data=b'x' * 40)
+    cache = new_cache(Clock(), max_bytes=100)
+    cache.rules.append(CacheRule(r'/r/[^/]+', 60))
+    handler = Cached(server, cache)
+    send(handler, 'https://oauth.reddit.com/r/a')
+    send(handler, 'https://oauth.reddit.com/r/b')
+    send(handler, 'https://oauth.reddit.com/r/a')
+    send(handler, 'https://oauth.reddit.com/r/c')
+    assert len(cache) == 2
+    assert cache.get_size() == 80
+    send(handler, 'https://oauth.reddit.com/r/a')
+    assert len(server.history) == 3
+    send(handler, 'https://oauth.reddit.com/r/b')
+    assert len(server.history) == 4
+
+def test_invalidate() -> None:
+    server = ServerHandler()
+    cache = new_cache(Clock())
+    handler = Cached(server, cache)
+    send(handler, URL)
+    cache.invalidate(r'/r/test/.*')
+    assert len(cache) == 0
+    send(handler, URL)
+    assert len(server.history) == 2
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pytest
+
+from redditwarp.core.tenant import FairQueue
+
+def test_quiet_tenant_is_ordered_ahead_of_busy_tenant() -> None:
+    fq = FairQueue()
+    busy = [fq.enqueue('busy', 0, 1) for _ in range(10)]
+    quiet = fq.enqueue('quiet', 0, 1)
+    assert busy == [float(i) for i in range(1, 11)]
+    assert quiet < busy[1]
+
+def test_weights_share_budget_proportionally() -> None:
+    fq = FairQueue()
+    fq.weights['a'] = 2
+    keys = sorted(
+        [(fq.enqueue('a', 0, 1), 'a') for _ in range(20)]
+        + [(fq.enqueue('b', 0, 1), 'b') for _ in range(20)]
+    )
+    first = [tenant for _, tenant in keys[:15]]
+    assert first.count('a') == 10
+    assert first.count('b') == 5
+
+def test_idle_tenant_clock_catches_up() -> None:
+    fq = FairQueue()
+    fq.enqueue('a', 0, 1)
+    assert fq.enqueue('a', 100, 1) == 101
+
+def test_stats() -> None:
+    fq = FairQueue()
+    fq.enqueue('a', 0, 1)
+    fq.enqueue('a', 0, 1)
+    fq.enqueue('a', 0, 1)
+    stats = fq.get_stats()['a']
+    assert stats.queued == 3
+    fq.dequeue('a', 2)
+    fq.dequeue('a', 4)
+    fq.dequeue('a', 9, admitted=False)
+    assert stats.queued == 0
+    assert stats.admitted == 2
+    assert stats.max_wait_time == 4
+    assert stats.get_mean_wait_time() == 3
+
+def test_non_positive_weight() -> None:
+    fq = FairQueue()
+    fq.weights['a'] = 0
+    with pytest.raises(ValueError):
+        fq.enqueue('a', 0, 1)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+from typing import AsyncIterator
+
+import asyncio
+
+import pytest
+
+from redditwarp.http.response import Response
+from redditwarp.http.response_stream_ASYNC import ResponseStream, StreamingResponse, as_streaming_response
+from redditwarp.http import exceptions
+
+
+@pytest.mark.asyncio
+async def test_from_bytes() -> None:
+    stream = ResponseStream.from_bytes(b'abcdefg')
+    assert [chunk async for chunk in stream.iter_chunks(3)] == [b'abc', b'def', b'g']
+    assert stream.bytes_read == 7
+    assert stream.closed
+
+@pytest.mark.asyncio
+async def test_body_can_only_be_read_once() -> None:
+    stream = ResponseStream.from_bytes(b'abc')
+    assert await stream.read() == b'abc'
+    with pytest.raises(RuntimeError):
+        await stream.read()
+
+@pytest.mark.asyncio
+async def test_close_is_called_once() -> None:
+    calls: list[None] = []
+
+    async def chunks(n: int) -> AsyncIterator[bytes]:
+        yield b'a'
+        yield b'b'
+
+    async def close() -> None:
+        calls.append(None)
+
+    stream = ResponseStream(chunks, close)
+    async with stream:
+        await stream.__aiter__().__anext__()
+    await stream.close()
+    assert len(calls) == 1
+
+@pytest.mark.asyncio
+async def test_errors_are_wrapped() -> None:
+    async def chunks(n: int) -> AsyncIterator[bytes]:
+        yield b'a'
+        raise asyncio.TimeoutError
+
+    stream = ResponseStream(chunks)
+    with pytest.raises(exceptions.TimeoutException):
+        await stream.read()
+    assert stream.closed
+
+    async def chunks2(n: int) -> AsyncIterator[bytes]:
+        raise ConnectionResetError
+        yield b''
+
+    with pytest.raises(exceptions.TransportError):
+        await ResponseStream(chunks2).read()
+
+@pytest.mark.asyncio
+async def test_as_streaming_response() -> None:
+    resp = Response(200, {'Content-Type': 'text/plain'}, b'hello')
+    sresp = as_streaming_response(resp)
+    assert isinstance(sresp, StreamingResponse)
+    assert sresp.status == 200
+    assert sresp.headers == {'Content-Type': 'text/plain'}
+    assert sresp.data == b''
+    assert await sresp.stream.read() == b'hello'
+    assert as_streaming_response(sresp) is sresp
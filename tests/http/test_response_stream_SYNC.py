@@ -0,0 +1,58 @@
+from __future__ import annotations
+from typing import Iterator
+
+import socket
+
+import pytest
+
+from redditwarp.http.response import Response
+from redditwarp.http.response_stream_SYNC import ResponseStream, StreamingResponse, as_streaming_response
+from redditwarp.http import exceptions
+
+
+def test_from_bytes() -> None:
+    stream = ResponseStream.from_bytes(b'abcdefg')
+    assert list(stream.iter_chunks(3)) == [b'abc', b'def', b'g']
+    assert stream.bytes_read == 7
+    assert stream.closed
+
+def test_body_can_only_be_read_once() -> None:
+    stream = ResponseStream.from_bytes(b'abc')
+    assert stream.read() == b'abc'
+    with pytest.raises(RuntimeError):
+        stream.read()
+
+def test_close_is_called_once() -> None:
+    calls: list[None] = []
+    stream = ResponseStream(lambda n: iter([b'a', b'b']), lambda: calls.append(None))
+    with stream:
+        next(iter(stream))
+    stream.close()
+    assert len(calls) == 1
+
+def test_errors_are_wrapped() -> None:
+    def chunks(n: int) -> Iterator[bytes]:
+        yield b'a'
+        raise socket.timeout
+
+    stream = ResponseStream(chunks)
+    with pytest.raises(exceptions.TimeoutException):
+        stream.read()
+    assert stream.closed
+
+    def chunks2(n: int) -> Iterator[bytes]:
+        raise ConnectionResetError
+        yield b''
+
+    with pytest.raises(exceptions.TransportError):
+        ResponseStream(chunks2).read()
+
+def test_as_streaming_response() -> None:
+    resp = Response(200, {'Content-Type': 'text/plain'}, b'hello')
+    sresp = as_streaming_response(resp)
+    assert isinstance(sresp, StreamingResponse)
+    assert sresp.status == 200
+    assert sresp.headers == {'Content-Type': 'text/plain'}
+    assert sresp.data == b''
+    assert sresp.stream.read() == b'hello'
+    assert as_streaming_response(sresp) is sresp
@@ -0,0 +1,190 @@
+from __future__ import annotations
+from typing import Iterator
+
+import io
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+from redditwarp.http.http_client_SYNC import HTTPClient
+from redditwarp.http.exceptions import TransportError
+from redditwarp.http.transport.impls.python_http_client import PythonHTTPClientConnector, ConnectionPool
+
+
+class MyHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    connection_count = 0
+    post_count = 0
+
+    def handle_error(self, request: object, client_address: object) -> None:
+        # Some tests drop connections on purpose; don't print their tracebacks.
+        pass
+
+class MyRequestHandler(BaseHTTPRequestHandler):
+    server: MyHTTPServer
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.connection_count += 1
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def _reply(self, status: int, body: bytes, headers: dict[str, str] = {}) -> None:
+        self.send_response(status)
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path == '/redirect':
+            self._reply(302, b'', {'Location': '/target'})
+        elif self.path == '/big':
+            self._reply(200, bytes(range(256)) * 1024)
+        elif self.path == '/close':
+            self._reply(200, b'closing', {'Connection': 'close'})
+        elif self.path == '/drop':
+            # Close the connection after replying without telling the client.
+            self._reply(200, b'dropping')
+            self.close_connection = True
+        else:
+            self._reply(200, self.path.encode())
+
+    def do_POST(self) -> None:
+        length = int(self.headers['Content-Length'])
+        body = self.rfile.read(length)
+        self.server.post_count += 1
+        if self.path == '/drop':
+            self._reply(200, b'dropping')
+            self.close_connection = True
+        elif self.path == '/redirect':
+            self._reply(303, b'', {'Location': '/target'})
+        else:
+            self._reply(200, body)
+
+
+@pytest.fixture
+def server() -> Iterator[MyHTTPServer]:
+    server = MyHTTPServer(('127.0.0.1', 0), MyRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def make_http(server: MyHTTPServer, pool: ConnectionPool) -> HTTPClient:
+    http = HTTPClient(PythonHTTPClientConnector(pool))
+    host, port = server.server_address[:2]
+    http.base_url = f'http://{host!s}:{port}'
+    http.timeout = 5
+    return http
+
+
+def test_connection_is_reused(server: MyHTTPServer) -> None:
+    with make_http(server, ConnectionPool()) as http:
+        for i in range(5):
+            resp = http.request('GET', f'/{i}')
+            assert resp.data == f'/{i}'.encode()
+    assert server.connection_count == 1
+
+def test_connection_close_response_is_not_reused(server: MyHTTPServer) -> None:
+    with make_http(server, ConnectionPool()) as http:
+        http.request('GET', '/close')
+        http.request('GET', '/')
+    assert server.connection_count == 2
+
+def test_idle_connections_are_pruned(server: MyHTTPServer) -> None:
+    pool = ConnectionPool(idle_timeout=0)
+    with make_http(server, pool) as http:
+        http.request('GET', '/')
+        pool.prune()
+        http.request('GET', '/')
+    assert server.connection_count == 2
+
+def test_stale_connection_is_retried_for_idempotent_verbs(server: MyHTTPServer) -> None:
+    with make_http(server, ConnectionPool()) as http:
+        http.request('GET', '/drop')
+        assert http.request('GET', '/1').data == b'/1'
+    assert server.connection_count == 2
+
+def test_stale_connection_is_not_retried_for_post(server: MyHTTPServer) -> None:
+    with make_http(server, ConnectionPool()) as http:
+        http.request('POST', '/drop', data={'a': '1'})
+        with pytest.raises(TransportError):
+            http.request('POST', '/echo', data={'a': '1'})
+    assert server.post_count == 1
+
+def test_follow_redirects(server: MyHTTPServer) -> None:
+    with make_http(server, ConnectionPool()) as http:
+        xchg = http.inquire('GET', '/redirect', follow_redirects=True)
+        assert xchg.response.status == 200
+        assert xchg.response.data == b'/target'
+        assert [resp.status for resp in xchg.history] == [302]
+
+        xchg = http.inquire('GET', '/redirect', follow_redirects=False)
+        assert xchg.response.status == 302
+        assert not xchg.history
+
+def test_see_other_redirect_changes_verb_to_get(server: MyHTTPServer) -> None:
+    with make_http(server, ConnectionPool()) as http:
+        xchg = http.inquire('POST', '/redirect', data={'a': '1'}, follow_redirects=True)
+        assert xchg.request.verb == 'GET'
+        assert xchg.response.data == b'/target'
+
+def test_form_data(server: MyHTTPServer) -> None:
+    with make_http(server, ConnectionPool()) as http:
+        resp = http.request('POST', '/echo', data={'a': '1', 'b': '2'})
+        assert resp.data == b'a=1&b=2'
+
+def test_timings(server: MyHTTPServer) -> None:
+    with make_http(server, ConnectionPool()) as http:
+        xchg1 = http.inquire('GET', '/1')
+        xchg2 = http.inquire('GET', '/2')
+    t1 = xchg1.timings
+    assert t1.started_at > 0
+    assert t1.connect is not None and t1.connect > 0
+    assert t1.ttfb is not None and t1.ttfb > 0
+    assert t1.download is not None
+    assert t1.transport is not None and t1.transport >= t1.connect + t1.ttfb + t1.download
+    assert xchg2.timings.connect == 0
+
+def test_stream(server: MyHTTPServer) -> None:
+    with make_http(server, ConnectionPool()) as http:
+        with http.stream('GET', '/big') as resp:
+            assert resp.data == b''
+            chunks = list(resp.stream.iter_chunks(1000))
+        assert max(map(len, chunks)) == 1000
+        assert b''.join(chunks) == bytes(range(256)) * 1024
+        assert resp.stream.bytes_read == 256 * 1024
+
+        # The connection is returned to the pool once the body has been read.
+        http.request('GET', '/')
+    assert server.connection_count == 1
+
+def test_stream_closed_early_discards_connection(server: MyHTTPServer) -> None:
+    with make_http(server, ConnectionPool()) as http:
+        with http.stream('GET', '/big') as resp:
+            next(iter(resp.stream))
+        assert resp.stream.closed
+
+        assert http.request('GET', '/1').data == b'/1'
+    assert server.connection_count == 2
+
+def test_stream_follows_redirects(server: MyHTTPServer) -> None:
+    with make_http(server, ConnectionPool()) as http:
+        with http.stream('GET', '/redirect', follow_redirects=True) as resp:
+            assert resp.stream.read() == b'/target'
+
+def test_multipart_form_data(server: MyHTTPServer) -> None:
+    with make_http(server, ConnectionPool()) as http:
+        xchg = http.inquire('POST', '/echo', data={'a': '1'}, files={'file': io.BytesIO(b'abc')})
+    assert xchg.request.headers['Content-Length'] == str(len(xchg.response.data))
+    body = xchg.response.data
+    assert b'Content-Disposition: form-data; name="a"\r\n\r\n1\r\n' in body
+    assert b'Content-Disposition: form-data; name="file"\r\nContent-Type: application/octet-stream\r\n\r\nabc\r\n' in body
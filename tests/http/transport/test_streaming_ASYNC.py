@@ -0,0 +1,110 @@
+from __future__ import annotations
+from typing import Iterator, Callable
+
+import importlib
+import threading
+from pathlib import Path
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+from redditwarp.http.http_client_ASYNC import HTTPClient
+from redditwarp.http.util.download_ASYNC import download
+
+
+BIG = bytes(range(256)) * 1024
+
+class MyHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request: object, client_address: object) -> None:
+        # Some tests close streams early; don't print the resulting tracebacks.
+        pass
+
+class MyRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def _reply(self, status: int, body: bytes, headers: dict[str, str] = {}) -> None:
+        self.send_response(status)
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except ConnectionError:
+            pass
+
+    def do_GET(self) -> None:
+        if self.path == '/redirect':
+            self._reply(302, b'', {'Location': '/target'})
+        elif self.path == '/big':
+            self._reply(200, BIG)
+        else:
+            self._reply(200, self.path.encode())
+
+
+@pytest.fixture
+def server() -> Iterator[MyHTTPServer]:
+    server = MyHTTPServer(('127.0.0.1', 0), MyRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+@pytest.fixture(params=[('aiohttp', 'aiohttp'), ('httpx', 'httpx_ASYNC')], ids=lambda param: param[1])
+def make_http(request: pytest.FixtureRequest, server: MyHTTPServer) -> Iterator[Callable[[], HTTPClient]]:
+    # A factory, since the connector has to be made inside the event loop.
+    library, impl = request.param
+    pytest.importorskip(library)
+    module = importlib.import_module(f'redditwarp.http.transport.impls.{impl}')
+    host, port = server.server_address[:2]
+
+    def make_http() -> HTTPClient:
+        http = HTTPClient(module.new_connector())
+        http.base_url = f'http://{host!s}:{port}'
+        return http
+
+    yield make_http
+
+
+@pytest.mark.asyncio
+async def test_stream(make_http: Callable[[], HTTPClient]) -> None:
+    async with make_http() as http:
+        async with await http.stream('GET', '/big') as resp:
+            assert resp.status == 200
+            assert resp.data == b''
+            chunks = [chunk async for chunk in resp.stream.iter_chunks(1000)]
+        assert all(len(chunk) <= 1000 for chunk in chunks)
+        assert b''.join(chunks) == BIG
+        assert resp.stream.bytes_read == len(BIG)
+        assert resp.stream.closed
+
+@pytest.mark.asyncio
+async def test_stream_closed_early(make_http: Callable[[], HTTPClient]) -> None:
+    async with make_http() as http:
+        async with await http.stream('GET', '/big') as resp:
+            await resp.stream.__aiter__().__anext__()
+        assert resp.stream.closed
+        # The connection was released, so the client can still be used.
+        resp1 = await http.request('GET', '/after')
+        assert resp1.data == b'/after'
+
+@pytest.mark.asyncio
+async def test_stream_follows_redirects(make_http: Callable[[], HTTPClient]) -> None:
+    async with make_http() as http:
+        async with await http.stream('GET', '/redirect', follow_redirects=True) as resp:
+            assert await resp.stream.read() == b'/target'
+
+@pytest.mark.asyncio
+async def test_download(make_http: Callable[[], HTTPClient], tmp_path: Path) -> None:
+    async with make_http() as http:
+        dest = tmp_path / 'file.bin'
+        assert await download(http, '/big', dest, chunk_size=4096) == len(BIG)
+    assert dest.read_bytes() == BIG
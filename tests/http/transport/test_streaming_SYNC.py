@@ -0,0 +1,103 @@
+from __future__ import annotations
+from typing import Iterator
+
+import importlib
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+from redditwarp.http.http_client_SYNC import HTTPClient
+
+
+BIG = bytes(range(256)) * 1024
+
+class MyHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    connection_count = 0
+
+    def handle_error(self, request: object, client_address: object) -> None:
+        # Some tests close streams early; don't print the resulting tracebacks.
+        pass
+
+class MyRequestHandler(BaseHTTPRequestHandler):
+    server: MyHTTPServer
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.connection_count += 1
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def _reply(self, status: int, body: bytes, headers: dict[str, str] = {}) -> None:
+        self.send_response(status)
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except ConnectionError:
+            pass
+
+    def do_GET(self) -> None:
+        if self.path == '/redirect':
+            self._reply(302, b'', {'Location': '/target'})
+        elif self.path == '/big':
+            self._reply(200, BIG)
+        else:
+            self._reply(200, self.path.encode())
+
+
+@pytest.fixture
+def server() -> Iterator[MyHTTPServer]:
+    server = MyHTTPServer(('127.0.0.1', 0), MyRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+@pytest.fixture(
+    params=[('urllib3', 'urllib3'), ('httpx', 'httpx_SYNC'), ('requests', 'requests')],
+    ids=lambda param: param[1],
+)
+def http(request: pytest.FixtureRequest, server: MyHTTPServer) -> Iterator[HTTPClient]:
+    library, impl = request.param
+    pytest.importorskip(library)
+    module = importlib.import_module(f'redditwarp.http.transport.impls.{impl}')
+    host, port = server.server_address[:2]
+    with HTTPClient(module.new_connector()) as http:
+        http.base_url = f'http://{host!s}:{port}'
+        yield http
+
+
+def test_stream(http: HTTPClient, server: MyHTTPServer) -> None:
+    with http.stream('GET', '/big') as resp:
+        assert resp.status == 200
+        assert resp.data == b''
+        chunks = list(resp.stream.iter_chunks(1000))
+    assert all(len(chunk) <= 1000 for chunk in chunks)
+    assert b''.join(chunks) == BIG
+    assert resp.stream.bytes_read == len(BIG)
+    assert resp.stream.closed
+
+    # The connection is reused once the body has been read.
+    assert http.request('GET', '/after').data == b'/after'
+    assert server.connection_count == 1
+
+def test_stream_closed_early(http: HTTPClient, server: MyHTTPServer) -> None:
+    with http.stream('GET', '/big') as resp:
+        next(iter(resp.stream))
+    assert resp.stream.closed
+    # The partly read connection was discarded, so a new one is made.
+    assert http.request('GET', '/after').data == b'/after'
+    assert server.connection_count == 2
+
+def test_stream_follows_redirects(http: HTTPClient) -> None:
+    with http.stream('GET', '/redirect', follow_redirects=True) as resp:
+        assert resp.stream.read() == b'/target'
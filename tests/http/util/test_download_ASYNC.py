@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+
+from redditwarp.http.http_client_ASYNC import HTTPClient
+from redditwarp.http.handler_ASYNC import Handler
+from redditwarp.http.send_params import SendParams
+from redditwarp.http.exchange import Exchange
+from redditwarp.http.request import Request
+from redditwarp.http.response import Response
+from redditwarp.http.util.download_ASYNC import download
+from redditwarp.http.exceptions import StatusCodeException
+
+
+class NeutralHandler(Handler):
+    def __init__(self, status: int, data: bytes) -> None:
+        super().__init__()
+        self.status = status
+        self.data = data
+        self.stream_requested = False
+
+    async def _send(self, p: SendParams) -> Exchange:
+        self.stream_requested = p.stream
+        return Exchange(
+            requisition=p.requisition,
+            request=Request('', '', {}, b''),
+            response=Response(self.status, {}, self.data),
+            history=(),
+        )
+
+
+@pytest.mark.asyncio
+async def test_download_to_path(tmp_path: Path) -> None:
+    handler = NeutralHandler(200, b'x' * 1000)
+    http = HTTPClient(handler)
+    dest = tmp_path / 'file.bin'
+    assert await download(http, 'https://i.redd.it/a.png', dest, chunk_size=64) == 1000
+    assert handler.stream_requested
+    assert dest.read_bytes() == b'x' * 1000
+    assert not (tmp_path / 'file.bin.part').exists()
+
+@pytest.mark.asyncio
+async def test_download_to_file_object() -> None:
+    http = HTTPClient(NeutralHandler(200, b'abc'))
+    fh = io.BytesIO()
+    assert await download(http, 'https://i.redd.it/a.png', fh) == 3
+    assert fh.getvalue() == b'abc'
+
+@pytest.mark.asyncio
+async def test_download_unsuccessful_status(tmp_path: Path) -> None:
+    http = HTTPClient(NeutralHandler(404, b'not found'))
+    dest = tmp_path / 'file.bin'
+    with pytest.raises(StatusCodeException):
+        await download(http, 'https://i.redd.it/a.png', dest)
+    assert list(tmp_path.iterdir()) == []
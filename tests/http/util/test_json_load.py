@@ -1,4 +1,10 @@
 
+from __future__ import annotations
+from typing import Iterator
+
+import pytest
+
+from redditwarp.http.util import json_loading
 from redditwarp.http.util.json_loading import load_json_from_response
 from redditwarp.http.response import Response
 
@@ -10,3 +16,51 @@ def test_load_json_from_response() -> None:
 def test_load_json_from_response__exception() -> None:
     resp = Response(200, {}, b'{"hello": "world"}')
     load_json_from_response(resp)
+
+@pytest.fixture
+def restore_json_backend() -> Iterator[None]:
+    saved = json_loading._current_json_backend
+    try:
+        yield
+    finally:
+        json_loading._current_json_backend = saved
+
+@pytest.mark.usefixtures('restore_json_backend')
+@pytest.mark.parametrize('name', ['orjson', 'msgspec', 'ujson', 'json'])
+def test_json_backends(name: str) -> None:
+    try:
+        json_loading.set_json_backend(name)
+    except ImportError:
+        pytest.skip(f'{name} is not installed')
+    assert json_loading.get_json_backend_name() == name
+    resp = Response(200, {}, '{"a": [1, 2.5, null, true], "b": "\\u00e9\u00e9"}'.encode())
+    assert load_json_from_response(resp) == {"a": [1, 2.5, None, True], "b": "\u00e9\u00e9"}
+    with pytest.raises(ValueError):
+        load_json_from_response(Response(200, {}, b'<html>'))
+
+@pytest.mark.usefixtures('restore_json_backend')
+def test_custom_json_backend() -> None:
+    json_loading.set_json_backend(lambda b: 'custom')
+    assert json_loading.get_json_backend_name() == 'custom'
+    assert load_json_from_response(Response(200, {}, b'{}')) == 'custom'
+
+@pytest.mark.usefixtures('restore_json_backend')
+def test_invalid_json_is_decoded_once() -> None:
+    calls: list[bytes] = []
+
+    def loads(data: bytes) -> object:
+        calls.append(data)
+        raise ValueError
+
+    json_loading.set_json_backend(loads)
+    with pytest.raises(ValueError):
+        json_loading.loads(b'<html>')
+    assert len(calls) == 1
+
+@pytest.mark.usefixtures('restore_json_backend')
+def test_unsupported_input_type_falls_back() -> None:
+    def loads(data: bytes) -> object:
+        raise TypeError
+
+    json_loading.set_json_backend(loads)
+    assert json_loading.loads(b'[18446744073709551616]') == [18446744073709551616]
@@ -0,0 +1,94 @@
+from __future__ import annotations
+from typing import Optional, Sequence
+
+import io
+import tracemalloc
+from pathlib import Path
+from email.parser import BytesParser
+from email.message import Message
+
+import pytest
+
+from redditwarp.http.payload import MultipartFormData
+from redditwarp.http.util.multipart_encoder import MultipartEncoder, MMAP_THRESHOLD
+
+
+def parse(encoder: MultipartEncoder) -> Sequence[tuple[object, Optional[str], str, object]]:
+    body = encoder.read_all()
+    head = f'Content-Type: {encoder.content_type}\r\n\r\n'.encode()
+    msg = BytesParser().parsebytes(head + body)
+    parts = msg.get_payload()
+    assert isinstance(parts, list)
+    result = []
+    for part in parts:
+        assert isinstance(part, Message)
+        result.append((part.get_param('name', header='content-disposition'), part.get_filename(),
+                part.get_content_type(), part.get_payload(decode=True)))
+    return result
+
+
+def test_encode() -> None:
+    pld = MultipartFormData([
+        MultipartFormData.TextField('key', 'value'),
+        MultipartFormData.FileField('file', io.BytesIO(b'\x00\x01data'), 'a.png', 'image/png'),
+    ])
+    encoder = MultipartEncoder(pld, boundary='xyz')
+    assert encoder.content_type == 'multipart/form-data; boundary=xyz'
+    assert len(encoder.read_all()) == encoder.content_length
+    assert parse(encoder) == [
+        ('key', None, 'text/plain', b'value'),
+        ('file', 'a.png', 'image/png', b'\x00\x01data'),
+    ]
+
+def test_can_be_iterated_again() -> None:
+    file = io.BytesIO(b'skipped|data')
+    file.seek(8)
+    encoder = MultipartEncoder(MultipartFormData([MultipartFormData.FileField('file', file)]))
+    assert encoder.read_all() == encoder.read_all()
+    assert parse(encoder)[0][3] == b'data'
+
+def test_non_seekable_file() -> None:
+    class Unseekable(io.RawIOBase):
+        def __init__(self) -> None:
+            self.data = io.BytesIO(b'abc')
+
+        def readinto(self, b: memoryview) -> int:  # type: ignore[override]
+            return self.data.readinto(b)
+
+        def readable(self) -> bool:
+            return True
+
+    file = io.BufferedReader(Unseekable())
+    encoder = MultipartEncoder(MultipartFormData([MultipartFormData.FileField('file', file)]))
+    assert len(encoder.read_all()) == encoder.content_length
+    assert parse(encoder)[0][3] == b'abc'
+
+def test_empty_content_type() -> None:
+    with pytest.raises(ValueError):
+        MultipartEncoder(MultipartFormData([MultipartFormData.FileField('file', io.BytesIO(), None, '')]))
+
+def test_large_file_memory_stays_flat(tmp_path: Path) -> None:
+    size = 8 * MMAP_THRESHOLD
+    path = tmp_path / 'video.mp4'
+    with open(path, 'wb') as fh:
+        for _ in range(8):
+            fh.write(b'v' * MMAP_THRESHOLD)
+
+    with open(path, 'rb') as fh:
+        encoder = MultipartEncoder(MultipartFormData([
+            MultipartFormData.TextField('key', 'value'),
+            MultipartFormData.FileField('file', fh, 'video.mp4', 'video/mp4'),
+        ]))
+        assert encoder.content_length > size
+
+        tracemalloc.start()
+        try:
+            n = 0
+            for chunk in encoder:
+                n += len(chunk)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    assert n == encoder.content_length
+    assert peak < size // 8
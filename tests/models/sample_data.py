@@ -0,0 +1,104 @@
+"""API data for submissions and comments, shared by the model tests."""
+
+from __future__ import annotations
+from typing import Any, Mapping
+
+
+AUTHOR_FLAIR_DATA: Mapping[str, Any] = {
+    'author_flair_text': None,
+    'author_flair_css_class': None,
+    'author_flair_template_id': None,
+    'author_flair_type': 'text',
+    'author_flair_background_color': None,
+    'author_flair_text_color': None,
+}
+
+VIEWER_DATA: Mapping[str, Any] = {
+    'saved': False,
+    'send_replies': True,
+    'likes': None,
+    'num_reports': None,
+    'subreddit_type': 'public',
+    'quarantine': False,
+}
+
+def make_submission_data() -> Mapping[str, Any]:
+    return {
+        **AUTHOR_FLAIR_DATA,
+        **VIEWER_DATA,
+        'id': 'abc',
+        'name': 't3_abc',
+        'created_utc': 1700000000.0,
+        'title': 'title',
+        'score': 10,
+        'permalink': '/r/test/comments/abc/title/',
+        'url': 'https://www.reddit.com/r/test/comments/abc/title/',
+        'edited': False,
+        'stickied': False,
+        'locked': False,
+        'archived': False,
+        'distinguished': None,
+        'num_comments': 2,
+        'upvote_ratio': .9,
+        'over_18': False,
+        'spoiler': False,
+        'is_self': True,
+        'selftext': 'body',
+        'selftext_html': '<p>body</p>',
+        'subreddit': 'test',
+        'subreddit_id': 't5_2qh1i',
+        'author': 'someone',
+        'author_fullname': 't2_xyz',
+        'author_premium': False,
+        'hide_score': False,
+        'removed_by_category': None,
+        'suggested_sort': None,
+        'contest_mode': False,
+        'is_original_content': False,
+        'num_crossposts': 0,
+        'is_crosspostable': True,
+        'is_robot_indexable': True,
+        'pinned': False,
+        'link_flair_type': 'text',
+        'link_flair_text': None,
+        'link_flair_css_class': None,
+        'link_flair_background_color': '',
+        'link_flair_text_color': 'dark',
+        'hidden': False,
+        'subreddit_subscribers': 100,
+        'thumbnail': 'self',
+        'preview': {'images': []},
+    }
+
+def make_comment_data(i: int = 0, *, parent_id: str = 't3_abc', author: str = 'someone') -> Mapping[str, Any]:
+    return {
+        **AUTHOR_FLAIR_DATA,
+        **VIEWER_DATA,
+        'id': f'c{i}',
+        'name': f't1_c{i}',
+        'created_utc': 1700000000.0 + i,
+        'body': 'text',
+        'score': 1,
+        'permalink': f'/r/test/comments/abc/title/c{i}/',
+        'edited': 1700000100.0,
+        'score_hidden': False,
+        'is_submitter': False,
+        'stickied': False,
+        'locked': False,
+        'collapsed': False,
+        'distinguished': None,
+        'archived': False,
+        'over_18': False,
+        'link_id': 't3_abc',
+        'parent_id': parent_id,
+        'subreddit': 'test',
+        'subreddit_id': 't5_2qh1i',
+        'author': author,
+        'author_fullname': 't2_xyz',
+        'author_premium': False,
+        'link_title': 'title',
+        'link_author': 'someone',
+        'link_permalink': 'https://www.reddit.com/r/test/comments/abc/title/',
+        'gildings': {},
+        'replies': '',
+    }
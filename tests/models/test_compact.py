@@ -0,0 +1,91 @@
+
+from __future__ import annotations
+from typing import Any, Mapping
+
+from types import SimpleNamespace
+
+import pytest
+
+from redditwarp.models.compact import CompactComment
+from redditwarp.models.comment import Comment
+from redditwarp.model_loaders.compact import CompactLoader
+from redditwarp.util.tree_node import TreeNode
+
+from .sample_data import make_comment_data, make_submission_data
+
+
+def test_comment_matches_regular_model() -> None:
+    d = make_comment_data(0, parent_id='t1_c1')
+    regular = Comment(d)
+    compact = CompactLoader().load_comment(d)
+    for name in (
+        'id36', 'idn', 'id', 'created_ut', 'created_at', 'body', 'score', 'permalink',
+        'is_edited', 'edited_ut', 'edited_at', 'is_top_level', 'has_parent_comment',
+        'parent_comment_id36', 'parent_comment_idn', 'parent_comment_id',
+        'distinguished', 'author_display_name',
+    ):
+        assert getattr(compact, name) == getattr(regular, name), name
+    assert compact.submission_id36 == regular.submission.id36
+    assert compact.subreddit.id36 == regular.subreddit.id36
+    assert compact.subreddit.name == regular.subreddit.name
+    assert compact.author is not None
+    assert compact.author.id36 == d['author_fullname'][3:]
+
+def test_models_have_no_dict() -> None:
+    comment = CompactLoader().load_comment(make_comment_data(0))
+    assert not hasattr(comment, '__dict__')
+    assert not hasattr(comment.author, '__dict__')
+    assert not hasattr(comment.subreddit, '__dict__')
+    with pytest.raises(AttributeError):
+        comment.foo = 1  # type: ignore[attr-defined]
+
+def test_d_is_discarded_by_default() -> None:
+    d = make_comment_data(0)
+    assert CompactLoader().load_comment(d).d is None
+    assert CompactLoader(keep_d=True).load_comment(d).d is d
+
+def test_subreddit_and_author_are_shared() -> None:
+    loader = CompactLoader()
+    c0 = loader.load_comment(make_comment_data(0))
+    c1 = loader.load_comment(make_comment_data(1))
+    assert c0.subreddit is c1.subreddit
+    assert c0.author is c1.author
+    assert c0.author_display_name is c1.author_display_name
+
+def test_deleted_author() -> None:
+    comment = CompactLoader().load_comment(make_comment_data(0, author='[deleted]'))
+    assert comment.author is None
+    assert comment.author_display_name == '[deleted]'
+
+def test_load_submission_tree_node() -> None:
+    reply = {'kind': 't1', 'data': make_comment_data(1, parent_id='t1_c0')}
+    more = {'kind': 'more', 'data': {}}
+    top = {'kind': 't1', 'data': {
+        **make_comment_data(0),
+        'replies': {'kind': 'Listing', 'data': {'children': [reply, more]}},
+    }}
+    d = [
+        {'kind': 'Listing', 'data': {'children': [{'kind': 't3', 'data': make_submission_data()}]}},
+        {'kind': 'Listing', 'data': {'children': [top, more]}},
+    ]
+    loader = CompactLoader()
+    node = loader.load_submission_tree_node(d)
+    assert node.value.title == 'title'
+    assert node.value.body == 'body'
+    assert node.value.author is not None
+    (top_node,) = node.children
+    assert top_node.value.id36 == 'c0'
+    (reply_node,) = top_node.children
+    assert isinstance(reply_node.value, CompactComment)
+    assert reply_node.value.parent_comment_id36 == 'c0'
+    assert reply_node.children == []
+
+    regular: TreeNode[Comment, TreeNode[Comment, Any]] = TreeNode(
+        Comment(make_comment_data(0)),
+        [TreeNode(Comment(make_comment_data(1, parent_id='t1_c0')), [])],
+    )
+    converted = CompactLoader().compact_submission_tree_node(
+        TreeNode(SimpleNamespace(d=make_submission_data()), [regular]),  # type: ignore[arg-type]
+    )
+    assert converted.value.title == 'title'
+    assert converted.children[0].children[0].value.id36 == 'c1'
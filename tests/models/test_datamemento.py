@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import tracemalloc
+
+from redditwarp.models import datamemento
+from redditwarp.models.comment import Comment
+from redditwarp.util.attribute_mapping_proxy import DictAndListRecursiveAttributeMappingProxy
+
+from .sample_data import make_comment_data
+
+
+def test_b_is_made_on_first_access() -> None:
+    comment = Comment({
+        **make_comment_data(0),
+        'replies': {'kind': 'Listing', 'data': {'children': [{'kind': 't1', 'data': {}}]}},
+    })
+    assert 'b' not in vars(comment)
+    assert isinstance(comment.b, DictAndListRecursiveAttributeMappingProxy)
+    assert comment.b is comment.b
+    assert comment.b.replies.data.children[0].kind == 't1'
+
+def test_loading_comments_allocates_no_proxies() -> None:
+    ds = [make_comment_data(i) for i in range(1000)]
+    filters = [tracemalloc.Filter(True, datamemento.__file__)]
+
+    tracemalloc.start()
+    try:
+        snapshot0 = tracemalloc.take_snapshot().filter_traces(filters)
+        comments = [Comment(d) for d in ds]
+        snapshot1 = tracemalloc.take_snapshot().filter_traces(filters)
+        for comment in comments:
+            comment.b
+        snapshot2 = tracemalloc.take_snapshot().filter_traces(filters)
+    finally:
+        tracemalloc.stop()
+
+    def size_diff(a: tracemalloc.Snapshot, b: tracemalloc.Snapshot) -> int:
+        return sum(stat.size_diff for stat in b.compare_to(a, 'filename'))
+
+    proxy_size = size_diff(snapshot1, snapshot2)
+    assert proxy_size >= len(comments) * 32
+    assert size_diff(snapshot0, snapshot1) < proxy_size // 100
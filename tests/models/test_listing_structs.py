@@ -0,0 +1,90 @@
+
+from __future__ import annotations
+from typing import Any, Mapping
+
+import json
+
+import pytest
+
+pytest.importorskip('msgspec')
+
+from msgspec import UNSET
+
+from redditwarp.client_SYNC import Client
+from redditwarp.models.listing_structs import (
+    Submission,
+    Comment,
+    decode_listing,
+    Listing,
+    decode_listing_or_json,
+)
+from redditwarp.models.submission_SYNC import TextPost
+from redditwarp.models.comment_SYNC import LooseComment
+from redditwarp.model_loaders.listing_structs_SYNC import load_thing
+from redditwarp.model_loaders.submission_SYNC import load_submission
+
+from .sample_data import make_comment_data, make_submission_data
+
+
+def make_listing(*children: tuple[str, Mapping[str, Any]]) -> bytes:
+    return json.dumps({
+        'kind': 'Listing',
+        'data': {
+            'after': 't3_abc',
+            'before': None,
+            'dist': len(children),
+            'modhash': None,
+            'children': [{'kind': kind, 'data': data} for kind, data in children],
+        },
+    }).encode()
+
+
+def test_decode_listing() -> None:
+    listing = decode_listing(make_listing(('t3', make_submission_data()), ('t1', make_comment_data())))
+    assert listing.data.after == 't3_abc'
+    assert listing.data.dist == 2
+    subm, comm = listing.data.children
+    assert isinstance(subm, Submission)
+    assert subm.data.title == 'title'
+    assert subm.data.crosspost_parent is UNSET
+    assert not hasattr(subm.data, 'thumbnail')
+    assert isinstance(comm, Comment)
+    assert comm.data.edited == 1700000100.0
+
+def test_decode_listing_rejects_other_data() -> None:
+    with pytest.raises(ValueError):
+        decode_listing(b'{"error": 403}')
+    with pytest.raises(ValueError):
+        decode_listing(make_listing(('t4', {'id': 'x'})))
+    with pytest.raises(ValueError):
+        decode_listing(b'<html>')
+
+def test_decode_listing_or_json() -> None:
+    listing = decode_listing_or_json(make_listing(('t3', make_submission_data())))
+    assert isinstance(listing, Listing)
+    (child,) = listing.data.children
+    assert isinstance(child, Submission)
+
+    assert decode_listing_or_json(b'{"error": 403}') == {'error': 403}
+    other = make_listing(('t4', {'id': 'x'}))
+    assert decode_listing_or_json(other) == json.loads(other)
+    with pytest.raises(ValueError):
+        decode_listing_or_json(b'<html>')
+    with pytest.raises(ValueError):
+        decode_listing_or_json(b'{"kind": "Listing", "data": {')
+
+def test_load_thing_matches_regular_loader() -> None:
+    client = Client()
+    listing = decode_listing(make_listing(('t3', make_submission_data()), ('t1', make_comment_data())))
+    subm = load_thing(listing.data.children[0], client)
+    assert isinstance(subm, TextPost)
+    regular = load_submission(make_submission_data(), client)
+    for name in ('id36', 'created_at', 'title', 'score', 'permalink', 'body', 'body_html', 'comment_count'):
+        assert getattr(subm, name) == getattr(regular, name), name
+    assert subm.subreddit.id36 == regular.subreddit.id36
+    assert subm.author_display_name == regular.author_display_name
+
+    comm = load_thing(listing.data.children[1], client)
+    assert isinstance(comm, LooseComment)
+    assert comm.body == 'text'
+    assert comm.submission.title == 'title'
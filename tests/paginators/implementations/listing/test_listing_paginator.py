@@ -1,5 +1,9 @@
-
 from typing import Sequence, Any, MutableMapping, Callable
+
+import json
+
+import pytest
+
 from redditwarp.client_SYNC import Client
 from redditwarp.core.http_client_SYNC import HTTPClient
 from redditwarp.http.handler_SYNC import Handler
@@ -9,6 +13,10 @@ from redditwarp.http.requisition import Requisition
 from redditwarp.http.request import Request
 from redditwarp.http.response import Response
 from redditwarp.pagination.paginators.listing.listing_paginator import ListingPaginator
+from redditwarp.pagination.paginators.listing.submission_listing_paginator import SubmissionListingPaginator
+from redditwarp.models.submission_SYNC import TextPost
+
+from ....models.sample_data import make_submission_data
 
 
 class MyHandler(Handler):
@@ -370,3 +378,85 @@ def test_dist_none_value() -> None:
     result = p.fetch()
     assert len(result) == 2
     assert p.after_count == 2
+
+def test_fetch_raw() -> None:
+    p = MyListingPaginator(client, '')
+    p.cursor_extractor = lambda x: x['data']['name']
+    handler.response_data = b'''\
+{
+    "kind": "Listing",
+    "data": {
+        "dist": 2,
+        "children": [
+            {"kind": "t3", "data": {"name": "t3_a"}},
+            {"kind": "t3", "data": {"name": "t3_b"}}
+        ],
+        "after": null,
+        "before": null
+    }
+}
+'''
+    assert p.fetch_raw() == [{'name': 't3_a'}, {'name': 't3_b'}]
+    assert p.after == 't3_b'
+    assert p.after_count == 2
+    assert not p.has_more()
+
+def test_struct_decoding() -> None:
+    pytest.importorskip('msgspec')
+    p = MyListingPaginator(client, '')
+    p.struct_decoding = True
+
+    # Not a listing of things the structs know, so it's decoded as regular JSON.
+    handler.response_data = b'''\
+{
+    "kind": "Listing",
+    "data": {
+        "dist": 2,
+        "children": [
+            {"name": "a"},
+            {"name": "b"}
+        ],
+        "after": "b",
+        "before": "a"
+    }
+}
+'''
+    assert p.fetch() == ['a', 'b']
+
+    handler.response_data = b'''\
+{
+    "kind": "Listing",
+    "data": {
+        "dist": 1,
+        "children": [
+            {"kind": "t2", "data": {"id": "c", "name": "t2_c", "created_utc": 0, "extra": 1}}
+        ],
+        "after": "t2_c",
+        "before": "t2_c"
+    }
+}
+'''
+    (d,) = p.fetch_raw()
+    assert d['name'] == 't2_c'
+    assert 'extra' not in d
+    assert p.after == 't2_c'
+
+def test_struct_decoding_loads_models() -> None:
+    pytest.importorskip('msgspec')
+    p = SubmissionListingPaginator(client, '')
+    p.struct_decoding = True
+    handler.response_data = json.dumps({
+        'kind': 'Listing',
+        'data': {
+            'dist': 1,
+            'children': [{'kind': 't3', 'data': make_submission_data()}],
+            'after': None,
+            'before': None,
+        },
+    }).encode()
+    (subm,) = p.fetch()
+    assert isinstance(subm, TextPost)
+    assert subm.title == 'title'
+    assert 'preview' not in subm.d
+    assert p.after == 't3_abc'
+    assert not p.has_more()
@@ -2,7 +2,7 @@
 from typing import Sequence
 
 from redditwarp.pagination.paginator_chaining_iterator import PaginatorChainingIterator
-from redditwarp.pagination.paginator import Paginator
+from redditwarp.pagination.paginator import Paginator, HasMorePaginator, RawPaginator
 
 class MyPaginator(Paginator[int]):
     def __init__(self, seq: Sequence[Sequence[int]]) -> None:
@@ -72,3 +72,41 @@ def test_efficient_pagination_limit() -> None:
     assert p.limit == 100
     next(pci)
     assert p.limit == 23
+
+class MyRawPaginator(HasMorePaginator[str]):
+    def __init__(self, seq: Sequence[Sequence[int]]) -> None:
+        super().__init__()
+        self._itr = iter(seq)
+        self._has_more = True
+        self.fetch_count = 0
+
+    def has_more(self) -> bool:
+        return self._has_more
+
+    def fetch(self) -> Sequence[str]:
+        return [str(d) for d in self.fetch_raw()]
+
+    def fetch_raw(self) -> Sequence[int]:
+        self.fetch_count += 1
+        page = next(self._itr, [])
+        self._has_more = len(page) > 1
+        return page
+
+def test_as_raw() -> None:
+    p = MyRawPaginator([
+        [1, 2],
+        [3],
+        [4, 5],
+    ])
+    p.limit = 10
+    it = PaginatorChainingIterator(p, 2).as_raw()
+    assert list(it) == [1, 2]
+    assert p.limit == 2
+
+    p = MyRawPaginator([
+        [1, 2],
+        [3],
+        [4, 5],
+    ])
+    assert list(PaginatorChainingIterator(RawPaginator(p))) == [1, 2, 3]
+    assert p.fetch_count == 2
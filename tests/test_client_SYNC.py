@@ -2,6 +2,9 @@
 from __future__ import annotations
 from typing import Mapping
 
+import sys
+import subprocess
+
 import pytest
 
 from redditwarp import exceptions
@@ -62,6 +65,19 @@ def test_last_value() -> None:
     client.request('', '')
     assert client.last_value is None
 
+def test_site_procedures_are_loaded_lazily() -> None:
+    code = '''if True:
+        import sys
+        from redditwarp.SYNC import Client
+        client = Client.from_access_token('')
+        assert 'redditwarp.siteprocs.submission.SYNC' not in sys.modules
+        procs = client.p.submission
+        assert 'redditwarp.siteprocs.submission.SYNC' in sys.modules
+        assert client.p.submission is procs
+        assert 'redditwarp.siteprocs.wiki.SYNC' not in sys.modules
+    '''
+    subprocess.run([sys.executable, '-c', code], check=True)
+
 class TestRequestExceptions:
     def test_json_decode_failed_and_status_code_exception(self) -> None:
         http = MyHTTPClient(414, {'Content-Type': 'text/plain'}, b'Error: URI Too Long')
@@ -80,3 +80,23 @@ class Test_DictAndListRecursiveAttributeMappingProxy:
         d = {'a': [None, [{'b': {'c': [{'d': 2}]}}]]}
         amp = DictAndListRecursiveAttributeMappingProxy(d)
         assert amp.a[1][0].b.c[0].d == 2
+
+    def test_children_are_wrapped_once(self) -> None:
+        d: dict[str, Any] = {'a': {'aa': [{'b': 1}, [2]]}, 'z': 0}
+        amp = DictAndListRecursiveAttributeMappingProxy(d)
+        assert amp.a is amp.a
+        assert amp.a.aa is amp.a.aa
+        assert amp.a.aa[0] is amp.a.aa[0]
+        assert amp.a.aa[1] is amp.a.aa[1]
+
+        d['a'] = {'aa': []}
+        assert abs(amp.a.aa) is d['a']['aa']
+
+    def test_pickle(self) -> None:
+        d: dict[str, Any] = {'a': {'aa': [{'b': 1}]}}
+        amp = DictAndListRecursiveAttributeMappingProxy(d)
+        amp.a.aa
+        for level in range(pickle.HIGHEST_PROTOCOL + 1):
+            other = pickle.loads(pickle.dumps(amp, protocol=level))
+            assert other == amp
+            assert other.a.aa[0].b == 1
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+
+from redditwarp.util.lazy_attribute import lazy_attribute
+
+
+class Thing:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @lazy_attribute
+    def value(self) -> int:
+        """The value."""
+        self.calls += 1
+        return 5
+
+
+def test_value_is_computed_once() -> None:
+    thing = Thing()
+    assert 'value' not in thing.__dict__
+    assert thing.value == 5
+    assert thing.value == 5
+    assert thing.calls == 1
+    assert thing.__dict__['value'] == 5
+
+def test_value_can_be_assigned() -> None:
+    thing = Thing()
+    thing.value = 7  # type: ignore[misc, assignment]
+    assert thing.value == 7
+    assert thing.calls == 0
+
+def test_exception_is_not_cached() -> None:
+    class Flaky:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        @lazy_attribute
+        def value(self) -> int:
+            self.calls += 1
+            if self.calls == 1:
+                raise KeyError('value')
+            return 5
+
+    flaky = Flaky()
+    with pytest.raises(KeyError):
+        flaky.value
+    assert 'value' not in flaky.__dict__
+    assert flaky.value == 5
+
+def test_class_access() -> None:
+    assert isinstance(Thing.value, lazy_attribute)
+    assert Thing.value.__doc__ == 'The value.'
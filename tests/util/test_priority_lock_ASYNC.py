@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from redditwarp.util.priority_lock_ASYNC import PriorityLock
+
+async def _wait_for_waiters(lock: PriorityLock, n: int) -> None:
+    for _ in range(1000):
+        if lock.get_waiter_count() >= n:
+            return
+        await asyncio.sleep(0)
+    raise AssertionError
+
+@pytest.mark.asyncio
+async def test_lowest_key_acquires_first() -> None:
+    lock = PriorityLock()
+    order: list[int] = []
+
+    async def worker(key: int) -> None:
+        await lock.acquire(key)
+        order.append(key)
+        lock.release()
+
+    await lock.acquire()
+    tasks = []
+    for i, key in enumerate((5, 1, 3)):
+        tasks.append(asyncio.create_task(worker(key)))
+        await _wait_for_waiters(lock, i + 1)
+    lock.release()
+    await asyncio.gather(*tasks)
+    assert order == [1, 3, 5]
+
+@pytest.mark.asyncio
+async def test_equal_keys_in_arrival_order() -> None:
+    lock = PriorityLock()
+    order: list[str] = []
+
+    async def worker(name: str) -> None:
+        await lock.acquire(0)
+        order.append(name)
+        lock.release()
+
+    await lock.acquire()
+    tasks = []
+    for i, name in enumerate('abc'):
+        tasks.append(asyncio.create_task(worker(name)))
+        await _wait_for_waiters(lock, i + 1)
+    lock.release()
+    await asyncio.gather(*tasks)
+    assert order == ['a', 'b', 'c']
+    assert not lock.locked()
+    assert lock.get_waiter_count() == 0
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_is_skipped() -> None:
+    lock = PriorityLock()
+    order: list[int] = []
+
+    async def worker(key: int) -> None:
+        await lock.acquire(key)
+        order.append(key)
+        lock.release()
+
+    await lock.acquire()
+    cancelled = asyncio.create_task(worker(1))
+    await _wait_for_waiters(lock, 1)
+    waiting = asyncio.create_task(worker(2))
+    await _wait_for_waiters(lock, 2)
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    assert lock.get_waiter_count() == 1
+    lock.release()
+    await waiting
+    assert order == [2]
+    assert not lock.locked()
+    assert lock.get_waiter_count() == 0
+
+@pytest.mark.asyncio
+async def test_uncontended_acquire() -> None:
+    lock = PriorityLock()
+    await lock.acquire()
+    assert lock.locked()
+    with pytest.raises(RuntimeError):
+        lock.release()
+        lock.release()
+    assert not lock.locked()
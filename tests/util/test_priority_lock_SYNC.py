@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from redditwarp.util.priority_lock_SYNC import PriorityLock
+
+def _wait_for_waiters(lock: PriorityLock, n: int) -> None:
+    deadline = time.monotonic() + 5
+    while lock.get_waiter_count() < n:
+        assert time.monotonic() < deadline
+        time.sleep(.001)
+
+def test_lowest_key_acquires_first() -> None:
+    lock = PriorityLock()
+    order: list[int] = []
+
+    def worker(key: int) -> None:
+        lock.acquire(key)
+        order.append(key)
+        lock.release()
+
+    lock.acquire()
+    threads = []
+    for i, key in enumerate((5, 1, 3)):
+        t = threading.Thread(target=worker, args=(key,))
+        t.start()
+        threads.append(t)
+        _wait_for_waiters(lock, i + 1)
+    lock.release()
+    for t in threads:
+        t.join()
+    assert order == [1, 3, 5]
+
+def test_equal_keys_in_arrival_order() -> None:
+    lock = PriorityLock()
+    order: list[str] = []
+
+    def worker(name: str) -> None:
+        lock.acquire(0)
+        order.append(name)
+        lock.release()
+
+    lock.acquire()
+    threads = []
+    for i, name in enumerate('abc'):
+        t = threading.Thread(target=worker, args=(name,))
+        t.start()
+        threads.append(t)
+        _wait_for_waiters(lock, i + 1)
+    lock.release()
+    for t in threads:
+        t.join()
+    assert order == ['a', 'b', 'c']
+    assert not lock.locked()
+
+def test_release_wakes_only_the_next_waiter() -> None:
+    lock = PriorityLock()
+    acquired = threading.Event()
+    finished: list[int] = []
+
+    def worker(key: int) -> None:
+        lock.acquire(key)
+        acquired.set()
+        finished.append(key)
+
+    lock.acquire()
+    threads = []
+    for i, key in enumerate((2, 1)):
+        t = threading.Thread(target=worker, args=(key,), daemon=True)
+        t.start()
+        threads.append(t)
+        _wait_for_waiters(lock, i + 1)
+    lock.release()
+    assert acquired.wait(5)
+    threads[1].join(5)
+    assert finished == [1]
+    assert lock.locked()
+    assert lock.get_waiter_count() == 1
+    lock.release()
+    threads[0].join(5)
+    assert finished == [1, 2]
+    lock.release()
+    assert not lock.locked()
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from redditwarp.util.reservation_rate_limiter import ReservationRateLimiter
+from redditwarp.util.rate_limit_state import LocalRateLimitStateBackend, SharedFileRateLimitStateBackend
+from redditwarp.http.handler_SYNC import Handler
+from redditwarp.core.rate_limited_SYNC import RateLimited
+
+class Clock:
+    def __init__(self, t: float = 0) -> None:
+        self.t = t
+    def __call__(self) -> float:
+        return self.t
+
+
+def test_burst_is_let_through() -> None:
+    clock = Clock()
+    rl = ReservationRateLimiter(burst=5, state_backend=LocalRateLimitStateBackend(time_func=clock))
+    rl.update(remaining=100, reset=100, used=0)
+    delays = [rl.reserve() for _ in range(5)]
+    assert delays == [0] * 5
+    assert rl.reserve() > 0
+
+def test_reservations_count_against_budget() -> None:
+    clock = Clock()
+    rl = ReservationRateLimiter(burst=1, state_backend=LocalRateLimitStateBackend(time_func=clock))
+    rl.update(remaining=10, reset=100, used=0)
+    for _ in range(4):
+        rl.reserve()
+    assert rl.reserved == 4
+    assert rl.get_available() == 6
+    rl.settle()
+    assert rl.get_available() == 7
+
+def test_budget_is_spread_across_window() -> None:
+    clock = Clock()
+    rl = ReservationRateLimiter(burst=1, state_backend=LocalRateLimitStateBackend(time_func=clock))
+    rl.update(remaining=10, reset=100, used=0)
+    delays = [rl.reserve() for _ in range(10)]
+    # Reservations are spaced out and never scheduled past the window end.
+    assert delays == sorted(delays)
+    assert delays[0] == 0
+    assert delays[-1] < 100
+    assert delays[1] == pytest.approx(10)
+
+def test_exhausted_budget_defers_to_next_window() -> None:
+    clock = Clock()
+    rl = ReservationRateLimiter(burst=3, state_backend=LocalRateLimitStateBackend(time_func=clock))
+    rl.update(remaining=2, reset=50, used=98)
+    rl.reserve()
+    rl.reserve()
+    assert rl.reserve() >= 50
+
+def test_window_rolls_over() -> None:
+    clock = Clock()
+    rl = ReservationRateLimiter(window_length=600, state_backend=LocalRateLimitStateBackend(time_func=clock))
+    rl.update(remaining=0, reset=30, used=600)
+    assert rl.get_available() == 0
+    clock.t = 31
+    assert rl.get_available() == 600
+    assert rl.used == 0
+
+def test_consume_without_headers() -> None:
+    clock = Clock()
+    rl = ReservationRateLimiter(fallback_limit=300, state_backend=LocalRateLimitStateBackend(time_func=clock))
+    rl.consume()
+    assert rl.remaining == 299
+    assert rl.used == 1
+
+def test_shared_file_backend(tmp_path: Path) -> None:
+    path = tmp_path / 'ratelimit'
+    rl1 = ReservationRateLimiter(state_backend=SharedFileRateLimitStateBackend(path))
+    rl2 = ReservationRateLimiter(state_backend=SharedFileRateLimitStateBackend(path))
+    rl1.update(remaining=500, reset=300, used=100)
+    assert rl2.remaining == 500
+    assert rl2.used == 100
+    rl2.reserve()
+    assert rl1.reserved == 1
+    rl1.settle()
+    assert rl2.reserved == 0
+
+def test_rate_limited_handler_closes_backend(tmp_path: Path) -> None:
+    backend = SharedFileRateLimitStateBackend(tmp_path / 'ratelimit')
+    handler = RateLimited(Handler(), ReservationRateLimiter(state_backend=backend))
+    handler._close()
+    with pytest.raises(OSError):
+        ReservationRateLimiter(state_backend=backend).reserve()
+    backend.close()
+
+def test_stale_update_is_ignored() -> None:
+    clock = Clock()
+    rl = ReservationRateLimiter(state_backend=LocalRateLimitStateBackend(time_func=clock))
+    rl.update(remaining=500, reset=300, used=100)
+    rl.update(remaining=510, reset=300, used=90)
+    assert rl.remaining == 500